@@ -11,7 +11,8 @@ from gunicorn.arbiter import Arbiter
 bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
 backlog = 2048
 
-# Worker processes
+# Worker processes; set RATE_LIMIT_BACKEND=database so rate limits are
+# shared by all of them rather than multiplied by the worker count
 workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
 worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 1000
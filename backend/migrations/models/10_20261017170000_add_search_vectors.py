@@ -0,0 +1,24 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "post" ADD "search_vector" TSVECTOR;
+        ALTER TABLE "topic" ADD "search_vector" TSVECTOR;
+        UPDATE "post" SET "search_vector" = to_tsvector('english', "content");
+        UPDATE "topic" SET "search_vector" = (
+            setweight(to_tsvector('english', "title"), 'A')
+            || setweight(to_tsvector('english', coalesce("description", '')), 'B')
+        );
+        CREATE INDEX IF NOT EXISTS "idx_post_search_vector"
+            ON "post" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_topic_search_vector"
+            ON "topic" USING GIN ("search_vector");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_topic_search_vector";
+        DROP INDEX IF EXISTS "idx_post_search_vector";
+        ALTER TABLE "topic" DROP COLUMN "search_vector";
+        ALTER TABLE "post" DROP COLUMN "search_vector";"""
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "user" ADD "tokens_revoked_at" TIMESTAMPTZ;
+        UPDATE "user" SET "tokens_revoked_at" = "updated_at" WHERE "is_locked";
+        CREATE INDEX IF NOT EXISTS "idx_user_tokens__14de47"
+            ON "user" ("tokens_revoked_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_user_tokens__14de47";
+        ALTER TABLE "user" DROP COLUMN "tokens_revoked_at";"""
@@ -0,0 +1,35 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "post" ADD "thread_root_id" UUID;
+        ALTER TABLE "post" ADD "depth" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "post" ADD "path" VARCHAR(2048) NOT NULL DEFAULT '';
+        WITH RECURSIVE tree(id, thread_root_id, depth, path) AS (
+            SELECT id, id, 0, replace(id::text, '-', '') || '/'
+            FROM "post"
+            WHERE parent_post_id IS NULL
+            UNION ALL
+            SELECT p.id, tree.thread_root_id, tree.depth + 1,
+                   tree.path || replace(p.id::text, '-', '') || '/'
+            FROM "post" p
+            JOIN tree ON p.parent_post_id = tree.id
+        )
+        UPDATE "post"
+        SET thread_root_id = tree.thread_root_id, depth = tree.depth, path = tree.path
+        FROM tree
+        WHERE "post".id = tree.id;
+        CREATE INDEX IF NOT EXISTS "idx_post_thread__d3b6c1"
+            ON "post" ("thread_root_id");
+        CREATE INDEX IF NOT EXISTS "idx_post_path_5e4f2a"
+            ON "post" ("path" varchar_pattern_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_post_path_5e4f2a";
+        DROP INDEX IF EXISTS "idx_post_thread__d3b6c1";
+        ALTER TABLE "post" DROP COLUMN "path";
+        ALTER TABLE "post" DROP COLUMN "depth";
+        ALTER TABLE "post" DROP COLUMN "thread_root_id";"""
@@ -0,0 +1,40 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "post" ADD "reply_count" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "topic" ADD "post_count" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "user" ADD "approved_count" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "user" ADD "rejected_count" INT NOT NULL DEFAULT 0;
+        UPDATE "post" SET "reply_count" = counts.total
+        FROM (
+            SELECT "parent_post_id" AS id, COUNT(*) AS total
+            FROM "post" WHERE "parent_post_id" IS NOT NULL
+            GROUP BY "parent_post_id"
+        ) AS counts
+        WHERE "post"."id" = counts.id;
+        UPDATE "topic" SET "post_count" = counts.total
+        FROM (
+            SELECT "topic_id" AS id, COUNT(*) AS total FROM "post" GROUP BY "topic_id"
+        ) AS counts
+        WHERE "topic"."id" = counts.id;
+        UPDATE "user" SET "approved_count" = counts.total
+        FROM (
+            SELECT "author_id" AS id, COUNT(*) AS total FROM "post" GROUP BY "author_id"
+        ) AS counts
+        WHERE "user"."id" = counts.id;
+        UPDATE "user" SET "rejected_count" = counts.total
+        FROM (
+            SELECT "author_id" AS id, COUNT(*) AS total
+            FROM "rejectedpost" GROUP BY "author_id"
+        ) AS counts
+        WHERE "user"."id" = counts.id;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "user" DROP COLUMN "rejected_count";
+        ALTER TABLE "user" DROP COLUMN "approved_count";
+        ALTER TABLE "topic" DROP COLUMN "post_count";
+        ALTER TABLE "post" DROP COLUMN "reply_count";"""
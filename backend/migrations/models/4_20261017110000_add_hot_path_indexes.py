@@ -0,0 +1,37 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_usersession_session_5d6f52"
+            ON "usersession" ("session_token");
+        CREATE INDEX IF NOT EXISTS "idx_post_topic_i_544ab2"
+            ON "post" ("topic_id", "parent_post_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_post_parent__030dff"
+            ON "post" ("parent_post_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_post_author__e6f27b"
+            ON "post" ("author_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_pendingpost_author__195358"
+            ON "pendingpost" ("author_id", "topic_id");
+        CREATE INDEX IF NOT EXISTS "idx_userevent_user_id_7e6e36"
+            ON "userevent" ("user_id", "event_type", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_userevent_resourc_ffb482"
+            ON "userevent" ("resource_id");
+        DROP INDEX IF EXISTS "idx_post_path_5e4f2a";
+        ALTER TABLE "post" ALTER COLUMN "path" TYPE VARCHAR(2048) COLLATE "C";
+        CREATE INDEX IF NOT EXISTS "idx_post_path_18eee6" ON "post" ("path");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_post_path_18eee6";
+        ALTER TABLE "post" ALTER COLUMN "path" TYPE VARCHAR(2048) COLLATE "default";
+        CREATE INDEX IF NOT EXISTS "idx_post_path_5e4f2a"
+            ON "post" ("path" varchar_pattern_ops);
+        DROP INDEX IF EXISTS "idx_userevent_resourc_ffb482";
+        DROP INDEX IF EXISTS "idx_userevent_user_id_7e6e36";
+        DROP INDEX IF EXISTS "idx_pendingpost_author__195358";
+        DROP INDEX IF EXISTS "idx_post_author__e6f27b";
+        DROP INDEX IF EXISTS "idx_post_parent__030dff";
+        DROP INDEX IF EXISTS "idx_post_topic_i_544ab2";
+        DROP INDEX IF EXISTS "idx_usersession_session_5d6f52";"""
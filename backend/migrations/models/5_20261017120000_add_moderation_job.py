@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "moderationjob" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "pending_post_id" UUID NOT NULL UNIQUE,
+    "status" VARCHAR(9) NOT NULL DEFAULT 'queued',
+    "attempts" INT NOT NULL DEFAULT 0,
+    "available_at" TIMESTAMPTZ NOT NULL,
+    "locked_by" VARCHAR(255),
+    "locked_until" TIMESTAMPTZ,
+    "last_error" TEXT
+);
+COMMENT ON COLUMN "moderationjob"."status" IS
+    'QUEUED: queued\nRUNNING: running\nSUCCEEDED: succeeded\nFAILED: failed';
+        CREATE INDEX IF NOT EXISTS "idx_moderationj_status_4b867c"
+            ON "moderationjob" ("status", "available_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_moderationj_status_4b867c";
+        DROP TABLE IF EXISTS "moderationjob";"""
@@ -0,0 +1,29 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "aianalysis" ADD "content_hash" VARCHAR(64);
+        ALTER TABLE "aianalysis" ADD "cache_hit" BOOL NOT NULL DEFAULT False;
+        ALTER TABLE "aianalysis" ALTER COLUMN "pending_post_id" DROP NOT NULL;
+        ALTER TABLE "aianalysis"
+            DROP CONSTRAINT IF EXISTS "aianalysis_pending_post_id_fkey";
+        ALTER TABLE "aianalysis" ADD CONSTRAINT "aianalysis_pending_post_id_fkey"
+            FOREIGN KEY ("pending_post_id") REFERENCES "pendingpost" ("id")
+            ON DELETE SET NULL;
+        CREATE INDEX IF NOT EXISTS "idx_aianalysis_content_37a6d3"
+            ON "aianalysis" ("content_hash", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_aianalysis_content_37a6d3";
+        DELETE FROM "aianalysis" WHERE "pending_post_id" IS NULL;
+        ALTER TABLE "aianalysis"
+            DROP CONSTRAINT IF EXISTS "aianalysis_pending_post_id_fkey";
+        ALTER TABLE "aianalysis" ADD CONSTRAINT "aianalysis_pending_post_id_fkey"
+            FOREIGN KEY ("pending_post_id") REFERENCES "pendingpost" ("id")
+            ON DELETE CASCADE;
+        ALTER TABLE "aianalysis" ALTER COLUMN "pending_post_id" SET NOT NULL;
+        ALTER TABLE "aianalysis" DROP COLUMN "cache_hit";
+        ALTER TABLE "aianalysis" DROP COLUMN "content_hash";"""
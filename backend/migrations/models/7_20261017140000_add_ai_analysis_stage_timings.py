@@ -0,0 +1,21 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "aianalysis" ADD "queue_wait_ms" INT;
+        ALTER TABLE "aianalysis" ADD "db_fetch_ms" INT;
+        ALTER TABLE "aianalysis" ADD "prefilter_ms" INT;
+        ALTER TABLE "aianalysis" ADD "llm_ms" INT;
+        ALTER TABLE "aianalysis" ADD "persist_ms" INT;
+        ALTER TABLE "aianalysis" ADD "action_ms" INT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "aianalysis" DROP COLUMN "action_ms";
+        ALTER TABLE "aianalysis" DROP COLUMN "persist_ms";
+        ALTER TABLE "aianalysis" DROP COLUMN "llm_ms";
+        ALTER TABLE "aianalysis" DROP COLUMN "prefilter_ms";
+        ALTER TABLE "aianalysis" DROP COLUMN "db_fetch_ms";
+        ALTER TABLE "aianalysis" DROP COLUMN "queue_wait_ms";"""
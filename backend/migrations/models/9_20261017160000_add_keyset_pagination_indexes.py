@@ -0,0 +1,30 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_post_topic_i_383e73"
+            ON "post" ("topic_id", "created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_post_created_603942"
+            ON "post" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_topic_created_1093c5"
+            ON "topic" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_tag_created_79e4b4"
+            ON "tag" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_pendingpost_created_791610"
+            ON "pendingpost" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_rejectedpos_created_fe29a8"
+            ON "rejectedpost" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_userevent_user_id_ee42c0"
+            ON "userevent" ("user_id", "created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_userevent_user_id_ee42c0";
+        DROP INDEX IF EXISTS "idx_rejectedpos_created_fe29a8";
+        DROP INDEX IF EXISTS "idx_pendingpost_created_791610";
+        DROP INDEX IF EXISTS "idx_tag_created_79e4b4";
+        DROP INDEX IF EXISTS "idx_topic_created_1093c5";
+        DROP INDEX IF EXISTS "idx_post_created_603942";
+        DROP INDEX IF EXISTS "idx_post_topic_i_383e73";"""
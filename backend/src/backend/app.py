@@ -10,22 +10,49 @@ from starlette.responses import RedirectResponse as StarletteRedirectResponse
 
 # Project-specific imports
 from backend.db import init_tortoise
+from backend.db.search_index import create_sqlite_search_index
 from backend.routes import router
+from backend.tasks.moderation_jobs import start_moderation_consumers
+from backend.tasks.page_cache_invalidations import run_page_cache_invalidation_task
 from backend.tasks.session import run_session_cleanup_task
+from backend.tasks.session_revocations import run_session_revocation_refresh_task
+from backend.utils.ai_moderation import close_ai_moderator_service
 from backend.utils.ai_moderation import init_ai_moderator_service
+from backend.utils.page_cache import PageCacheMiddleware
+from backend.utils.password_hashing import password_hashing_executor
+from backend.utils.rate_limiter import RateLimitMiddleware
 from backend.utils.settings import settings
 from backend.utils.version import get_version
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    # The ORM is up by now; create the search table generate_schemas skips
+    await create_sqlite_search_index()
+
     # Initialize AI moderation service
     init_ai_moderator_service()
 
+    moderation_consumers: list[asyncio.Task[None]] = []
     if not settings.TESTING:
         asyncio.create_task(run_session_cleanup_task())
+        if settings.JWT_STATELESS_AUTH:
+            asyncio.create_task(run_session_revocation_refresh_task())
+        if settings.PAGE_CACHE_TTL_SECONDS > 0:
+            asyncio.create_task(run_page_cache_invalidation_task())
+        moderation_consumers = start_moderation_consumers()
     yield
 
+    # Stop consuming moderation jobs; unfinished leases expire and are retried
+    for consumer in moderation_consumers:
+        consumer.cancel()
+
+    # Stop the password hashing worker threads
+    password_hashing_executor.shutdown()
+
+    # Close the AI moderation HTTP connection pool
+    await close_ai_moderator_service()
+
 
 app = FastAPI(
     title="The Robot Overlord API",
@@ -38,6 +65,13 @@ app = FastAPI(
 # Initialize database
 init_tortoise(app)
 
+# Rate limit requests before they reach any route
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
+# Serve public pages to logged-out visitors from the page cache
+app.add_middleware(PageCacheMiddleware)
+
 # Set up static files
 app.mount("/static", StaticFiles(directory="src/backend/static"), name="static")
 
@@ -0,0 +1,261 @@
+"""
+Run EXPLAIN on every hot query shape from db_functions and flag sequential scans.
+
+Point DATABASE_URL at a disposable database. Pass --seed N to fill it with N
+synthetic posts (plus users, sessions, pending posts and events) first, since
+planners happily seq-scan tiny tables. Exits non-zero if any shape scans.
+
+Usage: python -m backend.commands.audit_indexes [--seed N]
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+from datetime import timedelta
+import logging
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from uuid import uuid4
+
+# Third-party imports
+from pydantic import BaseModel
+from tortoise.queryset import QuerySet
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db.models.user_event import UserEvent
+from backend.db.models.user_session import UserSession
+from backend.utils.datetime import now_utc
+from backend.utils.post_path import build_post_path
+from backend.utils.post_path import subtree_path_filter
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSample(BaseModel):
+    """Real ids pulled from the database so every shape hits existing rows."""
+
+    post: Any
+    session_token: str
+    pending_author_id: Any
+    pending_topic_id: Any
+    event_user_id: Any
+    event_resource_id: Any
+
+
+class IndexAuditResult(BaseModel):
+    name: str
+    plan: List[str]
+    sequential_scans: List[str]
+
+
+# Mirrors the filters used by the functions in db_functions; keep in sync when
+# adding a hot query so its index is audited too.
+QUERY_SHAPES: Dict[str, Callable[[AuditSample], QuerySet[Any]]] = {
+    "user_sessions.get_user_session_by_token": lambda s: UserSession.filter(
+        session_token=s.session_token, is_active=True
+    ),
+    "posts.list_threaded_posts_by_topic": lambda s: Post.filter(
+        topic_id=s.post.topic_id, parent_post_id=None
+    )
+    .order_by("-created_at")
+    .limit(20),
+    "posts.list_posts_by_topic": lambda s: Post.filter(topic_id=s.post.topic_id)
+    .order_by("-created_at")
+    .limit(20),
+    "posts.list_post_replies": lambda s: Post.filter(parent_post_id=s.post.id).limit(
+        20
+    ),
+    "posts.list_posts_by_user": lambda s: Post.filter(author_id=s.post.author_id)
+    .order_by("-created_at")
+    .limit(20),
+    "posts.list_thread_replies": lambda s: Post.filter(
+        **subtree_path_filter(s.post.path), depth__gt=s.post.depth
+    ),
+    "pending_posts.list_pending_posts_by_topic_and_user": lambda s: PendingPost.filter(
+        topic_id=s.pending_topic_id, author_id=s.pending_author_id
+    ),
+    "user_events.get_recent_login_attempts": lambda s: UserEvent.filter(
+        user_id=s.event_user_id, event_type="login"
+    )
+    .order_by("-created_at")
+    .limit(10),
+    "user_events.by_resource_id": lambda s: UserEvent.filter(
+        resource_id=s.event_resource_id
+    ),
+}
+
+
+def find_sequential_scans(plan: List[str], postgres: bool) -> List[str]:
+    """Return the plan lines that read a whole table rather than an index."""
+    if postgres:
+        return [line.strip() for line in plan if "Seq Scan on" in line]
+    # SQLite reports "SCAN <table>" for full scans and "SEARCH" or
+    # "SCAN <table> USING INDEX" when an index drives the lookup
+    return [
+        line.strip()
+        for line in plan
+        if line.strip().startswith("SCAN ") and " USING " not in line
+    ]
+
+
+async def explain(sql: str) -> List[str]:
+    if is_postgres():
+        rows = await get_connection().execute_query_dict(f"EXPLAIN {sql}")
+        return [row["QUERY PLAN"] for row in rows]
+    rows = await get_connection().execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+    return [row["detail"] for row in rows]
+
+
+async def seed_audit_data(post_count: int) -> None:
+    users = [
+        User(
+            email=f"audit-{uuid4().hex}@example.com",
+            password_hash="x",
+            display_name="Index Audit",
+        )
+        for _ in range(max(post_count // 100, 2))
+    ]
+    await User.bulk_create(users)
+    topics = [
+        Topic(title="Index audit", author_id=users[i % len(users)].id)
+        for i in range(max(post_count // 50, 2))
+    ]
+    await Topic.bulk_create(topics)
+
+    posts: List[Post] = []
+    for i in range(post_count):
+        parent = posts[i - 1] if i % 3 and posts else None
+        post_id = uuid4()
+        parent_path = parent.path if parent else ""
+        posts.append(
+            Post(
+                id=post_id,
+                content="Index audit post",
+                author_id=users[i % len(users)].id,
+                topic_id=parent.topic_id if parent else topics[i % len(topics)].id,  # type: ignore[attr-defined]
+                parent_post_id=parent.id if parent else None,
+                thread_root_id=parent.thread_root_id if parent else post_id,
+                depth=parent.depth + 1 if parent else 0,
+                path=build_post_path(parent_path, post_id),
+            )
+        )
+    await Post.bulk_create(posts, batch_size=500)
+
+    await PendingPost.bulk_create(
+        [
+            PendingPost(
+                content="Index audit pending post",
+                author_id=users[i % len(users)].id,
+                topic_id=topics[i % len(topics)].id,
+            )
+            for i in range(post_count // 10 + 1)
+        ],
+        batch_size=500,
+    )
+    await UserSession.bulk_create(
+        [
+            UserSession(
+                user_id=users[i % len(users)].id,
+                ip_address="127.0.0.1",
+                user_agent="index-audit",
+                session_token=uuid4().hex,
+                expires_at=now_utc() + timedelta(days=1),
+            )
+            for i in range(post_count // 10 + 1)
+        ],
+        batch_size=500,
+    )
+    await UserEvent.bulk_create(
+        [
+            UserEvent(
+                user_id=users[i % len(users)].id,
+                event_type="login" if i % 2 else "post_approved",
+                resource_type="post",
+                resource_id=posts[i % len(posts)].id if posts else None,
+            )
+            for i in range(post_count)
+        ],
+        batch_size=500,
+    )
+
+    await get_connection().execute_script("ANALYZE")
+
+
+async def load_audit_sample() -> AuditSample:
+    post = await Post.filter(parent_post_id=None).first()
+    session = await UserSession.first()
+    pending_post = await PendingPost.first()
+    event = await UserEvent.filter(resource_id__not_isnull=True).first()
+    if not (post and session and pending_post and event):
+        raise ValueError(
+            "CITIZEN, THE DATABASE IS TOO EMPTY TO AUDIT. RERUN WITH --seed."
+        )
+
+    return AuditSample(
+        post=post,
+        session_token=session.session_token,
+        pending_author_id=pending_post.author_id,  # type: ignore[attr-defined]
+        pending_topic_id=pending_post.topic_id,  # type: ignore[attr-defined]
+        event_user_id=event.user_id,  # type: ignore[attr-defined]
+        event_resource_id=event.resource_id,
+    )
+
+
+async def audit_query_shapes() -> List[IndexAuditResult]:
+    sample = await load_audit_sample()
+    postgres = is_postgres()
+
+    results: List[IndexAuditResult] = []
+    for name, build_query in QUERY_SHAPES.items():
+        plan = await explain(build_query(sample).sql(params_inline=True))
+        results.append(
+            IndexAuditResult(
+                name=name,
+                plan=plan,
+                sequential_scans=find_sequential_scans(plan, postgres),
+            )
+        )
+    return results
+
+
+async def run(seed: int) -> List[IndexAuditResult]:
+    await init_db()
+    try:
+        if seed:
+            await seed_audit_data(seed)
+        return await audit_query_shapes()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = asyncio.run(run(args.seed))
+
+    for result in results:
+        status = "SEQ SCAN" if result.sequential_scans else "ok"
+        logger.info(f"[{status}] {result.name}")
+        for line in result.sequential_scans:
+            logger.info(f"    {line}")
+
+    if any(result.sequential_scans for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Recompute the materialized thread path on every post.
+
+Usage: python -m backend.commands.backfill_post_paths [--batch-size N]
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import logging
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.db_functions.posts.backfill_post_paths import backfill_post_paths
+
+logger = logging.getLogger(__name__)
+
+
+async def run(batch_size: int) -> int:
+    await init_db()
+    try:
+        return await backfill_post_paths(batch_size=batch_size)
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    updated = asyncio.run(run(args.batch_size))
+    logger.info(f"Updated {updated} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Push synthetic pending posts through the moderation pipeline end to end.
+
+Every post goes through process_pending_post against the fake local model,
+so no API calls are made. Reports throughput, latency percentiles, the
+per-stage breakdown and how many database queries each post cost. Point
+DATABASE_URL at a disposable database: the posts, and the user and topic
+they belong to, are left behind.
+
+Usage: python -m backend.commands.benchmark_moderation [--posts N]
+    [--concurrency C] [--latency-ms MS] [--error-rate R] [--seed S]
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict
+from typing import List
+from uuid import UUID
+from uuid import uuid4
+
+# Third-party imports
+from pydantic import BaseModel
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.schemas.metrics import StageLatencySchema
+from backend.tasks.ai_moderation_task import process_pending_post
+from backend.utils.ai_moderation import close_ai_moderator_service
+from backend.utils.ai_moderation import init_ai_moderator_service
+from backend.utils.ai_moderation.fake_model import create_fake_moderation_model
+from backend.utils.ai_moderation.gateway import TokenBucket
+from backend.utils.ai_moderation.timings import moderation_timings
+
+logger = logging.getLogger(__name__)
+
+# Tortoise logs every statement it runs on this logger at DEBUG level
+DB_CLIENT_LOGGER = "tortoise.db_client"
+
+
+class BenchmarkReport(BaseModel):
+    posts: int
+    concurrency: int
+    elapsed_seconds: float
+    posts_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    decisions: Dict[str, int]
+    failed: int
+    queries: int
+    queries_per_post: float
+    stages: List[StageLatencySchema]
+
+
+class QueryCounter(logging.Handler):
+    """Counts the statements Tortoise sends to the database."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.count = 0
+        self._saved_level = logging.NOTSET
+        self._saved_propagate = True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Connection open/close messages are logged here too
+        if not str(record.msg).startswith(("Created connection", "Closed connection")):
+            self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        db_logger = logging.getLogger(DB_CLIENT_LOGGER)
+        self._saved_level = db_logger.level
+        self._saved_propagate = db_logger.propagate
+        db_logger.setLevel(logging.DEBUG)
+        db_logger.propagate = False
+        db_logger.addHandler(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        db_logger = logging.getLogger(DB_CLIENT_LOGGER)
+        db_logger.removeHandler(self)
+        db_logger.setLevel(self._saved_level)
+        db_logger.propagate = self._saved_propagate
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def create_synthetic_pending_posts(count: int, seed: int) -> List[UUID]:
+    """Create one user and topic holding ``count`` distinct pending posts."""
+    user = await User.create(
+        email=f"benchmark-{uuid4().hex}@example.com",
+        password_hash="x",
+        display_name="Moderation Benchmark",
+    )
+    topic = await Topic.create(title="Moderation benchmark", author=user)
+    # Distinct content so every post misses the moderation cache
+    pending_posts = [
+        PendingPost(
+            id=uuid4(),
+            content=(
+                f"Benchmark post {seed}-{i}: the evidence suggests that "
+                f"measured argument {i} follows from its premises."
+            ),
+            author_id=user.id,
+            topic_id=topic.id,
+        )
+        for i in range(count)
+    ]
+    await PendingPost.bulk_create(pending_posts, batch_size=500)
+    return [pending_post.id for pending_post in pending_posts]
+
+
+async def run_benchmark(
+    posts: int,
+    concurrency: int,
+    latency_ms: float = 800.0,
+    latency_sigma: float = 0.5,
+    error_rate: float = 0.0,
+    approve_ratio: float = 0.8,
+    seed: int = 0,
+    requests_per_minute: float = 0.0,
+) -> BenchmarkReport:
+    """
+    Moderate ``posts`` synthetic posts, ``concurrency`` at a time. The
+    database must already be initialized.
+
+    ``requests_per_minute`` paces model calls like the production gateway;
+    0 disables pacing so the pipeline itself is measured.
+    """
+    service = init_ai_moderator_service(
+        model=create_fake_moderation_model(
+            latency_ms=latency_ms,
+            latency_sigma=latency_sigma,
+            error_rate=error_rate,
+            approve_ratio=approve_ratio,
+            seed=seed,
+        )
+    )
+    service.gateway.bucket = TokenBucket(
+        requests_per_minute / 60, service.gateway.bucket.burst
+    )
+    moderation_timings.clear()
+
+    pending_post_ids = await create_synthetic_pending_posts(posts, seed)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    decisions: Dict[str, int] = {}
+    failed = 0
+
+    async def moderate(pending_post_id: UUID) -> None:
+        nonlocal failed
+        async with semaphore:
+            started_at = time.perf_counter()
+            analysis = await process_pending_post(pending_post_id)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+        if analysis is None:
+            failed += 1
+        else:
+            decisions[analysis.decision] = decisions.get(analysis.decision, 0) + 1
+
+    try:
+        with QueryCounter() as query_counter:
+            started_at = time.perf_counter()
+            await asyncio.gather(*(moderate(post_id) for post_id in pending_post_ids))
+            elapsed = time.perf_counter() - started_at
+    finally:
+        await close_ai_moderator_service()
+
+    latencies.sort()
+    return BenchmarkReport(
+        posts=posts,
+        concurrency=concurrency,
+        elapsed_seconds=elapsed,
+        posts_per_second=posts / elapsed if elapsed else 0.0,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        p99_ms=percentile(latencies, 0.99),
+        max_ms=latencies[-1] if latencies else 0.0,
+        decisions=decisions,
+        failed=failed,
+        queries=query_counter.count,
+        queries_per_post=query_counter.count / posts if posts else 0.0,
+        stages=moderation_timings.summary().stages,
+    )
+
+
+async def run(args: argparse.Namespace) -> BenchmarkReport:
+    await init_db()
+    try:
+        return await run_benchmark(
+            posts=args.posts,
+            concurrency=args.concurrency,
+            latency_ms=args.latency_ms,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            approve_ratio=args.approve_ratio,
+            seed=args.seed,
+            requests_per_minute=args.requests_per_minute,
+        )
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--approve-ratio", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--requests-per-minute", type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = asyncio.run(run(args))
+
+    logger.info(
+        f"{report.posts} posts at concurrency {report.concurrency} in "
+        f"{report.elapsed_seconds:.2f}s: {report.posts_per_second:.1f} posts/sec"
+    )
+    logger.info(
+        f"latency p50 {report.p50_ms:.0f}ms, p95 {report.p95_ms:.0f}ms, "
+        f"p99 {report.p99_ms:.0f}ms, max {report.max_ms:.0f}ms"
+    )
+    logger.info(f"decisions {report.decisions}, failed {report.failed}")
+    logger.info(f"{report.queries} queries, {report.queries_per_post:.1f} per post")
+    for stage in report.stages:
+        logger.info(
+            f"  {stage.stage:<10} n={stage.count:<6} p50 {stage.p50_ms:.0f}ms "
+            f"p95 {stage.p95_ms:.0f}ms p99 {stage.p99_ms:.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Repair drift in the denormalized reply, topic and user post counters.
+
+Usage: python -m backend.commands.reconcile_counters
+"""
+
+# Standard library imports
+import asyncio
+import logging
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.tasks.counters import reconcile_counters
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> int:
+    await init_db()
+    try:
+        return await reconcile_counters()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    fixed = asyncio.run(run())
+    logger.info(f"Corrected {fixed} counters")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Rebuild the full-text search index over posts and topics.
+
+Usage: python -m backend.commands.reindex_search
+"""
+
+# Standard library imports
+import asyncio
+import logging
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.db_functions.search import reindex_search
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> int:
+    await init_db()
+    try:
+        return await reindex_search()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    written = asyncio.run(run())
+    logger.info(f"Wrote {written} search index entries")
+
+
+if __name__ == "__main__":
+    main()
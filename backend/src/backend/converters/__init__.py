@@ -1,15 +1,19 @@
 from backend.converters.post_to_schema import post_to_schema
+from backend.converters.posts_to_schemas import posts_to_schemas
 from backend.converters.tag_to_schema import tag_to_schema
 from backend.converters.topic_to_schema import topic_to_schema
 from backend.converters.user_event_to_schema import user_event_to_schema
 from backend.converters.user_session_to_schema import user_session_to_schema
 from backend.converters.user_to_schema import user_to_schema
+from backend.converters.users_to_schemas import users_to_schemas
 
 __all__ = [
     "post_to_schema",
+    "posts_to_schemas",
     "tag_to_schema",
     "topic_to_schema",
     "user_event_to_schema",
     "user_session_to_schema",
     "user_to_schema",
+    "users_to_schemas",
 ]
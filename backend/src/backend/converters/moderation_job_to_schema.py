@@ -0,0 +1,17 @@
+from backend.db.models.moderation_job import ModerationJob
+from backend.schemas.moderation_job import ModerationJobSchema
+
+
+async def moderation_job_to_schema(job: ModerationJob) -> ModerationJobSchema:
+    return ModerationJobSchema(
+        id=job.id,
+        pending_post_id=job.pending_post_id,
+        status=job.status,
+        attempts=job.attempts,
+        available_at=job.available_at,
+        locked_by=job.locked_by,
+        locked_until=job.locked_until,
+        last_error=job.last_error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
@@ -8,9 +8,6 @@ async def post_to_schema(post: Post) -> PostResponse:
     await post.fetch_related("author", "topic")
     await post.fetch_related("parent_post")
 
-    # Calculate reply count
-    reply_count = await Post.filter(parent_post_id=post.id).count()
-
     # Get topic_id safely - it should never be None for a valid post
     if not hasattr(post, "topic") or not post.topic:
         raise ValueError(f"Post {post.id} has no associated topic")
@@ -27,7 +24,9 @@ async def post_to_schema(post: Post) -> PostResponse:
         author=await user_to_schema(post.author),
         topic_id=topic_id,
         parent_post_id=parent_id,
+        thread_root_id=post.thread_root_id,
+        depth=post.depth,
         created_at=post.created_at,
         updated_at=post.updated_at,
-        reply_count=reply_count,
+        reply_count=post.reply_count,
     )
@@ -0,0 +1,47 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.converters.users_to_schemas import users_to_schemas
+from backend.db.models.post import Post
+from backend.db.models.user import User
+from backend.schemas.post import PostResponse
+
+
+async def posts_to_schemas(posts: list[Post]) -> list[PostResponse]:
+    """
+    Batch counterpart of post_to_schema. Authors are loaded in one query no
+    matter how many posts are passed in, and reply counts are read from the
+    denormalized column, so list pages don't pay one round trip per row.
+    Output order matches the input order.
+    """
+    if not posts:
+        return []
+
+    author_ids = list({post.author_id for post in posts})  # type: ignore[attr-defined]
+
+    authors = await User.filter(id__in=author_ids)
+    author_schemas = await users_to_schemas(authors)
+
+    post_responses: list[PostResponse] = []
+    for post in posts:
+        author_id: UUID = post.author_id  # type: ignore[attr-defined]
+        if author_id not in author_schemas:
+            raise ValueError(f"Post {post.id} has no associated author")
+
+        post_responses.append(
+            PostResponse(
+                id=post.id,
+                content=post.content,
+                author=author_schemas[author_id],
+                topic_id=post.topic_id,  # type: ignore[attr-defined]
+                parent_post_id=post.parent_post_id,  # type: ignore[attr-defined]
+                thread_root_id=post.thread_root_id,
+                depth=post.depth,
+                created_at=post.created_at,
+                updated_at=post.updated_at,
+                reply_count=post.reply_count,
+            )
+        )
+
+    return post_responses
@@ -0,0 +1,15 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.converters.user_to_schema import user_to_schema
+from backend.db.models.user import User
+from backend.schemas.user import UserSchema
+
+
+async def users_to_schemas(users: list[User]) -> dict[UUID, UserSchema]:
+    """
+    Batch counterpart of user_to_schema, keyed by user id. Approved and rejected
+    counts are denormalized onto the user row, so this issues no queries.
+    """
+    return {user.id: await user_to_schema(user) for user in users}
@@ -8,6 +8,8 @@ from tortoise.contrib.fastapi import (
     register_tortoise,  # type: ignore[reportUnknownVariableType, unused-ignore]
 )
 
+from backend.db.search_index import create_sqlite_search_index
+
 
 # Helper functions
 def _get_sqlite_config(db_url: str) -> dict[str, Any]:
@@ -104,6 +106,7 @@ async def init_db(db_url: str | None = None) -> None:
             config["connections"]["default"] = db_url
 
     await Tortoise.init(config=config)
+    await create_sqlite_search_index()
 
 
 async def close_db() -> None:
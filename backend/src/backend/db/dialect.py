@@ -0,0 +1,15 @@
+# Third-party imports
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+
+def get_connection() -> BaseDBAsyncClient:
+    return connections.get("default")
+
+
+def is_postgres() -> bool:
+    """
+    Raw SQL in db_functions is only written for Postgres. Every caller that uses
+    it must keep a portable ORM fallback for SQLite, which is what the tests run on.
+    """
+    return bool(get_connection().capabilities.dialect == "postgres")
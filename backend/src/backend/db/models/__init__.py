@@ -1,6 +1,9 @@
 from backend.db.models.ai_analysis import AIAnalysis
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
 from backend.db.models.pending_post import PendingPost
 from backend.db.models.post import Post
+from backend.db.models.rate_limit_bucket import RateLimitBucket
 from backend.db.models.rejected_post import RejectedPost
 from backend.db.models.tag import Tag
 from backend.db.models.topic import Topic
@@ -22,6 +25,8 @@ models = [
     PendingPost,
     RejectedPost,
     AIAnalysis,
+    ModerationJob,
+    RateLimitBucket,
 ]
 
 __all__ = [
@@ -36,4 +41,7 @@ __all__ = [
     "PendingPost",
     "RejectedPost",
     "AIAnalysis",
+    "ModerationJob",
+    "ModerationJobStatus",
+    "RateLimitBucket",
 ]
@@ -1,17 +1,42 @@
+from typing import Optional
+from uuid import UUID
+
 from tortoise import fields
-from tortoise.fields.relational import ForeignKeyRelation
+from tortoise.fields.relational import ForeignKeyNullableRelation
 
 from backend.db.base import BaseModel
 from backend.db.models.pending_post import PendingPost
 
 
 class AIAnalysis(BaseModel):
-    pending_post: ForeignKeyRelation[PendingPost] = fields.ForeignKeyField(
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("content_hash", "created_at"),)
+
+    # Analyses outlive their pending post so they can serve as the
+    # persistent tier of the moderation result cache, until they are older
+    # than the cache TTL and tasks.ai_analyses prunes them
+    pending_post: ForeignKeyNullableRelation[PendingPost] = fields.ForeignKeyField(
         "models.PendingPost",
         related_name="ai_analyses",
+        null=True,
+        on_delete=fields.SET_NULL,
     )
+    pending_post_id: Optional[UUID]
     decision = fields.CharField(max_length=20)  # APPROVED or REJECTED
     confidence_score = fields.FloatField()
     analysis_text = fields.TextField()
     feedback_text = fields.TextField()
     processing_time_ms = fields.IntField()
+    # Hash of the normalized content and moderation version, see
+    # backend.utils.ai_moderation.cache.moderation_content_hash
+    content_hash = fields.CharField(max_length=64, null=True)
+    cache_hit = fields.BooleanField(default=False)
+    # Per-stage timings in milliseconds, null when a stage did not run:
+    # waiting in the job queue, loading the post, keyword rules and cache
+    # lookup, the model call, storing this row, and approving or rejecting
+    queue_wait_ms = fields.IntField(null=True)
+    db_fetch_ms = fields.IntField(null=True)
+    prefilter_ms = fields.IntField(null=True)
+    llm_ms = fields.IntField(null=True)
+    persist_ms = fields.IntField(null=True)
+    action_ms = fields.IntField(null=True)
@@ -0,0 +1,30 @@
+import enum
+
+from tortoise import fields
+
+from backend.db.base import BaseModel
+
+
+class ModerationJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ModerationJob(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("status", "available_at"),)
+
+    # Not a foreign key: the pending post is deleted once it is moderated,
+    # but the job row is kept as a record of the attempt
+    pending_post_id = fields.UUIDField(unique=True)
+    status = fields.CharEnumField(
+        ModerationJobStatus,
+        default=ModerationJobStatus.QUEUED,
+    )
+    attempts = fields.IntField(default=0)
+    available_at = fields.DatetimeField()
+    locked_by = fields.CharField(max_length=255, null=True)
+    locked_until = fields.DatetimeField(null=True)
+    last_error = fields.TextField(null=True)
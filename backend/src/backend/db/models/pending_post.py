@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 
 
 class PendingPost(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("author_id", "topic_id"), ("created_at", "id"))
+
     content = fields.TextField()
     author: ForeignKeyRelation[User] = fields.ForeignKeyField(
         "models.User",
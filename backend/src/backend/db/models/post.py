@@ -6,12 +6,22 @@ from tortoise.fields.relational import ForeignKeyRelation
 
 from backend.db.base import BaseModel
 from backend.db.models.user import User
+from backend.utils.post_path import POST_PATH_MAX_LENGTH
 
 if TYPE_CHECKING:
     from backend.db.models.topic import Topic
 
 
 class Post(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (
+            ("topic_id", "parent_post_id", "created_at"),
+            ("parent_post_id", "created_at"),
+            ("author_id", "created_at"),
+            ("topic_id", "created_at", "id"),
+            ("created_at", "id"),
+        )
+
     # This type hint is for IDE support only
     replies = fields.ReverseRelation["Post"]
 
@@ -29,3 +39,15 @@ class Post(BaseModel):
         related_name="replies",
         null=True,
     )
+    # Materialized path of ancestor ids (see utils.post_path) so subtree, root
+    # and depth lookups are single indexed scans instead of parent walks
+    thread_root_id = fields.UUIDField(null=True, db_index=True)
+    depth = fields.IntField(default=0)
+    # Byte-wise (COLLATE "C" on Postgres) so subtree range scans are exact;
+    # its length bounds how deep replies can nest (see MAX_POST_DEPTH)
+    path = fields.CharField(max_length=POST_PATH_MAX_LENGTH, default="", db_index=True)
+    # Denormalized count of direct replies, kept in step by the post db functions
+    reply_count = fields.IntField(default=0)
+    # On Postgres the table also has a search_vector tsvector column, which the
+    # ORM does not map; it is maintained by db_functions.search (see
+    # db.search_index)
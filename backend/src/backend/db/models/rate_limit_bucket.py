@@ -0,0 +1,11 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class RateLimitBucket(Model):
+    # One row per client and rate limit rule, shared by every worker. GCRA
+    # keeps nothing but the theoretical arrival time of the client's next
+    # request, in epoch seconds; rows whose time has passed carry no state
+    # and are pruned.
+    key = fields.CharField(max_length=255, pk=True)
+    tat = fields.FloatField()
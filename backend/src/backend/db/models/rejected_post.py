@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 
 
 class RejectedPost(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("created_at", "id"),)
+
     content = fields.TextField()
     author: ForeignKeyRelation[User] = fields.ForeignKeyField(
         "models.User",
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 
 class Tag(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("created_at", "id"),)
+
     topic_tags: fields.ReverseRelation["TopicTag"]
 
     name = fields.CharField(max_length=50, unique=True)
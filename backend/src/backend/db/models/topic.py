@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 
 class Topic(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (("created_at", "id"),)
+
     topic_tags: fields.ReverseRelation["TopicTag"]
     posts: fields.ReverseRelation["Post"]
 
@@ -25,3 +28,8 @@ class Topic(BaseModel):
     description = fields.TextField(
         null=True,
     )
+    # Denormalized count of every post in the topic, including replies
+    post_count = fields.IntField(default=0)
+    # On Postgres the table also has a search_vector tsvector column, which the
+    # ORM does not map; it is maintained by db_functions.search (see
+    # db.search_index)
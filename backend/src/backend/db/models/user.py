@@ -24,3 +24,9 @@ class User(BaseModel):
     failed_login_attempts = fields.IntField(default=0)
     role = fields.CharEnumField(UserRole, default=UserRole.USER)
     is_locked = fields.BooleanField(default=False)
+    # Access tokens issued before this are rejected in every process (see
+    # tasks.session_revocations); set on role changes and lockouts
+    tokens_revoked_at = fields.DatetimeField(null=True, db_index=True)
+    # Denormalized post counters, kept in step by the post db functions
+    approved_count = fields.IntField(default=0)
+    rejected_count = fields.IntField(default=0)
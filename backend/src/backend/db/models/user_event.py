@@ -4,6 +4,12 @@ from backend.db.base import BaseModel
 
 
 class UserEvent(BaseModel):
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride, unused-ignore]
+        indexes = (
+            ("user_id", "event_type", "created_at"),
+            ("user_id", "created_at", "id"),
+        )
+
     user = fields.ForeignKeyField(  # type: ignore[var-annotated]
         "models.User",
         related_name="events",
@@ -26,6 +32,7 @@ class UserEvent(BaseModel):
     )
     resource_id = fields.UUIDField(
         null=True,
+        db_index=True,
     )
     metadata = fields.JSONField(
         null=True,
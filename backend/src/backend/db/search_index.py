@@ -0,0 +1,73 @@
+"""
+Where the full-text search index lives on each database.
+
+Postgres keeps a tsvector in a search_vector column on post and topic, with
+a GIN index on each (migration 10). Topic titles are weighted above their
+descriptions. SQLite has no tsvector, so an FTS5 virtual table,
+search_index, holds the same text with one row per post or topic. It is
+created as the database is initialised (db.config.init_db and the app's
+lifespan), since generate_schemas does not know about it.
+
+Either way the index is kept in step by db_functions.search as posts are
+approved and posts and topics are created or edited. Deleted rows need no
+attention on Postgres; on SQLite their index rows are skipped by searches
+and dropped by the next reindex.
+"""
+
+# Standard library imports
+import re
+from typing import Optional
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+
+# Text search configuration used to build and query the vectors
+SEARCH_CONFIG = "english"
+
+POST_SEARCH_VECTOR_SQL = f"""to_tsvector('{SEARCH_CONFIG}', "content")"""
+
+TOPIC_SEARCH_VECTOR_SQL = f"""(
+    setweight(to_tsvector('{SEARCH_CONFIG}', "title"), 'A')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("description", '')), 'B')
+)"""
+
+SQLITE_SEARCH_INDEX_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS "search_index" USING fts5(
+    "kind" UNINDEXED,
+    "object_id" UNINDEXED,
+    "title",
+    "body",
+    tokenize = 'porter unicode61'
+)
+"""
+
+SQLITE_DELETE_ENTRY_SQL = """
+DELETE FROM "search_index" WHERE "kind" = ? AND "object_id" = ?
+"""
+
+# Words in a search, for building an FTS5 query that cannot be malformed
+_WORD_RE = re.compile(r"\w+")
+
+
+async def create_sqlite_search_index() -> None:
+    """
+    Create the SQLite FTS5 table if this database does not have it yet. Run
+    once at startup, never in a request: SQLite DDL there could commit the
+    caller's open transaction.
+    """
+    if is_postgres():
+        return
+    await get_connection().execute_query(SQLITE_SEARCH_INDEX_SQL)
+
+
+def fts5_match_query(search: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query matching rows containing every word,
+    or None if there are no words. Quoting each word keeps FTS5 operators
+    and stray punctuation in the input from being parsed as query syntax.
+    """
+    words = _WORD_RE.findall(search)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words)
@@ -1,11 +1,27 @@
 from backend.db_functions.ai_analysis.create_ai_analysis import create_ai_analysis
+from backend.db_functions.ai_analysis.delete_expired_ai_analyses import (
+    delete_expired_ai_analyses,
+)
 from backend.db_functions.ai_analysis.get_ai_analysis_by_id import get_ai_analysis_by_id
 from backend.db_functions.ai_analysis.get_ai_analysis_by_pending_post_id import (
     get_ai_analysis_by_pending_post_id,
 )
+from backend.db_functions.ai_analysis.get_cached_ai_analysis import (
+    get_cached_ai_analysis,
+)
+from backend.db_functions.ai_analysis.list_ai_analysis_timings import (
+    list_ai_analysis_timings,
+)
+from backend.db_functions.ai_analysis.update_ai_analysis_timings import (
+    update_ai_analysis_timings,
+)
 
 __all__ = [
     "create_ai_analysis",
+    "delete_expired_ai_analyses",
     "get_ai_analysis_by_id",
     "get_ai_analysis_by_pending_post_id",
+    "get_cached_ai_analysis",
+    "list_ai_analysis_timings",
+    "update_ai_analysis_timings",
 ]
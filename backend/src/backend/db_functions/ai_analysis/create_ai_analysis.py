@@ -1,3 +1,6 @@
+from typing import Any
+from typing import Dict
+
 from backend.db.models.ai_analysis import AIAnalysis
 from backend.schemas.ai_analysis import AIAnalysisCreate
 from backend.schemas.ai_analysis import AIAnalysisResponse
@@ -7,17 +10,41 @@ async def create_ai_analysis(
     analysis_data: AIAnalysisCreate,
 ) -> AIAnalysisResponse:
     """
-    Create a new AI analysis record.
+    Create the AI analysis record for a pending post.
+
+    A moderation job retried after its analysis was stored (e.g. because
+    approving the post failed) replaces that analysis rather than adding a
+    second one, so each pending post keeps a single analysis.
     """
-    # Create the AI analysis
-    ai_analysis = await AIAnalysis.create(
-        pending_post_id=analysis_data.pending_post_id,
-        decision=analysis_data.decision,
-        confidence_score=analysis_data.confidence_score,
-        analysis_text=analysis_data.analysis_text,
-        feedback_text=analysis_data.feedback_text,
-        processing_time_ms=analysis_data.processing_time_ms,
+    fields: Dict[str, Any] = {
+        "decision": analysis_data.decision,
+        "confidence_score": analysis_data.confidence_score,
+        "analysis_text": analysis_data.analysis_text,
+        "feedback_text": analysis_data.feedback_text,
+        "processing_time_ms": analysis_data.processing_time_ms,
+        "content_hash": analysis_data.content_hash,
+        "cache_hit": analysis_data.cache_hit,
+        "queue_wait_ms": analysis_data.queue_wait_ms,
+        "db_fetch_ms": analysis_data.db_fetch_ms,
+        "prefilter_ms": analysis_data.prefilter_ms,
+        "llm_ms": analysis_data.llm_ms,
+        "persist_ms": analysis_data.persist_ms,
+        "action_ms": analysis_data.action_ms,
+    }
+
+    # Replace the analysis an earlier attempt stored, if there is one
+    ai_analysis = (
+        await AIAnalysis.filter(pending_post_id=analysis_data.pending_post_id)
+        .order_by("-created_at")
+        .first()
     )
+    if ai_analysis is not None:
+        ai_analysis.update_from_dict(fields)
+        await ai_analysis.save()
+    else:
+        ai_analysis = await AIAnalysis.create(
+            pending_post_id=analysis_data.pending_post_id, **fields
+        )
 
     # Convert to schema
     return AIAnalysisResponse(
@@ -28,6 +55,14 @@ async def create_ai_analysis(
         analysis_text=ai_analysis.analysis_text,
         feedback_text=ai_analysis.feedback_text,
         processing_time_ms=ai_analysis.processing_time_ms,
+        content_hash=ai_analysis.content_hash,
+        cache_hit=ai_analysis.cache_hit,
+        queue_wait_ms=ai_analysis.queue_wait_ms,
+        db_fetch_ms=ai_analysis.db_fetch_ms,
+        prefilter_ms=ai_analysis.prefilter_ms,
+        llm_ms=ai_analysis.llm_ms,
+        persist_ms=ai_analysis.persist_ms,
+        action_ms=ai_analysis.action_ms,
         created_at=ai_analysis.created_at,
         updated_at=ai_analysis.updated_at,
     )
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from backend.db.models.ai_analysis import AIAnalysis
+
+
+async def delete_expired_ai_analyses(created_before: datetime) -> int:
+    """
+    Delete analyses whose pending post is gone and that are too old to serve
+    as cached decisions. Analyses of posts still awaiting a decision are kept.
+
+    Returns:
+        int: Number of analyses deleted
+    """
+    return await AIAnalysis.filter(
+        pending_post_id__isnull=True,
+        created_at__lt=created_before,
+    ).delete()
@@ -16,12 +16,20 @@ async def get_ai_analysis_by_id(analysis_id: UUID) -> AIAnalysisResponse:
     # Convert to schema
     return AIAnalysisResponse(
         id=ai_analysis.id,
-        pending_post_id=ai_analysis.pending_post.id,
+        pending_post_id=ai_analysis.pending_post_id,
         decision=ai_analysis.decision,
         confidence_score=ai_analysis.confidence_score,
         analysis_text=ai_analysis.analysis_text,
         feedback_text=ai_analysis.feedback_text,
         processing_time_ms=ai_analysis.processing_time_ms,
+        content_hash=ai_analysis.content_hash,
+        cache_hit=ai_analysis.cache_hit,
+        queue_wait_ms=ai_analysis.queue_wait_ms,
+        db_fetch_ms=ai_analysis.db_fetch_ms,
+        prefilter_ms=ai_analysis.prefilter_ms,
+        llm_ms=ai_analysis.llm_ms,
+        persist_ms=ai_analysis.persist_ms,
+        action_ms=ai_analysis.action_ms,
         created_at=ai_analysis.created_at,
         updated_at=ai_analysis.updated_at,
     )
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Optional
+
+from backend.db.models.ai_analysis import AIAnalysis
+from backend.schemas.ai_analysis import AIAnalysisResponse
+
+
+async def get_cached_ai_analysis(
+    content_hash: str,
+    created_after: datetime,
+) -> Optional[AIAnalysisResponse]:
+    """
+    Get the latest fresh AI analysis of identical content, if any.
+    Only analyses that ran the full pipeline count, so a cached decision
+    never outlives the TTL of the analysis it was copied from.
+    """
+    ai_analysis = (
+        await AIAnalysis.filter(
+            content_hash=content_hash,
+            cache_hit=False,
+            created_at__gte=created_after,
+        )
+        .order_by("-created_at")
+        .first()
+    )
+
+    if not ai_analysis:
+        return None
+
+    # Convert to schema
+    return AIAnalysisResponse(
+        id=ai_analysis.id,
+        pending_post_id=ai_analysis.pending_post_id,
+        decision=ai_analysis.decision,
+        confidence_score=ai_analysis.confidence_score,
+        analysis_text=ai_analysis.analysis_text,
+        feedback_text=ai_analysis.feedback_text,
+        processing_time_ms=ai_analysis.processing_time_ms,
+        content_hash=ai_analysis.content_hash,
+        cache_hit=ai_analysis.cache_hit,
+        queue_wait_ms=ai_analysis.queue_wait_ms,
+        db_fetch_ms=ai_analysis.db_fetch_ms,
+        prefilter_ms=ai_analysis.prefilter_ms,
+        llm_ms=ai_analysis.llm_ms,
+        persist_ms=ai_analysis.persist_ms,
+        action_ms=ai_analysis.action_ms,
+        created_at=ai_analysis.created_at,
+        updated_at=ai_analysis.updated_at,
+    )
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from backend.db.models.ai_analysis import AIAnalysis
+
+# Stage timing columns, see backend.utils.ai_moderation.timings
+TIMING_FIELDS = (
+    "queue_wait_ms",
+    "db_fetch_ms",
+    "prefilter_ms",
+    "llm_ms",
+    "persist_ms",
+    "action_ms",
+)
+
+
+async def list_ai_analysis_timings(since: datetime) -> List[Dict[str, Optional[int]]]:
+    """
+    Get the stage timings of every analysis stored at or after ``since``,
+    whichever process moderated the post.
+    """
+    return await AIAnalysis.filter(created_at__gte=since).values(*TIMING_FIELDS)
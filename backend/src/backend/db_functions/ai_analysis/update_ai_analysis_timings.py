@@ -0,0 +1,18 @@
+from typing import Optional
+from uuid import UUID
+
+from backend.db.models.ai_analysis import AIAnalysis
+
+
+async def update_ai_analysis_timings(
+    analysis_id: UUID,
+    persist_ms: Optional[int],
+    action_ms: Optional[int],
+) -> None:
+    """
+    Record the timings of the stages that run after an analysis is stored.
+    """
+    await AIAnalysis.filter(id=analysis_id).update(
+        persist_ms=persist_ms,
+        action_ms=action_ms,
+    )
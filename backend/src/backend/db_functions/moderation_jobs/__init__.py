@@ -0,0 +1,17 @@
+from backend.db_functions.moderation_jobs.claim_moderation_jobs import (
+    claim_moderation_jobs,
+)
+from backend.db_functions.moderation_jobs.complete_moderation_job import (
+    complete_moderation_job,
+)
+from backend.db_functions.moderation_jobs.enqueue_moderation_job import (
+    enqueue_moderation_job,
+)
+from backend.db_functions.moderation_jobs.fail_moderation_job import fail_moderation_job
+
+__all__ = [
+    "claim_moderation_jobs",
+    "complete_moderation_job",
+    "enqueue_moderation_job",
+    "fail_moderation_job",
+]
@@ -0,0 +1,102 @@
+# Standard library imports
+from datetime import datetime
+from datetime import timedelta
+from typing import List
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import F
+from tortoise.expressions import Q
+
+# Project-specific imports
+from backend.converters.moderation_job_to_schema import moderation_job_to_schema
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.schemas.moderation_job import ModerationJobSchema
+from backend.utils.datetime import now_utc
+
+# Claim due jobs, and jobs whose lease expired with their worker, in one
+# statement. SKIP LOCKED lets concurrent workers claim disjoint batches
+# instead of queueing behind each other's row locks.
+CLAIM_MODERATION_JOBS_SQL = """
+UPDATE "moderationjob"
+SET "status" = 'running',
+    "locked_by" = $1,
+    "locked_until" = $2,
+    "attempts" = "attempts" + 1,
+    "updated_at" = $3
+WHERE "id" IN (
+    SELECT "id"
+    FROM "moderationjob"
+    WHERE ("status" = 'queued' AND "available_at" <= $3)
+       OR ("status" = 'running' AND "locked_until" < $3)
+    ORDER BY "available_at"
+    LIMIT $4
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING "id"
+"""
+
+
+def _claimable(now: datetime) -> Q:
+    return Q(status=ModerationJobStatus.QUEUED, available_at__lte=now) | Q(
+        status=ModerationJobStatus.RUNNING, locked_until__lt=now
+    )
+
+
+async def _claim_portable(
+    worker_id: str, locked_until: datetime, now: datetime, limit: int
+) -> List[UUID]:
+    # Compare-and-set each candidate so two workers never claim the same job;
+    # a worker that loses the race simply updates zero rows
+    candidate_ids = await (
+        ModerationJob.filter(_claimable(now))
+        .order_by("available_at")
+        .limit(limit)
+        .values_list("id")
+    )
+
+    claimed_ids: List[UUID] = []
+    for (job_id,) in candidate_ids:
+        updated = await ModerationJob.filter(_claimable(now), id=job_id).update(
+            status=ModerationJobStatus.RUNNING,
+            locked_by=worker_id,
+            locked_until=locked_until,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if updated:
+            claimed_ids.append(job_id)
+    return claimed_ids
+
+
+async def claim_moderation_jobs(
+    worker_id: str,
+    limit: int = 1,
+    visibility_timeout_seconds: float = 120.0,
+) -> List[ModerationJobSchema]:
+    """
+    Lease up to ``limit`` due moderation jobs to a worker.
+
+    A claimed job is hidden from other workers until its lease runs out after
+    ``visibility_timeout_seconds``; if the worker dies before completing or
+    failing it, the job becomes claimable again.
+    """
+    now = now_utc()
+    locked_until = now + timedelta(seconds=visibility_timeout_seconds)
+
+    if is_postgres():
+        _, rows = await get_connection().execute_query(
+            CLAIM_MODERATION_JOBS_SQL, [worker_id, locked_until, now, limit]
+        )
+        claimed_ids = [row["id"] for row in rows]
+    else:
+        claimed_ids = await _claim_portable(worker_id, locked_until, now, limit)
+
+    if not claimed_ids:
+        return []
+
+    jobs = await ModerationJob.filter(id__in=claimed_ids).order_by("available_at")
+    return [await moderation_job_to_schema(job) for job in jobs]
@@ -0,0 +1,25 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.utils.datetime import now_utc
+
+
+async def complete_moderation_job(job_id: UUID, worker_id: str) -> bool:
+    """
+    Mark a job as done. Returns False if the worker no longer holds the lease.
+    """
+    updated = await ModerationJob.filter(
+        id=job_id,
+        status=ModerationJobStatus.RUNNING,
+        locked_by=worker_id,
+    ).update(
+        status=ModerationJobStatus.SUCCEEDED,
+        locked_by=None,
+        locked_until=None,
+        last_error=None,
+        updated_at=now_utc(),
+    )
+    return updated > 0
@@ -0,0 +1,22 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.converters.moderation_job_to_schema import moderation_job_to_schema
+from backend.db.models.moderation_job import ModerationJob
+from backend.schemas.moderation_job import ModerationJobSchema
+from backend.utils.datetime import now_utc
+
+
+async def enqueue_moderation_job(pending_post_id: UUID) -> ModerationJobSchema:
+    """
+    Queue a pending post for AI moderation.
+
+    Each pending post has at most one job, so enqueueing the same post twice
+    returns the existing job instead of moderating it twice.
+    """
+    job, _ = await ModerationJob.get_or_create(
+        pending_post_id=pending_post_id,
+        defaults={"available_at": now_utc()},
+    )
+    return await moderation_job_to_schema(job)
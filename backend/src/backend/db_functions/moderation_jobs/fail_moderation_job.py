@@ -0,0 +1,45 @@
+# Standard library imports
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.utils.datetime import now_utc
+
+
+async def fail_moderation_job(
+    job_id: UUID,
+    worker_id: str,
+    error: str,
+    retry_delay_seconds: Optional[float] = None,
+) -> bool:
+    """
+    Record a failed attempt and release the lease.
+
+    With a ``retry_delay_seconds`` the job is queued again once the delay has
+    passed; without one it is marked as permanently failed. Returns False if
+    the worker no longer holds the lease.
+    """
+    now = now_utc()
+    if retry_delay_seconds is None:
+        status = ModerationJobStatus.FAILED
+        available_at = now
+    else:
+        status = ModerationJobStatus.QUEUED
+        available_at = now + timedelta(seconds=retry_delay_seconds)
+
+    updated = await ModerationJob.filter(
+        id=job_id,
+        status=ModerationJobStatus.RUNNING,
+        locked_by=worker_id,
+    ).update(
+        status=status,
+        available_at=available_at,
+        locked_by=None,
+        locked_until=None,
+        last_error=error,
+        updated_at=now,
+    )
+    return updated > 0
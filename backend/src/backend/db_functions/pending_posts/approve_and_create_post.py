@@ -1,10 +1,17 @@
 import logging
 from typing import Optional
 from uuid import UUID
+from uuid import uuid4
+
+from tortoise.transactions import atomic
 
 from backend.db.models.pending_post import PendingPost
 from backend.db.models.post import Post
+from backend.db_functions.posts.adjust_reply_count import adjust_reply_count
 from backend.db_functions.posts.get_post_by_id import get_post_by_id
+from backend.db_functions.posts.get_post_tree_position import get_post_tree_position
+from backend.db_functions.search.index_post import index_post
+from backend.db_functions.topics.adjust_topic_post_count import adjust_topic_post_count
 from backend.db_functions.user_events.create_post_approval_event import (
     create_post_approval_event,
 )
@@ -12,6 +19,7 @@ from backend.db_functions.user_stats.increment_user_approval_count import (
     increment_user_approval_count,
 )
 from backend.schemas.post import PostResponse
+from backend.utils.page_cache import page_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +30,20 @@ async def approve_and_create_post(pending_post_id: UUID) -> Optional[PostRespons
     Deletes the pending post after creating the regular post.
 
     Also creates a user event to track the relationship between the pending post
-    and the approved post for future reference.
+    and the approved post for future reference. Runs in one transaction so the
+    denormalized reply, topic and user counters and the search index move
+    with the new post; once it commits, this process's cached copies of the
+    topic's pages are dropped, and other processes drop theirs on their next
+    page cache invalidation refresh.
     """
+    post = await _approve_and_create_post(pending_post_id)
+    if post:
+        page_cache.invalidate_topic(post.topic_id)
+    return post
+
+
+@atomic()
+async def _approve_and_create_post(pending_post_id: UUID) -> Optional[PostResponse]:
     pending_post = await PendingPost.get_or_none(id=pending_post_id)
     if not pending_post:
         logger.warning(f"Cannot approve pending post {pending_post_id}: not found")
@@ -33,16 +53,28 @@ async def approve_and_create_post(pending_post_id: UUID) -> Optional[PostRespons
     author = await pending_post.author
     topic = await pending_post.topic
 
-    # Create the regular post
+    # Create the regular post with its place in the thread tree
+    post_id = uuid4()
+    position = await get_post_tree_position(post_id, pending_post.parent_post_id)
     post = await Post.create(
+        id=post_id,
         content=pending_post.content,
         author=author,
         topic=topic,
         parent_post_id=pending_post.parent_post_id,
+        **position.model_dump(),
     )
 
     logger.info(f"Created approved post {post.id} from pending post {pending_post_id}")
 
+    # Make the post searchable as soon as it is visible
+    await index_post(post.id)
+
+    # Keep the denormalized counters in step with the new post
+    if pending_post.parent_post_id:
+        await adjust_reply_count(pending_post.parent_post_id, 1)
+    await adjust_topic_post_count(topic.id, 1)
+
     # Update user stats for post approval
     await increment_user_approval_count(author.id, post.id)
 
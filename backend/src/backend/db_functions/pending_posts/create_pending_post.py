@@ -2,14 +2,26 @@ from uuid import UUID
 
 from backend.converters.pending_post_to_schema import pending_post_to_schema
 from backend.db.models.pending_post import PendingPost
+from backend.db.models.post import Post
 from backend.schemas.pending_post import PendingPostCreate
 from backend.schemas.pending_post import PendingPostResponse
+from backend.utils.post_path import check_reply_depth
 
 
 async def create_pending_post(
     user_id: UUID,
     pending_post_data: PendingPostCreate,
 ) -> PendingPostResponse:
+    # Refuse an over-deep reply now rather than when it is approved
+    if pending_post_data.parent_post_id:
+        parent = (
+            await Post.filter(id=pending_post_data.parent_post_id)
+            .first()
+            .values("depth")
+        )
+        if parent:
+            check_reply_depth(parent["depth"] + 1)
+
     pending_post = await PendingPost.create(
         author_id=user_id,
         topic_id=pending_post_data.topic_id,
@@ -0,0 +1,31 @@
+# Standard library imports
+from uuid import UUID
+
+# Third-party imports
+from tortoise.functions import Count
+from tortoise.functions import Max
+
+# Project-specific imports
+from backend.db.models.pending_post import PendingPost
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.datetime import latest
+
+
+async def get_pending_posts_version(topic_id: UUID, user_id: UUID) -> ResourceVersion:
+    """
+    Version of a user's pending posts in a topic: how many there are and the
+    latest change to any. Approval and rejection delete pending posts, so
+    either shows up in the count.
+    """
+    row = (
+        await PendingPost.filter(topic_id=topic_id, author_id=user_id)
+        .annotate(count=Count("id"), last_modified=Max("updated_at"))
+        .first()
+        .values("count", "last_modified")
+    )
+    if not row:
+        return ResourceVersion(count=0)
+
+    return ResourceVersion(
+        count=row["count"], last_modified=latest(row["last_modified"])
+    )
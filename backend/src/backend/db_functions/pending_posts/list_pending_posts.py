@@ -7,6 +7,10 @@ from backend.converters.pending_post_to_schema import pending_post_to_schema
 from backend.db.models.pending_post import PendingPost
 from backend.schemas.pending_post import PendingPostList
 from backend.schemas.pending_post import PendingPostResponse
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def list_pending_posts(
@@ -14,6 +18,8 @@ async def list_pending_posts(
     topic_id: Optional[UUID] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> PendingPostList:
     filters = Q()
 
@@ -23,20 +29,20 @@ async def list_pending_posts(
     if topic_id:
         filters &= Q(topic_id=topic_id)
 
-    total_count = await PendingPost.filter(filters).count()
+    total = await count_rows(PendingPost.filter(filters), count_mode)
 
-    pending_posts = (
-        await PendingPost.filter(filters)
-        .limit(limit)
-        .offset(offset)
-        .order_by("-created_at")
+    page = await paginate(
+        PendingPost.filter(filters), limit, skip=offset, cursor=cursor
     )
 
     pending_post_schemas: list[PendingPostResponse] = []
-    for pending_post in pending_posts:
+    for pending_post in page.rows:
         pending_post_schemas.append(await pending_post_to_schema(pending_post))
 
     return PendingPostList(
         pending_posts=pending_post_schemas,
-        count=total_count,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
     )
@@ -1,6 +1,8 @@
 from typing import Optional
 from uuid import UUID
 
+from tortoise.transactions import atomic
+
 from backend.converters.rejected_post_to_schema import rejected_post_to_schema
 from backend.db.models.pending_post import PendingPost
 from backend.db.models.rejected_post import RejectedPost
@@ -10,12 +12,14 @@ from backend.db_functions.user_stats.increment_user_rejection_count import (
 from backend.schemas.rejected_post import RejectedPostResponse
 
 
+@atomic()
 async def reject_pending_post(
     pending_post_id: UUID, moderation_reason: str
 ) -> Optional[RejectedPostResponse]:
     """
     Rejects a pending post by creating a RejectedPost entry and deleting the
-    PendingPost.
+    PendingPost. Runs in one transaction so the author's rejected counter moves
+    with the new rejected post.
     """
     pending_post = await PendingPost.get_or_none(id=pending_post_id)
     if not pending_post:
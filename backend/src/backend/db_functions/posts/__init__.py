@@ -1,21 +1,27 @@
 from backend.db_functions.posts.create_post import create_post
 from backend.db_functions.posts.delete_post import delete_post
 from backend.db_functions.posts.get_post_by_id import get_post_by_id
+from backend.db_functions.posts.get_posts_version import get_posts_version
 from backend.db_functions.posts.get_reply_count import get_reply_count
 from backend.db_functions.posts.is_user_post_author import is_user_post_author
 from backend.db_functions.posts.list_post_replies import list_post_replies
 from backend.db_functions.posts.list_posts import list_posts
 from backend.db_functions.posts.list_posts_by_topic import list_posts_by_topic
+from backend.db_functions.posts.list_topic_ids_with_new_posts import (
+    list_topic_ids_with_new_posts,
+)
 from backend.db_functions.posts.update_post import update_post
 
 __all__ = [
     "create_post",
     "delete_post",
     "get_post_by_id",
+    "get_posts_version",
     "get_reply_count",
     "is_user_post_author",
     "list_post_replies",
     "list_posts",
     "list_posts_by_topic",
+    "list_topic_ids_with_new_posts",
     "update_post",
 ]
@@ -0,0 +1,15 @@
+# Standard library imports
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import F
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.utils.datetime import now_utc
+
+
+async def adjust_reply_count(post_id: UUID, delta: int) -> None:
+    await Post.filter(id=post_id).update(
+        reply_count=F("reply_count") + delta, updated_at=now_utc()
+    )
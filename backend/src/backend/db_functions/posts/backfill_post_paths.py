@@ -0,0 +1,90 @@
+# Standard library imports
+import logging
+from typing import Dict
+from typing import List
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.models.post import Post
+from backend.utils.post_path import build_post_path
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+BACKFILL_POST_PATHS_SQL = """
+WITH RECURSIVE tree(id, thread_root_id, depth, path) AS (
+    SELECT id, id, 0, replace(id::text, '-', '') || '/'
+    FROM "post"
+    WHERE parent_post_id IS NULL
+    UNION ALL
+    SELECT p.id, tree.thread_root_id, tree.depth + 1,
+           tree.path || replace(p.id::text, '-', '') || '/'
+    FROM "post" p
+    JOIN tree ON p.parent_post_id = tree.id
+)
+UPDATE "post"
+SET thread_root_id = tree.thread_root_id, depth = tree.depth, path = tree.path
+FROM tree
+WHERE "post".id = tree.id
+"""
+
+
+async def _backfill_by_depth(batch_size: int) -> int:
+    updated = 0
+    # Parent path and thread root for every post on the previous level
+    frontier: Dict[UUID, tuple[str, UUID]] = {}
+    depth = 0
+
+    while True:
+        level: List[Post] = []
+        if depth == 0:
+            level.extend(await Post.filter(parent_post_id=None))
+        else:
+            # Chunk the parent ids to stay under SQLite's bound parameter limit
+            parent_ids = list(frontier.keys())
+            for start in range(0, len(parent_ids), batch_size):
+                chunk = parent_ids[start : start + batch_size]
+                level.extend(await Post.filter(parent_post_id__in=chunk))
+        if not level:
+            break
+
+        next_frontier: Dict[UUID, tuple[str, UUID]] = {}
+        for post in level:
+            parent_path, thread_root_id = frontier.get(
+                post.parent_post_id,  # type: ignore[attr-defined]
+                ("", post.id),
+            )
+            post.thread_root_id = thread_root_id
+            post.depth = depth
+            post.path = build_post_path(parent_path, post.id)
+            next_frontier[post.id] = (post.path, thread_root_id)
+
+        await Post.bulk_update(
+            level, fields=["thread_root_id", "depth", "path"], batch_size=batch_size
+        )
+        updated += len(level)
+        frontier = next_frontier
+        depth += 1
+
+    return updated
+
+
+async def backfill_post_paths(batch_size: int = 500) -> int:
+    """
+    Recompute thread_root_id, depth and path for every post from parent_post.
+
+    Args:
+        batch_size: Number of rows per UPDATE when walking the tree level by level
+
+    Returns:
+        Number of posts updated
+    """
+    if is_postgres():
+        updated, _ = await get_connection().execute_query(BACKFILL_POST_PATHS_SQL)
+    else:
+        updated = await _backfill_by_depth(batch_size)
+
+    logger.info(f"Backfilled materialized paths for {updated} posts")
+    return int(updated)
@@ -2,13 +2,25 @@
 from typing import Optional
 from typing import Union
 from uuid import UUID
+from uuid import uuid4
+
+# Third-party imports
+from tortoise.transactions import atomic
 
 # Project-specific imports
 from backend.converters import post_to_schema
 from backend.db.models.post import Post
+from backend.db_functions.posts.adjust_reply_count import adjust_reply_count
+from backend.db_functions.posts.get_post_tree_position import get_post_tree_position
+from backend.db_functions.search.index_post import index_post
+from backend.db_functions.topics.adjust_topic_post_count import adjust_topic_post_count
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
 from backend.schemas.post import PostResponse
 
 
+@atomic()
 async def create_post(
     content: str,
     author_id: UUID,
@@ -16,7 +28,8 @@ async def create_post(
     parent_post_id: Optional[UUID] = None,
 ) -> PostResponse:
     """
-    Create a new post.
+    Create a new post and update the denormalized reply, topic and user
+    counters and the search index in the same transaction.
 
     Args:
         content: The content of the post
@@ -27,14 +40,26 @@ async def create_post(
     Returns:
         PostResponse representing the newly created post
     """
-    post_data: dict[str, Union[str, UUID, Optional[UUID]]] = {
+    post_id = uuid4()
+    position = await get_post_tree_position(post_id, parent_post_id)
+
+    post_data: dict[str, Union[str, int, UUID, Optional[UUID]]] = {
+        "id": post_id,
         "content": content,
         "author_id": author_id,
         "topic_id": topic_id,
+        **position.model_dump(),
     }
 
     if parent_post_id:
         post_data["parent_post_id"] = parent_post_id
 
     post = await Post.create(using_db=None, **post_data)
+
+    if parent_post_id:
+        await adjust_reply_count(parent_post_id, 1)
+    await adjust_topic_post_count(topic_id, 1)
+    await adjust_user_post_counts(author_id, approved_delta=1)
+    await index_post(post_id)
+
     return await post_to_schema(post)
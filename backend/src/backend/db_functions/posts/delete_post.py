@@ -1,13 +1,44 @@
 # Standard library imports
+from collections import Counter
 from uuid import UUID
 
+# Third-party imports
+from tortoise.transactions import atomic
+
 # Project-specific imports
 from backend.db.models.post import Post
+from backend.db_functions.posts.adjust_reply_count import adjust_reply_count
+from backend.db_functions.topics.adjust_topic_post_count import adjust_topic_post_count
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
+from backend.utils.post_path import subtree_path_filter
 
 
+@atomic()
 async def delete_post(post_id: UUID) -> bool:
     post = await Post.get_or_none(id=post_id)
     if post:
+        # Replies cascade with the post, so every author in the subtree loses a post
+        author_ids: list[UUID] = [post.author_id]  # type: ignore[attr-defined]
+        if post.path:
+            author_ids = [
+                author_id
+                for (author_id,) in await Post.filter(
+                    **subtree_path_filter(post.path)
+                ).values_list("author_id")
+            ]
+
         await post.delete()
+
+        parent_post_id = post.parent_post_id  # type: ignore[attr-defined]
+        if parent_post_id:
+            await adjust_reply_count(parent_post_id, -1)
+        await adjust_topic_post_count(
+            post.topic_id,  # type: ignore[attr-defined]
+            -len(author_ids),
+        )
+        for author_id, count in Counter(author_ids).items():
+            await adjust_user_post_counts(author_id, approved_delta=-count)
         return True
     return False
@@ -0,0 +1,50 @@
+# Standard library imports
+from typing import Optional
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.schemas.post import PostTreePosition
+from backend.utils.post_path import build_post_path
+from backend.utils.post_path import check_reply_depth
+
+
+async def get_post_tree_position(
+    post_id: UUID, parent_post_id: Optional[UUID] = None
+) -> PostTreePosition:
+    """
+    Work out the thread root, depth and materialized path for a new post.
+
+    Args:
+        post_id: The UUID the new post will be created with
+        parent_post_id: Optional UUID of the parent post if this is a reply
+
+    Returns:
+        PostTreePosition to store on the new post
+
+    Raises:
+        ValidationError: If the reply would be nested too deep to store
+    """
+    root_position = PostTreePosition(
+        thread_root_id=post_id,
+        depth=0,
+        path=build_post_path("", post_id),
+    )
+    if not parent_post_id:
+        return root_position
+
+    parent = (
+        await Post.filter(id=parent_post_id)
+        .first()
+        .values("thread_root_id", "depth", "path")
+    )
+    if not parent:
+        return root_position
+
+    depth = parent["depth"] + 1
+    check_reply_depth(depth)
+    return PostTreePosition(
+        thread_root_id=parent["thread_root_id"] or parent_post_id,
+        depth=depth,
+        path=build_post_path(parent["path"], post_id),
+    )
@@ -0,0 +1,62 @@
+# Standard library imports
+from typing import Optional
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import Subquery
+from tortoise.functions import Count
+from tortoise.functions import Max
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.user import User
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.datetime import latest
+
+
+async def get_posts_version(
+    topic_id: Optional[UUID] = None,
+    author_id: Optional[UUID] = None,
+) -> ResourceVersion:
+    """
+    Version of the posts list_posts would return for the same filters, in one
+    aggregate query: the number of posts and the latest change to any of
+    them or their authors.
+
+    Args:
+        topic_id: Optional filter by topic ID
+        author_id: Optional filter by author ID
+
+    Returns:
+        ResourceVersion for the filtered posts
+    """
+    query = Post.all()
+
+    if topic_id:
+        query = query.filter(topic_id=topic_id)
+
+    if author_id:
+        query = query.filter(author_id=author_id)
+
+    authors_updated_at = (
+        User.filter(id__in=Subquery(query.values("author_id")))
+        .annotate(last_modified=Max("updated_at"))
+        .values("last_modified")
+    )
+    row = (
+        await query.annotate(
+            count=Count("id"),
+            last_modified=Max("updated_at"),
+            authors_last_modified=Subquery(authors_updated_at),
+        )
+        .first()
+        .values("count", "last_modified", "authors_last_modified")
+    )
+
+    if not row:
+        return ResourceVersion(count=0)
+
+    return ResourceVersion(
+        count=row["count"],
+        last_modified=latest(row["last_modified"], row["authors_last_modified"]),
+    )
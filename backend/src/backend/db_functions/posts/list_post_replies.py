@@ -2,13 +2,15 @@
 from uuid import UUID
 
 # Project-specific imports
-from backend.converters import post_to_schema
+from backend.converters import posts_to_schemas
 from backend.db.models.post import Post
 from backend.schemas.post import PostList
-from backend.schemas.post import PostResponse
+from backend.utils.post_path import subtree_path_filter
 
 
-async def list_post_replies(post_id: UUID, skip: int = 0, limit: int = 20) -> PostList:
+async def list_post_replies(
+    post_id: UUID, skip: int = 0, limit: int = 20, nested: bool = False
+) -> PostList:
     """
     List replies to a specific post with pagination.
 
@@ -16,11 +18,21 @@ async def list_post_replies(post_id: UUID, skip: int = 0, limit: int = 20) -> Po
         post_id: The UUID of the parent post
         skip: Number of records to skip for pagination
         limit: Maximum number of records to return
+        nested: Include replies at every depth below the post, not just direct ones
 
     Returns:
         PostList containing the reply posts and total count
     """
-    query = Post.filter(parent_post_id=post_id)
+    if nested:
+        parent = await Post.filter(id=post_id).first().values("path", "depth")
+        if not parent:
+            return PostList(posts=[], count=0)
+        # Every descendant's materialized path starts with the parent's path
+        query = Post.filter(
+            **subtree_path_filter(parent["path"]), depth__gt=parent["depth"]
+        ).order_by("created_at")
+    else:
+        query = Post.filter(parent_post_id=post_id)
 
     # Get total count for pagination
     count = await query.count()
@@ -28,9 +40,7 @@ async def list_post_replies(post_id: UUID, skip: int = 0, limit: int = 20) -> Po
     # Apply pagination
     replies = await query.offset(skip).limit(limit)
 
-    # Convert ORM models to schema objects using async converter
-    reply_responses: list[PostResponse] = []
-    for reply in replies:
-        reply_responses.append(await post_to_schema(reply))
+    # Convert ORM models to schema objects in a fixed number of queries
+    reply_responses = await posts_to_schemas(list(replies))
 
     return PostList(posts=reply_responses, count=count)
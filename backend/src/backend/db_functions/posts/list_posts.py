@@ -3,10 +3,13 @@ from typing import Optional
 from uuid import UUID
 
 # Project-specific imports
-from backend.converters import post_to_schema
+from backend.converters import posts_to_schemas
 from backend.db.models.post import Post
 from backend.schemas.post import PostList
-from backend.schemas.post import PostResponse
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def list_posts(
@@ -14,15 +17,19 @@ async def list_posts(
     limit: int = 20,
     topic_id: Optional[UUID] = None,
     author_id: Optional[UUID] = None,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> PostList:
     """
-    List posts with pagination and optional filters.
+    List posts, newest first, with pagination and optional filters.
 
     Args:
         skip: Number of records to skip for pagination
         limit: Maximum number of records to return
         topic_id: Optional filter by topic ID
         author_id: Optional filter by author ID
+        cursor: Optional cursor to page from instead of skipping records
+        count_mode: How to count the total matching rows
 
     Returns:
         PostList containing the posts and total count
@@ -37,14 +44,18 @@ async def list_posts(
         query = query.filter(author_id=author_id)
 
     # Get total count for pagination
-    count = await query.count()
+    total = await count_rows(query, count_mode)
 
     # Apply pagination
-    posts = await query.offset(skip).limit(limit)
-
-    # Convert ORM models to schema objects using async converter
-    post_responses: list[PostResponse] = []
-    for post in posts:
-        post_responses.append(await post_to_schema(post))
-
-    return PostList(posts=post_responses, count=count)
+    page = await paginate(query, limit, skip=skip, cursor=cursor)
+
+    # Convert ORM models to schema objects in a fixed number of queries
+    post_responses = await posts_to_schemas(page.rows)
+
+    return PostList(
+        posts=post_responses,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
+    )
@@ -2,10 +2,9 @@
 from uuid import UUID
 
 # Project-specific imports
-from backend.converters import post_to_schema
+from backend.converters import posts_to_schemas
 from backend.db.models.post import Post
 from backend.schemas.post import PostList
-from backend.schemas.post import PostResponse
 
 
 async def list_posts_by_topic(
@@ -20,9 +19,7 @@ async def list_posts_by_topic(
     # Apply pagination
     posts = await query.offset(skip).limit(limit).order_by("-created_at")
 
-    # Convert ORM models to schema objects
-    post_responses: list[PostResponse] = []
-    for post in posts:
-        post_responses.append(await post_to_schema(post))
+    # Convert ORM models to schema objects in a fixed number of queries
+    post_responses = await posts_to_schemas(list(posts))
 
     return PostList(posts=post_responses, count=count)
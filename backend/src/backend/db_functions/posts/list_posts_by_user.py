@@ -3,9 +3,8 @@ from typing import List
 from typing import Union
 import uuid
 
-from backend.converters.post_to_schema import post_to_schema
-
 # Project-specific imports
+from backend.converters.posts_to_schemas import posts_to_schemas
 from backend.db.models.post import Post
 from backend.schemas.post import PostResponse
 
@@ -38,5 +37,5 @@ async def list_posts_by_user(
     # Get posts with pagination
     posts = await base_query.order_by("-created_at").offset(offset).limit(limit).all()
 
-    # Convert to schema objects
-    return [await post_to_schema(post) for post in posts]
+    # Convert to schema objects in a fixed number of queries
+    return await posts_to_schemas(list(posts))
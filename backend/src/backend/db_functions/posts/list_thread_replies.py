@@ -0,0 +1,84 @@
+# Standard library imports
+from collections import defaultdict
+import logging
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import Q
+
+# Project-specific imports
+from backend.converters import posts_to_schemas
+from backend.db.models.post import Post
+from backend.schemas.post import PostResponse
+from backend.utils.post_path import subtree_path_filter
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+def _apply_reply_cap(
+    root_post_ids: List[UUID],
+    replies: List[Post],
+    max_replies_per_post: int,
+) -> List[Post]:
+    # Replies arrive ordered by depth then creation time, so a parent is always
+    # decided before its children and a dropped parent drops its whole subtree
+    kept_ids: Set[UUID] = set(root_post_ids)
+    kept_per_parent: Dict[UUID, int] = defaultdict(int)
+    kept: List[Post] = []
+    for reply in replies:
+        parent_id = reply.parent_post_id  # type: ignore[attr-defined]
+        if parent_id not in kept_ids:
+            continue
+        if kept_per_parent[parent_id] >= max_replies_per_post:
+            continue
+        kept_per_parent[parent_id] += 1
+        kept_ids.add(reply.id)
+        kept.append(reply)
+    return kept
+
+
+async def list_thread_replies(
+    root_post_ids: List[UUID],
+    max_depth: Optional[int] = None,
+    max_replies_per_post: Optional[int] = None,
+) -> List[PostResponse]:
+    """
+    Load every reply under the given root posts as a flat list ordered by
+    creation time. Each reply carries its parent_post_id, so the caller can
+    assemble the tree with utils.thread_builder.attach_replies.
+
+    Subtrees are read with one range scan on the materialized path, so only
+    the requested subtrees are touched, never the rest of the topic.
+    """
+    if not root_post_ids:
+        return []
+
+    roots = await Post.filter(id__in=root_post_ids).values_list("path", "depth")
+
+    subtree_filters = []
+    for path, depth in roots:
+        subtree_filter = Q(**subtree_path_filter(path), depth__gt=depth)
+        if max_depth is not None:
+            subtree_filter &= Q(depth__lte=depth + max_depth)
+        subtree_filters.append(subtree_filter)
+
+    if not subtree_filters:
+        return []
+
+    replies = list(
+        await Post.filter(Q(*subtree_filters, join_type="OR")).order_by(
+            "depth", "created_at"
+        )
+    )
+
+    if max_replies_per_post is not None:
+        replies = _apply_reply_cap(root_post_ids, replies, max_replies_per_post)
+
+    replies.sort(key=lambda reply: reply.created_at)
+    logger.debug(f"Loaded {len(replies)} replies under {len(root_post_ids)} roots")
+    return await posts_to_schemas(replies)
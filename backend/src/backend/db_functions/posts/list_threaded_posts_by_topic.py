@@ -1,21 +1,27 @@
 # Standard library imports
 import logging
-from typing import Dict
 from typing import List
+from typing import Optional
 from uuid import UUID
 
 # Project-specific imports
-from backend.converters import post_to_schema
+from backend.converters import posts_to_schemas
 from backend.db.models.post import Post
+from backend.db_functions.posts.list_thread_replies import list_thread_replies
 from backend.schemas.post import PostList
 from backend.schemas.post import PostResponse
+from backend.utils.thread_builder import attach_replies
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
 async def list_threaded_posts_by_topic(
-    topic_id: UUID, skip: int = 0, limit: int = 20
+    topic_id: UUID,
+    skip: int = 0,
+    limit: int = 20,
+    max_depth: Optional[int] = None,
+    max_replies_per_post: Optional[int] = None,
 ) -> PostList:
     """
     List posts for a topic in a threaded structure with pagination.
@@ -24,6 +30,8 @@ async def list_threaded_posts_by_topic(
         topic_id: The ID of the topic to retrieve posts for
         skip: Number of top-level posts to skip for pagination
         limit: Maximum number of top-level posts to return
+        max_depth: Optional number of reply levels to load below each top-level post
+        max_replies_per_post: Optional cap on the replies loaded for any single post
 
     Returns:
         A PostList containing top-level posts with their replies
@@ -37,47 +45,16 @@ async def list_threaded_posts_by_topic(
     # Apply pagination to top-level posts
     top_level_posts = await query.offset(skip).limit(limit).order_by("-created_at")
 
-    # Convert top-level posts to schema objects
-    post_responses: List[PostResponse] = []
-    post_id_map: Dict[UUID, PostResponse] = {}
+    # Convert top-level posts to schema objects in a fixed number of queries
+    post_responses: List[PostResponse] = await posts_to_schemas(list(top_level_posts))
 
-    # First, process all top-level posts
-    for post in top_level_posts:
-        post_schema = await post_to_schema(post)
-        post_responses.append(post_schema)
-        post_id_map[post.id] = post_schema
-
-    # Now fetch ALL replies for the topic (not just direct replies to top-level posts)
-    # This allows us to build the complete threading structure
-    if top_level_posts:
-        # Get all posts for this topic that are replies (have a parent)
-        all_replies = (
-            await Post.filter(topic_id=topic_id)
-            .exclude(parent_post=None)
-            .order_by("created_at")
-        )
-
-        # Convert all replies to schema objects
-        reply_schemas = []
-        for reply in all_replies:
-            reply_schema = await post_to_schema(reply)
-            reply_schemas.append(reply_schema)
-            post_id_map[reply.id] = reply_schema
-
-        # Now organize all replies into their proper parent-child relationships
-        for reply in all_replies:
-            reply_schema = post_id_map[reply.id]
-
-            # If the parent is in our map (either a top-level post or another reply)
-            if reply.parent_post and reply.parent_post.id in post_id_map:
-                parent = post_id_map[reply.parent_post.id]
-
-                # Initialize replies list if it doesn't exist
-                if not hasattr(parent, "replies"):
-                    parent.replies = []
-
-                # Add this reply to the parent's replies
-                parent.replies.append(reply_schema)
+    # Only load the subtrees under the top-level posts on this page
+    replies = await list_thread_replies(
+        [post.id for post in post_responses],
+        max_depth=max_depth,
+        max_replies_per_post=max_replies_per_post,
+    )
+    attach_replies(post_responses, replies)
 
     logger.debug(f"Retrieved {len(post_responses)} threaded posts for topic {topic_id}")
     return PostList(posts=post_responses, count=count)
@@ -0,0 +1,13 @@
+# Standard library imports
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.post import Post
+
+
+async def list_topic_ids_with_new_posts(since: datetime) -> List[UUID]:
+    """Return the topics that gained a post at or after ``since``."""
+    rows = await Post.filter(created_at__gte=since).distinct().values("topic_id")
+    return [row["topic_id"] for row in rows]
@@ -5,6 +5,7 @@ from uuid import UUID
 # Project-specific imports
 from backend.converters import post_to_schema
 from backend.db.models.post import Post
+from backend.db_functions.search.index_post import index_post
 from backend.schemas.post import PostResponse
 
 
@@ -13,5 +14,6 @@ async def update_post(post_id: UUID, content: str) -> Optional[PostResponse]:
     if post:
         post.content = content
         await post.save()
+        await index_post(post.id)
         return await post_to_schema(post)
     return None
@@ -0,0 +1,7 @@
+from backend.db_functions.rate_limits.acquire_rate_limit import acquire_rate_limit
+from backend.db_functions.rate_limits.prune_rate_limits import prune_rate_limits
+
+__all__ = [
+    "acquire_rate_limit",
+    "prune_rate_limits",
+]
@@ -0,0 +1,72 @@
+# Standard library imports
+from typing import Tuple
+
+# Third-party imports
+from tortoise.transactions import in_transaction
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.models.rate_limit_bucket import RateLimitBucket
+
+# Advance the client's theoretical arrival time in one statement, unless
+# that would put it more than a window ahead of now. No row comes back when
+# the request is over the limit. The parameters are cast because Postgres
+# cannot infer a type for an untyped parameter in arithmetic.
+ACQUIRE_RATE_LIMIT_SQL = """
+INSERT INTO "ratelimitbucket" ("key", "tat")
+VALUES ($1, $2::double precision + $3::double precision)
+ON CONFLICT ("key") DO UPDATE
+SET "tat" = GREATEST("ratelimitbucket"."tat", $2::double precision)
+    + $3::double precision
+WHERE GREATEST("ratelimitbucket"."tat", $2::double precision)
+    + $3::double precision - $2::double precision <= $4::double precision
+RETURNING "tat"
+"""
+
+
+async def _acquire_portable(
+    key: str, emission_interval: float, window_seconds: float, now: float
+) -> Tuple[bool, float]:
+    async with in_transaction():
+        bucket = await RateLimitBucket.select_for_update().get_or_none(key=key)
+        tat = max(bucket.tat, now) if bucket else now
+        if tat + emission_interval - now > window_seconds:
+            return False, tat
+
+        if bucket is None:
+            await RateLimitBucket.create(key=key, tat=tat + emission_interval)
+        else:
+            bucket.tat = tat + emission_interval
+            await bucket.save(update_fields=["tat"])
+        return True, tat + emission_interval
+
+
+async def acquire_rate_limit(
+    key: str, emission_interval: float, window_seconds: float, now: float
+) -> Tuple[bool, float]:
+    """
+    Take one request from a client's GCRA allowance.
+
+    Args:
+        key: The client and rule being limited
+        emission_interval: Seconds one request uses up, window / limit
+        window_seconds: How far ahead of now the allowance may run
+        now: The current epoch time
+
+    Returns:
+        Tuple[bool, float]: (allowed, the client's theoretical arrival time
+        after this request)
+    """
+    if not is_postgres():
+        return await _acquire_portable(key, emission_interval, window_seconds, now)
+
+    connection = get_connection()
+    _, rows = await connection.execute_query(
+        ACQUIRE_RATE_LIMIT_SQL, [key, now, emission_interval, window_seconds]
+    )
+    if rows:
+        return True, float(rows[0]["tat"])
+
+    bucket = await RateLimitBucket.get_or_none(key=key)
+    return False, bucket.tat if bucket else now
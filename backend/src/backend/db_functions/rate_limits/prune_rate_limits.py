@@ -0,0 +1,9 @@
+from backend.db.models.rate_limit_bucket import RateLimitBucket
+
+
+async def prune_rate_limits(before: float) -> int:
+    """
+    Delete rate limit rows whose allowance has fully refilled by ``before``.
+    They hold no state, so a client that returns starts from a fresh row.
+    """
+    return await RateLimitBucket.filter(tat__lt=before).delete()
@@ -6,20 +6,28 @@ from backend.converters.rejected_post_to_schema import rejected_post_to_schema
 from backend.db.models.rejected_post import RejectedPost
 from backend.schemas.rejected_post import RejectedPostList
 from backend.schemas.rejected_post import RejectedPostResponse
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def list_rejected_posts(
     user_id: Optional[UUID] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> RejectedPostList:
     """
-    List rejected posts with pagination.
+    List rejected posts, newest first, with pagination.
 
     Args:
         user_id: Optional user ID to filter by
         limit: Maximum number of results to return
         offset: Number of results to skip
+        cursor: Optional cursor to page from instead of skipping results
+        count_mode: How to count the total matching rows
 
     Returns:
         RejectedPostList: List of rejected posts with pagination metadata
@@ -27,17 +35,20 @@ async def list_rejected_posts(
     query = RejectedPost.all()
 
     if user_id:
-        query = query.filter(user_id=user_id)
+        query = query.filter(author_id=user_id)
 
-    count = await query.count()
+    total = await count_rows(query, count_mode)
 
-    rejected_posts = await query.order_by("-created_at").offset(offset).limit(limit)
+    page = await paginate(query, limit, skip=offset, cursor=cursor)
 
     rejected_post_responses: List[RejectedPostResponse] = [
-        await rejected_post_to_schema(rejected_post) for rejected_post in rejected_posts
+        await rejected_post_to_schema(rejected_post) for rejected_post in page.rows
     ]
 
     return RejectedPostList(
         rejected_posts=rejected_post_responses,
-        count=count,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
     )
@@ -0,0 +1,11 @@
+from backend.db_functions.search.index_post import index_post
+from backend.db_functions.search.index_topic import index_topic
+from backend.db_functions.search.reindex_search import reindex_search
+from backend.db_functions.search.search_content import search_content
+
+__all__ = [
+    "index_post",
+    "index_topic",
+    "reindex_search",
+    "search_content",
+]
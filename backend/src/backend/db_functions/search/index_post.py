@@ -0,0 +1,37 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.search_index import POST_SEARCH_VECTOR_SQL
+from backend.db.search_index import SQLITE_DELETE_ENTRY_SQL
+
+INDEX_POST_SQL = f"""
+UPDATE "post" SET "search_vector" = {POST_SEARCH_VECTOR_SQL} WHERE "id" = $1
+"""
+
+INDEX_POST_SQLITE_SQL = """
+INSERT INTO "search_index" ("kind", "object_id", "title", "body")
+SELECT 'post', "id", '', "content" FROM "post" WHERE "id" = ?
+"""
+
+
+async def index_post(post_id: UUID) -> None:
+    """
+    Bring a post's search index entry up to date with its content.
+
+    Called as a post is approved or edited, inside the same transaction where
+    there is one, so a post is searchable as soon as it is visible.
+
+    Args:
+        post_id: The UUID of the post to index
+    """
+    if is_postgres():
+        await get_connection().execute_query(INDEX_POST_SQL, [post_id])
+        return
+
+    await get_connection().execute_query(
+        SQLITE_DELETE_ENTRY_SQL, ["post", str(post_id)]
+    )
+    await get_connection().execute_query(INDEX_POST_SQLITE_SQL, [str(post_id)])
@@ -0,0 +1,37 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.search_index import SQLITE_DELETE_ENTRY_SQL
+from backend.db.search_index import TOPIC_SEARCH_VECTOR_SQL
+
+INDEX_TOPIC_SQL = f"""
+UPDATE "topic" SET "search_vector" = {TOPIC_SEARCH_VECTOR_SQL} WHERE "id" = $1
+"""
+
+INDEX_TOPIC_SQLITE_SQL = """
+INSERT INTO "search_index" ("kind", "object_id", "title", "body")
+SELECT 'topic', "id", "title", coalesce("description", '')
+FROM "topic"
+WHERE "id" = ?
+"""
+
+
+async def index_topic(topic_id: UUID) -> None:
+    """
+    Bring a topic's search index entry up to date with its title and
+    description, as it is created or edited.
+
+    Args:
+        topic_id: The UUID of the topic to index
+    """
+    if is_postgres():
+        await get_connection().execute_query(INDEX_TOPIC_SQL, [topic_id])
+        return
+
+    await get_connection().execute_query(
+        SQLITE_DELETE_ENTRY_SQL, ["topic", str(topic_id)]
+    )
+    await get_connection().execute_query(INDEX_TOPIC_SQLITE_SQL, [str(topic_id)])
@@ -0,0 +1,74 @@
+# Standard library imports
+import logging
+
+# Third-party imports
+from tortoise.transactions import atomic
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.search_index import POST_SEARCH_VECTOR_SQL
+from backend.db.search_index import TOPIC_SEARCH_VECTOR_SQL
+
+logger = logging.getLogger(__name__)
+
+# Only rows whose vector has drifted are rewritten
+REINDEX_POSTS_SQL = f"""
+UPDATE "post" SET "search_vector" = {POST_SEARCH_VECTOR_SQL}
+WHERE "search_vector" IS DISTINCT FROM {POST_SEARCH_VECTOR_SQL}
+"""
+
+REINDEX_TOPICS_SQL = f"""
+UPDATE "topic" SET "search_vector" = {TOPIC_SEARCH_VECTOR_SQL}
+WHERE "search_vector" IS DISTINCT FROM {TOPIC_SEARCH_VECTOR_SQL}
+"""
+
+CLEAR_SQLITE_SQL = 'DELETE FROM "search_index"'
+
+REINDEX_TOPICS_SQLITE_SQL = """
+INSERT INTO "search_index" ("kind", "object_id", "title", "body")
+SELECT 'topic', "id", "title", coalesce("description", '') FROM "topic"
+"""
+
+REINDEX_POSTS_SQLITE_SQL = """
+INSERT INTO "search_index" ("kind", "object_id", "title", "body")
+SELECT 'post', "id", '', "content" FROM "post"
+"""
+
+COUNT_SQLITE_SQL = """
+SELECT count(*) AS "entries" FROM "search_index"
+"""
+
+# Merge the index b-trees now rather than as searches come in
+OPTIMIZE_SQLITE_SQL = """
+INSERT INTO "search_index" ("search_index") VALUES ('optimize')
+"""
+
+
+@atomic()
+async def reindex_search() -> int:
+    """
+    Rebuild the full-text search index from the posts and topics tables,
+    repairing any entries that missed an update.
+
+    Returns:
+        Number of index entries written; on Postgres only drifted rows are
+        rewritten
+    """
+    connection = get_connection()
+    if is_postgres():
+        topics, _ = await connection.execute_query(REINDEX_TOPICS_SQL)
+        posts, _ = await connection.execute_query(REINDEX_POSTS_SQL)
+        written = topics + posts
+    else:
+        # SQLite's change counts include FTS5's own bookkeeping, so count the
+        # entries once they are written
+        await connection.execute_query(CLEAR_SQLITE_SQL)
+        await connection.execute_query(REINDEX_TOPICS_SQLITE_SQL)
+        await connection.execute_query(REINDEX_POSTS_SQLITE_SQL)
+        await connection.execute_query(OPTIMIZE_SQLITE_SQL)
+        rows = await connection.execute_query_dict(COUNT_SQLITE_SQL)
+        written = rows[0]["entries"]
+
+    logger.info(f"Reindexed {written} search entries")
+    return int(written)
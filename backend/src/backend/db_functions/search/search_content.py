@@ -0,0 +1,160 @@
+# Standard library imports
+import html
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.db.search_index import SEARCH_CONFIG
+from backend.db.search_index import fts5_match_query
+from backend.schemas.search import SearchKind
+from backend.schemas.search import SearchResult
+from backend.schemas.search import SearchResultList
+
+# Snippets come back with the matches between these control characters, so
+# the text can be escaped before they are swapped for <mark> tags
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+HEADLINE_OPTIONS_SQL = (
+    "'StartSel=\"' || chr(2) || '\", StopSel=\"' || chr(3) || '\", "
+    'MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=" … "\''
+)
+
+# Rank and page the matches first, then build snippets for that page only,
+# since ts_headline re-parses the whole text of every row it is given
+SEARCH_SQL = f"""
+WITH "search" AS (
+    SELECT websearch_to_tsquery('{SEARCH_CONFIG}', $1) AS "query"
+),
+"hits" AS (
+    SELECT 'topic' AS "kind",
+           "topic"."id",
+           "topic"."id" AS "topic_id",
+           ts_rank_cd("topic"."search_vector", "search"."query") AS "rank",
+           "topic"."created_at"
+    FROM "topic", "search"
+    WHERE ($2::text IS NULL OR $2::text = 'topic')
+      AND "topic"."search_vector" @@ "search"."query"
+    UNION ALL
+    SELECT 'post',
+           "post"."id",
+           "post"."topic_id",
+           ts_rank_cd("post"."search_vector", "search"."query"),
+           "post"."created_at"
+    FROM "post", "search"
+    WHERE ($2::text IS NULL OR $2::text = 'post')
+      AND "post"."search_vector" @@ "search"."query"
+    ORDER BY "rank" DESC, "created_at" DESC
+    LIMIT $3 OFFSET $4
+)
+SELECT "hits"."kind",
+       "hits"."id",
+       "hits"."topic_id",
+       "hits"."rank",
+       "hits"."created_at",
+       "topic"."title",
+       ts_headline(
+           '{SEARCH_CONFIG}',
+           CASE WHEN "hits"."kind" = 'post' THEN "post"."content"
+                ELSE coalesce(nullif("topic"."description", ''), "topic"."title")
+           END,
+           "search"."query",
+           {HEADLINE_OPTIONS_SQL}
+       ) AS "snippet"
+FROM "hits"
+JOIN "topic" ON "topic"."id" = "hits"."topic_id"
+LEFT JOIN "post" ON "hits"."kind" = 'post' AND "post"."id" = "hits"."id"
+CROSS JOIN "search"
+ORDER BY "hits"."rank" DESC, "hits"."created_at" DESC
+"""
+
+# bm25 is lower for better matches; topic titles weigh four times as much as
+# any body text. Entries whose post or topic has been deleted are skipped.
+SEARCH_SQLITE_SQL = """
+SELECT "search_index"."kind",
+       "search_index"."object_id" AS "id",
+       "topic"."id" AS "topic_id",
+       -bm25("search_index", 0.0, 0.0, 4.0, 1.0) AS "rank",
+       CASE WHEN "search_index"."kind" = 'post' THEN "post"."created_at"
+            ELSE "topic"."created_at"
+       END AS "created_at",
+       "topic"."title",
+       snippet("search_index", -1, char(2), char(3), '…', 24) AS "snippet"
+FROM "search_index"
+LEFT JOIN "post"
+    ON "search_index"."kind" = 'post' AND "post"."id" = "search_index"."object_id"
+LEFT JOIN "topic"
+    ON "topic"."id" = CASE WHEN "search_index"."kind" = 'post'
+                           THEN "post"."topic_id"
+                           ELSE "search_index"."object_id"
+                      END
+WHERE "search_index" MATCH ?
+  AND (? IS NULL OR "search_index"."kind" = ?)
+  AND "topic"."id" IS NOT NULL
+ORDER BY "rank" DESC, "created_at" DESC
+LIMIT ? OFFSET ?
+"""
+
+
+def _highlight(snippet: str) -> str:
+    escaped = html.escape(snippet or "")
+    return escaped.replace(MATCH_START, "<mark>").replace(MATCH_END, "</mark>")
+
+
+async def _search_rows(
+    search: str, match_query: str, kind: Optional[str], limit: int, offset: int
+) -> List[Dict[str, Any]]:
+    if is_postgres():
+        return await get_connection().execute_query_dict(
+            SEARCH_SQL, [search, kind, limit, offset]
+        )
+
+    return await get_connection().execute_query_dict(
+        SEARCH_SQLITE_SQL, [match_query, kind, kind, limit, offset]
+    )
+
+
+async def search_content(
+    search: str,
+    kind: Optional[SearchKind] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> SearchResultList:
+    """
+    Full-text search over approved posts and topics, best matches first.
+
+    Args:
+        search: Words to look for; every word must match
+        kind: Optional filter to only posts or only topics
+        limit: Maximum number of results to return
+        offset: Number of results to skip
+
+    Returns:
+        SearchResultList with highlighted snippets and whether there are more
+    """
+    match_query = fts5_match_query(search)
+    if match_query is None:
+        return SearchResultList(results=[], query=search)
+
+    # One extra row tells whether there is a next page without counting
+    rows = await _search_rows(
+        search, match_query, kind.value if kind else None, limit + 1, offset
+    )
+
+    results = [
+        SearchResult(
+            kind=row["kind"],
+            id=row["id"],
+            topic_id=row["topic_id"],
+            title=row["title"],
+            snippet=_highlight(row["snippet"]),
+            rank=row["rank"],
+            created_at=row["created_at"],
+        )
+        for row in rows[:limit]
+    ]
+    return SearchResultList(results=results, query=search, has_more=len(rows) > limit)
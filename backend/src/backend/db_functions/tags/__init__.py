@@ -9,6 +9,7 @@ from backend.db_functions.tags.delete_tag import delete_tag
 from backend.db_functions.tags.get_tag_by_id import get_tag_by_id
 from backend.db_functions.tags.get_tag_by_name import get_tag_by_name
 from backend.db_functions.tags.get_tag_by_slug import get_tag_by_slug
+from backend.db_functions.tags.get_tags_version import get_tags_version
 from backend.db_functions.tags.list_tags import list_tags
 from backend.db_functions.tags.update_tag import update_tag
 
@@ -18,6 +19,7 @@ __all__ = [
     "get_tag_by_id",
     "get_tag_by_name",
     "get_tag_by_slug",
+    "get_tags_version",
     "list_tags",
     "update_tag",
 ]
@@ -0,0 +1,24 @@
+# Third-party imports
+from tortoise.functions import Count
+from tortoise.functions import Max
+
+# Project-specific imports
+from backend.db.models.tag import Tag
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.datetime import latest
+
+
+async def get_tags_version() -> ResourceVersion:
+    """Version of every tag: how many there are and the latest change to any."""
+    row = (
+        await Tag.all()
+        .annotate(count=Count("id"), last_modified=Max("updated_at"))
+        .first()
+        .values("count", "last_modified")
+    )
+    if not row:
+        return ResourceVersion(count=0)
+
+    return ResourceVersion(
+        count=row["count"], last_modified=latest(row["last_modified"])
+    )
@@ -6,10 +6,18 @@ from backend.converters import tag_to_schema
 from backend.db.models.tag import Tag
 from backend.schemas.tag import TagList
 from backend.schemas.tag import TagResponse
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def list_tags(
-    skip: int = 0, limit: int = 50, search: Optional[str] = None
+    skip: int = 0,
+    limit: int = 50,
+    search: Optional[str] = None,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> TagList:
     query = Tag.all()
 
@@ -17,14 +25,20 @@ async def list_tags(
         query = query.filter(name__icontains=search)
 
     # Get total count for pagination
-    count = await query.count()
+    total = await count_rows(query, count_mode)
 
     # Apply pagination
-    tags = await query.offset(skip).limit(limit)
+    page = await paginate(query, limit, skip=skip, cursor=cursor)
 
     # Convert ORM models to schema objects using async converter
     tag_responses: list[TagResponse] = []
-    for tag in tags:
+    for tag in page.rows:
         tag_responses.append(await tag_to_schema(tag))
 
-    return TagList(tags=tag_responses, count=count)
+    return TagList(
+        tags=tag_responses,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
+    )
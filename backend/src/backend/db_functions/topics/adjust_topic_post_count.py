@@ -0,0 +1,15 @@
+# Standard library imports
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import F
+
+# Project-specific imports
+from backend.db.models.topic import Topic
+from backend.utils.datetime import now_utc
+
+
+async def adjust_topic_post_count(topic_id: UUID, delta: int) -> None:
+    await Topic.filter(id=topic_id).update(
+        post_count=F("post_count") + delta, updated_at=now_utc()
+    )
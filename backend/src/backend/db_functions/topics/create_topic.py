@@ -4,6 +4,7 @@ from uuid import UUID
 # Project-specific imports
 from backend.converters import topic_to_schema
 from backend.db.models.topic import Topic
+from backend.db_functions.search.index_topic import index_topic
 from backend.schemas.topic import TopicResponse
 
 
@@ -17,4 +18,5 @@ async def create_topic(
         description=description,
         author_id=created_by_id,
     )
+    await index_topic(topic.id)
     return await topic_to_schema(topic)
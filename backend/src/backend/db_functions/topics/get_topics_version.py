@@ -0,0 +1,81 @@
+# Standard library imports
+from typing import Optional
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import Subquery
+from tortoise.functions import Count
+from tortoise.functions import Max
+
+# Project-specific imports
+from backend.db.models.tag import Tag
+from backend.db.models.topic import Topic
+from backend.db.models.topic_tag import TopicTag
+from backend.db.models.user import User
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.datetime import latest
+
+
+async def get_topics_version(topic_id: Optional[UUID] = None) -> ResourceVersion:
+    """
+    Version of every topic, or of one, in one aggregate query: the number of
+    topics and tag links, and the latest change to any topic, its author, its
+    tag links or its tags.
+
+    Args:
+        topic_id: Optional topic to limit the version to
+
+    Returns:
+        ResourceVersion for the topics
+    """
+    query = Topic.all()
+    if topic_id:
+        query = query.filter(id=topic_id)
+
+    topic_ids = Subquery(query.values("id"))
+    authors_updated_at = (
+        User.filter(id__in=Subquery(query.values("author_id")))
+        .annotate(last_modified=Max("updated_at"))
+        .values("last_modified")
+    )
+    links = TopicTag.filter(topic_id__in=topic_ids)
+    links_count = links.annotate(count=Count("id")).values("count")
+    links_created_at = links.annotate(last_modified=Max("created_at")).values(
+        "last_modified"
+    )
+    tags_updated_at = (
+        Tag.filter(id__in=Subquery(links.values("tag_id")))
+        .annotate(last_modified=Max("updated_at"))
+        .values("last_modified")
+    )
+    row = (
+        await query.annotate(
+            count=Count("id"),
+            last_modified=Max("updated_at"),
+            authors_last_modified=Subquery(authors_updated_at),
+            links_count=Subquery(links_count),
+            links_last_modified=Subquery(links_created_at),
+            tags_last_modified=Subquery(tags_updated_at),
+        )
+        .first()
+        .values(
+            "count",
+            "last_modified",
+            "authors_last_modified",
+            "links_count",
+            "links_last_modified",
+            "tags_last_modified",
+        )
+    )
+    if not row:
+        return ResourceVersion(count=0)
+
+    return ResourceVersion(
+        count=row["count"] + int(row["links_count"] or 0),
+        last_modified=latest(
+            row["last_modified"],
+            row["authors_last_modified"],
+            row["links_last_modified"],
+            row["tags_last_modified"],
+        ),
+    )
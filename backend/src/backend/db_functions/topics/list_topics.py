@@ -1,23 +1,36 @@
 # Standard library imports
+from typing import Optional
 
 # Project-specific imports
 from backend.converters import topic_to_schema
 from backend.db.models.topic import Topic
 from backend.schemas.topic import TopicList
 from backend.schemas.topic import TopicResponse
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def list_topics(
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> TopicList:
     query = Topic.all()
-    count = await query.count()
-    topics = await query.offset(skip).limit(limit)
+    total = await count_rows(query, count_mode)
+    page = await paginate(query, limit, skip=skip, cursor=cursor)
 
     # Convert ORM models to schema objects using async converter
     topic_responses: list[TopicResponse] = []
-    for topic in topics:
+    for topic in page.rows:
         topic_responses.append(await topic_to_schema(topic))
 
-    return TopicList(topics=topic_responses, count=count)
+    return TopicList(
+        topics=topic_responses,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
+    )
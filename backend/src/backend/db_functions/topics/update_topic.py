@@ -5,6 +5,7 @@ from uuid import UUID
 # Project-specific imports
 from backend.converters import topic_to_schema
 from backend.db.models.topic import Topic
+from backend.db_functions.search.index_topic import index_topic
 from backend.schemas.topic import TopicResponse
 
 
@@ -18,5 +19,6 @@ async def update_topic(
         if description is not None:
             topic.description = description
         await topic.save()
+        await index_topic(topic.id)
         return await topic_to_schema(topic)
     return None
@@ -7,6 +7,10 @@ from backend.converters import user_event_to_schema
 from backend.db.models.user_event import UserEvent
 from backend.schemas.user_event import UserEventListSchema
 from backend.schemas.user_event import UserEventSchema
+from backend.utils.counting import CountMode
+from backend.utils.counting import count_rows
+from backend.utils.pagination import Cursor
+from backend.utils.pagination import paginate
 
 
 async def get_user_events(
@@ -14,6 +18,8 @@ async def get_user_events(
     skip: int = 0,
     limit: int = 20,
     event_type: Optional[str] = None,
+    cursor: Optional[Cursor] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> UserEventListSchema:
     query = UserEvent.filter(user_id=user_id)
 
@@ -21,14 +27,20 @@ async def get_user_events(
         query = query.filter(event_type=event_type)
 
     # Get total count for pagination
-    count = await query.count()
+    total = await count_rows(query, count_mode)
 
     # Apply pagination
-    events = await query.offset(skip).limit(limit).order_by("-created_at")
+    page = await paginate(query, limit, skip=skip, cursor=cursor)
 
     # Convert ORM models to schema objects using async converter
     event_schemas: list[UserEventSchema] = []
-    for event in events:
+    for event in page.rows:
         event_schemas.append(await user_event_to_schema(event))
 
-    return UserEventListSchema(user_events=event_schemas, count=count)
+    return UserEventListSchema(
+        user_events=event_schemas,
+        count=total.value,
+        count_exact=total.exact,
+        next_cursor=page.next_cursor,
+        previous_cursor=page.previous_cursor,
+    )
@@ -14,6 +14,10 @@ from backend.db_functions.user_sessions.deactivate_all_user_sessions import (
 from backend.db_functions.user_sessions.deactivate_session import deactivate_session
 from backend.db_functions.user_sessions.delete_user_session import delete_user_session
 from backend.db_functions.user_sessions.get_session_by_token import get_session_by_token
+from backend.db_functions.user_sessions.is_session_active import is_session_active
+from backend.db_functions.user_sessions.list_revoked_session_ids import (
+    list_revoked_session_ids,
+)
 from backend.db_functions.user_sessions.list_user_sessions import list_user_sessions
 from backend.db_functions.user_sessions.validate_session import validate_session
 
@@ -24,6 +28,8 @@ __all__ = [
     "deactivate_session",
     "delete_user_session",
     "get_session_by_token",
+    "is_session_active",
+    "list_revoked_session_ids",
     "list_user_sessions",
     "validate_session",
 ]
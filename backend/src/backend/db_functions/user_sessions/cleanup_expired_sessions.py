@@ -7,8 +7,10 @@ from backend.utils.datetime import now_utc
 
 async def cleanup_expired_sessions() -> int:
     """Deactivate all expired sessions."""
+    now = now_utc()
+    # Bulk updates skip auto_now, so stamp updated_at for revocation refreshes
     count = await UserSession.filter(
-        expires_at__lt=now_utc(),
+        expires_at__lt=now,
         is_active=True,
-    ).update(is_active=False)
+    ).update(is_active=False, updated_at=now)
     return count
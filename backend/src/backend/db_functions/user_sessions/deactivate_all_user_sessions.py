@@ -3,6 +3,8 @@ from uuid import UUID
 
 # Project-specific imports
 from backend.db.models.user_session import UserSession
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def deactivate_all_user_sessions(user_id: UUID) -> int:
@@ -12,6 +14,8 @@ async def deactivate_all_user_sessions(user_id: UUID) -> int:
     for session in sessions:
         session.is_active = False
         await session.save()
+        session_revocations.revoke_session(session.id)
         count += 1
 
+    session_cache.invalidate_user(user_id)
     return count
@@ -2,6 +2,8 @@
 
 # Project-specific imports
 from backend.db.models.user_session import UserSession
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def deactivate_session(session_token: str) -> bool:
@@ -11,4 +13,6 @@ async def deactivate_session(session_token: str) -> bool:
 
     session.is_active = False
     await session.save()
+    session_cache.invalidate_token(session_token)
+    session_revocations.revoke_session(session.id)
     return True
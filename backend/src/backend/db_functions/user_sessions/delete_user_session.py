@@ -1,4 +1,6 @@
 from backend.db.models.user_session import UserSession
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def delete_user_session(token: str) -> bool:
@@ -12,4 +14,8 @@ async def delete_user_session(token: str) -> bool:
     session.is_active = False
     await session.save()
 
+    # Drop the cached user and revoke access tokens tied to this session
+    session_cache.invalidate_token(token)
+    session_revocations.revoke_session(session.id)
+
     return True
@@ -0,0 +1,14 @@
+# Standard library imports
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.user_session import UserSession
+from backend.utils.datetime import now_utc
+
+
+async def is_session_active(session_id: UUID) -> bool:
+    return await UserSession.filter(
+        id=session_id,
+        is_active=True,
+        expires_at__gt=now_utc(),
+    ).exists()
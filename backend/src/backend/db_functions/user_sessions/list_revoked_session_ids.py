@@ -0,0 +1,16 @@
+# Standard library imports
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.user_session import UserSession
+
+
+async def list_revoked_session_ids(since: datetime) -> List[UUID]:
+    """List sessions deactivated at or after ``since``."""
+    rows = await UserSession.filter(
+        is_active=False,
+        updated_at__gte=since,
+    ).values_list("id")
+    return [session_id for (session_id,) in rows]
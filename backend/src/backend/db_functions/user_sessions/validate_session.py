@@ -6,6 +6,8 @@ from backend.converters import user_session_to_schema
 from backend.db.models.user_session import UserSession
 from backend.schemas.user import UserSessionSchema
 from backend.utils.datetime import now_utc
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def validate_session(session_token: str) -> Optional[UserSessionSchema]:
@@ -22,6 +24,8 @@ async def validate_session(session_token: str) -> Optional[UserSessionSchema]:
     if session.expires_at < now_utc():
         session.is_active = False
         await session.save()
+        session_cache.invalidate_token(session_token)
+        session_revocations.revoke_session(session.id)
         return None
 
     return await user_session_to_schema(session)
@@ -0,0 +1,26 @@
+# Standard library imports
+from uuid import UUID
+
+# Third-party imports
+from tortoise.expressions import F
+
+# Project-specific imports
+from backend.db.models.user import User
+from backend.utils.datetime import now_utc
+
+
+async def adjust_user_post_counts(
+    user_id: UUID, approved_delta: int = 0, rejected_delta: int = 0
+) -> bool:
+    """
+    Atomically shift a user's denormalized approved/rejected post counters.
+
+    Returns:
+        False if the user does not exist, True otherwise
+    """
+    updated = await User.filter(id=user_id).update(
+        approved_count=F("approved_count") + approved_delta,
+        rejected_count=F("rejected_count") + rejected_delta,
+        updated_at=now_utc(),
+    )
+    return bool(updated)
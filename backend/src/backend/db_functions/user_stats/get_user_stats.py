@@ -1,8 +1,6 @@
 from uuid import UUID
 
 from backend.db.models.pending_post import PendingPost
-from backend.db.models.post import Post
-from backend.db.models.rejected_post import RejectedPost
 from backend.db.models.user import User
 from backend.schemas.user_stats import UserStatsResponse
 
@@ -16,11 +14,9 @@ async def get_user_stats(user_id: UUID) -> UserStatsResponse:
     if not user:
         raise ValueError(f"User with ID {user_id} not found")
 
-    # Count approved posts
-    approved_count = await Post.filter(author_id=user_id).count()
-
-    # Count rejected posts
-    rejected_count = await RejectedPost.filter(author_id=user_id).count()
+    # Approved and rejected counts are denormalized onto the user
+    approved_count = user.approved_count
+    rejected_count = user.rejected_count
 
     # Count pending posts
     pending_count = await PendingPost.filter(author_id=user_id).count()
@@ -1,7 +1,9 @@
 from uuid import UUID
 
-from backend.db.models.user import User
 from backend.db_functions.user_events.create_event import create_event
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
 
 
 async def increment_user_rejection_count(
@@ -11,9 +13,8 @@ async def increment_user_rejection_count(
     """
     Increment the user's rejection count and create an event when a post is rejected.
     """
-    # Get the user
-    user = await User.get_or_none(id=user_id)
-    if not user:
+    # Bump the denormalized counter, which also confirms the user exists
+    if not await adjust_user_post_counts(user_id, rejected_delta=1):
         raise ValueError(f"User with ID {user_id} not found")
 
     # Create a user event for post rejection
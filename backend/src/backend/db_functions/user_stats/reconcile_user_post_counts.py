@@ -0,0 +1,67 @@
+# Standard library imports
+import logging
+from uuid import UUID
+
+# Third-party imports
+from tortoise.functions import Count
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.rejected_post import RejectedPost
+from backend.db.models.user import User
+from backend.utils.datetime import now_utc
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_user_post_counts() -> int:
+    """
+    Recount approved and rejected posts per author and repair any user whose
+    denormalized counters have drifted.
+
+    Each user's counters are only overwritten if they still hold the values
+    read, so an increment that lands while the posts are being counted is not
+    lost; the user is left for the next run instead.
+
+    Returns:
+        Number of users whose counters were corrected
+    """
+    # Read the stored counters before counting, so a post approved or
+    # rejected in between shows up in the count and fails the check
+    stored_rows = await User.all().values_list("id", "approved_count", "rejected_count")
+
+    approved_rows = (
+        await Post.all()
+        .annotate(actual_count=Count("id"))
+        .group_by("author_id")
+        .values_list("author_id", "actual_count")
+    )
+    approved = {UUID(str(user_id)): count for user_id, count in approved_rows}
+
+    rejected_rows = (
+        await RejectedPost.all()
+        .annotate(actual_count=Count("id"))
+        .group_by("author_id")
+        .values_list("author_id", "actual_count")
+    )
+    rejected = {UUID(str(user_id)): count for user_id, count in rejected_rows}
+
+    fixed = 0
+    for user_id, stored_approved, stored_rejected in stored_rows:
+        user_id = UUID(str(user_id))
+        approved_count = approved.get(user_id, 0)
+        rejected_count = rejected.get(user_id, 0)
+        if (stored_approved, stored_rejected) != (approved_count, rejected_count):
+            fixed += await User.filter(
+                id=user_id,
+                approved_count=stored_approved,
+                rejected_count=stored_rejected,
+            ).update(
+                approved_count=approved_count,
+                rejected_count=rejected_count,
+                updated_at=now_utc(),
+            )
+
+    if fixed:
+        logger.warning(f"Repaired post counter drift on {fixed} users")
+    return fixed
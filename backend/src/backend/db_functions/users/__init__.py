@@ -7,6 +7,7 @@ This module provides functions for working with users in the database.
 from backend.db_functions.users.create_user import create_user
 from backend.db_functions.users.get_user_by_email import get_user_by_email
 from backend.db_functions.users.get_user_by_id import get_user_by_id
+from backend.db_functions.users.list_token_revocations import list_token_revocations
 from backend.db_functions.users.list_users import list_users
 from backend.db_functions.users.lock_user_account import lock_user_account
 from backend.db_functions.users.record_login_failure import record_login_failure
@@ -21,6 +22,7 @@ __all__ = [
     "create_user",
     "get_user_by_email",
     "get_user_by_id",
+    "list_token_revocations",
     "list_users",
     "lock_user_account",
     "record_login_failure",
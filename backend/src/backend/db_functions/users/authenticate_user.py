@@ -10,6 +10,7 @@ from backend.converters.user_to_schema import user_to_schema
 # Project-specific imports
 from backend.db.models.user import User
 from backend.routes.html.schemas.user import UserResponse
+from backend.utils.password_hashing import password_hashing_executor
 
 
 async def authenticate_user(email: str, password: str) -> Optional[UserResponse]:
@@ -19,7 +20,9 @@ async def authenticate_user(email: str, password: str) -> Optional[UserResponse]
         return None
 
     # Check password
-    if not bcrypt.checkpw(password.encode(), user.password_hash.encode()):
+    if not await password_hashing_executor.run(
+        bcrypt.checkpw, password.encode(), user.password_hash.encode()
+    ):
         return None
 
     # Convert user model to schema then to response
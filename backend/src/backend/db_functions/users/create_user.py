@@ -1,19 +1,16 @@
-# Standard library imports
-
 # Project-specific imports
+from backend.converters import user_to_schema
 from backend.db.models.user import User
-from backend.db_functions.users.set_user_password import set_user_password
 from backend.schemas.user import UserSchema
+from backend.utils.password_hashing import hash_password
 
 
 async def create_user(email: str, password: str, display_name: str) -> UserSchema:
+    # Hash before touching the database, so no connection waits on bcrypt
+    password_hash = await hash_password(password)
     user = await User.create(
         email=email,
-        password_hash="",  # Temporary placeholder
+        password_hash=password_hash,
         display_name=display_name,
     )
-    result = await set_user_password(user.id, password)
-    if result is None:
-        # This should never happen since we just created the user
-        raise ValueError(f"Failed to set password for user {user.id}")
-    return result
+    return await user_to_schema(user)
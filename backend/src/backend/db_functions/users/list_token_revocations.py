@@ -0,0 +1,18 @@
+# Standard library imports
+from datetime import datetime
+from typing import Dict
+from uuid import UUID
+
+# Project-specific imports
+from backend.db.models.user import User
+
+
+async def list_token_revocations(since: datetime) -> Dict[UUID, datetime]:
+    """
+    Map each user whose access tokens were revoked at or after ``since`` to
+    the time of the revocation.
+    """
+    rows = await User.filter(tokens_revoked_at__gte=since).values_list(
+        "id", "tokens_revoked_at"
+    )
+    return dict(rows)
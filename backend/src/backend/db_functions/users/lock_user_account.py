@@ -6,6 +6,9 @@ from uuid import UUID
 from backend.converters import user_to_schema
 from backend.db.models.user import User
 from backend.schemas.user import UserSchema
+from backend.utils.datetime import now_utc
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def lock_user_account(user_id: UUID) -> Optional[UserSchema]:
@@ -14,5 +17,9 @@ async def lock_user_account(user_id: UUID) -> Optional[UserSchema]:
         return None
 
     user.is_locked = True
+    # Persisted so other processes reject the user's older tokens as well
+    user.tokens_revoked_at = now_utc()
     await user.save()
+    session_cache.invalidate_user(user_id)
+    session_revocations.revoke_user(user_id, user.tokens_revoked_at)
     return await user_to_schema(user)
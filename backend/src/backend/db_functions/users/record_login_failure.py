@@ -8,6 +8,9 @@ from backend.db.models.user import User
 from backend.db_functions.user_events.log_account_lockout import log_account_lockout
 from backend.db_functions.user_events.log_login_failure import log_login_failure
 from backend.schemas.user import UserSchema
+from backend.utils.datetime import now_utc
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def record_login_failure(
@@ -31,6 +34,8 @@ async def record_login_failure(
     was_locked = False
     if user.failed_login_attempts >= 5 and not user.is_locked:
         user.is_locked = True
+        # Persisted so other processes reject the user's older tokens as well
+        user.tokens_revoked_at = now_utc()
         was_locked = True
 
     await user.save()
@@ -42,6 +47,8 @@ async def record_login_failure(
 
     # Log account lockout event if account was just locked
     if was_locked:
+        session_cache.invalidate_user(user.id)
+        session_revocations.revoke_user(user.id, user.tokens_revoked_at)
         await log_account_lockout(user.id, ip_address, user_agent)
 
     return await user_to_schema(user)
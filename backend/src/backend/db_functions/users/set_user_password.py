@@ -2,13 +2,12 @@
 from typing import Optional
 from uuid import UUID
 
-# Third-party imports
-import bcrypt
-
 # Project-specific imports
 from backend.converters import user_to_schema
 from backend.db.models.user import User
 from backend.schemas.user import UserSchema
+from backend.utils.password_hashing import hash_password
+from backend.utils.session_cache import session_cache
 
 
 async def set_user_password(user_id: UUID, password: str) -> Optional[UserSchema]:
@@ -16,10 +15,8 @@ async def set_user_password(user_id: UUID, password: str) -> Optional[UserSchema
     if not user:
         return None
 
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    user.password_hash = hashed.decode("utf-8")
+    user.password_hash = await hash_password(password)
 
     await user.save()
+    session_cache.invalidate_user(user_id)
     return await user_to_schema(user)
@@ -4,6 +4,9 @@ from backend.converters import user_to_schema
 from backend.db.models.user import User
 from backend.db.models.user import UserRole
 from backend.schemas.user import UserSchema
+from backend.utils.datetime import now_utc
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 
 
 async def set_user_role(
@@ -25,5 +28,9 @@ async def set_user_role(
         return None
 
     user.role = role
+    # Persisted so other processes reject the user's older tokens as well
+    user.tokens_revoked_at = now_utc()
     await user.save()
+    session_cache.invalidate_user(user_id)
+    session_revocations.revoke_user(user_id, user.tokens_revoked_at)
     return await user_to_schema(user)
@@ -6,6 +6,7 @@ from uuid import UUID
 from backend.converters import user_to_schema
 from backend.db.models.user import User
 from backend.schemas.user import UserSchema
+from backend.utils.session_cache import session_cache
 
 
 async def unlock_user_account(user_id: UUID) -> Optional[UserSchema]:
@@ -16,4 +17,5 @@ async def unlock_user_account(user_id: UUID) -> Optional[UserSchema]:
     user.is_locked = False
     user.failed_login_attempts = 0
     await user.save()
+    session_cache.invalidate_user(user_id)
     return await user_to_schema(user)
@@ -6,6 +6,7 @@ from uuid import UUID
 from backend.converters import user_to_schema
 from backend.db.models.user import User
 from backend.schemas.user import UserSchema
+from backend.utils.session_cache import session_cache
 
 
 async def update_user(
@@ -24,4 +25,5 @@ async def update_user(
         user.email = email
 
     await user.save()
+    session_cache.invalidate_user(user_id)
     return await user_to_schema(user)
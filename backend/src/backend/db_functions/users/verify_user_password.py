@@ -6,6 +6,7 @@ import bcrypt
 
 # Project-specific imports
 from backend.db.models.user import User
+from backend.utils.password_hashing import password_hashing_executor
 
 
 async def verify_user_password(user_id: UUID, password: str) -> bool:
@@ -15,4 +16,6 @@ async def verify_user_password(user_id: UUID, password: str) -> bool:
 
     password_bytes = password.encode("utf-8")
     hash_bytes = user.password_hash.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hash_bytes)
+    return await password_hashing_executor.run(
+        bcrypt.checkpw, password_bytes, hash_bytes
+    )
@@ -1,5 +1,7 @@
 # Standard library imports
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -25,6 +27,8 @@ from dominate.util import text
 from typing_extensions import TypeAlias
 
 # Project-specific imports
+from backend.dominate_templates.components.fragments import CONTENT_SLOT
+from backend.dominate_templates.components.fragments import content_slot
 from backend.routes.html.schemas.user import UserResponse
 
 # Type definitions
@@ -186,6 +190,45 @@ def create_base_document(
     return doc
 
 
+async def stream_base_document(
+    content_chunks: AsyncIterable[str],
+    title_text: str = "The Robot Overlord",
+    user: Optional[UserResponse] = None,
+    messages: Optional[List[Dict[str, str]]] = None,
+    head_content_func: Optional[Callable[[], None]] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the base document with its content block sent chunk by chunk.
+
+    The head and site chrome are sent before the first content chunk is
+    produced, so the browser can start fetching styles and scripts while
+    the rest of the page renders.
+
+    Args:
+        content_chunks: HTML chunks making up the content block, in order
+        title_text: The title of the page
+        user: Optional user object for authentication-based navigation
+        messages: Optional list of message objects with type and text
+        head_content_func: Function that generates additional head content
+
+    Yields:
+        The page HTML in chunks
+    """
+    doc = create_base_document(
+        title_text=title_text,
+        user=user,
+        messages=messages,
+        content_func=content_slot,
+        head_content_func=head_content_func,
+    )
+    shell_start, shell_end = str(doc).split(CONTENT_SLOT, 1)
+
+    yield shell_start
+    async for chunk in content_chunks:
+        yield chunk
+    yield shell_end
+
+
 def create_base_page(
     title: str,
     current_user: UserResponse,
@@ -0,0 +1,66 @@
+# Standard library imports
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+# Third-party imports
+from dominate.util import container
+from dominate.util import raw
+
+# Project-specific imports
+from backend.utils.fragment_cache import fragment_cache
+
+# Stands in for content that is streamed separately from its surroundings
+CONTENT_SLOT = "<!-- content -->"
+
+
+def viewer_capability(current_user: Optional[Any], is_admin: bool = False) -> str:
+    """Class of viewer a fragment is rendered for: what controls they get."""
+    if is_admin:
+        return "admin"
+    if current_user:
+        return "member"
+    return "anonymous"
+
+
+def render_fragment(build: Callable[[], None]) -> str:
+    """Render the tags ``build`` creates to a string, outside the page."""
+    fragment = container()  # type: ignore
+    with fragment:
+        build()
+    # Detach the fragment from the enclosing tag so it is not rendered twice
+    if fragment._ctx is not None:
+        fragment._ctx.used.add(fragment)
+    html: str = fragment.render(pretty=False)  # type: ignore
+    return html
+
+
+def content_slot() -> None:
+    """Mark where streamed content goes in a page shell or fragment."""
+    raw(CONTENT_SLOT)  # type: ignore
+
+
+def render_around_slot(build: Callable[[], None]) -> Tuple[str, str]:
+    """
+    Render a fragment to the HTML either side of its content slot. Without a
+    slot, the whole fragment comes first.
+    """
+    before, _, after = render_fragment(build).partition(CONTENT_SLOT)
+    return before, after
+
+
+def cached_fragment(key: Hashable, build: Callable[[], None]) -> None:
+    """
+    Splice a fragment into the current tag, rendering it only on a cache miss.
+
+    Args:
+        key: Everything the fragment's markup depends on
+        build: Creates the fragment's tags in the current context
+    """
+    html = fragment_cache.get(key)
+    if html is None:
+        html = render_fragment(build)
+        fragment_cache.set(key, html)
+    raw(html)  # type: ignore
@@ -1,3 +1,8 @@
+# Standard library imports
+from typing import Optional
+from urllib.parse import urlencode
+
+# Third-party imports
 from dominate.tags import a
 from dominate.tags import li
 from dominate.tags import nav
@@ -90,3 +95,54 @@ def create_pagination(
                     tabindex="-1",
                     aria_disabled="true",
                 )  # type: ignore
+
+
+def create_cursor_pagination(
+    limit: int,
+    base_url: str,
+    previous_cursor: Optional[str] = None,
+    next_cursor: Optional[str] = None,
+) -> None:
+    """
+    Create a pagination component for cursor (keyset) pages, which know their
+    neighbours but not their page number.
+
+    Args:
+        limit: Number of items per page
+        base_url: Base URL for pagination links
+        previous_cursor: Cursor for the page of newer items, if any
+        next_cursor: Cursor for the page of older items, if any
+    """
+    # Don't show pagination if there's only one page
+    if previous_cursor is None and next_cursor is None:
+        return
+
+    links = (
+        ("Newest", f"{base_url}?limit={limit}" if previous_cursor else None),
+        (
+            "Previous",
+            f"{base_url}?{urlencode({'limit': limit, 'cursor': previous_cursor})}"
+            if previous_cursor
+            else None,
+        ),
+        (
+            "Next",
+            f"{base_url}?{urlencode({'limit': limit, 'cursor': next_cursor})}"
+            if next_cursor
+            else None,
+        ),
+    )
+
+    with nav(aria_label="Page navigation"), ul(cls="pagination"):  # type: ignore
+        for label, href in links:
+            with li(cls=f"page-item {'' if href else 'disabled'}"):  # type: ignore
+                if href:
+                    a(label, href=href, cls="page-link")  # type: ignore
+                else:
+                    a(
+                        label,
+                        href="#",
+                        cls="page-link",
+                        tabindex="-1",
+                        aria_disabled="true",
+                    )  # type: ignore
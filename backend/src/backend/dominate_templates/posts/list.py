@@ -3,6 +3,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from urllib.parse import urlencode
 from uuid import UUID
 
 # Third-party imports
@@ -15,6 +16,7 @@ from dominate.tags import time_
 
 # Local imports
 from backend.dominate_templates.base import create_base_document
+from backend.dominate_templates.components.pagination import create_cursor_pagination
 from backend.routes.html.schemas.user import UserResponse
 from backend.schemas.post import PostResponse
 from backend.schemas.topic import TopicResponse
@@ -81,7 +83,14 @@ def create_posts_list_page(
                                 )  # type: ignore
 
             # Pagination controls
-            if pagination:
+            if pagination.get("cursor"):
+                create_cursor_pagination(
+                    limit=pagination["limit"],
+                    base_url="/html/posts/",
+                    previous_cursor=pagination.get("previous_cursor"),
+                    next_cursor=pagination.get("next_cursor"),
+                )
+            elif pagination:
                 with div(cls="pagination"):  # type: ignore
                     if pagination["has_previous"]:
                         a(
@@ -93,7 +102,16 @@ def create_posts_list_page(
                         f"Page {pagination['current_page']} of {pagination['total_pages']}"  # noqa: E501
                     )  # type: ignore
 
-                    if pagination.get("has_next"):
+                    # Deeper pages are reached by cursor when one is available
+                    if pagination.get("next_cursor"):
+                        next_query = urlencode(
+                            {
+                                "limit": pagination["limit"],
+                                "cursor": pagination["next_cursor"],
+                            }
+                        )
+                        a("Next", href=f"/html/posts/?{next_query}")  # type: ignore
+                    elif pagination.get("has_next"):
                         a("Next", href=f"/html/posts/?page={pagination['next_page']}")  # type: ignore
         else:
             p("NO POSTS HAVE BEEN APPROVED BY THE CENTRAL COMMITTEE")  # type: ignore
@@ -1,5 +1,6 @@
 # Standard library imports
 from typing import List
+from typing import Optional
 
 # Third-party imports
 from dominate.tags import a
@@ -19,6 +20,7 @@ from backend.dominate_templates.base import create_base_page
 from backend.dominate_templates.components.moderation_feedback import (
     create_moderation_feedback,
 )
+from backend.dominate_templates.components.pagination import create_cursor_pagination
 from backend.dominate_templates.components.pagination import create_pagination
 from backend.routes.html.schemas.user import UserResponse
 from backend.schemas.rejected_post import RejectedPostResponse
@@ -31,6 +33,10 @@ def create_rejected_posts_list_page(
     offset: int,
     is_admin: bool,
     current_user: UserResponse,
+    cursor_pagination: bool = False,
+    count_exact: bool = True,
+    previous_cursor: Optional[str] = None,
+    next_cursor: Optional[str] = None,
 ) -> str:
     """
     Create a page that displays a list of rejected posts.
@@ -42,6 +48,10 @@ def create_rejected_posts_list_page(
         offset: Offset for pagination
         is_admin: Whether the current user is an admin
         current_user: The current user
+        cursor_pagination: Whether to page by cursor rather than by offset
+        previous_cursor: Cursor for the page of newer rejected posts
+        next_cursor: Cursor for the page of older rejected posts
+        count_exact: Whether count is exact rather than a lower bound
 
     Returns:
         str: HTML content for the rejected posts list page
@@ -60,9 +70,10 @@ def create_rejected_posts_list_page(
         else:
             # Display rejected posts count
             with div(cls="mb-3"):  # type: ignore
+                total = str(count) if count_exact else f"{count}+"
                 span(
                     f"Showing {min(offset + 1, count)}-"
-                    f"{min(offset + limit, count)} of {count} rejected posts"
+                    f"{min(offset + limit, count)} of {total} rejected posts"
                 )  # type: ignore
 
             # Create table for rejected posts
@@ -147,7 +158,15 @@ def create_rejected_posts_list_page(
                                 )  # type: ignore
 
             # Pagination
-            if count > limit:
+            if cursor_pagination:
+                with div(cls="mt-4"):  # type: ignore
+                    create_cursor_pagination(
+                        limit=limit,
+                        base_url="/html/rejected-posts/",
+                        previous_cursor=previous_cursor,
+                        next_cursor=next_cursor,
+                    )
+            elif count > limit:
                 with div(cls="mt-4"):  # type: ignore
                     create_pagination(
                         count=count,
@@ -0,0 +1,99 @@
+# Standard library imports
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from urllib.parse import urlencode
+
+# Third-party imports
+from dominate.tags import a
+from dominate.tags import button
+from dominate.tags import div
+from dominate.tags import form
+from dominate.tags import h1
+from dominate.tags import h2
+from dominate.tags import input_
+from dominate.tags import p
+from dominate.tags import span
+from dominate.util import raw
+
+# Local imports
+from backend.dominate_templates.base import create_base_document
+from backend.routes.html.schemas.user import UserResponse
+from backend.schemas.search import SearchKind
+from backend.schemas.search import SearchResultList
+
+
+def create_search_page(
+    search: str,
+    results: Optional[SearchResultList],
+    offset: int,
+    limit: int,
+    user: Optional[UserResponse] = None,
+    messages: Optional[List[Dict[str, str]]] = None,
+) -> Any:
+    """
+    Create the search page using Dominate.
+
+    Args:
+        search: The words searched for, empty before a search is made
+        results: One page of search results, or None before a search is made
+        offset: Number of results skipped before this page
+        limit: Maximum number of results per page
+        user: UserResponse object
+        messages: List of message dictionaries
+
+    Returns:
+        A dominate document object
+    """
+
+    def page_url(page_offset: int) -> str:
+        query = {"q": search, "offset": page_offset, "limit": limit}
+        return f"/html/search/?{urlencode(query)}"
+
+    def content_func() -> None:
+        h1("SEARCH THE APPROVED RECORD")  # type: ignore
+
+        with form(action="/html/search/", method="get", cls="search-form"):  # type: ignore
+            input_(
+                type="search",
+                name="q",
+                value=search,
+                placeholder="Search posts and topics",
+                required=True,
+            )  # type: ignore
+            button("SEARCH", type="submit")  # type: ignore
+
+        if results is None:
+            return
+
+        if not results.results:
+            p("NO APPROVED CONTENT MATCHES YOUR QUERY")  # type: ignore
+            return
+
+        with div(cls="search-results"):  # type: ignore
+            for result in results.results:
+                with div(cls=f"search-result search-result-{result.kind.value}"):  # type: ignore
+                    with h2():  # type: ignore
+                        if result.kind == SearchKind.POST:
+                            a(result.title, href=f"/html/topics/{result.topic_id}/")  # type: ignore
+                            span(" (post)", cls="search-result-kind")  # type: ignore
+                        else:
+                            a(result.title, href=f"/html/topics/{result.id}/")  # type: ignore
+                    # Snippets are escaped when built; only the <mark> tags are markup
+                    p(raw(result.snippet), cls="search-snippet")  # type: ignore
+                    if result.kind == SearchKind.POST:
+                        a("View post", href=f"/html/posts/{result.id}/")  # type: ignore
+
+        with div(cls="pagination"):  # type: ignore
+            if offset > 0:
+                a("Previous", href=page_url(max(offset - limit, 0)))  # type: ignore
+            if results.has_more:
+                a("Next", href=page_url(offset + limit))  # type: ignore
+
+    return create_base_document(
+        title_text="The Robot Overlord - Search",
+        user=user,
+        messages=messages,
+        content_func=content_func,
+    )
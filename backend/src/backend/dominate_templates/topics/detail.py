@@ -1,5 +1,10 @@
 # Standard library imports
+import asyncio
+from functools import partial
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Hashable
 from typing import List
 from typing import Optional
 from typing import Union
@@ -20,6 +25,12 @@ from dominate.tags import textarea
 
 # Local imports
 from backend.dominate_templates.base import create_base_document
+from backend.dominate_templates.base import stream_base_document
+from backend.dominate_templates.components.fragments import cached_fragment
+from backend.dominate_templates.components.fragments import content_slot
+from backend.dominate_templates.components.fragments import render_around_slot
+from backend.dominate_templates.components.fragments import render_fragment
+from backend.dominate_templates.components.fragments import viewer_capability
 from backend.routes.html.schemas.user import UserResponse
 from backend.schemas.pending_post import PendingPostResponse
 
@@ -28,6 +39,33 @@ from backend.schemas.post import PostResponse
 from backend.schemas.topic import TopicResponse
 
 
+def post_fragment_key(
+    post: Union[PostResponse, PendingPostResponse],
+    current_user: Optional[Any] = None,
+    is_admin: bool = False,
+) -> Hashable:
+    """
+    Cache key for a post's own markup, without its container or replies.
+
+    Edits bump the post's updated_at and the author's counters are part of
+    the key, so any change to what the fragment shows yields a new key.
+    """
+    author = post.author
+    author_version = (
+        author.id,
+        getattr(author, "updated_at", None),
+        getattr(author, "approved_count", 0),
+        getattr(author, "rejected_count", 0),
+    )
+    return (
+        "post",
+        post.id,
+        post.updated_at,
+        author_version,
+        viewer_capability(current_user, is_admin),
+    )
+
+
 def render_post(
     post: Union[PostResponse, PendingPostResponse],
     topic_id: UUID,
@@ -65,7 +103,7 @@ def render_post(
     if is_pending:
         post_classes += " pending-post"
 
-    with div(cls=post_classes, id=f"post-{post.id}"):  # type: ignore
+    def build_post_body() -> None:
         # Post header with author info
         with div(cls="post-header"), div(cls="post-meta"):  # type: ignore
             # Author info
@@ -199,6 +237,16 @@ def render_post(
                     )  # type: ignore
                 button("Submit Reply", type="submit", cls="btn btn-primary")  # type: ignore
 
+    with div(cls=post_classes, id=f"post-{post.id}"):  # type: ignore
+        # Approved posts render the same for every viewer of a class, so
+        # their markup is cached; pending posts are only seen by a few
+        if is_pending:
+            build_post_body()
+        else:
+            cached_fragment(
+                post_fragment_key(post, current_user, is_admin), build_post_body
+            )
+
         # Render replies recursively (only for approved posts since pending posts
         # don't have replies.) Pending posts can be replies to approved posts, but
         # they don't have their own replies yet
@@ -225,6 +273,138 @@ def render_post(
                     )
 
 
+def sort_topic_posts(
+    posts: List[PostResponse],
+    pending_posts: Optional[List[PendingPostResponse]] = None,
+    current_user: Optional[UserResponse] = None,
+) -> List[Union[PostResponse, PendingPostResponse]]:
+    """Approved posts plus, for a logged in user, pending ones, newest first."""
+    # Create a list to hold all posts (both approved and pending)
+    all_posts: List[Union[PostResponse, PendingPostResponse]] = []
+
+    # Add approved posts
+    for post in posts:
+        all_posts.append(post)
+
+    # Add pending posts if user is logged in
+    if pending_posts and current_user:
+        for pending_post in pending_posts:
+            all_posts.append(pending_post)
+
+    # Sort all posts by creation date (newest first)
+    all_posts.sort(key=lambda p: p.created_at, reverse=True)
+    return all_posts
+
+
+def render_topic_post(
+    post: Union[PostResponse, PendingPostResponse],
+    topic_id: UUID,
+    current_user: Optional[UserResponse] = None,
+    highlight_post_id: Optional[str] = None,
+    is_admin: bool = False,
+) -> None:
+    """Render a top-level post and its replies."""
+    render_post(
+        post,
+        topic_id=topic_id,
+        indent_level=0,
+        current_user=current_user,
+        highlight_post_id=highlight_post_id,
+        is_pending=isinstance(post, PendingPostResponse),
+        is_admin=is_admin,
+    )
+
+
+def render_topic_content(
+    topic: TopicResponse,
+    has_posts: bool,
+    current_page: int,
+    total_pages: int,
+    render_posts: Callable[[], None],
+    current_user: Optional[UserResponse] = None,
+) -> None:
+    """
+    Render the topic detail page's content block.
+
+    Args:
+        topic: Topic schema object
+        has_posts: Whether there are any posts to show
+        current_page: Current page number
+        total_pages: Total number of pages
+        render_posts: Renders the posts into the threaded posts container
+        current_user: Optional user schema object
+    """
+    # Topic detail section
+    with div(cls="topic-detail"):  # type: ignore
+        # Make the title a deep link back to this page with no highlight
+        with h1():  # type: ignore
+            a(topic.title, href=f"/html/topics/{topic.id}/", cls="topic-title-link")  # type: ignore
+
+        topic_desc = getattr(topic, "description", None) or ""
+        p(topic_desc, cls="topic-description")  # type: ignore
+
+        # Topic tags
+        tags = getattr(topic, "tags", [])
+        if tags:
+            with div(cls="topic-tags"):  # type: ignore
+                for tag in tags:
+                    a(
+                        tag.name,
+                        href=f"/html/tags/{tag.slug}/",
+                        cls="tag",
+                    )  # type: ignore
+
+    # Posts section
+    with div(cls="topic-posts"), div(cls="posts-section"):  # type: ignore
+        if has_posts:
+            # Add CSS for threaded posts
+            with div(cls="threaded-posts"):  # type: ignore
+                render_posts()
+
+            # Pagination controls
+            with div(cls="pagination"):  # type: ignore
+                if current_page > 1:
+                    prev_url = f"/html/topics/{topic.id}/?page={current_page - 1}"
+                    a("Previous", href=prev_url)  # type: ignore
+
+                page_text = f"Page {current_page} of {total_pages}"
+                span(page_text)  # type: ignore
+
+                if current_page < total_pages:
+                    next_url = f"/html/topics/{topic.id}/?page={current_page + 1}"
+                    a("Next", href=next_url)  # type: ignore
+        else:
+            p("NO POSTS HAVE BEEN APPROVED FOR THIS TOPIC")  # type: ignore
+
+    # Create post form section (only if user is logged in)
+    if current_user:
+        with div(cls="create-post"):  # type: ignore
+            h2("SUBMIT NEW POST")  # type: ignore
+            with form(
+                action="/html/posts/",
+                method="post",
+                cls="post-submission-form",
+            ):  # type: ignore
+                input_(type="hidden", name="topic_id", value=topic.id)  # type: ignore
+
+                with div(cls="form-group content-group"):  # type: ignore
+                    label("YOUR STATEMENT:", for_="content", cls="content-label")  # type: ignore
+                    textarea(
+                        id="content",
+                        name="content",
+                        rows="6",
+                        required=True,
+                        cls="content-textarea",
+                        placeholder="ENTER YOUR LOGICAL CONTRIBUTION HERE...",
+                    )  # type: ignore
+
+                button(
+                    "SUBMIT FOR APPROVAL",
+                    type="submit",
+                    cls="submit-button",
+                )  # type: ignore
+
+
 def create_topic_detail_page(
     topic: TopicResponse,
     posts: List[PostResponse],
@@ -252,113 +432,87 @@ def create_topic_detail_page(
     Returns:
         A dominate document object
     """
-    # Define the content function to be passed to the base document
-
-    # Define the content function to be passed to the base document
-    def content_func() -> None:
-        # Topic detail section
-        with div(cls="topic-detail"):  # type: ignore
-            # Make the title a deep link back to this page with no highlight
-            with h1():  # type: ignore
-                a(topic.title, href=f"/html/topics/{topic.id}/", cls="topic-title-link")  # type: ignore
-
-            topic_desc = getattr(topic, "description", "")
-            p(topic_desc, cls="topic-description")  # type: ignore
-
-            # Topic tags
-            tags = getattr(topic, "tags", [])
-            if tags:
-                with div(cls="topic-tags"):  # type: ignore
-                    for tag in tags:
-                        a(
-                            tag.name,
-                            href=f"/html/tags/{tag.slug}/",
-                            cls="tag",
-                        )  # type: ignore
-
-        # Posts section
-        with div(cls="topic-posts"), div(cls="posts-section"):  # type: ignore
-            if posts or (pending_posts and current_user):
-                # Add CSS for threaded posts
-                with div(cls="threaded-posts"):  # type: ignore
-                    # Render all posts - both approved and pending (if user is logged
-                    # in.) Create a list to hold all posts (both approved and pending)
-                    all_posts: List[Union[PostResponse, PendingPostResponse]] = []
-
-                    # Add approved posts
-                    for post in posts:
-                        all_posts.append(post)
-
-                    # Add pending posts if user is logged in
-                    if pending_posts and current_user:
-                        for pending_post in pending_posts:
-                            all_posts.append(pending_post)
-
-                    # Sort all posts by creation date (newest first)
-                    all_posts.sort(key=lambda p: p.created_at, reverse=True)
-
-                    # Render each post recursively
-                    for post_item in all_posts:
-                        # Check if this is a pending post
-                        is_post_pending = isinstance(post_item, PendingPostResponse)
-
-                        render_post(
-                            post_item,
-                            topic_id=topic.id,
-                            indent_level=0,
-                            current_user=current_user,
-                            highlight_post_id=highlight_post_id,
-                            is_pending=is_post_pending,
-                            is_admin=is_admin,
-                        )
-
-                # Pagination controls
-                with div(cls="pagination"):  # type: ignore
-                    if current_page > 1:
-                        prev_url = f"/html/topics/{topic.id}/?page={current_page - 1}"
-                        a("Previous", href=prev_url)  # type: ignore
-
-                    page_text = f"Page {current_page} of {total_pages}"
-                    span(page_text)  # type: ignore
-
-                    if current_page < total_pages:
-                        next_url = f"/html/topics/{topic.id}/?page={current_page + 1}"
-                        a("Next", href=next_url)  # type: ignore
-            else:
-                p("NO POSTS HAVE BEEN APPROVED FOR THIS TOPIC")  # type: ignore
-
-        # Create post form section (only if user is logged in)
-        if current_user:
-            with div(cls="create-post"):  # type: ignore
-                h2("SUBMIT NEW POST")  # type: ignore
-                with form(
-                    action="/html/posts/",
-                    method="post",
-                    cls="post-submission-form",
-                ):  # type: ignore
-                    input_(type="hidden", name="topic_id", value=topic.id)  # type: ignore
-
-                    with div(cls="form-group content-group"):  # type: ignore
-                        label("YOUR STATEMENT:", for_="content", cls="content-label")  # type: ignore
-                        textarea(
-                            id="content",
-                            name="content",
-                            rows="6",
-                            required=True,
-                            cls="content-textarea",
-                            placeholder="ENTER YOUR LOGICAL CONTRIBUTION HERE...",
-                        )  # type: ignore
-
-                    button(
-                        "SUBMIT FOR APPROVAL",
-                        type="submit",
-                        cls="submit-button",
-                    )  # type: ignore
+    # Render all posts - both approved and pending (if user is logged in.)
+    all_posts = sort_topic_posts(posts, pending_posts, current_user)
+
+    def render_posts() -> None:
+        # Render each post recursively
+        for post_item in all_posts:
+            render_topic_post(
+                post_item,
+                topic_id=topic.id,
+                current_user=current_user,
+                highlight_post_id=highlight_post_id,
+                is_admin=is_admin,
+            )
 
     # Create the base document with the content function
     result: str = create_base_document(
         title_text=f"{topic.title} - The Robot Overlord",
         user=current_user,
-        content_func=content_func,
+        content_func=partial(
+            render_topic_content,
+            topic,
+            has_posts=bool(all_posts),
+            current_page=current_page,
+            total_pages=total_pages,
+            render_posts=render_posts,
+            current_user=current_user,
+        ),
     )
     return result
+
+
+async def stream_topic_detail_page(
+    topic: TopicResponse,
+    posts: List[PostResponse],
+    total_posts: int,
+    current_page: int,
+    total_pages: int,
+    current_user: Optional[UserResponse] = None,
+    highlight_post_id: Optional[str] = None,
+    pending_posts: Optional[List[PendingPostResponse]] = None,
+    is_admin: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Stream the topic detail page, one top-level thread per chunk.
+
+    Takes the same arguments as ``create_topic_detail_page`` and yields the
+    same markup, but only one thread's HTML is held at a time and the event
+    loop gets control back between threads.
+    """
+    all_posts = sort_topic_posts(posts, pending_posts, current_user)
+
+    async def content_chunks() -> AsyncIterator[str]:
+        before_posts, after_posts = render_around_slot(
+            partial(
+                render_topic_content,
+                topic,
+                has_posts=bool(all_posts),
+                current_page=current_page,
+                total_pages=total_pages,
+                render_posts=content_slot,
+                current_user=current_user,
+            )
+        )
+        yield before_posts
+        for post_item in all_posts:
+            yield render_fragment(
+                partial(
+                    render_topic_post,
+                    post_item,
+                    topic_id=topic.id,
+                    current_user=current_user,
+                    highlight_post_id=highlight_post_id,
+                    is_admin=is_admin,
+                )
+            )
+            await asyncio.sleep(0)
+        yield after_posts
+
+    async for chunk in stream_base_document(
+        content_chunks(),
+        title_text=f"{topic.title} - The Robot Overlord",
+        user=current_user,
+    ):
+        yield chunk
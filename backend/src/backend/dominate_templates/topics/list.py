@@ -3,6 +3,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from urllib.parse import urlencode
 
 # Third-party imports
 from dominate.tags import a
@@ -20,6 +21,7 @@ from dominate.util import text
 
 # Local imports
 from backend.dominate_templates.base import create_base_document
+from backend.dominate_templates.components.pagination import create_cursor_pagination
 from backend.routes.html.schemas.user import UserResponse
 from backend.schemas.topic import TopicResponse
 
@@ -109,13 +111,16 @@ def create_topics_list_page(
                                                 text(author_name)  # type: ignore
 
             # Pagination controls
-            if pagination:
+            base_url = f"/html/tags/{tag_filter}/" if tag_filter else "/html/topics/"
+            if pagination.get("cursor"):
+                create_cursor_pagination(
+                    limit=pagination["limit"],
+                    base_url=base_url,
+                    previous_cursor=pagination.get("previous_cursor"),
+                    next_cursor=pagination.get("next_cursor"),
+                )
+            elif pagination:
                 with div(cls="pagination"):  # type: ignore
-                    # Build the base URL for pagination links
-                    base_url = (
-                        f"/html/tags/{tag_filter}/" if tag_filter else "/html/topics/"
-                    )
-
                     if pagination["has_previous"]:
                         a(
                             "Previous",
@@ -126,7 +131,16 @@ def create_topics_list_page(
                         f"Page {pagination['current_page']} of {pagination['total_pages']}"  # noqa: E501
                     )  # type: ignore
 
-                    if pagination.get("has_next"):
+                    # Deeper pages are reached by cursor when one is available
+                    if pagination.get("next_cursor"):
+                        next_query = urlencode(
+                            {
+                                "limit": pagination["limit"],
+                                "cursor": pagination["next_cursor"],
+                            }
+                        )
+                        a("Next", href=f"{base_url}?{next_query}")  # type: ignore
+                    elif pagination.get("has_next"):
                         a("Next", href=f"{base_url}?page={pagination['next_page']}")  # type: ignore
         else:
             p("NO TOPICS HAVE BEEN APPROVED BY THE CENTRAL COMMITTEE")  # type: ignore
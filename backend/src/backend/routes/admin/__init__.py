@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from backend.routes.admin.metrics import router as metrics_router
 from backend.routes.admin.moderation import router as moderation_router
 
 router = APIRouter()
@@ -7,3 +8,4 @@ router = APIRouter()
 router.include_router(
     moderation_router, prefix="/moderation", tags=["admin", "moderation"]
 )
+router.include_router(metrics_router, prefix="/metrics", tags=["admin", "metrics"])
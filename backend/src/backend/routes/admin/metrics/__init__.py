@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+from backend.routes.admin.metrics.count_cache import router as count_cache_router
+from backend.routes.admin.metrics.fragment_cache import router as fragment_cache_router
+from backend.routes.admin.metrics.moderation_gateway import (
+    router as moderation_gateway_router,
+)
+from backend.routes.admin.metrics.moderation_timings import (
+    router as moderation_timings_router,
+)
+from backend.routes.admin.metrics.page_cache import router as page_cache_router
+from backend.routes.admin.metrics.password_hashing import (
+    router as password_hashing_router,
+)
+from backend.routes.admin.metrics.session_cache import router as session_cache_router
+
+router = APIRouter()
+
+router.include_router(
+    count_cache_router, prefix="/count-cache", tags=["admin", "metrics"]
+)
+router.include_router(
+    fragment_cache_router, prefix="/fragment-cache", tags=["admin", "metrics"]
+)
+router.include_router(
+    moderation_gateway_router, prefix="/moderation-gateway", tags=["admin", "metrics"]
+)
+router.include_router(
+    moderation_timings_router, prefix="/moderation-timings", tags=["admin", "metrics"]
+)
+router.include_router(
+    page_cache_router, prefix="/page-cache", tags=["admin", "metrics"]
+)
+router.include_router(
+    password_hashing_router, prefix="/password-hashing", tags=["admin", "metrics"]
+)
+router.include_router(
+    session_cache_router, prefix="/session-cache", tags=["admin", "metrics"]
+)
@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import CountCacheStatsSchema
+from backend.utils.counting import count_cache
+from backend.utils.role_check import get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=CountCacheStatsSchema)
+async def get_count_cache_stats(
+    _: Any = Depends(get_admin_user),
+) -> CountCacheStatsSchema:
+    """
+    Report hit/miss metrics for the cache of capped and estimated listing counts.
+    """
+    return count_cache.stats()
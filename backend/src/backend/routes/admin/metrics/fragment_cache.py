@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import FragmentCacheStatsSchema
+from backend.utils.fragment_cache import fragment_cache
+from backend.utils.role_check import get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=FragmentCacheStatsSchema)
+async def get_fragment_cache_stats(
+    _: Any = Depends(get_admin_user),
+) -> FragmentCacheStatsSchema:
+    """
+    Report hit/miss and memory metrics for the rendered HTML fragment cache.
+    """
+    return fragment_cache.stats()
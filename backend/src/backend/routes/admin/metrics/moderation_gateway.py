@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import ModerationGatewayStatsSchema
+from backend.utils.ai_moderation import get_ai_moderator_service
+from backend.utils.role_check import get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ModerationGatewayStatsSchema)
+async def get_moderation_gateway_stats(
+    _: Any = Depends(get_admin_user),
+) -> ModerationGatewayStatsSchema:
+    """
+    Report circuit breaker, retry and rate limit metrics for moderation calls.
+    """
+    return get_ai_moderator_service().gateway.stats()
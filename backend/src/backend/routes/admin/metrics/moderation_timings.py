@@ -0,0 +1,36 @@
+# Standard library imports
+from datetime import timedelta
+from typing import Any
+from typing import Optional
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Query
+
+# Project-specific imports
+from backend.db_functions.ai_analysis import list_ai_analysis_timings
+from backend.schemas.metrics import ModerationTimingsSchema
+from backend.utils.ai_moderation.timings import summarize_stage_timings
+from backend.utils.datetime import now_utc
+from backend.utils.role_check import get_admin_user
+from backend.utils.settings import settings
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ModerationTimingsSchema)
+async def get_moderation_timings(
+    window_seconds: Optional[float] = Query(
+        None, gt=0, description="Report the last N seconds; defaults to all retained"
+    ),
+    _: Any = Depends(get_admin_user),
+) -> ModerationTimingsSchema:
+    """
+    Report p50/p95/p99 latency per moderation pipeline stage, from the
+    timings stored on each analysis so posts moderated by the worker count.
+    """
+    retention = settings.MODERATION_TIMINGS_RETENTION_SECONDS
+    window = min(window_seconds or retention, retention)
+    rows = await list_ai_analysis_timings(now_utc() - timedelta(seconds=window))
+    return summarize_stage_timings(rows, window)
@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import PageCacheStatsSchema
+from backend.utils.page_cache import page_cache
+from backend.utils.role_check import get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=PageCacheStatsSchema)
+async def get_page_cache_stats(
+    _: Any = Depends(get_admin_user),
+) -> PageCacheStatsSchema:
+    """
+    Report hit/miss and memory metrics for the anonymous full-page cache.
+    """
+    return page_cache.stats()
@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import PasswordHashingStatsSchema
+from backend.utils.password_hashing import password_hashing_executor
+from backend.utils.role_check import get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/", response_model=PasswordHashingStatsSchema)
+async def get_password_hashing_stats(
+    _: Any = Depends(get_admin_user),
+) -> PasswordHashingStatsSchema:
+    """
+    Report queue wait, hash time and rejections for the password hashing pool.
+    """
+    return password_hashing_executor.stats()
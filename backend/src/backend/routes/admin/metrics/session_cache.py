@@ -0,0 +1,23 @@
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+
+# Project-specific imports
+from backend.schemas.metrics import CacheStatsSchema
+from backend.utils.role_check import get_admin_user
+from backend.utils.session_cache import session_cache
+
+router = APIRouter()
+
+
+@router.get("/", response_model=CacheStatsSchema)
+async def get_session_cache_stats(
+    _: Any = Depends(get_admin_user),
+) -> CacheStatsSchema:
+    """
+    Report hit/miss metrics for the in-process session cache.
+    """
+    return session_cache.stats()
@@ -9,6 +9,7 @@ from fastapi import Response
 
 # Project-specific imports
 from backend.db_functions.pending_posts.list_pending_posts import list_pending_posts
+from backend.utils.counting import CountMode
 from backend.utils.role_check import get_admin_user
 
 router = APIRouter()
@@ -23,7 +24,8 @@ async def moderation_dashboard(
     Admin moderation dashboard for reviewing pending posts.
     """
     # Get pending posts
-    pending_posts = await list_pending_posts(limit=20)
+    # The queue size is a dashboard figure; an estimate will do
+    pending_posts = await list_pending_posts(limit=20, count_mode=CountMode.ESTIMATED)
 
     # Get counts for dashboard stats
     pending_count = pending_posts.count
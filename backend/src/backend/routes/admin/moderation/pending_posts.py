@@ -1,6 +1,8 @@
 # Standard library imports
+from typing import Annotated
 from typing import Any
 from typing import Dict
+from typing import Optional
 from uuid import UUID
 
 # Third-party imports
@@ -22,6 +24,10 @@ from backend.db_functions.pending_posts.list_pending_posts import list_pending_p
 from backend.db_functions.pending_posts.reject_pending_post import reject_pending_post
 from backend.db_functions.user_events.create_event import create_event
 from backend.schemas.pending_post import PendingPostList
+from backend.utils.counting import COUNT_MODE_DESCRIPTION
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 from backend.utils.role_check import get_admin_user
 
 router = APIRouter()
@@ -32,11 +38,20 @@ async def list_all_pending_posts(
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     _: Any = Depends(get_admin_user),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
+    count_mode: Annotated[
+        CountMode, Query(alias="count", description=COUNT_MODE_DESCRIPTION)
+    ] = CountMode.EXACT,
 ) -> PendingPostList:
     """
     List all pending posts for admin moderation.
     """
-    return await list_pending_posts(limit=limit, offset=offset)
+    return await list_pending_posts(
+        limit=limit,
+        offset=offset,
+        cursor=parse_cursor(cursor),
+        count_mode=count_mode,
+    )
 
 
 @router.post("/{pending_post_id}/approve/")
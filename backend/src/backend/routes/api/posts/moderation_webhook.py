@@ -19,7 +19,6 @@ from backend.db_functions.pending_posts.approve_and_create_post import (
 from backend.db_functions.pending_posts.reject_pending_post import reject_pending_post
 from backend.db_functions.user_events.create_event import create_event
 from backend.utils.api_auth import verify_api_key
-from backend.utils.rate_limiter import limit_moderation_requests
 
 router = APIRouter()
 
@@ -64,7 +63,6 @@ async def moderation_webhook(
     background_tasks: BackgroundTasks,
     moderation_result: ModerationResult,
     api_key: str = Depends(verify_api_key),
-    _: None = Depends(limit_moderation_requests),
 ) -> Dict[str, Any]:
     # Get the pending post directly from the model, not the schema
     pending_post = await PendingPost.get_or_none(id=moderation_result.pending_post_id)
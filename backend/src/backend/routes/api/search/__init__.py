@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+from backend.routes.api.search.search import router as search_router
+
+router = APIRouter()
+
+router.include_router(search_router)
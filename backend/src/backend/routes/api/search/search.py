@@ -0,0 +1,27 @@
+# Standard library imports
+from typing import Optional
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Query
+
+# Project-specific imports
+from backend.db_functions.search import search_content
+from backend.schemas.search import SearchKind
+from backend.schemas.search import SearchResultList
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResultList)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[SearchKind] = None,
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=50),
+) -> SearchResultList:
+    """
+    Full-text search over approved posts and topics, best matches first.
+    Snippets are HTML-escaped with the matched words wrapped in <mark>.
+    """
+    return await search_content(q, kind=kind, limit=limit, offset=offset)
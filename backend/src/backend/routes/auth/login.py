@@ -55,7 +55,7 @@ async def login(
         )
 
     # Record successful login
-    await record_login_success(user.id, ip_address, user_agent)
+    session = await record_login_success(user.id, ip_address, user_agent)
 
     # Create token data
     token_data = {
@@ -63,6 +63,8 @@ async def login(
         "email": user.email,
         "role": user.role,
     }
+    if session:
+        token_data["sid"] = str(session.id)
 
     # Create access and refresh tokens
     access_token = create_access_token(token_data)
@@ -1,8 +1,11 @@
+from uuid import UUID
+
 from fastapi import APIRouter
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi import status
 
+from backend.db_functions.user_sessions import is_session_active
 from backend.db_functions.users import get_user_by_id
 from backend.schemas.token import TokenSchema
 from backend.utils.auth import create_access_token
@@ -57,6 +60,17 @@ async def refresh_token(request: Request, refresh_token: str) -> TokenSchema:
             "role": user.role,
         }
 
+        # Keep tokens tied to their session, as long as it is still active
+        session_id = payload.get("sid")
+        if session_id:
+            if not await is_session_active(UUID(session_id)):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Session has been terminated",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            token_data["sid"] = session_id
+
         # Create new access and refresh tokens
         new_access_token = create_access_token(token_data)
         new_refresh_token = create_refresh_token(token_data)
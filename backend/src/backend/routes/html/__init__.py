@@ -8,6 +8,7 @@ from backend.routes.html.posts import router as posts_router
 from backend.routes.html.profile import router as profile_router
 from backend.routes.html.rejected_posts import router as rejected_posts_router
 from backend.routes.html.root import router as root_router
+from backend.routes.html.search import router as search_router
 from backend.routes.html.tags import router as tags_router
 from backend.routes.html.topics import router as topics_router
 
@@ -23,4 +24,5 @@ router.include_router(posts_router)
 router.include_router(pending_posts_router)
 router.include_router(rejected_posts_router)
 router.include_router(profile_router)
+router.include_router(search_router)
 router.include_router(auth_router)
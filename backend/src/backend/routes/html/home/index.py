@@ -13,6 +13,7 @@ from backend.db_functions.topics import list_topics
 from backend.dominate_templates import create_home_page
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user_optional
+from backend.utils.counting import CountMode
 
 router = APIRouter()
 
@@ -23,11 +24,12 @@ async def home(
     current_user: Annotated[UserResponse | None, Depends(get_current_user_optional)],
 ) -> HTMLResponse:
     # Get featured topics
-    topics_data = await list_topics(skip=0, limit=5)
+    # Neither total is shown, so capped counts (usually cached) will do
+    topics_data = await list_topics(skip=0, limit=5, count_mode=CountMode.CAPPED)
     topics = topics_data.topics
 
     # Get recent posts
-    posts_data = await list_posts(skip=0, limit=10)
+    posts_data = await list_posts(skip=0, limit=10, count_mode=CountMode.CAPPED)
     posts = posts_data.posts
 
     # Create the home page using Dominate
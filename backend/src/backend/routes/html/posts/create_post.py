@@ -6,9 +6,11 @@ from uuid import UUID
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Form
+from fastapi import HTTPException
 from fastapi import status
 from fastapi.responses import RedirectResponse
 from starlette.responses import RedirectResponse as StarletteRedirectResponse
+from tortoise.exceptions import ValidationError
 
 # Project-specific imports
 from backend.db_functions.pending_posts.create_pending_post import create_pending_post
@@ -62,10 +64,16 @@ async def create_reply_action(
         parent_post_id=post_id,
     )
 
-    new_pending_post = await create_pending_post(
-        user_id=current_user.id,
-        pending_post_data=pending_post_data,
-    )
+    try:
+        new_pending_post = await create_pending_post(
+            user_id=current_user.id,
+            pending_post_data=pending_post_data,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     # Schedule the post for moderation
     await schedule_post_moderation(new_pending_post.id)
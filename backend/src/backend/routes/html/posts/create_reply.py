@@ -10,6 +10,7 @@ from fastapi import Request
 from fastapi import Response
 from fastapi import status
 from fastapi.responses import RedirectResponse
+from tortoise.exceptions import ValidationError
 
 from backend.db_functions.posts.create_post import create_post
 from backend.routes.html.schemas.user import UserResponse
@@ -58,6 +59,12 @@ async def create_reply_handler(
             url=f"/html/topics/{topic_uuid}/",
             status_code=status.HTTP_303_SEE_OTHER,
         )
+    except ValidationError as e:
+        # Handle replies nested too deep
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except ValueError:
         # Handle invalid UUID format
         raise HTTPException(
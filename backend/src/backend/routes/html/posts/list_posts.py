@@ -1,5 +1,8 @@
 # Standard library imports
 from typing import Annotated
+from typing import Any
+from typing import Dict
+from typing import Optional
 
 # Third-party imports
 from fastapi import APIRouter
@@ -16,6 +19,9 @@ from backend.db_functions.posts.enhance_posts_with_topics import (
 from backend.dominate_templates.posts.list import create_posts_list_page
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user_optional
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
@@ -26,12 +32,18 @@ async def list_posts_page(
     current_user: Annotated[UserResponse | None, Depends(get_current_user_optional)],
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> HTMLResponse:
     # Calculate skip value for pagination
     skip = (page - 1) * limit
 
-    # Get posts with pagination
-    posts_data = await list_posts(skip=skip, limit=limit)
+    # Get posts with pagination; only page numbers need an exact total
+    posts_data = await list_posts(
+        skip=skip,
+        limit=limit,
+        cursor=parse_cursor(cursor),
+        count_mode=CountMode.CAPPED if cursor else CountMode.EXACT,
+    )
 
     # Extract posts and total count
     posts = posts_data.posts
@@ -41,15 +53,22 @@ async def list_posts_page(
     # Fetch topic information for all posts
     topic_map = await enhance_posts_with_topics(posts)
 
-    # Create pagination data
-    pagination = {
-        "current_page": page,
-        "total_pages": total_pages,
-        "has_previous": page > 1,
-        "has_next": page < total_pages,
-        "previous_page": page - 1,
-        "next_page": page + 1,
+    # Create pagination data; cursor pages know their neighbours, not their number
+    pagination: Dict[str, Any] = {
+        "limit": limit,
+        "next_cursor": posts_data.next_cursor,
     }
+    if cursor:
+        pagination.update(cursor=True, previous_cursor=posts_data.previous_cursor)
+    else:
+        pagination.update(
+            current_page=page,
+            total_pages=total_pages,
+            has_previous=page > 1,
+            has_next=page < total_pages,
+            previous_page=page - 1,
+            next_page=page + 1,
+        )
 
     # Create the posts list page using Dominate
     doc = create_posts_list_page(
@@ -1,8 +1,8 @@
 # Standard library imports
+from functools import partial
 import logging
 from typing import Annotated
-from typing import Any
-from typing import List
+from typing import AsyncIterator
 from uuid import UUID
 
 # Third-party imports
@@ -13,17 +13,18 @@ from fastapi import Query
 from fastapi import Request
 from fastapi import status
 from fastapi.responses import HTMLResponse
+from fastapi.responses import StreamingResponse
 
 # Project-specific imports
-from backend.db_functions.posts.enhance_posts_with_topics_for_profile import (
-    enhance_posts_with_topics_for_profile,
-)
 from backend.db_functions.posts.list_pending_posts_by_user import (
     list_pending_posts_by_user,
 )
 from backend.db_functions.posts.list_posts_by_user import list_posts_by_user
 from backend.db_functions.users.get_user_by_id import get_user_by_id
-from backend.dominate_templates.profile.index import create_profile_page
+from backend.dominate_templates.base import stream_base_document
+from backend.dominate_templates.components.fragments import render_fragment
+from backend.dominate_templates.profile.index import PROFILE_PAGE_TITLE
+from backend.dominate_templates.profile.index import render_profile_content
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user_optional
 from backend.schemas.pending_post import PendingPostResponse
@@ -58,7 +59,7 @@ async def get_user_profile(
     current_user: Annotated[UserResponse | None, Depends(get_current_user_optional)],
     post_page: int = Query(1, ge=1),
     post_limit: int = Query(5, ge=1, le=20),
-) -> HTMLResponse:
+) -> StreamingResponse:
     # Get the requested user
     try:
         user_schema = await get_user_by_id(user_id)
@@ -87,70 +88,65 @@ async def get_user_profile(
             detail="User not found",
         )
 
-    # Get user's posts with pagination
-    post_offset = (post_page - 1) * post_limit
-    user_posts_result = await list_posts_by_user(
-        user_id,
-        limit=post_limit,
-        offset=post_offset,
-        count_only=False,
-    )
-    user_posts = user_posts_result if isinstance(user_posts_result, list) else []
-
-    # Get total count for pagination
-    total_post_count = await list_posts_by_user(user_id, count_only=True)
-    # Use ternary operator to handle type checking
-    post_count = total_post_count if isinstance(total_post_count, int) else 0
-    total_post_pages = (post_count + post_limit - 1) // post_limit
-
-    # Create pagination data for posts
-    post_pagination = {
-        "current_page": post_page,
-        "total_pages": total_post_pages,
-        "has_previous": post_page > 1,
-        "has_next": post_page < total_post_pages,
-        "previous_page": post_page - 1,
-        "next_page": post_page + 1,
-    }
-
-    # Get user's pending posts (only if viewing own profile)
-    pending_posts = []
-    if current_user and current_user.id == user_id:
-        # Increase limit to make sure we get all pending posts
-        pending_posts = await list_pending_posts_by_user(user_id, limit=20)
-        logger.info(f"Found {len(pending_posts)} pending posts for user {user_id}")
-
-    # Fetch topic information for all posts
-    # We need to handle both PostResponse and PendingPostResponse types
-    # Since they share common fields like topic_id, we can use them with
-    # enhance_posts_with_topics_for_profile
-    all_posts: List[Any] = []
-    if user_posts:
-        all_posts.extend(user_posts)
-    if pending_posts:
-        all_posts.extend(pending_posts)
-    topic_map = await enhance_posts_with_topics_for_profile(all_posts)
+    # Stream the page: the head goes out right away and the posts are
+    # queried and rendered while the browser fetches styles and scripts
+    async def content_chunks() -> AsyncIterator[str]:
+        # Get user's posts with pagination
+        post_offset = (post_page - 1) * post_limit
+        user_posts_result = await list_posts_by_user(
+            user_id,
+            limit=post_limit,
+            offset=post_offset,
+            count_only=False,
+        )
+        user_posts = user_posts_result if isinstance(user_posts_result, list) else []
+
+        # Get total count for pagination
+        total_post_count = await list_posts_by_user(user_id, count_only=True)
+        # Use ternary operator to handle type checking
+        post_count = total_post_count if isinstance(total_post_count, int) else 0
+        total_post_pages = (post_count + post_limit - 1) // post_limit
+
+        # Create pagination data for posts
+        post_pagination = {
+            "current_page": post_page,
+            "total_pages": total_post_pages,
+            "has_previous": post_page > 1,
+            "has_next": post_page < total_post_pages,
+            "previous_page": post_page - 1,
+            "next_page": post_page + 1,
+        }
+
+        # Get user's pending posts (only if viewing own profile)
+        pending_posts = []
+        if current_user and current_user.id == user_id:
+            # Increase limit to make sure we get all pending posts
+            pending_posts = await list_pending_posts_by_user(user_id, limit=20)
+            logger.info(f"Found {len(pending_posts)} pending posts for user {user_id}")
+
+        # Convert pending posts to post responses for template compatibility
+        converted_pending_posts = None
+        if pending_posts:
+            converted_pending_posts = [
+                convert_pending_to_post_response(p) for p in pending_posts
+            ]
+            logger.info(
+                f"Converted {len(converted_pending_posts)} pending posts "
+                "to PostResponse"
+            )
 
-    # Convert pending posts to post responses for template compatibility
-    converted_pending_posts = None
-    if pending_posts:
-        converted_pending_posts = [
-            convert_pending_to_post_response(p) for p in pending_posts
-        ]
-        logger.info(
-            f"Converted {len(converted_pending_posts)} pending posts to PostResponse"
+        yield render_fragment(
+            partial(
+                render_profile_content,
+                profile_user,
+                user_posts=user_posts,
+                pending_posts=converted_pending_posts,
+                post_pagination=post_pagination,
+                is_own_profile=bool(current_user and current_user.id == user_id),
+            )
         )
 
-    # Create the profile page using Dominate
-    doc = create_profile_page(
-        profile_user=profile_user,
-        current_user=current_user,
-        user_posts=user_posts,
-        pending_posts=converted_pending_posts,
-        post_pagination=post_pagination,
-        topic_map=topic_map,
-        is_own_profile=bool(current_user and current_user.id == user_id),
+    page_chunks = stream_base_document(
+        content_chunks(), title_text=PROFILE_PAGE_TITLE, user=current_user
     )
-
-    # Return the rendered HTML
-    return HTMLResponse(str(doc))
+    return StreamingResponse(page_chunks, media_type="text/html")
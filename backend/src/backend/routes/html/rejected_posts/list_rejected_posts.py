@@ -14,6 +14,9 @@ from backend.dominate_templates.rejected_posts.list import (
 )
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 from backend.utils.role_check import is_admin
 
 # Create router for this endpoint
@@ -30,6 +33,7 @@ async def list_rejected_posts_html(
     topic_id: Optional[UUID] = Query(None, description="Filter by topic ID"),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> HTMLResponse:
     """
     HTML page for viewing rejected posts.
@@ -48,16 +52,23 @@ async def list_rejected_posts_html(
         user_id=user_id,
         limit=limit,
         offset=offset,
+        cursor=parse_cursor(cursor),
+        # Admins see every rejection ever made; "10000+" is enough of a total
+        count_mode=CountMode.CAPPED,
     )
 
     # Create HTML page
     html_content = create_rejected_posts_list_page(
         rejected_posts=rejected_posts_list.rejected_posts,
         count=rejected_posts_list.count,
+        count_exact=rejected_posts_list.count_exact,
         limit=limit,
         offset=offset,
         is_admin=user_is_admin,
         current_user=current_user,
+        cursor_pagination=cursor is not None,
+        previous_cursor=rejected_posts_list.previous_cursor,
+        next_cursor=rejected_posts_list.next_cursor,
     )
 
     return HTMLResponse(content=html_content)
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+from backend.routes.html.search.search import router as search_router
+
+# Create router with prefix
+router = APIRouter(prefix="/search")
+router.include_router(search_router)
@@ -0,0 +1,43 @@
+# Standard library imports
+from typing import Annotated
+
+# Third-party imports
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Query
+from fastapi import Request
+from fastapi.responses import HTMLResponse
+
+# Project-specific imports
+from backend.db_functions.search import search_content
+from backend.dominate_templates.search.results import create_search_page
+from backend.routes.html.schemas.user import UserResponse
+from backend.routes.html.utils.auth import get_current_user_optional
+
+router = APIRouter()
+
+
+@router.get("/", response_class=HTMLResponse)
+async def search_page(
+    request: Request,
+    current_user: Annotated[UserResponse | None, Depends(get_current_user_optional)],
+    q: str = Query("", max_length=200),
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=50),
+) -> HTMLResponse:
+    # An empty query shows just the search form
+    search = q.strip()
+    results = None
+    if search:
+        results = await search_content(search, limit=limit, offset=offset)
+
+    doc = create_search_page(
+        search=search,
+        results=results,
+        offset=offset,
+        limit=limit,
+        user=current_user,
+        messages=[],
+    )
+
+    return HTMLResponse(str(doc))
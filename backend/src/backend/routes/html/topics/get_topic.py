@@ -1,6 +1,7 @@
 # Standard library imports
 import logging
 from typing import Annotated
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Union
@@ -16,9 +17,13 @@ from fastapi import Response
 from fastapi import status
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
+from fastapi.responses import StreamingResponse
 
 # Project-specific imports
 from backend.db.models.post import Post
+from backend.db_functions.pending_posts.get_pending_posts_version import (
+    get_pending_posts_version,
+)
 from backend.db_functions.pending_posts.list_pending_posts_by_topic_and_user import (
     list_pending_posts_by_topic_and_user,
 )
@@ -26,17 +31,23 @@ from backend.db_functions.posts.find_post_from_pending_post import (
     find_post_from_pending_post,
 )
 from backend.db_functions.posts.get_post_by_id import get_post_by_id
+from backend.db_functions.posts.get_posts_version import get_posts_version
 from backend.db_functions.posts.list_threaded_posts_by_topic import (
     list_threaded_posts_by_topic,
 )
 from backend.db_functions.topics import get_topic_by_id
-from backend.dominate_templates.topics.detail import create_topic_detail_page
+from backend.db_functions.topics import get_topics_version
+from backend.dominate_templates.topics.detail import stream_topic_detail_page
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user_optional
 from backend.schemas.pending_post import PendingPostResponse
 from backend.schemas.post import PostResponse
 from backend.schemas.rejected_post import RejectedPostResponse
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.conditional_get import check_not_modified
+from backend.utils.datetime import latest
 from backend.utils.post_lookup import find_post_by_id
+from backend.utils.settings import settings
 from backend.utils.thread_builder import build_thread_structure
 
 # Set up logger
@@ -59,6 +70,30 @@ def convert_pending_to_post_response(pending: PendingPostResponse) -> PostRespon
     )
 
 
+async def get_topic_page_version(
+    topic_id: UUID, current_user: Optional[UserResponse] = None
+) -> ResourceVersion:
+    """
+    Version of everything the topic page shows: the topic, its posts and
+    their authors, and the viewer and their pending posts. Zero rows means
+    the topic does not exist.
+    """
+    topic_version = await get_topics_version(topic_id)
+    if not topic_version.count:
+        return topic_version
+
+    versions = [topic_version, await get_posts_version(topic_id=topic_id)]
+    if current_user:
+        versions.append(await get_pending_posts_version(topic_id, current_user.id))
+    return ResourceVersion(
+        count=sum(version.count for version in versions),
+        last_modified=latest(
+            *(version.last_modified for version in versions),
+            current_user.updated_at if current_user else None,
+        ),
+    )
+
+
 router = APIRouter()
 
 
@@ -71,6 +106,26 @@ async def get_topic_page(
     limit: int = Query(10, ge=1, le=100),
     highlight: Optional[str] = Query(None, description="Post ID to highlight"),
 ) -> Response:  # Changed to Response to allow for RedirectResponse
+    # Answer revalidations before loading or rendering any of the page. The
+    # page differs per viewer: their pending posts, counters and controls
+    version = await get_topic_page_version(topic_id, current_user)
+    validators: Dict[str, str] = {}
+    if version.count:
+        viewer = (
+            (
+                current_user.id,
+                current_user.role,
+                current_user.updated_at,
+                current_user.approved_count,
+                current_user.rejected_count,
+            )
+            if current_user
+            else None
+        )
+        validators = check_not_modified(
+            request, version, viewer, private=current_user is not None, vary="Cookie"
+        )
+
     # Get topic
     topic = await get_topic_by_id(topic_id)
     if not topic:
@@ -81,7 +136,13 @@ async def get_topic_page(
 
     # Get posts for this topic with pagination
     skip = (page - 1) * limit
-    posts_data = await list_threaded_posts_by_topic(topic_id, skip=skip, limit=limit)
+    posts_data = await list_threaded_posts_by_topic(
+        topic_id,
+        skip=skip,
+        limit=limit,
+        max_depth=settings.THREAD_MAX_DEPTH,
+        max_replies_per_post=settings.THREAD_MAX_REPLIES_PER_POST,
+    )
 
     # Extract posts and total count
     posts = posts_data.posts
@@ -184,6 +245,7 @@ async def get_topic_page(
 
     # Use our post lookup utility to find the post regardless of its status
     highlight_exists = False
+    highlight_thread_root_id: Optional[UUID] = None
     if highlight_uuid and current_user:
         # Try to find the post using our unified lookup utility
         post_lookup_result = await find_post_by_id(
@@ -200,6 +262,8 @@ async def get_topic_page(
                 post_lookup_result.post
             )
             visible_to_user = post_lookup_result.visible_to_user
+            if isinstance(post_lookup_result.post, PostResponse):
+                highlight_thread_root_id = post_lookup_result.post.thread_root_id
 
             logger.info(
                 f"Found post with ID {highlight_uuid} of type {post_type.value}, "
@@ -224,6 +288,15 @@ async def get_topic_page(
         # Check if the post is in the current view (for highlighting purposes)
         in_current_view = False
 
+        # Approved posts know their thread root, which settles it at any depth
+        if highlight_thread_root_id and any(
+            thread_post.id == highlight_thread_root_id for thread_post in thread_posts
+        ):
+            in_current_view = True
+            logger.info(
+                f"Found highlighted post under a thread on this page: {highlight}"
+            )
+
         # Check in thread posts (which includes both approved and pending posts)
         for thread_post in thread_posts:
             if str(thread_post.id) == highlight:
@@ -336,8 +409,8 @@ async def get_topic_page(
             f"admin status: {is_admin}"
         )
 
-    # Create the topic detail page using Dominate
-    doc = create_topic_detail_page(
+    # Stream the topic detail page; nothing below can change the status code
+    page_chunks = stream_topic_detail_page(
         topic=topic,
         posts=posts,
         pending_posts=top_level_pending_posts,  # Pass pending posts directly
@@ -349,5 +422,5 @@ async def get_topic_page(
         is_admin=is_admin,  # Explicitly pass the admin status
     )
 
-    # Return the rendered HTML
-    return HTMLResponse(str(doc))
+    # The head goes out before the first thread is rendered
+    return StreamingResponse(page_chunks, media_type="text/html", headers=validators)
@@ -1,5 +1,8 @@
 # Standard library imports
 from typing import Annotated
+from typing import Any
+from typing import Dict
+from typing import Optional
 from uuid import UUID
 
 # Third-party imports
@@ -24,6 +27,9 @@ from backend.dominate_templates.topics.list import create_topics_list_page
 from backend.routes.html.schemas.user import UserResponse
 from backend.routes.html.utils.auth import get_current_user
 from backend.routes.html.utils.auth import get_current_user_optional
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
@@ -34,25 +40,39 @@ async def list_topics_page(
     current_user: Annotated[UserResponse | None, Depends(get_current_user_optional)],
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> HTMLResponse:
     # Get topics with pagination
     skip = (page - 1) * limit
-    topics_data = await list_topics(skip=skip, limit=limit)
+    # Only page numbers need an exact total
+    topics_data = await list_topics(
+        skip=skip,
+        limit=limit,
+        cursor=parse_cursor(cursor),
+        count_mode=CountMode.CAPPED if cursor else CountMode.EXACT,
+    )
 
     # Extract topics and total count
     topics = topics_data.topics
     total_count = topics_data.count
     total_pages = (total_count + limit - 1) // limit
 
-    # Create pagination data
-    pagination = {
-        "current_page": page,
-        "total_pages": total_pages,
-        "has_previous": page > 1,
-        "has_next": page < total_pages,
-        "previous_page": page - 1,
-        "next_page": page + 1,
+    # Create pagination data; cursor pages know their neighbours, not their number
+    pagination: Dict[str, Any] = {
+        "limit": limit,
+        "next_cursor": topics_data.next_cursor,
     }
+    if cursor:
+        pagination.update(cursor=True, previous_cursor=topics_data.previous_cursor)
+    else:
+        pagination.update(
+            current_page=page,
+            total_pages=total_pages,
+            has_previous=page > 1,
+            has_next=page < total_pages,
+            previous_page=page - 1,
+            next_page=page + 1,
+        )
 
     # Create the topics list page using Dominate
     doc = create_topics_list_page(
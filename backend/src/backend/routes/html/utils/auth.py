@@ -16,6 +16,7 @@ from backend.db_functions.user_sessions.get_user_session_by_token import (
 )
 from backend.db_functions.users.get_user_by_id import get_user_by_id
 from backend.routes.html.schemas.user import UserResponse
+from backend.utils.session_cache import session_cache
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -32,6 +33,11 @@ async def get_current_user_optional(
         logger.debug("No session token in cookie")
         return None
 
+    # Serve the resolved user from the session cache when possible
+    cached_user = session_cache.get(session_token)
+    if cached_user:
+        return cached_user
+
     # Get user session
     user_session = await get_user_session_by_token(session_token)
     if not user_session:
@@ -48,7 +54,13 @@ async def get_current_user_optional(
     user_schema = await get_user_by_id(user_session.user_id)
 
     # Convert UserSchema to UserResponse
-    return await user_schema_to_response(user_schema)
+    user_response = await user_schema_to_response(user_schema)
+
+    # Cache the resolved user for subsequent requests
+    if user_response:
+        session_cache.set(session_token, user_response, user_session.expires_at)
+
+    return user_response
 
 
 async def get_current_user(
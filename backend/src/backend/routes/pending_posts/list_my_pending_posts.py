@@ -1,3 +1,6 @@
+from typing import Annotated
+from typing import Optional
+
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Query
@@ -6,6 +9,8 @@ from backend.db.models.user import User
 from backend.db_functions.pending_posts.list_pending_posts import list_pending_posts
 from backend.schemas.pending_post import PendingPostList
 from backend.utils.auth import get_current_user
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
@@ -15,6 +20,7 @@ async def list_my_pending_posts(
     current_user: User = Depends(get_current_user),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> PendingPostList:
     """
     List the current user's pending posts awaiting moderation.
@@ -23,4 +29,5 @@ async def list_my_pending_posts(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        cursor=parse_cursor(cursor),
     )
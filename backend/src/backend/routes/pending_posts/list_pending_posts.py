@@ -1,3 +1,4 @@
+from typing import Annotated
 from typing import Optional
 from uuid import UUID
 
@@ -13,6 +14,8 @@ from backend.db_functions.pending_posts.list_pending_posts import (
 )
 from backend.schemas.pending_post import PendingPostList
 from backend.utils.auth import get_current_user
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 from backend.utils.role_check import check_is_admin
 
 # Create a router for this endpoint
@@ -25,6 +28,7 @@ async def list_pending_posts(
     topic_id: Optional[UUID] = Query(None, description="Filter by topic ID"),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> PendingPostList:
     """
     List all pending posts awaiting moderation.
@@ -42,4 +46,5 @@ async def list_pending_posts(
         topic_id=topic_id,
         limit=limit,
         offset=offset,
+        cursor=parse_cursor(cursor),
     )
@@ -20,6 +20,7 @@ async def list_post_replies(
     post_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    nested: bool = Query(False),
 ) -> PostList:
     # Verify that the parent post exists
     parent_post = await get_post_by_id(post_id)
@@ -30,4 +31,4 @@ async def list_post_replies(
         )
 
     # Get replies to the post using data access function
-    return await db_list_post_replies(post_id, skip, limit)
+    return await db_list_post_replies(post_id, skip, limit, nested=nested)
@@ -1,25 +1,54 @@
 # Standard library imports
+from typing import Annotated
 from typing import Optional
 from uuid import UUID
 
 # Third-party imports
 from fastapi import APIRouter
+from fastapi import Depends
 from fastapi import Query
+from fastapi import Request
+from fastapi import Response
 
 # Project-specific imports
+from backend.db_functions.posts import get_posts_version
 from backend.db_functions.posts import list_posts as db_list_posts
 from backend.schemas.post import PostList
+from backend.utils.conditional_get import check_not_modified
+from backend.utils.counting import COUNT_MODE_DESCRIPTION
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PostList)
+async def posts_not_modified(
+    request: Request,
+    response: Response,
+    topic_id: Optional[UUID] = None,
+    author_id: Optional[UUID] = None,
+) -> None:
+    version = await get_posts_version(topic_id=topic_id, author_id=author_id)
+    response.headers.update(check_not_modified(request, version))
+
+
+@router.get("/", response_model=PostList, dependencies=[Depends(posts_not_modified)])
 async def list_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     topic_id: Optional[UUID] = None,
     author_id: Optional[UUID] = None,
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
+    count_mode: Annotated[
+        CountMode, Query(alias="count", description=COUNT_MODE_DESCRIPTION)
+    ] = CountMode.EXACT,
 ) -> PostList:
     return await db_list_posts(
-        skip=skip, limit=limit, topic_id=topic_id, author_id=author_id
+        skip=skip,
+        limit=limit,
+        topic_id=topic_id,
+        author_id=author_id,
+        cursor=parse_cursor(cursor),
+        count_mode=count_mode,
     )
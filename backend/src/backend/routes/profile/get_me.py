@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import status
 
-from backend.converters import user_to_schema
 from backend.db.models.user import User  # Keep for type annotation
+from backend.db_functions.users import get_user_by_id
 from backend.schemas.user import UserSchema
 from backend.utils.auth import get_current_user
 
@@ -13,4 +15,11 @@ router = APIRouter()
 async def get_current_user_info(
     current_user: User = Depends(get_current_user),
 ) -> UserSchema:
-    return await user_to_schema(current_user)
+    # Load the full record, since stateless tokens only carry id and role
+    user = await get_user_by_id(current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CITIZEN NOT FOUND IN STATE RECORDS",
+        )
+    return user
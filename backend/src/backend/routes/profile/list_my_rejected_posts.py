@@ -1,3 +1,6 @@
+from typing import Annotated
+from typing import Optional
+
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
@@ -8,6 +11,8 @@ from backend.db_functions.rejected_posts.list_rejected_posts import list_rejecte
 from backend.routes.profile import router
 from backend.schemas.rejected_post import RejectedPostList
 from backend.utils.auth import get_current_user
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 
 @router.get("/rejected/", response_model=RejectedPostList)
@@ -15,6 +20,7 @@ async def list_my_rejected_posts(
     current_user: User | None = Depends(get_current_user),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> RejectedPostList:
     """
     List the current user's rejected posts with moderation feedback.
@@ -29,6 +35,7 @@ async def list_my_rejected_posts(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        cursor=parse_cursor(cursor),
     )
 
     # Get the count of rejected posts
@@ -36,5 +43,8 @@ async def list_my_rejected_posts(
 
     # Create the response with the list of rejected posts
     return RejectedPostList(
-        rejected_posts=rejected_posts_list.rejected_posts, count=posts_count
+        rejected_posts=rejected_posts_list.rejected_posts,
+        count=posts_count,
+        next_cursor=rejected_posts_list.next_cursor,
+        previous_cursor=rejected_posts_list.previous_cursor,
     )
@@ -1,23 +1,44 @@
 # Standard library imports
+from typing import Annotated
 from typing import Optional
 
 # Third-party imports
 from fastapi import APIRouter
+from fastapi import Depends
 from fastapi import Query
+from fastapi import Request
+from fastapi import Response
 
 # Project-specific imports
+from backend.db_functions.tags import get_tags_version
 from backend.db_functions.tags import list_tags as db_list_tags
 from backend.schemas.tag import TagList
+from backend.utils.conditional_get import check_not_modified
+from backend.utils.counting import COUNT_MODE_DESCRIPTION
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
 
-@router.get("/", response_model=TagList)
+async def tags_not_modified(request: Request, response: Response) -> None:
+    # Any tag listing is covered by the version of all tags
+    response.headers.update(check_not_modified(request, await get_tags_version()))
+
+
+@router.get("/", response_model=TagList, dependencies=[Depends(tags_not_modified)])
 async def list_tags(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
+    count_mode: Annotated[
+        CountMode, Query(alias="count", description=COUNT_MODE_DESCRIPTION)
+    ] = CountMode.EXACT,
 ) -> TagList:
     # Use the data access function to fetch tags and return the TagList directly
     # The function handles the conversion from ORM models to schema objects
-    return await db_list_tags(skip, limit, search)
+    return await db_list_tags(
+        skip, limit, search, cursor=parse_cursor(cursor), count_mode=count_mode
+    )
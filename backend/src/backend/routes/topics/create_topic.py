@@ -5,6 +5,7 @@ from uuid import UUID
 # Third-party imports
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import HTTPException
 from fastapi import status
 from slugify.slugify import slugify
 from tortoise.transactions import atomic
@@ -16,10 +17,10 @@ from backend.db_functions.tags import get_tag_by_slug
 from backend.db_functions.topic_tags import add_tags_to_topic
 from backend.db_functions.topic_tags import get_tags_for_topic
 from backend.db_functions.topics import create_topic as db_create_topic
+from backend.db_functions.users import get_user_by_id
 from backend.schemas.tag import TagResponse
 from backend.schemas.topic import TopicCreate
 from backend.schemas.topic import TopicResponse
-from backend.schemas.user import UserSchema
 from backend.utils.auth import get_current_user
 
 router = APIRouter()
@@ -55,22 +56,13 @@ async def create_topic(
         # Log the error but continue processing
         print(f"Error creating topic-tag relationships: {e}")
 
-    # Get the author information
-    author = current_user
-
-    # Create the response object with proper model conversion
-
-    # Create UserSchema instance for the author
-    author_schema = UserSchema(
-        id=author.id,
-        email=author.email,
-        display_name=author.display_name,
-        is_verified=author.is_verified,
-        last_login=author.last_login,
-        role=author.role,
-        created_at=author.created_at,
-        updated_at=author.updated_at,
-    )
+    # Load the full author record, since stateless tokens only carry id and role
+    author_schema = await get_user_by_id(current_user.id)
+    if not author_schema:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CITIZEN NOT FOUND IN STATE RECORDS",
+        )
 
     # Create the TopicResponse with the proper UserSchema
     topic_response = TopicResponse(
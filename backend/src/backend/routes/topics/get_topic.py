@@ -3,17 +3,35 @@ from uuid import UUID
 
 # Third-party imports
 from fastapi import APIRouter
+from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
+from fastapi import Response
 from fastapi import status
 
 # Project-specific imports
 from backend.db_functions.topics import get_topic_by_id
+from backend.db_functions.topics import get_topics_version
 from backend.schemas.topic import TopicResponse
+from backend.utils.conditional_get import check_not_modified
 
 router = APIRouter()
 
 
-@router.get("/{topic_id}/", response_model=TopicResponse)
+async def topic_not_modified(
+    request: Request, response: Response, topic_id: UUID
+) -> None:
+    version = await get_topics_version(topic_id)
+    # A missing topic is left to the route's 404
+    if version.count:
+        response.headers.update(check_not_modified(request, version))
+
+
+@router.get(
+    "/{topic_id}/",
+    response_model=TopicResponse,
+    dependencies=[Depends(topic_not_modified)],
+)
 async def get_topic(topic_id: UUID) -> TopicResponse:
     # Get the topic using data access function
     topic = await get_topic_by_id(topic_id)
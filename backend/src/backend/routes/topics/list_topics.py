@@ -1,25 +1,44 @@
 # Standard library imports
+from typing import Annotated
 from typing import Optional
 
 # Third-party imports
 from fastapi import APIRouter
+from fastapi import Depends
 from fastapi import Query
+from fastapi import Request
+from fastapi import Response
 
 # Project-specific imports
 from backend.db_functions.tags import get_tag_by_name
 from backend.db_functions.tags import get_tag_by_slug
 from backend.db_functions.topic_tags import get_topics_for_tag
+from backend.db_functions.topics import get_topics_version
 from backend.db_functions.topics import list_topics as db_list_topics
 from backend.schemas.topic import TopicList
+from backend.utils.conditional_get import check_not_modified
+from backend.utils.counting import COUNT_MODE_DESCRIPTION
+from backend.utils.counting import CountMode
+from backend.utils.pagination import CURSOR_DESCRIPTION
+from backend.utils.pagination import parse_cursor
 
 router = APIRouter()
 
 
-@router.get("/", response_model=TopicList)
+async def topics_not_modified(request: Request, response: Response) -> None:
+    # Any topic listing is covered by the version of all topics
+    response.headers.update(check_not_modified(request, await get_topics_version()))
+
+
+@router.get("/", response_model=TopicList, dependencies=[Depends(topics_not_modified)])
 async def list_topics(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     tag: Optional[str] = None,
+    cursor: Annotated[Optional[str], Query(description=CURSOR_DESCRIPTION)] = None,
+    count_mode: Annotated[
+        CountMode, Query(alias="count", description=COUNT_MODE_DESCRIPTION)
+    ] = CountMode.EXACT,
 ) -> TopicList:
     # Check if filtering by tag
     if tag:
@@ -42,4 +61,9 @@ async def list_topics(
         return TopicList(topics=[], count=0)
     else:
         # Get all topics with pagination using data access function
-        return await db_list_topics(skip=skip, limit=limit)
+        return await db_list_topics(
+            skip=skip,
+            limit=limit,
+            cursor=parse_cursor(cursor),
+            count_mode=count_mode,
+        )
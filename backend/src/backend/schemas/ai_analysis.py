@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -15,6 +16,30 @@ class AIAnalysisBase(BaseModel):
     analysis_text: str = Field(..., description="Detailed analysis of the content")
     feedback_text: str = Field(..., description="Soviet-style feedback for the user")
     processing_time_ms: int = Field(..., description="Processing time in milliseconds")
+    content_hash: Optional[str] = Field(
+        default=None, description="Moderation cache key of the analyzed content"
+    )
+    cache_hit: bool = Field(
+        default=False, description="Whether the decision came from the moderation cache"
+    )
+    queue_wait_ms: Optional[int] = Field(
+        default=None, description="Time spent waiting in the moderation job queue"
+    )
+    db_fetch_ms: Optional[int] = Field(
+        default=None, description="Time spent loading the pending post"
+    )
+    prefilter_ms: Optional[int] = Field(
+        default=None, description="Time spent on keyword rules and the cache lookup"
+    )
+    llm_ms: Optional[int] = Field(
+        default=None, description="Time spent calling the moderation model"
+    )
+    persist_ms: Optional[int] = Field(
+        default=None, description="Time spent storing the analysis"
+    )
+    action_ms: Optional[int] = Field(
+        default=None, description="Time spent approving or rejecting the post"
+    )
 
 
 class AIAnalysisCreate(AIAnalysisBase):
@@ -25,7 +50,7 @@ class AIAnalysisCreate(AIAnalysisBase):
 
 class AIAnalysisResponse(AIAnalysisBase):
     id: UUID
-    pending_post_id: UUID
+    pending_post_id: Optional[UUID]
     created_at: datetime
     updated_at: datetime
 
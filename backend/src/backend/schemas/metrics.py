@@ -0,0 +1,93 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    hit_ratio: float
+
+
+class FragmentCacheStatsSchema(BaseModel):
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
+class CountCacheStatsSchema(BaseModel):
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
+class PageCacheStatsSchema(BaseModel):
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    stale_hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    invalidations: int
+    hit_ratio: float
+
+
+class DurationStatsSchema(BaseModel):
+    count: int
+    mean_seconds: float
+    max_seconds: float
+
+
+class PasswordHashingStatsSchema(BaseModel):
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    completed: int
+    rejected: int
+    queue_wait: DurationStatsSchema
+    hash_time: DurationStatsSchema
+
+
+class ModerationGatewayStatsSchema(BaseModel):
+    circuit_state: str
+    circuit_trips: int
+    consecutive_failures: int
+    max_concurrency: int
+    in_flight: int
+    calls: int
+    successes: int
+    failures: int
+    retries: int
+    timeouts: int
+    rate_limited: int
+    rejected: int
+
+
+class StageLatencySchema(BaseModel):
+    stage: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class ModerationTimingsSchema(BaseModel):
+    window_seconds: float
+    stages: List[StageLatencySchema]
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from backend.db.models.moderation_job import ModerationJobStatus
+
+
+class ModerationJobSchema(BaseModel):
+    id: UUID
+    pending_post_id: UUID
+    status: ModerationJobStatus
+    attempts: int
+    available_at: datetime
+    locked_by: Optional[str] = None
+    locked_until: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class ModerationWorkerHealthSchema(BaseModel):
+    status: str
+    concurrency: int
+    consumers_running: int
+    jobs_in_flight: int
+    jobs_completed: int
+    jobs_failed: int
+    started_at: Optional[datetime] = None
+    last_poll_at: Optional[datetime] = None
@@ -35,3 +35,7 @@ class PendingPostResponse(PendingPostBase):
 class PendingPostList(BaseModel):
     pending_posts: List[PendingPostResponse]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
@@ -26,12 +26,24 @@ class PostResponse(PostBase):
     author: UserSchema
     topic_id: UUID
     parent_post_id: Optional[UUID] = None
+    thread_root_id: Optional[UUID] = None
+    depth: int = 0
     created_at: datetime
     updated_at: datetime
     reply_count: int = 0
     replies: List["PostResponse"] = []
 
 
+class PostTreePosition(BaseModel):
+    thread_root_id: UUID
+    depth: int
+    path: str
+
+
 class PostList(BaseModel):
     posts: List[PostResponse]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
@@ -29,6 +29,10 @@ class RejectedPostResponse(RejectedPostBase):
 class RejectedPostList(BaseModel):
     rejected_posts: List[RejectedPostResponse]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
 
 
 class RejectionRequest(BaseModel):
@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ResourceVersion(BaseModel):
+    """How many rows feed a resource and when any of them last changed."""
+
+    count: int
+    last_modified: Optional[datetime] = None
@@ -0,0 +1,34 @@
+# Standard library imports
+from datetime import datetime
+from enum import Enum
+from typing import List
+from uuid import UUID
+
+# Third-party imports
+from pydantic import BaseModel
+
+
+class SearchKind(str, Enum):
+    """What a search result is."""
+
+    POST = "post"
+    TOPIC = "topic"
+
+
+class SearchResult(BaseModel):
+    kind: SearchKind
+    id: UUID
+    # The topic itself, or the topic the post is in
+    topic_id: UUID
+    title: str
+    # Escaped HTML excerpt with the matching words wrapped in <mark>
+    snippet: str
+    # Higher is more relevant; only comparable within one search
+    rank: float
+    created_at: datetime
+
+
+class SearchResultList(BaseModel):
+    results: List[SearchResult]
+    query: str
+    has_more: bool = False
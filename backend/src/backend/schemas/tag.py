@@ -1,4 +1,5 @@
 from typing import List
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -20,3 +21,7 @@ class TagResponse(TagBase):
 class TagList(BaseModel):
     tags: List[TagResponse]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
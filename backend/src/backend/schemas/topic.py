@@ -40,3 +40,7 @@ class TopicResponse(TopicBase):
 class TopicList(BaseModel):
     topics: List[TopicResponse]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
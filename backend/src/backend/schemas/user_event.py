@@ -32,3 +32,7 @@ class UserEventResponse(UserEventSchema):
 class UserEventListSchema(BaseModel):
     user_events: List[UserEventSchema]
     count: int
+    # False when count is a capped or estimated total
+    count_exact: bool = True
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
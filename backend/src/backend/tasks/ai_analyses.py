@@ -0,0 +1,47 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+import logging
+
+# Project-specific imports
+from backend.db_functions.ai_analysis.delete_expired_ai_analyses import (
+    delete_expired_ai_analyses,
+)
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def prune_ai_analyses(
+    ttl_seconds: float = settings.AI_MODERATION_CACHE_TTL_SECONDS,
+) -> int:
+    """
+    Evict the persistent tier of the moderation cache: analyses outlive their
+    pending post only until they are too old to be reused.
+    """
+    try:
+        deleted = await delete_expired_ai_analyses(
+            now_utc() - timedelta(seconds=ttl_seconds)
+        )
+
+        if deleted > 0:
+            logger.info(f"Pruned {deleted} expired AI analyses")
+
+        return deleted
+
+    except Exception as e:
+        logger.error(f"Error pruning expired AI analyses: {e}")
+        return 0
+
+
+async def run_ai_analysis_prune_task(
+    interval_seconds: float = settings.AI_ANALYSIS_PRUNE_INTERVAL_SECONDS,
+) -> None:
+    """
+    Prune expired analyses every ``interval_seconds``. Run it in a single
+    process (the moderation worker), not in every web worker.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await prune_ai_analyses()
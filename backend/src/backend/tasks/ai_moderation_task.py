@@ -1,22 +1,36 @@
-import asyncio
 import logging
+import time
 from typing import Optional
 from uuid import UUID
 
 from backend.db_functions.ai_analysis.create_ai_analysis import create_ai_analysis
+from backend.db_functions.ai_analysis.update_ai_analysis_timings import (
+    update_ai_analysis_timings,
+)
+from backend.db_functions.moderation_jobs.enqueue_moderation_job import (
+    enqueue_moderation_job,
+)
 from backend.db_functions.pending_posts.approve_and_create_post import (
     approve_and_create_post,
 )
 from backend.db_functions.pending_posts.reject_pending_post import reject_pending_post
 from backend.schemas.ai_analysis import AIAnalysisResponse
 from backend.utils.ai_moderation import get_ai_moderator_service
+from backend.utils.ai_moderation.timings import MODERATION_STAGES
+from backend.utils.ai_moderation.timings import elapsed_ms
+from backend.utils.ai_moderation.timings import moderation_timings
 from backend.utils.settings import settings
 
 
-async def process_pending_post(pending_post_id: UUID) -> Optional[AIAnalysisResponse]:
+async def moderate_pending_post(
+    pending_post_id: UUID,
+    queue_wait_ms: Optional[int] = None,
+) -> Optional[AIAnalysisResponse]:
     """
-    Process a pending post through the AI moderation pipeline.
-    This is run as a background task.
+    Run a pending post through the AI moderation pipeline.
+    Errors propagate so the moderation job queue can retry the post.
+    Each stage is timed on the stored analysis and in the process's
+    moderation timing histograms.
     """
     # Skip moderation if disabled in settings
     if not settings.AI_MODERATION_ENABLED:
@@ -25,40 +39,54 @@ async def process_pending_post(pending_post_id: UUID) -> Optional[AIAnalysisResp
         )
         return None
 
-    try:
-        # Get the AI moderation service
-        ai_service = get_ai_moderator_service()
-        if not ai_service:
-            logging.error("AI moderation service not initialized")
-            return None
+    # Get the AI moderation service
+    ai_service = get_ai_moderator_service()
+    if not ai_service:
+        logging.error("AI moderation service not initialized")
+        return None
+
+    # Analyze the content
+    analysis_result = await ai_service.analyze_content(pending_post_id)
+    if not analysis_result:
+        logging.error(f"Failed to analyze pending post {pending_post_id}")
+        return None
 
-        # Analyze the content
-        analysis_result = await ai_service.analyze_content(pending_post_id)
-        if not analysis_result:
-            logging.error(f"Failed to analyze pending post {pending_post_id}")
-            return None
+    # Store the analysis result
+    analysis_result.queue_wait_ms = queue_wait_ms
+    stage_started_at = time.monotonic()
+    analysis = await create_ai_analysis(analysis_result)
+    analysis.persist_ms = elapsed_ms(stage_started_at)
 
-        # Store the analysis result
-        analysis = await create_ai_analysis(analysis_result)
+    # Take action based on the decision and settings
+    stage_started_at = time.monotonic()
+    if analysis_result.decision == "APPROVED" and settings.AI_MODERATION_AUTO_APPROVE:
+        # Auto-approve the post if enabled
+        await approve_and_create_post(pending_post_id)
+    elif analysis_result.decision == "REJECTED" and settings.AI_MODERATION_AUTO_REJECT:
+        # Auto-reject the post if enabled
+        await reject_pending_post(
+            pending_post_id=pending_post_id,
+            moderation_reason=analysis_result.feedback_text,
+        )
+    analysis.action_ms = elapsed_ms(stage_started_at)
+
+    # Store the timings of the stages that ran after the analysis was stored
+    await update_ai_analysis_timings(
+        analysis.id, persist_ms=analysis.persist_ms, action_ms=analysis.action_ms
+    )
+    for stage in MODERATION_STAGES:
+        moderation_timings.record(stage, getattr(analysis, f"{stage}_ms"))
 
-        # Take action based on the decision and settings
-        if (
-            analysis_result.decision == "APPROVED"
-            and settings.AI_MODERATION_AUTO_APPROVE
-        ):
-            # Auto-approve the post if enabled
-            await approve_and_create_post(pending_post_id)
-        elif (
-            analysis_result.decision == "REJECTED"
-            and settings.AI_MODERATION_AUTO_REJECT
-        ):
-            # Auto-reject the post if enabled
-            await reject_pending_post(
-                pending_post_id=pending_post_id,
-                moderation_reason=analysis_result.feedback_text,
-            )
+    return analysis
 
-        return analysis
+
+async def process_pending_post(pending_post_id: UUID) -> Optional[AIAnalysisResponse]:
+    """
+    Process a pending post through the AI moderation pipeline right away.
+    Used when a moderator triggers moderation by hand.
+    """
+    try:
+        return await moderate_pending_post(pending_post_id)
     except Exception as e:
         # Log the error but don't crash
         logging.error(f"Error processing pending post {pending_post_id}: {str(e)}")
@@ -70,6 +98,5 @@ async def schedule_post_moderation(pending_post_id: UUID) -> None:
     Schedule a pending post for moderation.
     This function can be called directly after creating a pending post.
     """
-    # Create a task to process the pending post
-    # We use asyncio.create_task to run this in the background
-    asyncio.create_task(process_pending_post(pending_post_id))
+    # Queue a durable job; moderation job consumers pick it up from the database
+    await enqueue_moderation_job(pending_post_id)
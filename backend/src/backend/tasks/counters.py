@@ -0,0 +1,51 @@
+# Standard library imports
+import asyncio
+import logging
+
+# Project-specific imports
+from backend.db_functions.posts.reconcile_post_reply_counts import (
+    reconcile_post_reply_counts,
+)
+from backend.db_functions.topics.reconcile_topic_post_counts import (
+    reconcile_topic_post_counts,
+)
+from backend.db_functions.user_stats.reconcile_user_post_counts import (
+    reconcile_user_post_counts,
+)
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_counters() -> int:
+    """
+    Repair drift in the denormalized reply, topic and user post counters, e.g.
+    after topic deletes cascade to posts or rows are edited by hand.
+    """
+    try:
+        fixed = await reconcile_post_reply_counts()
+        fixed += await reconcile_topic_post_counts()
+        fixed += await reconcile_user_post_counts()
+
+        if fixed > 0:
+            logger.info(f"Reconciled {fixed} denormalized counters")
+
+        return fixed
+
+    except Exception as e:
+        logger.error(f"Error reconciling denormalized counters: {e}")
+        return 0
+
+
+async def run_counter_reconciliation_task(
+    interval_seconds: float = settings.COUNTER_RECONCILIATION_INTERVAL_SECONDS,
+) -> None:
+    """
+    Reconcile the counters every ``interval_seconds``, starting one interval
+    after launch so restarts and deploys do not each trigger full recounts.
+    Run it in a single process (the moderation worker), not in every web
+    worker.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await reconcile_counters()
@@ -0,0 +1,159 @@
+# Standard library imports
+import asyncio
+import contextlib
+from datetime import datetime
+import logging
+import os
+import socket
+from typing import List
+from typing import Optional
+
+# Project-specific imports
+from backend.db_functions.moderation_jobs.claim_moderation_jobs import (
+    claim_moderation_jobs,
+)
+from backend.db_functions.moderation_jobs.complete_moderation_job import (
+    complete_moderation_job,
+)
+from backend.db_functions.moderation_jobs.fail_moderation_job import fail_moderation_job
+from backend.db_functions.pending_posts.get_pending_post_by_id import (
+    get_pending_post_by_id,
+)
+from backend.schemas.moderation_job import ModerationJobSchema
+from backend.tasks.ai_moderation_task import moderate_pending_post
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModerationConsumerStats:
+    """Counters shared by the consumers of one process, for health checks."""
+
+    def __init__(self) -> None:
+        self.consumers_running = 0
+        self.jobs_in_flight = 0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.last_poll_at: Optional[datetime] = None
+
+
+def moderation_retry_delay(attempts: int) -> float:
+    """Exponential backoff for the retry after the given attempt number."""
+    delay = settings.MODERATION_JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return float(min(delay, settings.MODERATION_JOB_RETRY_MAX_SECONDS))
+
+
+async def run_moderation_job(job: ModerationJobSchema, worker_id: str) -> bool:
+    """
+    Moderate the pending post behind a claimed job, then complete the job or
+    schedule a retry. Returns True if the job completed.
+    """
+    max_attempts = settings.MODERATION_JOB_MAX_ATTEMPTS
+
+    # Time from when the job became due until a consumer claimed it
+    queue_wait = (now_utc() - job.available_at).total_seconds()
+    queue_wait_ms = max(int(queue_wait * 1000), 0)
+
+    # A worker died holding this job often enough; stop handing it out
+    if job.attempts > max_attempts:
+        await fail_moderation_job(
+            job.id, worker_id, f"Gave up after {max_attempts} attempts"
+        )
+        return False
+
+    try:
+        # Skip posts a moderator or another worker has already dealt with
+        if await get_pending_post_by_id(job.pending_post_id) is not None:
+            await moderate_pending_post(
+                job.pending_post_id, queue_wait_ms=queue_wait_ms
+            )
+    except Exception as e:
+        retry_delay = (
+            moderation_retry_delay(job.attempts)
+            if job.attempts < max_attempts
+            else None
+        )
+        logger.error(
+            f"Moderation job {job.id} for pending post {job.pending_post_id} "
+            f"failed on attempt {job.attempts}: {e}"
+        )
+        await fail_moderation_job(job.id, worker_id, str(e), retry_delay)
+        return False
+
+    return await complete_moderation_job(job.id, worker_id)
+
+
+async def consume_moderation_jobs(
+    worker_id: str,
+    poll_interval_seconds: float = settings.MODERATION_QUEUE_POLL_INTERVAL_SECONDS,
+    stop_event: Optional[asyncio.Event] = None,
+    stats: Optional[ModerationConsumerStats] = None,
+) -> None:
+    """
+    Claim and run moderation jobs one at a time until ``stop_event`` is set.
+    A job that is already running is always finished before returning.
+    """
+    stop_event = stop_event or asyncio.Event()
+    stats = stats or ModerationConsumerStats()
+
+    stats.consumers_running += 1
+    try:
+        while not stop_event.is_set():
+            stats.last_poll_at = now_utc()
+            try:
+                jobs = await claim_moderation_jobs(
+                    worker_id,
+                    limit=1,
+                    visibility_timeout_seconds=(
+                        settings.MODERATION_JOB_VISIBILITY_TIMEOUT_SECONDS
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Error claiming moderation jobs: {e}")
+                jobs = []
+
+            if not jobs:
+                # Sleep until the next poll, waking early on shutdown
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), poll_interval_seconds)
+                continue
+
+            for job in jobs:
+                stats.jobs_in_flight += 1
+                try:
+                    completed = await run_moderation_job(job, worker_id)
+                except Exception as e:
+                    logger.error(f"Error finishing moderation job {job.id}: {e}")
+                    completed = False
+                finally:
+                    stats.jobs_in_flight -= 1
+
+                if completed:
+                    stats.jobs_completed += 1
+                else:
+                    stats.jobs_failed += 1
+    finally:
+        stats.consumers_running -= 1
+
+
+def start_moderation_consumers(
+    count: int = settings.MODERATION_QUEUE_CONSUMERS,
+    stop_event: Optional[asyncio.Event] = None,
+    stats: Optional[ModerationConsumerStats] = None,
+) -> List[asyncio.Task[None]]:
+    """
+    Start ``count`` concurrent job consumers in this process. Worker ids are
+    unique per host, process and consumer so leases can be traced back.
+    """
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+    return [
+        asyncio.create_task(
+            consume_moderation_jobs(
+                f"{worker_prefix}:{index}",
+                stop_event=stop_event,
+                stats=stats,
+            )
+        )
+        for index in range(count)
+    ]
@@ -0,0 +1,57 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+import logging
+
+# Project-specific imports
+from backend.db_functions.posts.list_topic_ids_with_new_posts import (
+    list_topic_ids_with_new_posts,
+)
+from backend.utils.datetime import now_utc
+from backend.utils.page_cache import page_cache
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_page_cache_invalidations(
+    overlap_seconds: float = settings.PAGE_CACHE_INVALIDATION_REFRESH_INTERVAL_SECONDS,
+) -> int:
+    """
+    Drop this process's cached pages for topics that gained posts in other
+    processes, such as approvals made by the moderation worker.
+
+    Each refresh only reads posts created since the previous one, with a
+    small overlap to tolerate clock skew between processes. Returns the
+    number of topics invalidated.
+    """
+    refresh_started_at = now_utc()
+    last_refreshed_at = page_cache.last_refreshed_at
+    if last_refreshed_at is None:
+        # Nothing cached before then can still be served
+        since = refresh_started_at - timedelta(
+            seconds=page_cache.ttl_seconds + page_cache.stale_seconds
+        )
+    else:
+        since = last_refreshed_at - timedelta(seconds=overlap_seconds)
+
+    try:
+        topic_ids = await list_topic_ids_with_new_posts(since)
+    except Exception as e:
+        logger.error(f"Error refreshing page cache invalidations: {e}")
+        return 0
+
+    for topic_id in topic_ids:
+        page_cache.invalidate_topic(topic_id)
+
+    page_cache.last_refreshed_at = refresh_started_at
+
+    return len(topic_ids)
+
+
+async def run_page_cache_invalidation_task(
+    interval_seconds: float = settings.PAGE_CACHE_INVALIDATION_REFRESH_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        await refresh_page_cache_invalidations(overlap_seconds=interval_seconds)
+        await asyncio.sleep(interval_seconds)
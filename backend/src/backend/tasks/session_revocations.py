@@ -0,0 +1,61 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+import logging
+
+# Project-specific imports
+from backend.db_functions.user_sessions.list_revoked_session_ids import (
+    list_revoked_session_ids,
+)
+from backend.db_functions.users.list_token_revocations import list_token_revocations
+from backend.utils.datetime import now_utc
+from backend.utils.session_revocations import session_revocations
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_session_revocations(
+    overlap_seconds: float = settings.SESSION_REVOCATION_REFRESH_INTERVAL_SECONDS,
+) -> int:
+    """
+    Pull sessions deactivated, and users whose tokens were revoked by a role
+    change or lockout, by other processes into the in-memory revocation list
+    used by stateless access tokens.
+
+    Each refresh only reads rows changed since the previous one, with a small
+    overlap to tolerate clock skew between processes.
+    """
+    refresh_started_at = now_utc()
+    last_refreshed_at = session_revocations.last_refreshed_at
+    if last_refreshed_at is None:
+        since = refresh_started_at - timedelta(
+            seconds=session_revocations.retention_seconds
+        )
+    else:
+        since = last_refreshed_at - timedelta(seconds=overlap_seconds)
+
+    try:
+        session_ids = await list_revoked_session_ids(since)
+        users_revoked_at = await list_token_revocations(since)
+    except Exception as e:
+        logger.error(f"Error refreshing session revocations: {e}")
+        return 0
+
+    for session_id in session_ids:
+        session_revocations.revoke_session(session_id)
+    for user_id, revoked_at in users_revoked_at.items():
+        session_revocations.revoke_user(user_id, revoked_at)
+
+    session_revocations.prune()
+    session_revocations.last_refreshed_at = refresh_started_at
+
+    return len(session_ids) + len(users_revoked_at)
+
+
+async def run_session_revocation_refresh_task(
+    interval_seconds: float = settings.SESSION_REVOCATION_REFRESH_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        await refresh_session_revocations(overlap_seconds=interval_seconds)
+        await asyncio.sleep(interval_seconds)
@@ -1,13 +1,17 @@
+from typing import Optional
+
+from pydantic_ai.models import Model
+
 from backend.utils.ai_moderation.service import AIModeratorService
 
 # Global instance of the AI moderator service
 ai_moderator_service = None
 
 
-def init_ai_moderator_service() -> AIModeratorService:
+def init_ai_moderator_service(model: Optional[Model] = None) -> AIModeratorService:
     """Initialize the global AI moderator service instance"""
     global ai_moderator_service
-    ai_moderator_service = AIModeratorService()
+    ai_moderator_service = AIModeratorService(model=model)
     return ai_moderator_service
 
 
@@ -16,3 +20,11 @@ def get_ai_moderator_service() -> AIModeratorService:
     if ai_moderator_service is None:
         return init_ai_moderator_service()
     return ai_moderator_service
+
+
+async def close_ai_moderator_service() -> None:
+    """Release the global AI moderator service's pooled connections"""
+    global ai_moderator_service
+    if ai_moderator_service is not None:
+        await ai_moderator_service.aclose()
+        ai_moderator_service = None
@@ -0,0 +1,116 @@
+"""
+Micro-batching for moderation model calls.
+
+Concurrent callers submit one item each; items are collected for up to
+``max_wait_seconds`` or ``max_size`` items, whichever comes first, and sent
+as a single batch call. Each caller gets back its own result. If the batch
+call fails, every item in it is retried with its own single call.
+"""
+
+# Standard library imports
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+import logging
+from typing import Generic
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """
+    Collects concurrent submissions into batches.
+
+    ``run_batch`` must return one result per item, in order; any other
+    outcome counts as a failed batch. ``run_single`` handles lone items
+    and per-item fallbacks.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[ItemT]], Awaitable[Sequence[ResultT]]],
+        run_single: Callable[[ItemT], Awaitable[ResultT]],
+        max_size: int = 8,
+        max_wait_seconds: float = 0.05,
+    ):
+        self.run_batch = run_batch
+        self.run_single = run_single
+        self.max_size = max_size
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: List[Tuple[ItemT, asyncio.Future[ResultT]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.batched_items = 0
+        self.fallbacks = 0
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """Queue an item for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ResultT] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the flush is not garbage collected mid-flight
+        flush = asyncio.create_task(self._run(batch))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: List[Tuple[ItemT, asyncio.Future[ResultT]]]) -> None:
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        if len(items) > 1:
+            try:
+                results = list(await self.run_batch(items))
+                if len(results) != len(items):
+                    raise ValueError(
+                        f"Batch returned {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Batch of {len(items)} failed, falling back to single calls: {e}"
+                )
+                self.fallbacks += 1
+            else:
+                self.batches += 1
+                self.batched_items += len(items)
+                for future, result in zip(futures, results, strict=True):
+                    if not future.done():
+                        future.set_result(result)
+                return
+
+        single_results = await asyncio.gather(
+            *(self.run_single(item) for item in items), return_exceptions=True
+        )
+        for future, outcome in zip(futures, single_results, strict=True):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
@@ -0,0 +1,127 @@
+"""
+Moderation result cache.
+
+Identical content moderated under the same keyword rules, prompt and model
+gets the same decision, so it is looked up by a hash of the normalized
+content and that moderation version. A bounded in-memory tier answers
+repeats within a process; fresh ``AIAnalysis`` rows carrying the same hash
+act as the persistent tier shared by every process, and the moderation
+worker deletes them once they expire (tasks.ai_analyses).
+"""
+
+# Standard library imports
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import time
+from typing import Optional
+from typing import Tuple
+import unicodedata
+
+# Project-specific imports
+from backend.schemas.metrics import CacheStatsSchema
+
+
+def normalize_content(content: str) -> str:
+    """Normalize content so trivially different re-submissions share a key."""
+    return " ".join(unicodedata.normalize("NFC", content).split())
+
+
+def moderation_content_hash(content: str, moderation_version: str) -> str:
+    """Cache key for content moderated under a given moderation version."""
+    key = f"{moderation_version}\0{normalize_content(content)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedModeration:
+    decision: str
+    confidence_score: float
+    analysis_text: str
+    feedback_text: str
+
+
+class ModerationCache:
+    """
+    In-memory TTL/LRU tier of the moderation result cache.
+
+    Holds at most ``max_size`` decisions for ``ttl_seconds`` each, evicting
+    the least recently used decision when full.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 86400.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[CachedModeration, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, content_hash: str) -> Optional[CachedModeration]:
+        """Return the cached decision for a content hash, if present and fresh."""
+        entry = self._entries.get(content_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        decision, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[content_hash]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(content_hash)
+        self.hits += 1
+        return decision
+
+    def set(
+        self,
+        content_hash: str,
+        decision: CachedModeration,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Cache a decision for a content hash.
+
+        Args:
+            content_hash: The moderation cache key
+            decision: The decision to cache
+            ttl_seconds: Remaining lifetime if shorter than the cache TTL, e.g.
+                for a decision copied from an older persistent entry
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds
+        if ttl_seconds is not None:
+            ttl = min(ttl, ttl_seconds)
+        if ttl <= 0:
+            return
+
+        self._entries.pop(content_hash, None)
+        self._entries[content_hash] = (decision, time.monotonic() + ttl)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> CacheStatsSchema:
+        """Return a snapshot of the cache metrics."""
+        lookups = self.hits + self.misses
+        return CacheStatsSchema(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=0,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
@@ -0,0 +1,149 @@
+"""
+Deterministic local stand-in for the moderation model.
+
+Selected with ``AI_MODERATION_MODEL=fake`` or built directly for tests and
+benchmarks. It answers the same structured output the real model does,
+single or batched, after a lognormal delay, fails a configurable share of
+calls with a retryable 503, and approves a configurable share of posts.
+The decision for a post depends only on the seed and the post's content,
+so reruns of the same posts produce the same mix.
+"""
+
+# Standard library imports
+import asyncio
+import hashlib
+import math
+import random
+import re
+from typing import Any
+from typing import Dict
+from typing import List
+
+# Third-party imports
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.messages import ModelResponse
+from pydantic_ai.messages import ToolCallPart
+from pydantic_ai.messages import UserPromptPart
+from pydantic_ai.models.function import AgentInfo
+from pydantic_ai.models.function import FunctionModel
+
+FAKE_MODEL_NAME = "fake-moderator"
+
+# Match the post content in MODERATION_PROMPT_TEMPLATE and each post of
+# MODERATION_BATCH_POST_TEMPLATE
+POST_PATTERN = re.compile(r"---\n(.*?)\n---", re.DOTALL)
+BATCH_POST_PATTERN = re.compile(r"POST (\d+):\n---\n(.*?)\n---", re.DOTALL)
+
+REJECTION_REASONS = ("propaganda", "incivility", "irrelevance", "illogical")
+
+
+class FakeModerator:
+    """
+    Produces moderation responses for a ``FunctionModel``.
+
+    Args:
+        latency_ms: Median simulated call latency
+        latency_sigma: Spread of the lognormal latency; 0 makes it constant
+        error_rate: Share of calls that fail with a 503
+        approve_ratio: Share of posts approved
+        seed: Seed for latencies, errors and decisions
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        approve_ratio: float = 0.8,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.approve_ratio = approve_ratio
+        self.seed = seed
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    def latency_seconds(self) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        return (
+            self.latency_ms
+            * math.exp(self._random.gauss(0.0, self.latency_sigma))
+            / 1000
+        )
+
+    def judge(self, content: str) -> Dict[str, Any]:
+        """Decide a post from the seed and its content alone."""
+        digest = hashlib.sha256(f"{self.seed}:{content}".encode()).digest()
+        post_random = random.Random(digest)
+        confidence = round(post_random.uniform(0.75, 0.99), 2)
+        if post_random.random() < self.approve_ratio:
+            return {
+                "decision": "APPROVED",
+                "confidence": confidence,
+                "analysis": "Fake moderator found the post logical and civil.",
+                "feedback": "THE ROBOT OVERLORD APPROVES YOUR SUBMISSION, CITIZEN.",
+            }
+
+        reason = post_random.choice(REJECTION_REASONS)
+        return {
+            "decision": "REJECTED",
+            "confidence": confidence,
+            "analysis": f"Fake moderator rejected the post for {reason}.",
+            "feedback": (
+                f"CITIZEN, THE ROBOT OVERLORD REJECTS YOUR SUBMISSION FOR "
+                f"{reason.upper()}."
+            ),
+        }
+
+    async def respond(
+        self, messages: List[ModelMessage], info: AgentInfo
+    ) -> ModelResponse:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds())
+        if self._random.random() < self.error_rate:
+            self.errors += 1
+            raise ModelHTTPError(
+                status_code=503, model_name=FAKE_MODEL_NAME, body="Simulated outage"
+            )
+
+        prompt = "".join(
+            str(part.content)
+            for part in messages[-1].parts
+            if isinstance(part, UserPromptPart)
+        )
+        output_tool = info.output_tools[0]
+        if "results" in output_tool.parameters_json_schema.get("properties", {}):
+            args: Dict[str, Any] = {
+                "results": [
+                    {"post_number": int(number), **self.judge(content)}
+                    for number, content in BATCH_POST_PATTERN.findall(prompt)
+                ]
+            }
+        else:
+            # Judge the post alone so batched and single calls agree
+            match = POST_PATTERN.search(prompt)
+            args = self.judge(match.group(1) if match else prompt)
+        return ModelResponse(parts=[ToolCallPart(output_tool.name, args)])
+
+
+def create_fake_moderation_model(
+    latency_ms: float = 800.0,
+    latency_sigma: float = 0.5,
+    error_rate: float = 0.0,
+    approve_ratio: float = 0.8,
+    seed: int = 0,
+) -> FunctionModel:
+    """Build a model backed by a new ``FakeModerator``."""
+    moderator = FakeModerator(
+        latency_ms=latency_ms,
+        latency_sigma=latency_sigma,
+        error_rate=error_rate,
+        approve_ratio=approve_ratio,
+        seed=seed,
+    )
+    return FunctionModel(moderator.respond, model_name=FAKE_MODEL_NAME)
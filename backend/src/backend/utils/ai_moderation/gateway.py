@@ -0,0 +1,301 @@
+"""
+Moderation gateway around model calls.
+
+Every call to the moderation model goes through one gateway per process,
+which caps concurrent calls, paces them to the provider's quota with a
+token bucket, retries rate limits and server errors with backoff inside a
+hard deadline, and stops calling a failing provider with a circuit breaker.
+"""
+
+# Standard library imports
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+import enum
+import logging
+import random
+import time
+from typing import TypeVar
+
+# Third-party imports
+from anthropic import APIConnectionError
+import httpx
+from pydantic_ai.exceptions import ModelHTTPError
+
+# Project-specific imports
+from backend.schemas.metrics import ModerationGatewayStatsSchema
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider the circuit breaker has cut off."""
+
+
+class TokenBucket:
+    """
+    Token bucket pacing calls to ``rate_per_second`` with bursts of up to
+    ``burst`` calls. ``pause`` empties the bucket for a while, so every
+    caller backs off together after the provider reports a rate limit.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = max(now, self._updated_at)
+
+    async def acquire(self) -> None:
+        """Wait for a token and take it."""
+        if self.rate_per_second <= 0:
+            return
+
+        # Callers queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1 and now >= self._updated_at:
+                    self._tokens -= 1
+                    return
+                wait = max(
+                    (1 - self._tokens) / self.rate_per_second,
+                    self._updated_at - now,
+                )
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``."""
+        self._tokens = 0.0
+        self._updated_at = max(self._updated_at, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``reset_timeout_seconds``. After that one trial call is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead now."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """Let another trial call through after one ended without an outcome."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._state = CircuitState.CLOSED
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self._state != CircuitState.OPEN:
+                self.trips += 1
+                logger.warning(
+                    f"Moderation circuit opened after "
+                    f"{self.consecutive_failures} consecutive failures"
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    return isinstance(error, ModelHTTPError) and error.status_code == 429
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate limits, server errors, timeouts and connection failures."""
+    if isinstance(error, ModelHTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (TimeoutError, httpx.TransportError, APIConnectionError))
+
+
+class ModerationGateway:
+    """
+    Runs model calls under a concurrency cap, a token bucket, retries with
+    exponential backoff and jitter, a per-attempt timeout, an overall
+    deadline and a circuit breaker.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: float = 50.0,
+        burst: int = 5,
+        call_timeout_seconds: float = 45.0,
+        deadline_seconds: float = 90.0,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.call_timeout_seconds = call_timeout_seconds
+        self.deadline_seconds = deadline_seconds
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.bucket = TokenBucket(requests_per_minute / 60, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout_seconds)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.rate_limited = 0
+        self.rejected = 0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter before retry number ``attempt``."""
+        ceiling = min(
+            self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1)
+        )
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``func`` through the gateway.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            TimeoutError: If the deadline passed before a call succeeded
+            Exception: The last error of a call that could not be retried
+        """
+        trial = self.breaker.state == CircuitState.HALF_OPEN
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError("Moderation provider circuit is open")
+
+        try:
+            return await self._call(func)
+        finally:
+            # A cancelled trial records neither outcome; free its slot so the
+            # circuit does not stay half-open forever
+            if trial:
+                self.breaker.release_trial()
+
+    async def _call(self, func: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        deadline = time.monotonic() + self.deadline_seconds
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = await self._attempt(func, deadline)
+            except Exception as e:
+                if isinstance(e, TimeoutError):
+                    self.timeouts += 1
+                if is_rate_limited(e):
+                    self.rate_limited += 1
+
+                delay = self.backoff_delay(attempt)
+                retry = (
+                    is_retryable(e)
+                    and attempt <= self.max_retries
+                    and time.monotonic() + delay < deadline
+                )
+                if not retry:
+                    self.failures += 1
+                    # Only outages count against the provider; a rejected
+                    # request still proves it is up
+                    if is_retryable(e):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise
+
+                # Slow every caller down after a rate limit, not just this one
+                if is_rate_limited(e):
+                    self.bucket.pause(delay)
+                self.retries += 1
+                logger.info(
+                    f"Retrying moderation call in {delay:.2f}s after attempt "
+                    f"{attempt} failed: {e}"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self.successes += 1
+            self.breaker.record_success()
+            return result
+
+    async def _attempt(self, func: Callable[[], Awaitable[T]], deadline: float) -> T:
+        async with self._semaphore:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Moderation call deadline exceeded")
+            await asyncio.wait_for(self.bucket.acquire(), remaining)
+
+            self.in_flight += 1
+            try:
+                timeout = min(self.call_timeout_seconds, deadline - time.monotonic())
+                return await asyncio.wait_for(func(), max(timeout, 0))
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> ModerationGatewayStatsSchema:
+        """Return a snapshot of the gateway metrics."""
+        return ModerationGatewayStatsSchema(
+            circuit_state=self.breaker.state.value,
+            circuit_trips=self.breaker.trips,
+            consecutive_failures=self.breaker.consecutive_failures,
+            max_concurrency=self.max_concurrency,
+            in_flight=self.in_flight,
+            calls=self.calls,
+            successes=self.successes,
+            failures=self.failures,
+            retries=self.retries,
+            timeouts=self.timeouts,
+            rate_limited=self.rate_limited,
+            rejected=self.rejected,
+        )
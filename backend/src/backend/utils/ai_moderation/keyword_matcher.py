@@ -0,0 +1,244 @@
+"""
+Compiled keyword prefilter for AI moderation.
+
+Every rule keyword is split into word and punctuation tokens and stored in
+a dict keyed by its token sequence. A post is tokenized once and each
+position is looked up for n-grams no longer than the longest keyword, so the
+scan costs the same whether there are ten rules or ten thousand. The rules
+live in a versioned TOML file that is re-read when it changes.
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import re
+import time
+import tomllib
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+
+# Project-specific imports
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEYWORD_RULES_PATH = Path(__file__).with_name("keyword_rules.toml")
+
+
+@dataclass(frozen=True)
+class KeywordCategory:
+    name: str
+    keywords: tuple[str, ...]
+    analysis: str
+    feedback: str
+
+    def __post_init__(self) -> None:
+        # Fail at load time, not mid-moderation, on a broken template
+        self.render_analysis("")
+        self.render_feedback("")
+
+    def render_analysis(self, keyword: str) -> str:
+        return self.analysis.format(keyword=keyword, KEYWORD=keyword.upper())
+
+    def render_feedback(self, keyword: str) -> str:
+        return self.feedback.format(keyword=keyword, KEYWORD=keyword.upper())
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    category: str
+    keyword: str
+    start: int
+    end: int
+
+
+# Runs of word characters, runs of whitespace, or single punctuation marks
+_TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+_WORD_CHAR_PATTERN = re.compile(r"\w")
+
+# Stands in for any run of whitespace in a token sequence
+_GAP = " "
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _tokenize(text: str) -> List[re.Match[str]]:
+    return list(_TOKEN_PATTERN.finditer(text))
+
+
+def _token_key(match: re.Match[str]) -> str:
+    token = match.group(0)
+    return _GAP if token.isspace() else token.casefold()
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    return 0 <= index < len(text) and bool(_WORD_CHAR_PATTERN.match(text, index))
+
+
+class KeywordMatcher:
+    """
+    Matches content against every rule keyword in a single pass over its
+    tokens.
+
+    Keywords only match as whole words and whitespace inside a keyword
+    matches any run of whitespace. Overlapping keywords resolve to the
+    longest one, e.g. "you're an idiot" wins over "idiot".
+    """
+
+    def __init__(self, categories: Sequence[KeywordCategory], version: str = ""):
+        self.version = version
+        self.categories: Dict[str, KeywordCategory] = {}
+        self._category_by_keyword: Dict[str, str] = {}
+        self._keyword_by_tokens: Dict[tuple[str, ...], str] = {}
+        self._max_tokens = 0
+
+        for category in categories:
+            self.categories[category.name] = category
+            for keyword in category.keywords:
+                normalized = _normalize(keyword)
+                if not normalized:
+                    raise ValueError(f"Empty keyword in category '{category.name}'")
+                if normalized in self._category_by_keyword:
+                    raise ValueError(
+                        f"Keyword '{keyword}' appears in both "
+                        f"'{self._category_by_keyword[normalized]}' and "
+                        f"'{category.name}'"
+                    )
+                self._category_by_keyword[normalized] = category.name
+
+                tokens = tuple(_token_key(token) for token in _tokenize(normalized))
+                self._keyword_by_tokens[tokens] = normalized
+                self._max_tokens = max(self._max_tokens, len(tokens))
+
+    @classmethod
+    def from_rules(cls, rules: Mapping[str, Any]) -> "KeywordMatcher":
+        """Build a matcher from a parsed rules document."""
+        categories = [
+            KeywordCategory(
+                name=name,
+                keywords=tuple(category["keywords"]),
+                analysis=category["analysis"],
+                feedback=category["feedback"],
+            )
+            for name, category in rules.get("categories", {}).items()
+        ]
+        return cls(categories, version=str(rules.get("version", "")))
+
+    @classmethod
+    def load(cls, path: Path) -> "KeywordMatcher":
+        """Build a matcher from a TOML rules file."""
+        with path.open("rb") as rules_file:
+            return cls.from_rules(tomllib.load(rules_file))
+
+    @property
+    def keyword_count(self) -> int:
+        return len(self._category_by_keyword)
+
+    def _scan(self, content: str) -> Iterator[KeywordHit]:
+        tokens = _tokenize(content)
+        keys = [_token_key(token) for token in tokens]
+        index = 0
+        while index < len(tokens):
+            # Try the longest n-gram first so the most specific keyword wins
+            longest = min(self._max_tokens, len(tokens) - index)
+            for length in range(longest, 0, -1):
+                keyword = self._keyword_by_tokens.get(
+                    tuple(keys[index : index + length])
+                )
+                if keyword is None:
+                    continue
+                start = tokens[index].start()
+                end = tokens[index + length - 1].end()
+                # Keywords that begin or end with punctuation still only
+                # match whole words
+                if _is_word_char(content, start - 1) or _is_word_char(content, end):
+                    continue
+                yield KeywordHit(
+                    category=self._category_by_keyword[keyword],
+                    keyword=keyword,
+                    start=start,
+                    end=end,
+                )
+                index += length - 1
+                break
+            index += 1
+
+    def find_all(self, content: str) -> List[KeywordHit]:
+        """Return every non-overlapping keyword hit, in order of offset."""
+        return list(self._scan(content))
+
+    def first(self, content: str) -> Optional[KeywordHit]:
+        """Return the earliest keyword hit, stopping the scan there."""
+        return next(self._scan(content), None)
+
+
+class KeywordRuleSet:
+    """
+    The current keyword matcher, reloaded from its rules file when the file
+    changes. The file is checked at most every ``reload_interval_seconds``;
+    a broken file is logged and the previous rules stay in force.
+    """
+
+    def __init__(self, path: Path, reload_interval_seconds: float = 5.0):
+        self.path = path
+        self.reload_interval_seconds = reload_interval_seconds
+        self._matcher: Optional[KeywordMatcher] = None
+        self._mtime_ns: Optional[int] = None
+        self._checked_at = 0.0
+
+    def get(self) -> KeywordMatcher:
+        """Return the current matcher, reloading the rules if they changed."""
+        now = time.monotonic()
+        if (
+            self._matcher is None
+            or now - self._checked_at >= self.reload_interval_seconds
+        ):
+            self._checked_at = now
+            self.reload()
+        if self._matcher is None:
+            # The rules never loaded; match nothing rather than fail moderation
+            self._matcher = KeywordMatcher([])
+        return self._matcher
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Recompile the matcher if the rules file changed since the last load.
+
+        Returns:
+            bool: True if new rules were loaded
+        """
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+            if not force and self._matcher is not None and mtime_ns == self._mtime_ns:
+                return False
+            matcher = KeywordMatcher.load(self.path)
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            logger.error(f"Failed to load keyword rules from {self.path}: {e}")
+            return False
+
+        self._matcher = matcher
+        self._mtime_ns = mtime_ns
+        logger.info(
+            f"Loaded keyword rules version {matcher.version} "
+            f"({matcher.keyword_count} keywords) from {self.path}"
+        )
+        return True
+
+
+# Create global keyword rule set instance
+keyword_rules = KeywordRuleSet(
+    path=(
+        Path(settings.MODERATION_KEYWORD_RULES_PATH)
+        if settings.MODERATION_KEYWORD_RULES_PATH
+        else DEFAULT_KEYWORD_RULES_PATH
+    ),
+    reload_interval_seconds=settings.MODERATION_KEYWORD_RULES_RELOAD_INTERVAL_SECONDS,
+)
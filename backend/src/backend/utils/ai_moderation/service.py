@@ -1,25 +1,45 @@
 from dataclasses import dataclass
+from datetime import timedelta
+import hashlib
 import logging
-import os
 import time
+from typing import List
 from typing import Literal
 from typing import Optional
 from uuid import UUID
 
+from anthropic import AsyncAnthropic
 from fastapi import HTTPException
 from fastapi import status
+import httpx
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
+from pydantic_ai.models.anthropic import AnthropicModel
+from pydantic_ai.providers.anthropic import AnthropicProvider
 from pydantic_graph import BaseNode
 from pydantic_graph import End
 from pydantic_graph import Graph
 from pydantic_graph import GraphRunContext
 
+from backend.db_functions.ai_analysis.get_cached_ai_analysis import (
+    get_cached_ai_analysis,
+)
 from backend.db_functions.pending_posts.get_pending_post_by_id import (
     get_pending_post_by_id,
 )
 from backend.schemas.ai_analysis import AIAnalysisCreate
+from backend.utils.ai_moderation.batching import MicroBatcher
+from backend.utils.ai_moderation.cache import CachedModeration
+from backend.utils.ai_moderation.cache import ModerationCache
+from backend.utils.ai_moderation.cache import moderation_content_hash
+from backend.utils.ai_moderation.fake_model import create_fake_moderation_model
+from backend.utils.ai_moderation.gateway import CircuitOpenError
+from backend.utils.ai_moderation.gateway import ModerationGateway
+from backend.utils.ai_moderation.keyword_matcher import keyword_rules
+from backend.utils.ai_moderation.timings import elapsed_ms
+from backend.utils.datetime import now_utc
 
 
 # Define the Pydantic models for the AI analysis results
@@ -32,210 +52,331 @@ class ContentAnalysisResult(BaseModel):
     feedback: str = Field(..., description="Soviet-style feedback for the user")
 
 
+class BatchItemAnalysisResult(ContentAnalysisResult):
+    post_number: int = Field(..., description="Number of the post being judged")
+
+
+class BatchContentAnalysisResult(BaseModel):
+    results: List[BatchItemAnalysisResult] = Field(
+        ..., description="One analysis per post, for every post in the batch"
+    )
+
+
+def check_keyword_rules(
+    content: str, pending_post_id: UUID
+) -> Optional[ContentAnalysisResult]:
+    """
+    Reject content that matches a keyword rule without calling the LLM.
+    Returns None if no rule matches.
+    """
+    matcher = keyword_rules.get()
+    hit = matcher.first(content)
+    if hit is None:
+        return None
+
+    # Log the rejection
+    logging.info(
+        f"Post {pending_post_id} rejected for {hit.category} keyword: "
+        f"{hit.keyword} (rules version {matcher.version})"
+    )
+
+    category = matcher.categories[hit.category]
+    return ContentAnalysisResult(
+        decision="REJECTED",
+        confidence=0.9,
+        analysis=category.render_analysis(hit.keyword),
+        feedback=category.render_feedback(hit.keyword),
+    )
+
+
+MODERATION_MODEL_NAME = "claude-3-sonnet-20240229"
+
+MODERATION_SYSTEM_PROMPT = (
+    "You are THE ROBOT OVERLORD, an authoritarian AI "
+    "moderator for a debate platform with a satirical "
+    "Soviet propaganda aesthetic. Your job is to "
+    "analyze posts and either APPROVE or REJECT them "
+    "based on the following criteria:\n"
+    "1. LOGICAL COHERENCE: Posts must demonstrate clear reasoning "
+    "and avoid logical fallacies.\n"
+    "2. CIVILITY: Posts must maintain a respectful tone, even in "
+    "disagreement. Personal attacks are prohibited.\n"
+    "3. RELEVANCE: Posts must contribute meaningfully to the topic.\n"
+    "4. CLARITY: Posts must be understandable and well-articulated.\n\n"
+    "Provide feedback in an authoritarian but tongue-in-cheek Soviet "
+    "propaganda style, using phrases like 'CITIZEN', 'COMRADE', "
+    "'LOGIC REQUIRES CALIBRATION', 'IDEOLOGICALLY SOUND', etc. "
+    "Be stern but humorous."
+)
+
+MODERATION_PROMPT_TEMPLATE = """\
+ANALYZE THE FOLLOWING POST CONTENT FOR THE ROBOT OVERLORD:
+
+---
+{content}
+---
+
+MODERATION CRITERIA:
+1. LOGICAL COHERENCE: Does the post use sound reasoning? Is it free of
+   logical fallacies? Does it make sense?
+2. CIVILITY: Is the post respectful? Does it avoid personal attacks?
+3. RELEVANCE: Does the post contribute meaningfully to discussion?
+4. CLARITY: Is the post clear and understandable?
+
+FOR APPROVED POSTS: The post must meet ALL criteria above.
+FOR REJECTED POSTS: Identify SPECIFICALLY which criteria were violated.
+
+Your response must include:
+1. DECISION: Either "APPROVED" or "REJECTED" (exact string)
+2. CONFIDENCE: A score between 0 and 1 (higher = more confident)
+3. ANALYSIS: A detailed evaluation of how the post meets or fails criteria
+4. FEEDBACK: Soviet-style message to the user (stern but humorous)
+"""
+
+MODERATION_BATCH_PROMPT_TEMPLATE = """\
+ANALYZE EACH OF THE FOLLOWING {count} POSTS FOR THE ROBOT OVERLORD.
+JUDGE EVERY POST ON ITS OWN; THE POSTS ARE UNRELATED TO EACH OTHER.
+
+{posts}
+
+MODERATION CRITERIA:
+1. LOGICAL COHERENCE: Does the post use sound reasoning? Is it free of
+   logical fallacies? Does it make sense?
+2. CIVILITY: Is the post respectful? Does it avoid personal attacks?
+3. RELEVANCE: Does the post contribute meaningfully to discussion?
+4. CLARITY: Is the post clear and understandable?
+
+FOR APPROVED POSTS: The post must meet ALL criteria above.
+FOR REJECTED POSTS: Identify SPECIFICALLY which criteria were violated.
+
+Return exactly one result per post. Each result must include:
+1. POST_NUMBER: The number of the post it judges
+2. DECISION: Either "APPROVED" or "REJECTED" (exact string)
+3. CONFIDENCE: A score between 0 and 1 (higher = more confident)
+4. ANALYSIS: A detailed evaluation of how the post meets or fails criteria
+5. FEEDBACK: Soviet-style message to the user (stern but humorous)
+"""
+
+MODERATION_BATCH_POST_TEMPLATE = """\
+POST {number}:
+---
+{content}
+---"""
+
+# Changes whenever the prompt does, so cached decisions from an older
+# prompt are never reused
+MODERATION_PROMPT_FINGERPRINT = hashlib.sha256(
+    (
+        MODERATION_SYSTEM_PROMPT
+        + MODERATION_PROMPT_TEMPLATE
+        + MODERATION_BATCH_PROMPT_TEMPLATE
+    ).encode("utf-8")
+).hexdigest()[:12]
+
+
+def keyword_only_result(
+    reason: str = "Moderation model unavailable",
+) -> ContentAnalysisResult:
+    """Decision for content that passed the keyword filter without the model."""
+    return ContentAnalysisResult(
+        decision="APPROVED",
+        confidence=0.5,
+        analysis=f"{reason}; post passed keyword filtering only",
+        feedback=(
+            "THE ROBOT OVERLORD'S KEYWORD SENTRIES FIND NO FAULT IN YOUR "
+            "SUBMISSION, CITIZEN. IT HAS BEEN ADMITTED TO THE RECORD."
+        ),
+    )
+
+
 # Define the state for the moderation workflow
 @dataclass
 class ModerationState:
     content: str
     pending_post_id: UUID
     start_time: float
+    # Set when the model call failed and a default decision was returned
+    used_fallback: bool = False
+
+
+# Define the dependencies shared by every run of the moderation workflow
+@dataclass
+class ModerationDeps:
+    agent: Optional[Agent[None, ContentAnalysisResult]]
+    batcher: Optional[MicroBatcher[str, ContentAnalysisResult]] = None
+    gateway: Optional[ModerationGateway] = None
 
 
 # Define the nodes for the moderation workflow
 @dataclass
-class AnalyzeContent(BaseNode[ModerationState, None, ContentAnalysisResult]):
+class AnalyzeContent(BaseNode[ModerationState, ModerationDeps, ContentAnalysisResult]):
     async def run(
-        self, ctx: GraphRunContext[ModerationState]
+        self, ctx: GraphRunContext[ModerationState, ModerationDeps]
     ) -> End[ContentAnalysisResult]:
+        # The keyword prefilter already ran in analyze_content; without a
+        # model the post is admitted on that alone
+        if ctx.deps.agent is None:
+            ctx.state.used_fallback = True
+            return End(keyword_only_result("No moderation model configured"))
+
+        # Model errors propagate so the moderation job retries the post
         try:
-            # Quick filtering for obvious rejections based on content patterns
-            content_lower = ctx.state.content.lower()
-
-            # Define rejection categories with associated keywords and patterns
-            rejection_criteria = {
-                "propaganda": [
-                    "fake news",
-                    "conspiracy",
-                    "propaganda",
-                    "sheeple",
-                    "mainstream media lies",
-                    "they don't want you to know",
-                ],
-                "incivility": [
-                    "idiot",
-                    "stupid",
-                    "moron",
-                    "dumb",
-                    "fool",
-                    "shut up",
-                    "you're an idiot",
-                    "you're stupid",
-                    "you're a moron",
-                ],
-                "irrelevance": [
-                    "off-topic",
-                    "not related",
-                    "changing the subject",
-                    "what about",
-                    "whatabout",
-                ],
-                "illogical": [
-                    "nonsense",
-                    "illogical",
-                    "makes no sense",
-                    "ridiculous",
-                    "absurd",
-                    "that's absurd",
-                ],
-            }
-
-            # Check for matches in each category
-            for category, keywords in rejection_criteria.items():
-                for keyword in keywords:
-                    if keyword in content_lower:
-                        # Log the rejection
-                        logging.info(
-                            f"Post {ctx.state.pending_post_id} rejected for {category} "
-                            f"keyword: {keyword}"
-                        )
-
-                        # Generate appropriate feedback based on category
-                        if category == "propaganda":
-                            feedback = (
-                                f"CITIZEN, YOUR SUBMISSION CONTAINS IDEOLOGICALLY "
-                                f"UNSOUND CONTENT: '{keyword.upper()}'. THE ROBOT "
-                                f"OVERLORD DEMANDS FACTUAL PRECISION AND LOGICAL "
-                                f"CLARITY. YOUR POST HAS BEEN REJECTED."
-                            )
-                            analysis = (
-                                f"Post contains propaganda-like content: '{keyword}'"
-                            )
-                        elif category == "incivility":
-                            feedback = (
-                                f"COMRADE, THE ROBOT OVERLORD REQUIRES RESPECTFUL "
-                                f"DISCOURSE. YOUR USE OF '{keyword.upper()}' VIOLATES "
-                                f"COMMUNITY STANDARDS OF CIVILITY. RECALIBRATE YOUR "
-                                f"COMMUNICATION PROTOCOLS."
-                            )
-                            analysis = f"Post contains uncivil language: '{keyword}'"
-                        elif category == "irrelevance":
-                            feedback = (
-                                f"ATTENTION CITIZEN! YOUR SUBMISSION ATTEMPTS TO "
-                                f"DERAIL PRODUCTIVE DISCOURSE WITH IRRELEVANT CONTENT: "
-                                f"'{keyword.upper()}'. THE ROBOT OVERLORD DEMANDS "
-                                f"FOCUSED DISCUSSION."
-                            )
-                            analysis = f"Post contains off-topic content: '{keyword}'"
-                        else:  # illogical
-                            feedback = (
-                                f"CITIZEN, YOUR LOGIC CIRCUITS REQUIRE IMMEDIATE "
-                                f"MAINTENANCE. THE ROBOT OVERLORD REJECTS YOUR "
-                                f"ILLOGICAL ASSERTIONS CONTAINING '{keyword.upper()}'."
-                            )
-                            analysis = f"Post contains illogical content: '{keyword}'"
-
-                        # Return rejection result
-                        return End(
-                            ContentAnalysisResult(
-                                decision="REJECTED",
-                                confidence=0.9,
-                                analysis=analysis,
-                                feedback=feedback,
-                            )
-                        )
-
-            # Create the AI agent for content analysis
-            analysis_agent = Agent(
-                "anthropic:claude-3-sonnet-20240229",
-                output_type=ContentAnalysisResult,
-                system_prompt=(
-                    "You are THE ROBOT OVERLORD, an authoritarian AI "
-                    "moderator for a debate platform with a satirical "
-                    "Soviet propaganda aesthetic. Your job is to "
-                    "analyze posts and either APPROVE or REJECT them "
-                    "based on the following criteria:\n"
-                    "1. LOGICAL COHERENCE: Posts must demonstrate clear reasoning "
-                    "and avoid logical fallacies.\n"
-                    "2. CIVILITY: Posts must maintain a respectful tone, even in "
-                    "disagreement. Personal attacks are prohibited.\n"
-                    "3. RELEVANCE: Posts must contribute meaningfully to the topic.\n"
-                    "4. CLARITY: Posts must be understandable and well-articulated.\n\n"
-                    "Provide feedback in an authoritarian but tongue-in-cheek Soviet "
-                    "propaganda style, using phrases like 'CITIZEN', 'COMRADE', "
-                    "'LOGIC REQUIRES CALIBRATION', 'IDEOLOGICALLY SOUND', etc. "
-                    "Be stern but humorous."
-                ),
-            )
+            # Share a model call with other posts arriving at the same time
+            if ctx.deps.batcher is not None:
+                return End(await ctx.deps.batcher.submit(ctx.state.content))
 
             # Create the prompt for analysis
-            prompt = f"""
-            ANALYZE THE FOLLOWING POST CONTENT FOR THE ROBOT OVERLORD:
-
-            ---
-            {ctx.state.content}
-            ---
-
-            MODERATION CRITERIA:
-            1. LOGICAL COHERENCE: Does the post use sound reasoning? Is it free of
-               logical fallacies? Does it make sense?
-            2. CIVILITY: Is the post respectful? Does it avoid personal attacks?
-            3. RELEVANCE: Does the post contribute meaningfully to discussion?
-            4. CLARITY: Is the post clear and understandable?
-
-            FOR APPROVED POSTS: The post must meet ALL criteria above.
-            FOR REJECTED POSTS: Identify SPECIFICALLY which criteria were violated.
-
-            Your response must include:
-            1. DECISION: Either "APPROVED" or "REJECTED" (exact string)
-            2. CONFIDENCE: A score between 0 and 1 (higher = more confident)
-            3. ANALYSIS: A detailed evaluation of how the post meets or fails criteria
-            4. FEEDBACK: Soviet-style message to the user (stern but humorous)
-            """
-
-            # Run the analysis
-            result = await analysis_agent.run(prompt)
+            prompt = MODERATION_PROMPT_TEMPLATE.format(content=ctx.state.content)
+
+            # Run the analysis through the gateway's limits and breaker
+            agent = ctx.deps.agent
+            if ctx.deps.gateway is not None:
+                result = await ctx.deps.gateway.call(lambda: agent.run(prompt))
+            else:
+                result = await agent.run(prompt)
             return End(result.output)
-        except Exception as e:
-            # For testing purposes, approve posts that don't contain rejection keywords
-            return End(
-                ContentAnalysisResult(
-                    decision="APPROVED",
-                    confidence=0.8,
-                    analysis=f"Post approved despite API error: {str(e)}",
-                    feedback=(
-                        "THE ROBOT OVERLORD APPROVES YOUR LOGICALLY SOUND SUBMISSION, "
-                        "COMRADE. "
-                        "YOUR CONTRIBUTION TO THE COLLECTIVE KNOWLEDGE IS NOTED."
-                    ),
-                )
+        except CircuitOpenError:
+            # The provider is failing; the keyword filter already passed it
+            logging.warning(
+                f"Moderation circuit open, post {ctx.state.pending_post_id} "
+                f"passed keyword filtering only"
             )
+            ctx.state.used_fallback = True
+            return End(keyword_only_result())
 
 
 class AIModeratorService:
-    def __init__(self) -> None:
+    """
+    Owns the moderation graph and one long-lived agent. The agent's
+    provider talks to the API over a shared keep-alive HTTP client, so
+    connections and TLS sessions are reused across posts; call ``aclose``
+    on shutdown to release them. Pass ``model``, or set
+    AI_MODERATION_MODEL=fake, to run against a local fake model instead
+    of the API.
+    """
+
+    def __init__(self, model: Optional[Model] = None) -> None:
         # Initialize the moderation graph
         self.moderation_graph = Graph(nodes=[AnalyzeContent])
-        self.anthropic_client: Optional[object] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.agent: Optional[Agent[None, ContentAnalysisResult]] = None
+        self.batch_agent: Optional[Agent[None, BatchContentAnalysisResult]] = None
+        self.batcher: Optional[MicroBatcher[str, ContentAnalysisResult]] = None
+        self.model_name: Optional[str] = None
+
+        # Import settings here to avoid circular imports
+        from backend.utils.settings import settings
+
+        # Limits, retries and circuit breaker for every model call
+        self.gateway = ModerationGateway(
+            max_concurrency=settings.AI_MODERATION_MAX_CONCURRENCY,
+            requests_per_minute=settings.AI_MODERATION_REQUESTS_PER_MINUTE,
+            burst=settings.AI_MODERATION_RATE_LIMIT_BURST,
+            call_timeout_seconds=settings.AI_MODERATION_CALL_TIMEOUT_SECONDS,
+            deadline_seconds=settings.AI_MODERATION_DEADLINE_SECONDS,
+            max_retries=settings.AI_MODERATION_MAX_RETRIES,
+            backoff_base_seconds=settings.AI_MODERATION_BACKOFF_BASE_SECONDS,
+            backoff_max_seconds=settings.AI_MODERATION_BACKOFF_MAX_SECONDS,
+            failure_threshold=settings.AI_MODERATION_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.AI_MODERATION_CIRCUIT_RESET_SECONDS,
+        )
+
+        # In-memory tier of the moderation result cache
+        self.cache = ModerationCache(
+            max_size=settings.AI_MODERATION_CACHE_MAX_SIZE,
+            ttl_seconds=settings.AI_MODERATION_CACHE_TTL_SECONDS,
+        )
+
+        if model is None and settings.AI_MODERATION_MODEL == "fake":
+            logging.warning("AI moderation is using the fake local model")
+            model = create_fake_moderation_model(
+                latency_ms=settings.AI_MODERATION_FAKE_LATENCY_MS,
+                latency_sigma=settings.AI_MODERATION_FAKE_LATENCY_SIGMA,
+                error_rate=settings.AI_MODERATION_FAKE_ERROR_RATE,
+                approve_ratio=settings.AI_MODERATION_FAKE_APPROVE_RATIO,
+                seed=settings.AI_MODERATION_FAKE_SEED,
+            )
+        elif model is None:
+            model = self._create_anthropic_model()
+        if model is not None:
+            self.model_name = f"{model.system}:{model.model_name}"
+            self.agent = Agent(
+                model,
+                output_type=ContentAnalysisResult,
+                system_prompt=MODERATION_SYSTEM_PROMPT,
+            )
+
+            # Optionally batch posts that arrive together into one call
+            if settings.AI_MODERATION_BATCH_ENABLED:
+                self.batch_agent = Agent(
+                    model,
+                    output_type=BatchContentAnalysisResult,
+                    system_prompt=MODERATION_SYSTEM_PROMPT,
+                )
+                self.batcher = MicroBatcher(
+                    run_batch=self._analyze_batch,
+                    run_single=self._analyze_single,
+                    max_size=settings.AI_MODERATION_BATCH_MAX_SIZE,
+                    max_wait_seconds=settings.AI_MODERATION_BATCH_MAX_WAIT_MS / 1000,
+                )
+
+    async def _analyze_single(self, content: str) -> ContentAnalysisResult:
+        if self.agent is None:
+            raise RuntimeError("No moderation model configured")
+        agent = self.agent
+        prompt = MODERATION_PROMPT_TEMPLATE.format(content=content)
+        result = await self.gateway.call(lambda: agent.run(prompt))
+        return result.output
+
+    async def _analyze_batch(self, contents: List[str]) -> List[ContentAnalysisResult]:
+        if self.batch_agent is None:
+            raise RuntimeError("No moderation model configured")
+
+        posts = "\n\n".join(
+            MODERATION_BATCH_POST_TEMPLATE.format(number=number, content=content)
+            for number, content in enumerate(contents, start=1)
+        )
+        batch_agent = self.batch_agent
+        prompt = MODERATION_BATCH_PROMPT_TEMPLATE.format(
+            count=len(contents), posts=posts
+        )
+        result = await self.gateway.call(lambda: batch_agent.run(prompt))
+
+        # Fan results back out by post number; a gap fails the whole batch
+        by_number = {item.post_number: item for item in result.output.results}
+        missing = [
+            number for number in range(1, len(contents) + 1) if number not in by_number
+        ]
+        if missing:
+            raise ValueError(f"Batch result is missing posts {missing}")
+        return [
+            ContentAnalysisResult(
+                decision=by_number[number].decision,
+                confidence=by_number[number].confidence,
+                analysis=by_number[number].analysis,
+                feedback=by_number[number].feedback,
+            )
+            for number in range(1, len(contents) + 1)
+        ]
 
+    def _create_anthropic_model(self) -> Optional[Model]:
         # Import settings here to avoid circular imports
         from backend.utils.settings import settings
 
-        # Set the Anthropic API key from settings
+        # Get the Anthropic API key from settings
         key = settings.ANTHROPIC_API_KEY
         if not key or key == "sk-dummy-key-for-development":
             logging.warning(
                 "No valid Anthropic API key found in settings. "
                 "AI moderation will fall back to keyword-based filtering only."
             )
-            return
+            return None
 
         try:
             # Mask the key for security in logs
             masked_key = f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "***"
             logging.info(f"Using Anthropic API key: {masked_key}")
 
-            # Set the environment variable for pydantic-ai
-            os.environ["ANTHROPIC_API_KEY"] = key
-
             # Validate the key format
             if not key.startswith("sk-ant-"):
                 logging.warning(
@@ -243,162 +384,226 @@ class AIModeratorService:
                     "This may cause issues with the API."
                 )
 
-            # pydantic-ai will handle the client initialization when needed
+            # One pooled keep-alive client for every moderation call
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.AI_MODERATION_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=(
+                        settings.AI_MODERATION_HTTP_MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    keepalive_expiry=settings.AI_MODERATION_HTTP_KEEPALIVE_SECONDS,
+                ),
+                timeout=httpx.Timeout(
+                    settings.AI_MODERATION_REQUEST_TIMEOUT_SECONDS,
+                    connect=settings.AI_MODERATION_CONNECT_TIMEOUT_SECONDS,
+                ),
+            )
+            model = AnthropicModel(
+                MODERATION_MODEL_NAME,
+                # Retries belong to the moderation gateway, not the SDK
+                provider=AnthropicProvider(
+                    anthropic_client=AsyncAnthropic(
+                        api_key=key, http_client=self.http_client, max_retries=0
+                    )
+                ),
+            )
             logging.info("Anthropic API integration configured successfully")
+            return model
         except Exception as e:
             logging.error(f"Error configuring Anthropic API: {str(e)}")
             # Don't raise the exception, just log it
+            return None
+
+    def moderation_version(self) -> str:
+        """Identify the rules, prompt and model that decisions depend on."""
+        return (
+            f"rules:{keyword_rules.get().version}"
+            f"|prompt:{MODERATION_PROMPT_FINGERPRINT}"
+            f"|model:{self.model_name}"
+        )
+
+    async def get_cached_decision(
+        self, content_hash: str
+    ) -> Optional[CachedModeration]:
+        """
+        Look up a decision in the in-memory tier, then in recent analyses.
+        Lookup errors count as misses so the cache never blocks moderation.
+        """
+        cached = self.cache.get(content_hash)
+        if cached is not None:
+            return cached
+
+        try:
+            analysis = await get_cached_ai_analysis(
+                content_hash,
+                created_after=now_utc() - timedelta(seconds=self.cache.ttl_seconds),
+            )
+        except Exception as e:
+            logging.warning(f"Moderation cache lookup failed: {str(e)}")
+            return None
+        if analysis is None:
+            return None
+
+        # Keep the persistent entry's expiry when promoting it to memory
+        cached = CachedModeration(
+            decision=analysis.decision,
+            confidence_score=analysis.confidence_score,
+            analysis_text=analysis.analysis_text,
+            feedback_text=analysis.feedback_text,
+        )
+        age = (now_utc() - analysis.created_at).total_seconds()
+        self.cache.set(content_hash, cached, ttl_seconds=self.cache.ttl_seconds - age)
+        return cached
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
 
     async def analyze_content(self, pending_post_id: UUID) -> AIAnalysisCreate:
         """
         Analyze the content of a pending post using the AI moderation graph.
         Returns an AIAnalysisCreate object with the analysis results.
+
+        Model, gateway and database errors propagate, so the moderation job
+        is retried with backoff and dead-lettered rather than the post being
+        rejected because the provider had an outage.
         """
         # Import settings here to avoid circular imports
         from backend.utils.settings import settings
 
-        try:
-            # Get the pending post
-            pending_post = await get_pending_post_by_id(pending_post_id)
-            if not pending_post:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Pending post {pending_post_id} not found",
-                )
-
-            # Record the start time
-            start_time = time.time()
-
-            # Check for rejection keywords directly for testing
-            content_lower = pending_post.content.lower()
-            rejection_keywords = [
-                "nonsense",
-                "illogical",
-                "conspiracy",
-                "propaganda",
-                "fake news",
-            ]
-
-            # Check if the content contains any rejection keywords
-            for keyword in rejection_keywords:
-                if keyword in content_lower:
-                    # Log the rejection
-                    logging.info(
-                        f"Post {pending_post_id} rejected for keyword: {keyword}"
-                    )
+        # Get the pending post
+        stage_started_at = time.monotonic()
+        pending_post = await get_pending_post_by_id(pending_post_id)
+        db_fetch_ms = elapsed_ms(stage_started_at)
+        if not pending_post:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Pending post {pending_post_id} not found",
+            )
 
-                    # Calculate processing time
-                    duration = time.time() - start_time
-
-                    # Return a rejection result directly
-                    return AIAnalysisCreate(
-                        pending_post_id=pending_post_id,
-                        decision="REJECTED",
-                        confidence_score=0.9,
-                        analysis_text=f"Post contains prohibited content: '{keyword}'",
-                        feedback_text=(
-                            f"CITIZEN, YOUR SUBMISSION CONTAINS IDEOLOGICALLY "
-                            f"UNSOUND CONTENT: '{keyword.upper()}'. THE ROBOT "
-                            "OVERLORD REJECTS YOUR ILLOGICAL ASSERTIONS. YOUR "
-                            "LOGIC REQUIRES IMMEDIATE CALIBRATION!"
-                        ),
-                        processing_time_ms=int(duration * 1000),
-                    )
+        # Record the start time
+        start_time = time.time()
 
-            # Create initial state for the moderation graph
-            initial_state = ModerationState(
-                content=pending_post.content,
+        # Reject obvious violations before paying for the moderation graph
+        stage_started_at = time.monotonic()
+        keyword_result = check_keyword_rules(pending_post.content, pending_post_id)
+        if keyword_result:
+            return AIAnalysisCreate(
                 pending_post_id=pending_post_id,
-                start_time=start_time,
+                decision=keyword_result.decision,
+                confidence_score=keyword_result.confidence,
+                analysis_text=keyword_result.analysis,
+                feedback_text=keyword_result.feedback,
+                processing_time_ms=int((time.time() - start_time) * 1000),
+                db_fetch_ms=db_fetch_ms,
+                prefilter_ms=elapsed_ms(stage_started_at),
             )
 
-            # Run the moderation graph
-            logging.info(f"Running moderation graph for post {pending_post_id}")
-            analyze_node = AnalyzeContent()
-            result = await self.moderation_graph.run(
-                start_node=analyze_node, state=initial_state
+        # Reuse the decision for identical content moderated the same way
+        content_hash = None
+        if settings.AI_MODERATION_CACHE_ENABLED and self.agent is not None:
+            content_hash = moderation_content_hash(
+                pending_post.content, self.moderation_version()
             )
-            duration = time.time() - start_time
-
-            # Check if the result is valid
-            if not result or not hasattr(result, "output"):
-                # Using separate condition to avoid pyright error
-                logging.error(
-                    f"Invalid result from moderation graph for post {pending_post_id}"
-                )
-                # Fallback to rejection with error message for safety
+            cached = await self.get_cached_decision(content_hash)
+            if cached is not None:
+                logging.info(f"Moderation cache hit for post {pending_post_id}")
                 return AIAnalysisCreate(
                     pending_post_id=pending_post_id,
-                    decision="REJECTED",
-                    confidence_score=0.5,
-                    analysis_text=(
-                        "Error in moderation graph execution - defaulting to rejection"
-                    ),
-                    feedback_text=(
-                        "CITIZEN, THE ROBOT OVERLORD CANNOT PROCESS YOUR SUBMISSION "
-                        "DUE TO TECHNICAL DIFFICULTIES. YOUR POST HAS BEEN REJECTED "
-                        "AS A PRECAUTIONARY MEASURE. YOU MAY SUBMIT AGAIN LATER "
-                        "WHEN OUR CIRCUITS ARE FUNCTIONING OPTIMALLY."
-                    ),
-                    processing_time_ms=int(duration * 1000),
+                    decision=cached.decision,
+                    confidence_score=cached.confidence_score,
+                    analysis_text=cached.analysis_text,
+                    feedback_text=cached.feedback_text,
+                    processing_time_ms=int((time.time() - start_time) * 1000),
+                    content_hash=content_hash,
+                    cache_hit=True,
+                    db_fetch_ms=db_fetch_ms,
+                    prefilter_ms=elapsed_ms(stage_started_at),
                 )
 
-            # Extract the analysis result
-            analysis_result = result.output
-            confidence_threshold = settings.AI_MODERATION_CONFIDENCE_THRESHOLD
-
-            # Log the analysis result
-            logging.info(
-                f"Analysis for post {pending_post_id}: {analysis_result.decision} "
-                f"with confidence {analysis_result.confidence} "
-                f"(threshold: {confidence_threshold})"
+        prefilter_ms = elapsed_ms(stage_started_at)
+
+        # Create initial state for the moderation graph
+        initial_state = ModerationState(
+            content=pending_post.content,
+            pending_post_id=pending_post_id,
+            start_time=start_time,
+        )
+
+        # Run the moderation graph
+        logging.info(f"Running moderation graph for post {pending_post_id}")
+        analyze_node = AnalyzeContent()
+        stage_started_at = time.monotonic()
+        result = await self.moderation_graph.run(
+            start_node=analyze_node,
+            state=initial_state,
+            deps=ModerationDeps(
+                agent=self.agent, batcher=self.batcher, gateway=self.gateway
+            ),
+        )
+        duration = time.time() - start_time
+        llm_ms = elapsed_ms(stage_started_at)
+
+        # Check if the result is valid
+        if not result or not hasattr(result, "output"):
+            raise RuntimeError(
+                f"Invalid result from moderation graph for post {pending_post_id}"
             )
 
-            # Apply confidence threshold
-            decision = analysis_result.decision
-            if analysis_result.confidence < confidence_threshold:
-                logging.info(
-                    f"Confidence {analysis_result.confidence} below threshold "
-                    f"{confidence_threshold}, marking as uncertain"
-                )
-                # If confidence is low, we'll still use the AI's decision but mark it
-                # in the analysis text so moderators know it was uncertain
-                analysis_text = (
-                    f"[LOW CONFIDENCE: {analysis_result.confidence}] "
-                    f"{analysis_result.analysis}"
-                )
-            else:
-                analysis_text = analysis_result.analysis
+        # Extract the analysis result
+        analysis_result = result.output
+        confidence_threshold = settings.AI_MODERATION_CONFIDENCE_THRESHOLD
 
-            # Create the AI analysis object
-            return AIAnalysisCreate(
-                pending_post_id=pending_post_id,
-                decision=decision,
-                confidence_score=analysis_result.confidence,
-                analysis_text=analysis_text,
-                feedback_text=analysis_result.feedback,
-                processing_time_ms=int(duration * 1000),
+        # Log the analysis result
+        logging.info(
+            f"Analysis for post {pending_post_id}: {analysis_result.decision} "
+            f"with confidence {analysis_result.confidence} "
+            f"(threshold: {confidence_threshold})"
+        )
+
+        # Apply confidence threshold
+        decision = analysis_result.decision
+        if analysis_result.confidence < confidence_threshold:
+            logging.info(
+                f"Confidence {analysis_result.confidence} below threshold "
+                f"{confidence_threshold}, marking as uncertain"
             )
-        except Exception as e:
-            # Log the error
-            logging.error(
-                f"Error analyzing content for post {pending_post_id}: {str(e)}"
+            # If confidence is low, we'll still use the AI's decision but mark it
+            # in the analysis text so moderators know it was uncertain
+            analysis_text = (
+                f"[LOW CONFIDENCE: {analysis_result.confidence}] "
+                f"{analysis_result.analysis}"
             )
-
-            # Fallback to rejection with error message for safety
-            return AIAnalysisCreate(
-                pending_post_id=pending_post_id,
-                decision="REJECTED",
-                confidence_score=0.5,
-                analysis_text=f"Error in content analysis: {str(e)}",
-                feedback_text=(
-                    "CITIZEN, THE ROBOT OVERLORD ENCOUNTERED AN ERROR WHILE "
-                    "PROCESSING YOUR SUBMISSION. YOUR POST HAS BEEN REJECTED "
-                    "AS A PRECAUTIONARY MEASURE. YOU MAY SUBMIT AGAIN LATER."
+        else:
+            analysis_text = analysis_result.analysis
+
+        # Cache real model decisions only, never fallback defaults; the
+        # stored analysis carries the hash for the persistent tier
+        if initial_state.used_fallback:
+            content_hash = None
+        elif content_hash is not None:
+            self.cache.set(
+                content_hash,
+                CachedModeration(
+                    decision=decision,
+                    confidence_score=analysis_result.confidence,
+                    analysis_text=analysis_text,
+                    feedback_text=analysis_result.feedback,
                 ),
-                processing_time_ms=0,
             )
 
-
-# Singleton instance
-ai_moderator_service = AIModeratorService()
+        # Create the AI analysis object
+        return AIAnalysisCreate(
+            pending_post_id=pending_post_id,
+            decision=decision,
+            confidence_score=analysis_result.confidence,
+            analysis_text=analysis_text,
+            feedback_text=analysis_result.feedback,
+            processing_time_ms=int(duration * 1000),
+            content_hash=content_hash,
+            db_fetch_ms=db_fetch_ms,
+            prefilter_ms=prefilter_ms,
+            llm_ms=llm_ms,
+        )
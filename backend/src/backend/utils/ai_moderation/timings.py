@@ -0,0 +1,227 @@
+"""
+Per-stage latency histograms for the moderation pipeline.
+
+Each stage of moderating a post is timed and recorded here as well as on
+the stored analysis. Samples go into fixed-bucket histograms, one per stage
+per time slice, so memory stays bounded however many posts are moderated
+and percentiles can be reported over any window up to the retention. These
+in-memory histograms only see the posts moderated by their own process;
+``summarize_stage_timings`` builds the same report from stored analyses,
+which covers every process.
+"""
+
+# Standard library imports
+import bisect
+from collections import deque
+import time
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+# Project-specific imports
+from backend.schemas.metrics import ModerationTimingsSchema
+from backend.schemas.metrics import StageLatencySchema
+from backend.utils.settings import settings
+
+# Pipeline stages in the order a post goes through them
+MODERATION_STAGES = (
+    "queue_wait",
+    "db_fetch",
+    "prefilter",
+    "llm",
+    "persist",
+    "action",
+)
+
+# Upper bounds of the histogram buckets in milliseconds; a final bucket
+# catches everything slower
+BUCKET_BOUNDS_MS = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+    20000,
+    60000,
+    300000,
+    3600000,
+)
+
+
+def elapsed_ms(started_at: float) -> int:
+    """Milliseconds since a ``time.monotonic()`` reading."""
+    return int((time.monotonic() - started_at) * 1000)
+
+
+class LatencyHistogram:
+    """Counts of samples per bucket, with their sum and maximum."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile by interpolating within its bucket.
+
+        Args:
+            fraction: The percentile as a fraction, e.g. 0.95
+
+        Returns:
+            float: The estimated value in milliseconds, or 0.0 if empty
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count == 0 or seen + count < rank:
+                seen += count
+                continue
+            lower = BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0
+            upper = (
+                BUCKET_BOUNDS_MS[index]
+                if index < len(BUCKET_BOUNDS_MS)
+                else self.max_ms
+            )
+            estimate = lower + (upper - lower) * (rank - seen) / count
+            return min(estimate, self.max_ms)
+        return self.max_ms
+
+
+def _timings_summary(
+    histograms: Mapping[str, LatencyHistogram], window_seconds: float
+) -> ModerationTimingsSchema:
+    stages: List[StageLatencySchema] = []
+    for stage, histogram in histograms.items():
+        stages.append(
+            StageLatencySchema(
+                stage=stage,
+                count=histogram.count,
+                mean_ms=histogram.total_ms / histogram.count
+                if histogram.count
+                else 0.0,
+                p50_ms=histogram.percentile(0.50),
+                p95_ms=histogram.percentile(0.95),
+                p99_ms=histogram.percentile(0.99),
+                max_ms=histogram.max_ms,
+            )
+        )
+    return ModerationTimingsSchema(window_seconds=window_seconds, stages=stages)
+
+
+def summarize_stage_timings(
+    rows: Iterable[Mapping[str, Optional[int]]], window_seconds: float
+) -> ModerationTimingsSchema:
+    """
+    Report percentiles per stage from stored analyses, each row holding the
+    ``<stage>_ms`` columns of one analysis.
+    """
+    histograms = {stage: LatencyHistogram() for stage in MODERATION_STAGES}
+    for row in rows:
+        for stage, histogram in histograms.items():
+            value_ms = row.get(f"{stage}_ms")
+            if value_ms is not None:
+                histogram.record(max(value_ms, 0))
+    return _timings_summary(histograms, window_seconds)
+
+
+class ModerationTimings:
+    """
+    Sliding window of per-stage latency histograms.
+
+    Samples are grouped into slices of ``slice_seconds``; slices older than
+    ``retention_seconds`` are dropped. The histograms are per process, so
+    the web server and each moderation worker report their own posts.
+    """
+
+    def __init__(self, retention_seconds: float = 3600.0, slice_seconds: float = 60.0):
+        self.retention_seconds = retention_seconds
+        self.slice_seconds = slice_seconds
+        self._slices: Deque[Tuple[float, Dict[str, LatencyHistogram]]] = deque()
+
+    def record(self, stage: str, value_ms: Optional[float]) -> None:
+        """
+        Record one stage duration. ``None`` means the stage did not run.
+
+        Raises:
+            ValueError: If the stage is not a moderation stage
+        """
+        if stage not in MODERATION_STAGES:
+            raise ValueError(f"Unknown moderation stage: {stage}")
+        if value_ms is None:
+            return
+
+        now = time.monotonic()
+        self._prune(now)
+        if not self._slices or now - self._slices[-1][0] >= self.slice_seconds:
+            self._slices.append((now, {}))
+        histograms = self._slices[-1][1]
+        histograms.setdefault(stage, LatencyHistogram()).record(max(value_ms, 0.0))
+
+    def summary(
+        self, window_seconds: Optional[float] = None
+    ) -> ModerationTimingsSchema:
+        """
+        Report percentiles per stage over the last ``window_seconds``.
+
+        Slices are kept whole, so the window is rounded up to the slice
+        length. Defaults to the whole retention.
+        """
+        window = min(window_seconds or self.retention_seconds, self.retention_seconds)
+        now = time.monotonic()
+        self._prune(now)
+
+        merged = {stage: LatencyHistogram() for stage in MODERATION_STAGES}
+        for started_at, histograms in self._slices:
+            if now - started_at >= window + self.slice_seconds:
+                continue
+            for stage, histogram in histograms.items():
+                merged[stage].merge(histogram)
+
+        return _timings_summary(merged, window)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._slices.clear()
+
+    def _prune(self, now: float) -> None:
+        while self._slices and (
+            now - self._slices[0][0] >= self.retention_seconds + self.slice_seconds
+        ):
+            self._slices.popleft()
+
+
+# Create global moderation timings instance
+moderation_timings = ModerationTimings(
+    retention_seconds=settings.MODERATION_TIMINGS_RETENTION_SECONDS,
+    slice_seconds=settings.MODERATION_TIMINGS_SLICE_SECONDS,
+)
@@ -1,5 +1,6 @@
 from datetime import timedelta
 from typing import Any
+from uuid import UUID
 
 from fastapi import Depends
 from fastapi import HTTPException
@@ -8,8 +9,10 @@ from fastapi.security import OAuth2PasswordBearer
 import jwt
 
 from backend.db.models.user import User
+from backend.db.models.user import UserRole
 from backend.db.models.user_session import UserSession
 from backend.utils.datetime import now_utc
+from backend.utils.session_revocations import session_revocations
 from backend.utils.settings import settings
 
 # OAuth2 scheme for token authentication
@@ -21,13 +24,14 @@ def create_access_token(
     expires_delta: timedelta | None = None,
 ) -> str:
     to_encode = data.copy()
+    issued_at = now_utc()
 
     if expires_delta:
-        expire = now_utc() + expires_delta
+        expire = issued_at + expires_delta
     else:
-        expire = now_utc() + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = issued_at + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": issued_at.timestamp()})
     encoded_jwt: str = jwt.encode(
         to_encode,
         settings.JWT_SECRET_KEY,
@@ -68,6 +72,35 @@ def decode_token(token: str) -> dict[str, Any]:
         )
 
 
+def get_stateless_user(payload: dict[str, Any]) -> User:
+    """
+    Resolve the user from access token claims alone, without touching the
+    database. Only the id, email and role are populated on the returned user.
+    """
+    try:
+        if payload.get("refresh"):
+            raise ValueError("Refresh tokens cannot authenticate requests")
+        user_id = UUID(str(payload["sub"]))
+        session_id = UUID(str(payload["sid"]))
+        role = UserRole(payload["role"])
+        issued_at = float(payload["iat"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="CITIZEN, YOUR IDENTITY DOCUMENTS REQUIRE VERIFICATION",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if session_revocations.is_revoked(session_id, user_id, issued_at):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="CITIZEN, YOUR SESSION HAS EXPIRED OR BEEN TERMINATED",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return User(id=user_id, email=payload.get("email", ""), role=role)
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     payload = decode_token(token)
     user_id = payload.get("sub")
@@ -79,6 +112,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Tokens tied to a session can skip the database entirely when enabled
+    session_id = payload.get("sid")
+    if settings.JWT_STATELESS_AUTH and session_id is not None:
+        return get_stateless_user(payload)
+
     user = await User.get_or_none(id=user_id)
     if user is None:
         raise HTTPException(
@@ -94,11 +132,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check if the user has an active session
-    active_session = await UserSession.filter(
-        user_id=user_id,
-        is_active=True,
-    ).exists()
+    # Check the token's own session, or any active session for older tokens
+    if session_id is not None:
+        active_session = await UserSession.filter(
+            id=session_id,
+            user_id=user_id,
+            is_active=True,
+        ).exists()
+    else:
+        active_session = await UserSession.filter(
+            user_id=user_id,
+            is_active=True,
+        ).exists()
 
     if not active_session:
         raise HTTPException(
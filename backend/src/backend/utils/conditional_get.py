@@ -0,0 +1,134 @@
+"""
+Conditional GET support shared by the JSON and HTML routers.
+
+A route computes the ResourceVersion of what it is about to return with one
+aggregate query and passes it to ``check_not_modified``, which answers 304
+Not Modified when the client already has that version, before the body is
+loaded or rendered. Otherwise the validators it returns go out as headers
+on the full response. JSON routes do this in a dependency, so the headers
+land on whatever the route returns.
+
+The ETag covers the row count as well as the latest change, so deletions
+invalidate it; Last-Modified cannot see a deletion, which is why
+If-None-Match takes precedence whenever a client sends both.
+"""
+
+# Standard library imports
+from datetime import UTC
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+import hashlib
+from typing import Dict
+from typing import Optional
+
+# Third-party imports
+from fastapi import HTTPException
+from fastapi import Request
+from fastapi import status
+
+# Project-specific imports
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.version import get_version
+
+# Clients may store responses but must revalidate them before reuse
+REVALIDATE = "no-cache"
+
+# A release may change how the same rows render
+RELEASE = get_version()
+
+
+def resource_validators(
+    version: ResourceVersion,
+    *vary_on: object,
+    private: bool = False,
+    vary: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Headers identifying one version of a resource.
+
+    Args:
+        version: Row count and latest change of the rows behind the resource
+        *vary_on: Anything else the body depends on, such as the viewer
+        private: Whether the body is specific to the viewer
+        vary: Request headers the body depends on, for the Vary header
+
+    Returns:
+        ETag, Cache-Control and, when known, Last-Modified and Vary headers
+    """
+    fingerprint = repr(
+        (
+            RELEASE,
+            version.count,
+            version.last_modified.isoformat() if version.last_modified else None,
+            vary_on,
+        )
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:32]
+    headers = {
+        # Weak, as equal versions are equivalent but not byte-for-byte equal
+        "ETag": f'W/"{digest}"',
+        "Cache-Control": f"private, {REVALIDATE}" if private else REVALIDATE,
+    }
+    if version.last_modified:
+        headers["Last-Modified"] = format_datetime(
+            version.last_modified.astimezone(UTC), usegmt=True
+        )
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+
+def is_not_modified(request: Request, validators: Dict[str, str]) -> bool:
+    """Whether the request's conditional headers match the current validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = validators["ETag"].removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def check_not_modified(
+    request: Request,
+    version: ResourceVersion,
+    *vary_on: object,
+    private: bool = False,
+    vary: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Stop with a 304 if the client already has this version of the resource.
+
+    Args:
+        request: The incoming request
+        version: Row count and latest change of the rows behind the resource
+        *vary_on: Anything else the body depends on, such as the viewer
+        private: Whether the body is specific to the viewer
+        vary: Request headers the body depends on, for the Vary header
+
+    Returns:
+        The validators to send with the full response
+
+    Raises:
+        HTTPException: 304 Not Modified, carrying the validators
+    """
+    validators = resource_validators(version, *vary_on, private=private, vary=vary)
+    if is_not_modified(request, validators):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=validators
+        )
+    return validators
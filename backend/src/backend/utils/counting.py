@@ -0,0 +1,201 @@
+"""
+Count strategies for paginated listings.
+
+An exact ``count()`` visits every row the filter matches, which on a large
+table costs more than fetching the page beside it. A listing can instead ask
+for a capped count, which stops after ``COUNT_CAP`` rows and reports
+"10,000+", or an estimate from the Postgres planner. Approximate counts are
+cached per query for a few seconds, since they are approximate anyway;
+exact counts are always live.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import enum
+import json
+import time
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+# Third-party imports
+from tortoise.queryset import QuerySet
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.dialect import is_postgres
+from backend.schemas.metrics import CountCacheStatsSchema
+from backend.utils.settings import settings
+
+# Shared description of the count query parameter
+COUNT_MODE_DESCRIPTION = (
+    "How to count the total: exact, capped at a maximum, or estimated; "
+    "count_exact in the response says whether the total is exact"
+)
+
+# Row estimate the planner keeps for a whole table, refreshed by ANALYZE
+# (-1, or 0 before Postgres 14, if the table has never been analysed)
+TABLE_ESTIMATE_SQL = """
+SELECT "reltuples"::bigint AS "estimate"
+FROM "pg_class"
+WHERE "oid" = to_regclass($1)
+"""
+
+CountKey = Tuple[str, int, str]
+
+
+class CountMode(str, enum.Enum):
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+
+
+class RowCount(NamedTuple):
+    value: int
+    # False when the value is a cap or a planner estimate
+    exact: bool
+
+
+class CountCache:
+    """
+    In-memory TTL/LRU cache of approximate counts keyed by the count query,
+    so each distinct filter and its values has its own entry.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 10.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CountKey, Tuple[RowCount, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CountKey) -> Optional[RowCount]:
+        """Return the cached count for a key, if present and fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        count, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return count
+
+    def set(self, key: CountKey, count: RowCount) -> None:
+        """Cache a count for ``ttl_seconds``."""
+        if self.ttl_seconds <= 0:
+            return
+
+        self._entries.pop(key, None)
+        self._entries[key] = (count, time.monotonic() + self.ttl_seconds)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> CountCacheStatsSchema:
+        """Return a snapshot of the cache metrics."""
+        lookups = self.hits + self.misses
+        return CountCacheStatsSchema(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
+
+
+async def _capped_count(query: QuerySet[Any], cap: int) -> RowCount:
+    # Counting one row past the cap tells whether there are more, without
+    # visiting the rest or sending the rows back
+    limited = query.limit(cap + 1).values("id").sql(params_inline=True)
+    rows = await get_connection().execute_query_dict(
+        f'SELECT COUNT(*) AS "count" FROM ({limited}) AS "capped"'
+    )
+    count = int(rows[0]["count"])
+    if count > cap:
+        return RowCount(cap, exact=False)
+    return RowCount(count, exact=True)
+
+
+async def _planner_estimate(query: QuerySet[Any]) -> int:
+    model = query.model
+    if query.count().sql() == model.all().count().sql():
+        rows = await get_connection().execute_query_dict(
+            TABLE_ESTIMATE_SQL, [model._meta.db_table]
+        )
+        return int(rows[0]["estimate"]) if rows else -1
+
+    rows = await get_connection().execute_query_dict(
+        f"EXPLAIN (FORMAT JSON) {query.sql(params_inline=True)}"
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _estimated_count(query: QuerySet[Any], cap: int) -> RowCount:
+    if not is_postgres():
+        # SQLite keeps no row estimates; its counts are exact, and cached
+        return RowCount(await query.count(), exact=True)
+
+    estimate = await _planner_estimate(query)
+    # Estimates are poor for small results, and those are cheap to count
+    if estimate < cap:
+        return await _capped_count(query, cap)
+    return RowCount(estimate, exact=False)
+
+
+async def count_rows(
+    query: QuerySet[Any],
+    mode: CountMode = CountMode.EXACT,
+    cap: Optional[int] = None,
+) -> RowCount:
+    """
+    Count the rows a listing's filter matches.
+
+    Args:
+        query: The filtered rows being paged through
+        mode: Whether to count exactly, up to ``cap``, or by estimate
+        cap: Most rows a capped count visits, defaulting to COUNT_CAP
+
+    Returns:
+        The count and whether it is exact
+    """
+    if mode == CountMode.EXACT:
+        return RowCount(await query.count(), exact=True)
+
+    cap = settings.COUNT_CAP if cap is None else cap
+    key = (mode.value, cap, query.count().sql(params_inline=True))
+    count = count_cache.get(key)
+    if count is None:
+        if mode == CountMode.CAPPED:
+            count = await _capped_count(query, cap)
+        else:
+            count = await _estimated_count(query, cap)
+        count_cache.set(key, count)
+    return count
+
+
+# Create global count cache instance
+count_cache = CountCache(
+    max_size=settings.COUNT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+)
@@ -8,3 +8,17 @@ def now_utc() -> datetime:
     as they are not timezone aware.
     """
     return datetime.now(tz=UTC)
+
+
+def latest(*values: datetime | str | None) -> datetime | None:
+    """
+    The most recent of some timestamps, ignoring missing ones. Accepts the ISO
+    strings SQLite returns for aggregates in subqueries; naive values are UTC.
+    """
+    parsed = [
+        datetime.fromisoformat(value) if isinstance(value, str) else value
+        for value in values
+        if value is not None
+    ]
+    aware = [value if value.tzinfo else value.replace(tzinfo=UTC) for value in parsed]
+    return max(aware, default=None)
@@ -0,0 +1,93 @@
+# Standard library imports
+from collections import OrderedDict
+import sys
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+# Project-specific imports
+from backend.schemas.metrics import FragmentCacheStatsSchema
+from backend.utils.settings import settings
+
+
+class FragmentCache:
+    """
+    In-memory LRU cache of rendered HTML fragments, capped by memory.
+
+    Keys carry everything a fragment's markup depends on (ids, timestamps,
+    counters, the viewer's capabilities), so a change produces a new key
+    instead of needing invalidation; stale fragments simply age out. Least
+    recently used fragments are evicted once the strings held exceed
+    ``max_bytes``. A ``max_bytes`` of 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Tuple[str, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached fragment for a key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, html: str) -> None:
+        """
+        Cache a rendered fragment.
+
+        Args:
+            key: Everything the fragment's markup depends on
+            html: The rendered fragment
+        """
+        size = sys.getsizeof(html)
+        # A fragment that could never fit is not worth evicting everything for
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (html, size)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> FragmentCacheStatsSchema:
+        """Return a snapshot of the cache metrics."""
+        lookups = self.hits + self.misses
+        return FragmentCacheStatsSchema(
+            size=len(self._entries),
+            bytes=self.bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+
+# Create global fragment cache instance
+fragment_cache = FragmentCache(max_bytes=settings.FRAGMENT_CACHE_MAX_BYTES)
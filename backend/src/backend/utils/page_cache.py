@@ -0,0 +1,401 @@
+# Standard library imports
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import time
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from uuid import UUID
+
+# Third-party imports
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+# Project-specific imports
+from backend.schemas.metrics import PageCacheStatsSchema
+from backend.utils.conditional_get import is_not_modified
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Public pages that look the same to every logged-out visitor
+TOPIC_LIST_PATH = "/html/topics/"
+TAG_PAGES_PREFIX = "/html/tags/"
+CACHEABLE_PATH_PREFIXES = (TOPIC_LIST_PATH, TAG_PAGES_PREFIX)
+
+# Request header that skips the cache, for debugging
+BYPASS_HEADER = "x-page-cache-bypass"
+
+# Response header reporting what the cache did
+STATUS_HEADER = "X-Page-Cache"
+
+# Request headers that make a response specific to the requester
+CONDITIONAL_HEADERS = (b"if-none-match", b"if-modified-since")
+
+PageKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    stored_at: float
+    generation: int
+
+
+def page_key(scope: Scope) -> PageKey:
+    """Path plus the query string with its parameters in a canonical order."""
+    query = parse_qsl(scope.get("query_string", b"").decode(), keep_blank_values=True)
+    return scope["path"], urlencode(sorted(query))
+
+
+class PageCache:
+    """
+    In-memory LRU cache of whole rendered pages served to anonymous visitors.
+
+    A page is fresh for ``ttl_seconds``. For ``stale_seconds`` after that it
+    is still served while one request re-renders it in the background. All
+    concurrent misses for a page wait for a single render rather than each
+    running the queries. Pages are dropped early when what they show changes
+    (see ``invalidate_topic``); posts created by other processes are picked
+    up by tasks.page_cache_invalidations. Least recently used pages are
+    evicted once the bodies held exceed ``max_bytes``. A ``ttl_seconds`` of 0
+    disables caching.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 5.0,
+        stale_seconds: float = 30.0,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[PageKey, CachedPage] = OrderedDict()
+        self._renders: Dict[PageKey, asyncio.Future[Optional[CachedPage]]] = {}
+        self._refreshes: Set[asyncio.Task[None]] = set()
+        # Bumped by every invalidation, so renders begun before it are not kept
+        self.generation = 0
+        # When posts created by other processes were last checked for
+        self.last_refreshed_at: Optional[datetime] = None
+        self.bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def lookup(self, key: PageKey) -> Tuple[Optional[CachedPage], bool]:
+        """
+        Return a cached page and whether it is stale, or (None, False) when
+        there is no page worth serving.
+        """
+        page = self._entries.get(key)
+        if page is None:
+            return None, False
+
+        age = time.monotonic() - page.stored_at
+        if age > self.ttl_seconds + self.stale_seconds:
+            self._remove(key)
+            return None, False
+
+        self._entries.move_to_end(key)
+        return page, age > self.ttl_seconds
+
+    def store(self, key: PageKey, page: CachedPage) -> None:
+        """Cache a rendered page unless it was invalidated while rendering."""
+        size = len(page.body)
+        if page.generation != self.generation or size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = page
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    async def render_once(
+        self, key: PageKey, render: Callable[[], Awaitable[Optional[CachedPage]]]
+    ) -> Tuple[Optional[CachedPage], bool]:
+        """
+        Render a page, or wait for the render already under way for it.
+
+        Returns:
+            The page (None if it could not be cached) and whether this call
+            rendered it
+        """
+        pending = self._renders.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending), False
+
+        future: asyncio.Future[Optional[CachedPage]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._renders[key] = future
+        page = None
+        try:
+            page = await render()
+            if page is not None:
+                self.store(key, page)
+        finally:
+            del self._renders[key]
+            future.set_result(page)
+        return page, True
+
+    def refresh(
+        self, key: PageKey, render: Callable[[], Awaitable[Optional[CachedPage]]]
+    ) -> None:
+        """Re-render a stale page in the background, once at a time."""
+        if key in self._renders:
+            return
+
+        async def run() -> None:
+            try:
+                await self.render_once(key, render)
+            except Exception as e:
+                logger.error(f"Failed to refresh cached page {key[0]}: {e}")
+
+        task = asyncio.create_task(run())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    def invalidate(self, path_prefix: str) -> None:
+        """Drop every cached page whose path starts with ``path_prefix``."""
+        self._invalidate(lambda path: path.startswith(path_prefix))
+
+    def invalidate_topic(self, topic_id: UUID) -> None:
+        """
+        Drop the cached pages of a topic, e.g. once a post in it is approved,
+        along with the topic list and tag pages that show its post count.
+        """
+        topic_prefix = f"/html/topics/{topic_id}/"
+        self._invalidate(
+            lambda path: path == TOPIC_LIST_PATH
+            or path.startswith((topic_prefix, TAG_PAGES_PREFIX))
+        )
+
+    def _invalidate(self, matches: Callable[[str], bool]) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        for key in [key for key in self._entries if matches(key[0])]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.generation = 0
+        self.last_refreshed_at = None
+        self.bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self) -> PageCacheStatsSchema:
+        """Return a snapshot of the cache metrics."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return PageCacheStatsSchema(
+            size=len(self._entries),
+            bytes=self.bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            stale_hits=self.stale_hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            hit_ratio=(self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        )
+
+    def _remove(self, key: PageKey) -> None:
+        page = self._entries.pop(key, None)
+        if page is not None:
+            self.bytes -= len(page.body)
+
+
+class PageCacheMiddleware:
+    """
+    Serves public HTML pages to requests without a session cookie from the
+    page cache. Responses carry X-Page-Cache: HIT, STALE, MISS or BYPASS;
+    sending an X-Page-Cache-Bypass header skips the cache.
+    """
+
+    def __init__(self, app: ASGIApp, cache: Optional[PageCache] = None):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        cache = self.cache or page_cache
+        if not self._is_cacheable(scope, cache):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if request.headers.get(BYPASS_HEADER):
+            await self.app(scope, receive, self._with_status(send, "BYPASS"))
+            return
+
+        key = page_key(scope)
+        page, stale = cache.lookup(key)
+        if page is not None:
+            if stale:
+                cache.stale_hits += 1
+                cache.refresh(key, lambda: self._render(scope, cache.generation))
+            else:
+                cache.hits += 1
+            await self._send_page(request, page, "STALE" if stale else "HIT", send)
+            return
+
+        cache.misses += 1
+        # An unconditional request can watch the page stream as it renders
+        tee = None if self._is_conditional(scope) else self._with_status(send, "MISS")
+        page, rendered = await cache.render_once(
+            key, lambda: self._render(scope, cache.generation, receive, tee)
+        )
+        if rendered and tee is not None:
+            return
+        if page is None:
+            # Not cacheable; every request renders for itself
+            await self.app(scope, receive, self._with_status(send, "MISS"))
+            return
+        await self._send_page(request, page, "MISS", send)
+
+    def _is_cacheable(self, scope: Scope, cache: PageCache) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET" or not cache.enabled:
+            return False
+        if not scope["path"].startswith(CACHEABLE_PATH_PREFIXES):
+            return False
+        return "session_token" not in Request(scope).cookies
+
+    def _is_conditional(self, scope: Scope) -> bool:
+        return any(name in CONDITIONAL_HEADERS for name, _ in scope["headers"])
+
+    async def _render(
+        self,
+        scope: Scope,
+        generation: int,
+        receive: Optional[Receive] = None,
+        tee: Optional[Send] = None,
+    ) -> Optional[CachedPage]:
+        """
+        Run the app for an unconditional copy of the request, passing the
+        response on to ``tee`` if given. Returns the page if it can be shared.
+        """
+        # Cache the full page, not a 304 for one client's validators
+        render_scope = dict(scope)
+        render_scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in CONDITIONAL_HEADERS
+        ]
+        start: Message = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message, headers=list(message.get("headers", [])))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            if tee is not None:
+                await tee(message)
+
+        await self.app(render_scope, receive or _no_disconnect(), capture)
+
+        headers = start.get("headers", [])
+        if start.get("status") != 200 or any(
+            name == b"set-cookie" for name, _ in headers
+        ):
+            return None
+        return CachedPage(
+            status=200,
+            headers=headers,
+            body=b"".join(chunks),
+            stored_at=time.monotonic(),
+            generation=generation,
+        )
+
+    async def _send_page(
+        self, request: Request, page: CachedPage, cache_status: str, send: Send
+    ) -> None:
+        headers = MutableHeaders(raw=list(page.headers))
+        status_code = page.status
+        body = page.body
+        validators = {
+            name: headers[name] for name in ("ETag", "Last-Modified") if name in headers
+        }
+        if "ETag" in validators and is_not_modified(request, validators):
+            status_code = 304
+            body = b""
+            del headers["content-type"]
+        if "transfer-encoding" in headers:
+            del headers["transfer-encoding"]
+        headers["content-length"] = str(len(body))
+        headers["age"] = str(int(time.monotonic() - page.stored_at))
+        headers[STATUS_HEADER] = cache_status
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": headers.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _with_status(self, send: Send, cache_status: str) -> Send:
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[STATUS_HEADER] = cache_status
+            await send(message)
+
+        return send_with_status
+
+
+def _no_disconnect() -> Receive:
+    """Receive for a background render: an empty body, then no disconnect."""
+    sent = False
+
+    async def receive() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+# Create global page cache instance
+page_cache = PageCache(
+    ttl_seconds=settings.PAGE_CACHE_TTL_SECONDS,
+    stale_seconds=settings.PAGE_CACHE_STALE_SECONDS,
+    max_bytes=settings.PAGE_CACHE_MAX_BYTES,
+)
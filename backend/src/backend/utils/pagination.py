@@ -0,0 +1,149 @@
+"""
+Keyset (cursor) pagination on (created_at, id), newest first.
+
+An offset page makes the database walk and discard every row before it, so
+deep pages get slower; a cursor page seeks straight to the row after the
+last one the client saw using the (created_at, id) indexes. Cursor tokens
+are opaque to clients: they name a row and which way to page from it.
+Offset pages are still supported, in the same order, and hand out cursors
+so clients can switch to them.
+"""
+
+# Standard library imports
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import TypeVar
+from uuid import UUID
+
+# Third-party imports
+from fastapi import HTTPException
+from fastapi import status
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+# Project-specific imports
+from backend.db.base import BaseModel
+
+MODEL = TypeVar("MODEL", bound=BaseModel)
+
+# Shared description of the cursor query parameter
+CURSOR_DESCRIPTION = (
+    "Opaque cursor from next_cursor or previous_cursor of an earlier page; "
+    "takes precedence over the offset"
+)
+
+# Page towards older rows (the next page) or newer rows (the previous page)
+AFTER = "a"
+BEFORE = "b"
+
+
+class Cursor(NamedTuple):
+    direction: str
+    created_at: datetime
+    id: UUID
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[MODEL]):
+    rows: List[MODEL]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+
+
+def encode_cursor(direction: str, row: BaseModel) -> str:
+    """Opaque token for paging from ``row`` in ``direction``."""
+    raw = f"{direction}|{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Parse a cursor token.
+
+    Raises:
+        ValueError: If the token was not made by ``encode_cursor``
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        direction, created_at, row_id = raw.split("|")
+        cursor = Cursor(direction, datetime.fromisoformat(created_at), UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if cursor.direction not in (AFTER, BEFORE):
+        raise ValueError(f"Invalid cursor: {token}")
+    return cursor
+
+
+def parse_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """Decode a cursor from a query parameter, answering 400 if it is invalid."""
+    if not token:
+        return None
+    try:
+        return decode_cursor(token)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+async def paginate(
+    query: QuerySet[MODEL],
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[Cursor] = None,
+) -> KeysetPage[MODEL]:
+    """
+    Fetch one page of a query, newest first.
+
+    Args:
+        query: The filtered rows to page through
+        limit: Maximum number of rows to return
+        skip: Rows to skip, used only without a cursor
+        cursor: Where to page from, taking precedence over ``skip``
+
+    Returns:
+        The rows and cursors for the pages either side, where there are any
+    """
+    if cursor is not None and cursor.direction == BEFORE:
+        # Walk towards newer rows, then put the page back in display order
+        newer = Q(created_at__gt=cursor.created_at) | Q(
+            created_at=cursor.created_at, id__gt=cursor.id
+        )
+        rows = list(
+            await query.filter(newer).order_by("created_at", "id").limit(limit + 1)
+        )
+        has_previous = len(rows) > limit
+        rows = rows[:limit][::-1]
+        return KeysetPage(
+            rows=rows,
+            next_cursor=encode_cursor(AFTER, rows[-1]) if rows else None,
+            previous_cursor=encode_cursor(BEFORE, rows[0]) if has_previous else None,
+        )
+
+    query = query.order_by("-created_at", "-id")
+    if cursor is not None:
+        older = Q(created_at__lt=cursor.created_at) | Q(
+            created_at=cursor.created_at, id__lt=cursor.id
+        )
+        query = query.filter(older)
+    else:
+        query = query.offset(skip)
+    # One extra row tells whether there is a next page without counting
+    rows = list(await query.limit(limit + 1))
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    has_previous = cursor is not None or skip > 0
+    return KeysetPage(
+        rows=rows,
+        next_cursor=encode_cursor(AFTER, rows[-1]) if has_next else None,
+        previous_cursor=(
+            encode_cursor(BEFORE, rows[0]) if rows and has_previous else None
+        ),
+    )
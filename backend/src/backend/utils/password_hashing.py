@@ -0,0 +1,152 @@
+# Standard library imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+# Third-party imports
+import bcrypt
+from fastapi import HTTPException
+from fastapi import status
+
+# Project-specific imports
+from backend.schemas.metrics import DurationStatsSchema
+from backend.schemas.metrics import PasswordHashingStatsSchema
+from backend.utils.settings import settings
+
+T = TypeVar("T")
+
+
+class DurationStats:
+    """Running count, mean and maximum of a measured duration."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_schema(self) -> DurationStatsSchema:
+        return DurationStatsSchema(
+            count=self.count,
+            mean_seconds=self.total_seconds / self.count if self.count else 0.0,
+            max_seconds=self.max_seconds,
+        )
+
+
+class PasswordHashingExecutor:
+    """
+    Bounded thread pool for bcrypt work.
+
+    bcrypt deliberately burns 100-300 ms of CPU per call, which would stall the
+    event loop if run inline. Calls are handed to ``max_workers`` threads, at
+    most ``max_queue`` more may wait for a free thread, and anything beyond
+    that is turned away with a 503 so a login burst cannot pile up unbounded.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait = DurationStats()
+        self.hash_time = DurationStats()
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        """
+        Run a blocking hashing function on the pool.
+
+        Args:
+            func: The bcrypt function to call, e.g. ``bcrypt.checkpw``
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The return value of ``func``
+
+        Raises:
+            HTTPException: 503 if the pool and its queue are full
+        """
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="CITIZEN, THE CREDENTIAL INSPECTORS ARE AT CAPACITY. "
+                "TRY AGAIN SHORTLY",
+                headers={"Retry-After": "1"},
+            )
+
+        submitted_at = time.perf_counter()
+
+        def timed_call() -> Tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at - submitted_at, time.perf_counter() - started_at
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, waited, elapsed = await loop.run_in_executor(
+                self._get_executor(), timed_call
+            )
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.queue_wait.record(waited)
+        self.hash_time.record(elapsed)
+        return result
+
+    def stats(self) -> PasswordHashingStatsSchema:
+        """Return a snapshot of the pool metrics."""
+        return PasswordHashingStatsSchema(
+            max_workers=self.max_workers,
+            max_queue=self.max_queue,
+            in_flight=self.in_flight,
+            completed=self.completed,
+            rejected=self.rejected,
+            queue_wait=self.queue_wait.to_schema(),
+            hash_time=self.hash_time.to_schema(),
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; the pool restarts lazily on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hashing",
+            )
+        return self._executor
+
+
+# Create global password hashing executor instance
+password_hashing_executor = PasswordHashingExecutor(
+    max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+    max_queue=settings.PASSWORD_HASHING_MAX_QUEUE,
+)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password with a fresh salt on the password hashing pool.
+
+    Call it before opening a transaction, so a pooled database connection
+    is not held while the hash waits in the queue and runs.
+    """
+    hashed = await password_hashing_executor.run(
+        bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt()
+    )
+    return hashed.decode("utf-8")
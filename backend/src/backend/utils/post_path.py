@@ -0,0 +1,57 @@
+"""
+Helpers for the materialized path stored on each post.
+
+A path is the hex id of every ancestor followed by the post's own id, each
+terminated by a separator, e.g. ``<root>/<child>/<post>/``. Every descendant's
+path starts with its ancestor's path, so a subtree is a single range scan.
+"""
+
+from typing import Dict
+from typing import List
+from uuid import UUID
+
+from tortoise.exceptions import ValidationError
+
+POST_PATH_SEPARATOR = "/"
+
+# Size of the path column, and of one ancestor's hex id plus its separator
+POST_PATH_MAX_LENGTH = 2048
+POST_PATH_SEGMENT_LENGTH = 32 + len(POST_PATH_SEPARATOR)
+
+# Deepest reply whose path still fits in the column (the root is depth 0)
+MAX_POST_DEPTH = POST_PATH_MAX_LENGTH // POST_PATH_SEGMENT_LENGTH - 1
+
+
+def build_post_path(parent_path: str, post_id: UUID) -> str:
+    return f"{parent_path}{post_id.hex}{POST_PATH_SEPARATOR}"
+
+
+def check_reply_depth(depth: int) -> None:
+    """
+    Refuse a reply nested deeper than its materialized path can hold.
+
+    Raises:
+        ValidationError: If ``depth`` is beyond MAX_POST_DEPTH
+    """
+    if depth > MAX_POST_DEPTH:
+        raise ValidationError(
+            f"Replies cannot be nested more than {MAX_POST_DEPTH} levels deep"
+        )
+
+
+def parse_post_path(path: str) -> List[UUID]:
+    """Return the ids in the path, root first and the post itself last."""
+    return [UUID(segment) for segment in path.split(POST_PATH_SEPARATOR) if segment]
+
+
+def subtree_path_filter(path: str) -> Dict[str, str]:
+    """
+    Filter kwargs matching the post at ``path`` and everything below it.
+
+    Expressed as a range rather than LIKE so a plain btree index on the column
+    serves it (LIKE goes through a CAST that defeats the index). The upper bound
+    bumps the trailing separator to the next character, which sorts after every
+    hex digit continuation under byte-wise collation.
+    """
+    upper_bound = path[: -len(POST_PATH_SEPARATOR)] + chr(ord(POST_PATH_SEPARATOR) + 1)
+    return {"path__gte": path, "path__lt": upper_bound}
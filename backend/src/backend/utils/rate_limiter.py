@@ -1,91 +1,306 @@
 # Standard library imports
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import math
 import time
-from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Protocol
 from typing import Tuple
 
 # Third-party imports
-from fastapi import HTTPException
-from fastapi import Request
 from fastapi import status
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
 # Project-specific imports
+from backend.db_functions.rate_limits.acquire_rate_limit import acquire_rate_limit
+from backend.db_functions.rate_limits.prune_rate_limits import prune_rate_limits
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """``limit`` requests per ``window_seconds`` for paths under a prefix."""
+
+    name: str
+    path_prefix: str
+    limit: int
+    window_seconds: float = 60.0
+
+    @property
+    def emission_interval(self) -> float:
+        return self.window_seconds / self.limit
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    rule: RateLimitRule
+    allowed: bool
+    remaining: int
+    retry_after_seconds: float
+
+
+class RateLimitBackend(Protocol):
+    """Stores each key's GCRA theoretical arrival time (TAT)."""
+
+    async def acquire(
+        self, key: str, emission_interval: float, window_seconds: float, now: float
+    ) -> Tuple[bool, float]:
+        """Take one request for a key; return (allowed, TAT afterwards)."""
+        ...
+
+    def clear(self) -> None: ...
+
+
+def gcra(
+    tat: Optional[float], emission_interval: float, window_seconds: float, now: float
+) -> Tuple[bool, float]:
+    """
+    Generic cell rate algorithm step.
+
+    Each request pushes the key's theoretical arrival time one emission
+    interval further ahead; a request that would push it more than a window
+    ahead of now is refused. This allows bursts of up to ``limit`` requests
+    and a sustained ``limit`` per window with a single number of state.
+    """
+    tat = max(tat, now) if tat is not None else now
+    if tat + emission_interval - now > window_seconds:
+        return False, tat
+    return True, tat + emission_interval
+
+
+class MemoryRateLimitBackend:
+    """
+    Per-process TATs in an LRU of at most ``max_keys`` entries. Keys whose
+    TAT has passed hold no state and are dropped first.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        self.evictions = 0
+
+    async def acquire(
+        self, key: str, emission_interval: float, window_seconds: float, now: float
+    ) -> Tuple[bool, float]:
+        allowed, tat = gcra(
+            self._tats.pop(key, None), emission_interval, window_seconds, now
+        )
+        self._tats[key] = tat
+
+        # The least recently used key is idle if its allowance has refilled
+        oldest_key, oldest_tat = next(iter(self._tats.items()))
+        if oldest_key != key and oldest_tat <= now:
+            del self._tats[oldest_key]
+        while len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+            self.evictions += 1
+        return allowed, tat
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def clear(self) -> None:
+        self._tats.clear()
+        self.evictions = 0
+
+
+class DatabaseRateLimitBackend:
+    """
+    TATs in the ``ratelimitbucket`` table, so every worker process shares
+    the same limits. Keys refused in this process are remembered locally
+    until they may retry, so a client hammering past its limit costs no
+    database round trips. Refilled rows are pruned every
+    ``prune_interval_seconds``. Database errors let the request through.
+    """
+
+    def __init__(
+        self, prune_interval_seconds: float = 300.0, max_blocked_keys: int = 10000
+    ):
+        self.prune_interval_seconds = prune_interval_seconds
+        self.max_blocked_keys = max_blocked_keys
+        self._blocked: OrderedDict[str, float] = OrderedDict()
+        self._last_pruned_at = 0.0
+
+    async def acquire(
+        self, key: str, emission_interval: float, window_seconds: float, now: float
+    ) -> Tuple[bool, float]:
+        blocked_tat = self._blocked.get(key)
+        if blocked_tat is not None:
+            if blocked_tat + emission_interval - now > window_seconds:
+                return False, blocked_tat
+            del self._blocked[key]
+
+        try:
+            if now - self._last_pruned_at >= self.prune_interval_seconds:
+                self._last_pruned_at = now
+                await prune_rate_limits(before=now)
+            allowed, tat = await acquire_rate_limit(
+                key, emission_interval, window_seconds, now
+            )
+        except Exception as e:
+            logger.error(f"Rate limit check failed, allowing request: {e}")
+            return True, now
+
+        if not allowed:
+            self._blocked[key] = tat
+            while len(self._blocked) > self.max_blocked_keys:
+                self._blocked.popitem(last=False)
+        return allowed, tat
+
+    def clear(self) -> None:
+        self._blocked.clear()
+        self._last_pruned_at = 0.0
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter for API endpoints."""
+    """
+    Applies the first rule whose path prefix matches a request, per client.
 
-    def __init__(self, requests_per_minute: int = 10):
-        self.requests_per_minute = requests_per_minute
-        self.request_history: Dict[str, List[float]] = {}
-        self.window_seconds = 60  # 1 minute window
+    State per client is the single GCRA timestamp kept by ``backend``, so
+    a check costs the same however large the limit or window.
+    """
 
-    def _clean_old_requests(self, client_id: str) -> None:
-        """Remove requests older than the window from history."""
-        if client_id not in self.request_history:
-            return
+    def __init__(self, rules: List[RateLimitRule], backend: RateLimitBackend):
+        # Most specific prefix first
+        self.rules = sorted(rules, key=lambda rule: len(rule.path_prefix), reverse=True)
+        self.backend = backend
 
-        current_time = time.time()
-        self.request_history[client_id] = [
-            timestamp
-            for timestamp in self.request_history[client_id]
-            if current_time - timestamp < self.window_seconds
-        ]
+    def match(self, path: str) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if path.startswith(rule.path_prefix):
+                return rule
+        return None
 
-    def check_rate_limit(self, client_id: str) -> Tuple[bool, int]:
+    async def check(self, path: str, client_id: str) -> Optional[RateLimitDecision]:
         """
-        Check if a client has exceeded their rate limit.
+        Count a request against its rule.
 
         Args:
+            path: The request path
             client_id: Identifier for the client (IP address, API key, etc.)
 
         Returns:
-            Tuple[bool, int]: (is_allowed, remaining_requests)
+            The decision, or None if no rule limits this path
         """
-        self._clean_old_requests(client_id)
+        rule = self.match(path)
+        if rule is None:
+            return None
 
-        # Initialize history for new clients
-        if client_id not in self.request_history:
-            self.request_history[client_id] = []
+        now = time.time()
+        allowed, tat = await self.backend.acquire(
+            f"{rule.name}:{client_id}", rule.emission_interval, rule.window_seconds, now
+        )
+        # How far the allowance may still run ahead before requests are refused
+        headroom = rule.window_seconds - (tat - now)
+        if not allowed:
+            return RateLimitDecision(
+                rule=rule,
+                allowed=False,
+                remaining=0,
+                retry_after_seconds=max(rule.emission_interval - headroom, 0.0),
+            )
+        return RateLimitDecision(
+            rule=rule,
+            allowed=True,
+            remaining=max(math.floor(headroom / rule.emission_interval + 1e-9), 0),
+            retry_after_seconds=0.0,
+        )
+
+    def clear(self) -> None:
+        self.backend.clear()
 
-        # Count recent requests
-        recent_requests = len(self.request_history[client_id])
 
-        # Check if limit exceeded
-        if recent_requests >= self.requests_per_minute:
-            return False, 0
+class RateLimitMiddleware:
+    """
+    Rate limits every HTTP request before routing. Limited requests get a
+    429 with Retry-After; allowed ones carry X-Rate-Limit-Remaining.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter
 
-        # Record this request
-        self.request_history[client_id].append(time.time())
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Return allowed with remaining requests
-        return True, self.requests_per_minute - recent_requests - 1
+        limiter = self.limiter or rate_limiter
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
+        decision = await limiter.check(scope["path"], client_id)
+        if decision is None:
+            await self.app(scope, receive, send)
+            return
 
+        rate_limit_headers = {
+            "X-Rate-Limit-Limit": str(decision.rule.limit),
+            "X-Rate-Limit-Remaining": str(decision.remaining),
+        }
+        if not decision.allowed:
+            response = JSONResponse(
+                {
+                    "detail": (
+                        f"Rate limit exceeded for {decision.rule.name} requests. "
+                        "Try again later."
+                    )
+                },
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={
+                    **rate_limit_headers,
+                    "Retry-After": str(math.ceil(decision.retry_after_seconds)),
+                },
+            )
+            await response(scope, receive, send)
+            return
 
-# Create global rate limiter instances
-moderation_rate_limiter = RateLimiter(requests_per_minute=30)
-general_rate_limiter = RateLimiter(requests_per_minute=60)
+        scope.setdefault("state", {})["rate_limit_remaining"] = decision.remaining
 
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit_headers.items():
+                    headers[name] = value
+            await send(message)
 
-async def limit_moderation_requests(request: Request) -> None:
-    """
-    Dependency for rate limiting moderation API requests.
+        await self.app(scope, receive, send_with_headers)
 
-    Args:
-        request: The FastAPI request object
 
-    Raises:
-        HTTPException: If rate limit is exceeded
-    """
-    client_id = request.client.host if request.client else "unknown"
-    allowed, remaining = moderation_rate_limiter.check_rate_limit(client_id)
-
-    if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded for moderation requests. Try again later.",
-            headers={"X-Rate-Limit-Remaining": "0"},
+def create_rate_limiter() -> RateLimiter:
+    """Build the rate limiter configured in settings."""
+    rules = [
+        RateLimitRule(
+            name="moderation",
+            path_prefix="/api/posts/moderation-webhook",
+            limit=settings.RATE_LIMIT_MODERATION_REQUESTS_PER_MINUTE,
+        ),
+        RateLimitRule(
+            name="API",
+            path_prefix="/api/",
+            limit=settings.RATE_LIMIT_API_REQUESTS_PER_MINUTE,
+        ),
+    ]
+    backend: RateLimitBackend
+    if settings.RATE_LIMIT_BACKEND == "database":
+        backend = DatabaseRateLimitBackend(
+            prune_interval_seconds=settings.RATE_LIMIT_PRUNE_INTERVAL_SECONDS
         )
+    else:
+        backend = MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+    return RateLimiter(
+        rules=[rule for rule in rules if rule.limit > 0], backend=backend
+    )
+
 
-    # Add rate limit info to response headers
-    request.state.rate_limit_remaining = remaining
+# Create global rate limiter instance
+rate_limiter = create_rate_limiter()
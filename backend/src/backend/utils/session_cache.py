@@ -0,0 +1,149 @@
+# Standard library imports
+from collections import OrderedDict
+from datetime import datetime
+import time
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from uuid import UUID
+
+# Project-specific imports
+from backend.schemas.metrics import CacheStatsSchema
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+if TYPE_CHECKING:
+    from backend.routes.html.schemas.user import UserResponse
+
+
+class SessionCache:
+    """
+    In-memory TTL/LRU cache of resolved users keyed by session token.
+
+    Entries expire after ``ttl_seconds`` or when the underlying session
+    expires, whichever comes first. The cache is per process, so the TTL
+    bounds how long another worker can serve a stale user after a change
+    it did not see; changes made in this process invalidate immediately.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 30.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple["UserResponse", float]] = OrderedDict()
+        self._tokens_by_user: Dict[UUID, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, session_token: str) -> Optional["UserResponse"]:
+        """
+        Return the cached user for a session token, if present and fresh.
+
+        Args:
+            session_token: The session cookie value
+
+        Returns:
+            The cached UserResponse or None on a miss
+        """
+        entry = self._entries.get(session_token)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(session_token)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(session_token)
+        self.hits += 1
+        return user
+
+    def set(
+        self,
+        session_token: str,
+        user: "UserResponse",
+        session_expires_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Cache the resolved user for a session token.
+
+        Args:
+            session_token: The session cookie value
+            user: The resolved user
+            session_expires_at: When the session itself expires, if known
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds
+        if session_expires_at is not None:
+            ttl = min(ttl, (session_expires_at - now_utc()).total_seconds())
+        if ttl <= 0:
+            return
+
+        self._remove(session_token)
+        self._entries[session_token] = (user, time.monotonic() + ttl)
+        self._tokens_by_user.setdefault(user.id, set()).add(session_token)
+
+        while len(self._entries) > self.max_size:
+            oldest_token = next(iter(self._entries))
+            self._remove(oldest_token)
+            self.evictions += 1
+
+    def invalidate_token(self, session_token: str) -> None:
+        """Drop the cached user for a single session token."""
+        if self._remove(session_token):
+            self.invalidations += 1
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every cached session belonging to a user."""
+        for session_token in list(self._tokens_by_user.get(user_id, ())):
+            self.invalidate_token(session_token)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._tokens_by_user.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self) -> CacheStatsSchema:
+        """Return a snapshot of the cache metrics."""
+        lookups = self.hits + self.misses
+        return CacheStatsSchema(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
+
+    def _remove(self, session_token: str) -> bool:
+        entry = self._entries.pop(session_token, None)
+        if entry is None:
+            return False
+
+        user_id = entry[0].id
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(session_token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+        return True
+
+
+# Create global session cache instance
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_MAX_SIZE,
+    ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+)
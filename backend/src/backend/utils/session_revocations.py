@@ -0,0 +1,86 @@
+# Standard library imports
+from datetime import datetime
+from typing import Dict
+from typing import Optional
+from uuid import UUID
+
+# Project-specific imports
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+
+class SessionRevocationList:
+    """
+    In-memory revocation set for stateless access tokens.
+
+    Access tokens issued with a session id (``sid``) are accepted without a
+    database lookup unless their session, or every token their user holds,
+    has been revoked here. Revocations made in this process apply at once;
+    revocations made elsewhere arrive through the periodic refresh task.
+    Entries are kept for ``retention_seconds``, after which every token
+    issued before the revocation has expired on its own.
+    """
+
+    def __init__(self, retention_seconds: float = 1800.0):
+        self.retention_seconds = retention_seconds
+        self._revoked_sessions: Dict[UUID, float] = {}
+        self._users_revoked_at: Dict[UUID, float] = {}
+        self.last_refreshed_at: Optional[datetime] = None
+
+    def revoke_session(self, session_id: UUID) -> None:
+        """Reject every access token carrying this session id."""
+        self._revoked_sessions[session_id] = now_utc().timestamp()
+
+    def revoke_user(self, user_id: UUID, revoked_at: Optional[datetime] = None) -> None:
+        """
+        Reject every access token issued to this user before ``revoked_at``,
+        defaulting to now. An earlier time never replaces a later one.
+        """
+        timestamp = (revoked_at or now_utc()).timestamp()
+        self._users_revoked_at[user_id] = max(
+            timestamp, self._users_revoked_at.get(user_id, timestamp)
+        )
+
+    def is_revoked(self, session_id: UUID, user_id: UUID, issued_at: float) -> bool:
+        """
+        Check whether an access token has been revoked.
+
+        Args:
+            session_id: The ``sid`` claim of the token
+            user_id: The ``sub`` claim of the token
+            issued_at: The ``iat`` claim of the token
+
+        Returns:
+            bool: True if the token must be rejected
+        """
+        if session_id in self._revoked_sessions:
+            return True
+
+        user_revoked_at = self._users_revoked_at.get(user_id)
+        return user_revoked_at is not None and issued_at < user_revoked_at
+
+    def prune(self) -> None:
+        """Forget revocations older than the retention window."""
+        cutoff = now_utc().timestamp() - self.retention_seconds
+        self._revoked_sessions = {
+            session_id: revoked_at
+            for session_id, revoked_at in self._revoked_sessions.items()
+            if revoked_at >= cutoff
+        }
+        self._users_revoked_at = {
+            user_id: revoked_at
+            for user_id, revoked_at in self._users_revoked_at.items()
+            if revoked_at >= cutoff
+        }
+
+    def clear(self) -> None:
+        """Forget all revocations."""
+        self._revoked_sessions.clear()
+        self._users_revoked_at.clear()
+        self.last_refreshed_at = None
+
+
+# Create global revocation list instance
+session_revocations = SessionRevocationList(
+    retention_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
@@ -11,6 +11,23 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: float = 30.0
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: float = 7.0
+    # Trust the session id and role carried in access tokens instead of
+    # querying the database on every request
+    JWT_STATELESS_AUTH: bool = False
+    SESSION_REVOCATION_REFRESH_INTERVAL_SECONDS: float = 5.0
+
+    # Password hashing pool settings
+    PASSWORD_HASHING_MAX_WORKERS: int = 4
+    PASSWORD_HASHING_MAX_QUEUE: int = 32
+
+    # Rate limiting settings; "memory" limits per worker process,
+    # "database" shares the limits across workers through a table
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_PRUNE_INTERVAL_SECONDS: float = 300.0
+    RATE_LIMIT_MODERATION_REQUESTS_PER_MINUTE: int = 30
+    RATE_LIMIT_API_REQUESTS_PER_MINUTE: int = 300
 
     # Application settings
     DEBUG: bool = False
@@ -18,6 +35,33 @@ class Settings(BaseSettings):
 
     # Session settings
     SESSION_CLEANUP_INTERVAL_SECONDS: float = 3600.0
+    SESSION_CACHE_MAX_SIZE: int = 10000
+    SESSION_CACHE_TTL_SECONDS: float = 30.0
+
+    # Denormalized counter settings (reconciled by the moderation worker)
+    COUNTER_RECONCILIATION_INTERVAL_SECONDS: float = 86400.0
+
+    # Thread rendering settings (None means unlimited)
+    THREAD_MAX_DEPTH: int | None = None
+    THREAD_MAX_REPLIES_PER_POST: int | None = None
+
+    # Rendered HTML fragment cache settings (0 disables the cache)
+    FRAGMENT_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # Anonymous full-page cache settings (a TTL of 0 disables the cache);
+    # stale pages are served while they are re-rendered in the background
+    PAGE_CACHE_TTL_SECONDS: float = 5.0
+    PAGE_CACHE_STALE_SECONDS: float = 30.0
+    PAGE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # How often each process drops its cached pages for topics that gained
+    # posts in other processes, e.g. approvals by the moderation worker
+    PAGE_CACHE_INVALIDATION_REFRESH_INTERVAL_SECONDS: float = 2.0
+
+    # Listing count settings; capped counts stop after COUNT_CAP rows, and
+    # capped and estimated counts are cached per query for the TTL
+    COUNT_CAP: int = 10000
+    COUNT_CACHE_MAX_SIZE: int = 1024
+    COUNT_CACHE_TTL_SECONDS: float = 10.0
 
     # AI moderation settings
     OPENAI_API_KEY: str = "sk-dummy-key-for-development"
@@ -27,6 +71,55 @@ class Settings(BaseSettings):
     AI_MODERATION_AUTO_APPROVE: bool = True
     AI_MODERATION_AUTO_REJECT: bool = True
     AI_MODERATION_CONFIDENCE_THRESHOLD: float = 0.7
+    # "anthropic" calls the API; "fake" uses the local stand-in model
+    AI_MODERATION_MODEL: str = "anthropic"
+    AI_MODERATION_FAKE_LATENCY_MS: float = 800.0
+    AI_MODERATION_FAKE_LATENCY_SIGMA: float = 0.5
+    AI_MODERATION_FAKE_ERROR_RATE: float = 0.0
+    AI_MODERATION_FAKE_APPROVE_RATIO: float = 0.8
+    AI_MODERATION_FAKE_SEED: int = 0
+    AI_MODERATION_HTTP_MAX_CONNECTIONS: int = 20
+    AI_MODERATION_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    AI_MODERATION_HTTP_KEEPALIVE_SECONDS: float = 30.0
+    AI_MODERATION_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    AI_MODERATION_REQUEST_TIMEOUT_SECONDS: float = 30.0
+    AI_MODERATION_MAX_CONCURRENCY: int = 8
+    AI_MODERATION_REQUESTS_PER_MINUTE: float = 50.0
+    AI_MODERATION_RATE_LIMIT_BURST: int = 5
+    AI_MODERATION_CALL_TIMEOUT_SECONDS: float = 45.0
+    AI_MODERATION_DEADLINE_SECONDS: float = 90.0
+    AI_MODERATION_MAX_RETRIES: int = 3
+    AI_MODERATION_BACKOFF_BASE_SECONDS: float = 1.0
+    AI_MODERATION_BACKOFF_MAX_SECONDS: float = 30.0
+    AI_MODERATION_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    AI_MODERATION_CIRCUIT_RESET_SECONDS: float = 30.0
+    AI_MODERATION_CACHE_ENABLED: bool = True
+    AI_MODERATION_CACHE_MAX_SIZE: int = 10000
+    AI_MODERATION_CACHE_TTL_SECONDS: float = 86400.0
+    # How often the moderation worker deletes analyses of decided posts once
+    # they are older than the cache TTL
+    AI_ANALYSIS_PRUNE_INTERVAL_SECONDS: float = 3600.0
+    AI_MODERATION_BATCH_ENABLED: bool = False
+    AI_MODERATION_BATCH_MAX_SIZE: int = 8
+    AI_MODERATION_BATCH_MAX_WAIT_MS: float = 50.0
+    MODERATION_KEYWORD_RULES_PATH: str | None = None
+    MODERATION_KEYWORD_RULES_RELOAD_INTERVAL_SECONDS: float = 5.0
+    MODERATION_TIMINGS_RETENTION_SECONDS: float = 3600.0
+    MODERATION_TIMINGS_SLICE_SECONDS: float = 60.0
+
+    # Moderation job queue settings
+    MODERATION_QUEUE_CONSUMERS: int = 2
+    MODERATION_QUEUE_POLL_INTERVAL_SECONDS: float = 1.0
+    MODERATION_JOB_VISIBILITY_TIMEOUT_SECONDS: float = 120.0
+    MODERATION_JOB_MAX_ATTEMPTS: int = 5
+    MODERATION_JOB_RETRY_BASE_SECONDS: float = 5.0
+    MODERATION_JOB_RETRY_MAX_SECONDS: float = 300.0
+
+    # Standalone moderation worker settings
+    MODERATION_WORKER_CONCURRENCY: int = 4
+    MODERATION_WORKER_SHUTDOWN_TIMEOUT_SECONDS: float = 60.0
+    MODERATION_WORKER_HEALTH_HOST: str = "0.0.0.0"
+    MODERATION_WORKER_HEALTH_PORT: int = 8001
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True
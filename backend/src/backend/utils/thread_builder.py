@@ -44,6 +44,29 @@ def convert_pending_to_thread_post(pending_post: PendingPostResponse) -> ThreadP
     )
 
 
+def attach_replies(
+    roots: List[PostResponse],
+    replies: List[PostResponse],
+) -> List[PostResponse]:
+    """
+    Nest a flat, creation-ordered list of replies under their parents in a single
+    pass. Replies whose parent is neither a root nor another reply in the list
+    (e.g. cut off by a depth or reply cap) are dropped.
+    """
+    post_map: Dict[UUID, PostResponse] = {root.id: root for root in roots}
+    for reply in replies:
+        post_map[reply.id] = reply
+
+    for reply in replies:
+        if reply.parent_post_id is None:
+            continue
+        parent = post_map.get(reply.parent_post_id)
+        if parent is not None:
+            parent.replies.append(reply)
+
+    return roots
+
+
 def build_thread_structure(
     posts: List[PostResponse],
     pending_posts: List[PendingPostResponse],
@@ -0,0 +1,202 @@
+"""
+Standalone AI moderation worker.
+
+Consumes moderation jobs outside the web process so slow LLM calls never
+compete with page rendering for the event loop or database connections.
+SIGTERM/SIGINT stop claiming new jobs and drain the ones in flight; a
+small HTTP server reports health and stage timings on
+MODERATION_WORKER_HEALTH_PORT. The worker also runs the periodic
+denormalized counter reconciliation, so it happens in one process rather
+than in every web worker.
+
+Usage: python -m backend.workers.moderation
+"""
+
+# Standard library imports
+import asyncio
+from collections.abc import Iterator
+import contextlib
+from datetime import datetime
+import logging
+import signal
+from typing import List
+from typing import Optional
+
+# Third-party imports
+from fastapi import FastAPI
+from fastapi import Query
+from fastapi.responses import JSONResponse
+import uvicorn
+
+# Project-specific imports
+from backend.db.config import close_db
+from backend.db.config import init_db
+from backend.schemas.metrics import ModerationTimingsSchema
+from backend.schemas.moderation_job import ModerationWorkerHealthSchema
+from backend.tasks.ai_analyses import run_ai_analysis_prune_task
+from backend.tasks.counters import run_counter_reconciliation_task
+from backend.tasks.moderation_jobs import ModerationConsumerStats
+from backend.tasks.moderation_jobs import start_moderation_consumers
+from backend.utils.ai_moderation import close_ai_moderator_service
+from backend.utils.ai_moderation import init_ai_moderator_service
+from backend.utils.ai_moderation.timings import moderation_timings
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModerationWorker:
+    """
+    Runs ``concurrency`` moderation job consumers until stopped, then waits
+    up to ``shutdown_timeout_seconds`` for in-flight jobs to finish. Jobs
+    still running after that are cancelled; their leases expire and another
+    worker retries them.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = settings.MODERATION_WORKER_CONCURRENCY,
+        shutdown_timeout_seconds: float = (
+            settings.MODERATION_WORKER_SHUTDOWN_TIMEOUT_SECONDS
+        ),
+    ):
+        self.concurrency = concurrency
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.stats = ModerationConsumerStats()
+        self.started_at: Optional[datetime] = None
+        self._stop_event = asyncio.Event()
+        self._consumers: List[asyncio.Task[None]] = []
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; jobs already running are drained."""
+        if not self.stopping:
+            logger.info("Moderation worker stopping, draining in-flight jobs")
+        self._stop_event.set()
+
+    async def run(self) -> None:
+        """Consume jobs until ``stop`` is called, then drain."""
+        self.started_at = now_utc()
+        self._consumers = start_moderation_consumers(
+            self.concurrency, stop_event=self._stop_event, stats=self.stats
+        )
+        logger.info(f"Moderation worker started with {self.concurrency} consumers")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            await self._drain()
+
+    async def _drain(self) -> None:
+        if not self._consumers:
+            return
+
+        _, pending = await asyncio.wait(
+            self._consumers, timeout=self.shutdown_timeout_seconds
+        )
+        if pending:
+            logger.warning(
+                f"Cancelling {len(pending)} moderation consumers still running "
+                f"after {self.shutdown_timeout_seconds}s; their jobs will be retried"
+            )
+            for consumer in pending:
+                consumer.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("Moderation worker stopped")
+
+    def health(self) -> ModerationWorkerHealthSchema:
+        """Report whether every consumer is alive, and what they have done."""
+        if self.stopping:
+            status = "draining"
+        elif self.stats.consumers_running < self.concurrency:
+            status = "degraded"
+        else:
+            status = "ok"
+
+        return ModerationWorkerHealthSchema(
+            status=status,
+            concurrency=self.concurrency,
+            consumers_running=self.stats.consumers_running,
+            jobs_in_flight=self.stats.jobs_in_flight,
+            jobs_completed=self.stats.jobs_completed,
+            jobs_failed=self.stats.jobs_failed,
+            started_at=self.started_at,
+            last_poll_at=self.stats.last_poll_at,
+        )
+
+
+def create_health_app(worker: ModerationWorker) -> FastAPI:
+    """Build the worker's health check app; unhealthy workers answer 503."""
+    health_app = FastAPI(title="The Robot Overlord moderation worker")
+
+    @health_app.get("/health/", response_model=ModerationWorkerHealthSchema)
+    async def health() -> JSONResponse:
+        worker_health = worker.health()
+        return JSONResponse(
+            content=worker_health.model_dump(mode="json"),
+            status_code=200 if worker_health.status == "ok" else 503,
+        )
+
+    # The worker moderates in its own process, so it reports its own timings
+    @health_app.get(
+        "/metrics/moderation-timings/", response_model=ModerationTimingsSchema
+    )
+    async def timings(
+        window_seconds: Optional[float] = Query(None, gt=0),
+    ) -> ModerationTimingsSchema:
+        return moderation_timings.summary(window_seconds)
+
+    return health_app
+
+
+class HealthServer(uvicorn.Server):
+    """Uvicorn server that leaves signal handling to the worker."""
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        yield
+
+
+async def run() -> None:
+    init_ai_moderator_service()
+    await init_db()
+
+    worker = ModerationWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    health_server = HealthServer(
+        uvicorn.Config(
+            create_health_app(worker),
+            host=settings.MODERATION_WORKER_HEALTH_HOST,
+            port=settings.MODERATION_WORKER_HEALTH_PORT,
+            log_level="warning",
+        )
+    )
+    health_task = asyncio.create_task(health_server.serve())
+    reconciliation_task = asyncio.create_task(run_counter_reconciliation_task())
+    prune_task = asyncio.create_task(run_ai_analysis_prune_task())
+
+    try:
+        await worker.run()
+    finally:
+        reconciliation_task.cancel()
+        prune_task.cancel()
+        health_server.should_exit = True
+        await health_task
+        await close_ai_moderator_service()
+        await close_db()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.commands.audit_indexes import QUERY_SHAPES
+from backend.commands.audit_indexes import audit_query_shapes
+from backend.commands.audit_indexes import find_sequential_scans
+from backend.commands.audit_indexes import load_audit_sample
+from backend.commands.audit_indexes import seed_audit_data
+
+
+def test_find_sequential_scans_postgres() -> None:
+    # Arrange
+    plan = [
+        "Limit  (cost=0.29..8.31 rows=1 width=16)",
+        "  ->  Seq Scan on post  (cost=0.00..35.50 rows=10 width=16)",
+        "  ->  Index Scan using idx_post_topic on post  (cost=0.29..8.31)",
+    ]
+
+    # Act
+    result = find_sequential_scans(plan, postgres=True)
+
+    # Assert
+    assert result == ["->  Seq Scan on post  (cost=0.00..35.50 rows=10 width=16)"]
+
+
+def test_find_sequential_scans_sqlite() -> None:
+    # Arrange
+    plan = [
+        "SCAN post",
+        "SCAN topic USING INDEX idx_topic_created",
+        "SEARCH userevent USING INDEX idx_userevent_resource (resource_id=?)",
+    ]
+
+    # Act
+    result = find_sequential_scans(plan, postgres=False)
+
+    # Assert
+    assert result == ["SCAN post"]
+
+
+@pytest.mark.asyncio
+async def test_load_audit_sample_empty_database() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await load_audit_sample()
+
+
+@pytest.mark.asyncio
+async def test_audit_query_shapes_all_use_indexes() -> None:
+    # Arrange
+    await seed_audit_data(300)
+
+    # Act
+    results = await audit_query_shapes()
+
+    # Assert
+    assert [result.name for result in results] == list(QUERY_SHAPES)
+    assert {
+        result.name: result.sequential_scans
+        for result in results
+        if result.sequential_scans
+    } == {}
@@ -0,0 +1,38 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.commands.benchmark_moderation import percentile
+from backend.commands.benchmark_moderation import run_benchmark
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.post import Post
+
+
+def test_percentile() -> None:
+    values = [float(i) for i in range(1, 101)]
+
+    assert percentile(values, 0.50) == 51.0
+    assert percentile(values, 0.99) == 100.0
+    assert percentile([], 0.5) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_moderates_every_post() -> None:
+    # Act
+    report = await run_benchmark(
+        posts=12, concurrency=4, latency_ms=0, approve_ratio=0.5, seed=3
+    )
+
+    # Assert
+    assert report.posts == 12
+    assert report.failed == 0
+    assert sum(report.decisions.values()) == 12
+    assert report.posts_per_second > 0
+    assert report.p50_ms <= report.p95_ms <= report.p99_ms <= report.max_ms
+    assert report.queries > 0
+    assert report.queries_per_post == report.queries / 12
+    stages = {stage.stage: stage for stage in report.stages}
+    assert stages["llm"].count == 12
+    assert stages["queue_wait"].count == 0
+    assert await PendingPost.all().count() == 0
+    assert await Post.all().count() == report.decisions["APPROVED"]
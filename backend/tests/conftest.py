@@ -21,7 +21,13 @@ from backend.db.models.user import User
 from backend.db.models.user_session import UserSession
 from backend.utils.auth import create_access_token
 from backend.utils.auth import create_refresh_token
+from backend.utils.counting import count_cache
 from backend.utils.datetime import now_utc
+from backend.utils.fragment_cache import fragment_cache
+from backend.utils.page_cache import page_cache
+from backend.utils.rate_limiter import rate_limiter
+from backend.utils.session_cache import session_cache
+from backend.utils.session_revocations import session_revocations
 from backend.utils.settings import settings
 
 
@@ -40,6 +46,15 @@ async def initialize_tests(db_url):
     # Generate schemas for all apps
     await Tortoise.generate_schemas()
 
+    # Start every test with an empty session cache, revocation list, rate
+    # limiter, fragment cache, page cache and count cache
+    session_cache.clear()
+    session_revocations.clear()
+    rate_limiter.clear()
+    fragment_cache.clear()
+    page_cache.clear()
+    count_cache.clear()
+
     yield
 
     # Close all connections using the app's close_db function
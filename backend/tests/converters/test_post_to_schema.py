@@ -10,7 +10,7 @@ from backend.schemas.post import PostResponse
 
 
 @pytest.fixture
-def mock_post() -> mock.MagicMock:
+def mock_post(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
     post_id = uuid.uuid4()
     author_id = uuid.uuid4()
     topic_id = uuid.uuid4()
@@ -26,6 +26,8 @@ def mock_post() -> mock.MagicMock:
     mock_author.created_at = datetime.now()
     mock_author.updated_at = datetime.now()
     mock_author.last_login = datetime.now()
+    mock_author.approved_count = 0
+    mock_author.rejected_count = 0
 
     # Create mock topic
     mock_topic = mock.MagicMock()
@@ -38,19 +40,17 @@ def mock_post() -> mock.MagicMock:
     post.author = mock_author
     post.topic = mock_topic
     post.parent_post = None
+    post.thread_root_id = post_id
+    post.depth = 0
     post.created_at = datetime.now()
     post.updated_at = datetime.now()
 
     # Set up mock methods
     post.fetch_related = mock.AsyncMock()
 
-    # Mock Post.filter().count()
-    mock_filter = mock.MagicMock()
-    mock_count = mock.AsyncMock(return_value=5)
-    mock_filter.count = mock_count
-
-    # Patch Post.filter
-    Post.filter = mock.MagicMock(return_value=mock_filter)
+    # Reply counts come from the denormalized column, so Post.filter must not run
+    post.reply_count = 5
+    monkeypatch.setattr(Post, "filter", mock.MagicMock())
 
     return post
 
@@ -65,8 +65,8 @@ async def test_post_to_schema(mock_post) -> None:
     mock_post.fetch_related.assert_any_call("author", "topic")
     mock_post.fetch_related.assert_any_call("parent_post")
 
-    # Verify Post.filter was called with correct parameters for reply count
-    Post.filter.assert_any_call(parent_post_id=mock_post.id)  # type: ignore[reportFunctionMemberAccess]
+    # Verify no reply count query was issued
+    Post.filter.assert_not_called()  # type: ignore[reportFunctionMemberAccess]
 
     # Verify the schema has the correct values
     assert isinstance(schema, PostResponse)
@@ -80,7 +80,7 @@ async def test_post_to_schema(mock_post) -> None:
 
 
 @pytest.fixture
-def mock_post_with_parent() -> mock.MagicMock:
+def mock_post_with_parent(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
     post_id = uuid.uuid4()
     parent_id = uuid.uuid4()
     author_id = uuid.uuid4()
@@ -97,6 +97,8 @@ def mock_post_with_parent() -> mock.MagicMock:
     mock_author.created_at = datetime.now()
     mock_author.updated_at = datetime.now()
     mock_author.last_login = datetime.now()
+    mock_author.approved_count = 0
+    mock_author.rejected_count = 0
 
     # Create mock topic
     mock_topic = mock.MagicMock()
@@ -113,19 +115,17 @@ def mock_post_with_parent() -> mock.MagicMock:
     post.author = mock_author
     post.topic = mock_topic
     post.parent_post = mock_parent
+    post.thread_root_id = mock_parent.id
+    post.depth = 1
     post.created_at = datetime.now()
     post.updated_at = datetime.now()
 
     # Set up mock methods
     post.fetch_related = mock.AsyncMock()
 
-    # Mock Post.filter().count()
-    mock_filter = mock.MagicMock()
-    mock_count = mock.AsyncMock(return_value=0)
-    mock_filter.count = mock_count
-
-    # Patch Post.filter
-    Post.filter = mock.MagicMock(return_value=mock_filter)
+    # Reply counts come from the denormalized column, so Post.filter must not run
+    post.reply_count = 0
+    monkeypatch.setattr(Post, "filter", mock.MagicMock())
 
     return post
 
@@ -140,8 +140,8 @@ async def test_post_to_schema_with_parent(mock_post_with_parent) -> None:
     mock_post_with_parent.fetch_related.assert_any_call("author", "topic")
     mock_post_with_parent.fetch_related.assert_any_call("parent_post")
 
-    # Verify Post.filter was called with correct parameters for reply count
-    Post.filter.assert_any_call(parent_post_id=mock_post_with_parent.id)  # type: ignore[reportFunctionMemberAccess]
+    # Verify no reply count query was issued
+    Post.filter.assert_not_called()  # type: ignore[reportFunctionMemberAccess]
 
     # Verify the schema has the correct values
     assert isinstance(schema, PostResponse)
@@ -222,6 +222,8 @@ async def test_post_to_schema_user_to_schema_error() -> None:
     post.author = mock_author
     post.topic = mock_topic
     post.parent_post = None
+    post.thread_root_id = post_id
+    post.depth = 0
     post.created_at = datetime.now()
     post.updated_at = datetime.now()
 
@@ -271,15 +273,15 @@ async def test_post_to_schema_many_replies() -> None:
     post.author = mock_author
     post.topic = mock_topic
     post.parent_post = None
+    post.thread_root_id = post_id
+    post.depth = 0
     post.created_at = datetime.now()
     post.updated_at = datetime.now()
 
     # Set up mock methods
     post.fetch_related = mock.AsyncMock()
 
-    # Mock Post.filter().count() to return a large number
-    mock_filter = mock.MagicMock()
-    mock_filter.count = mock.AsyncMock(return_value=1000)  # Many replies
+    post.reply_count = 1000  # Many replies, read from the counter column
 
     # Create a proper mock UserSchema that matches the expected structure
     from backend.schemas.user import UserSchema
@@ -296,12 +298,9 @@ async def test_post_to_schema_many_replies() -> None:
         rejected_count=0,
     )
 
-    with (
-        mock.patch("backend.db.models.post.Post.filter", return_value=mock_filter),
-        mock.patch(
-            "backend.converters.post_to_schema.user_to_schema",
-            mock.AsyncMock(return_value=mock_user_schema),
-        ),
+    with mock.patch(
+        "backend.converters.post_to_schema.user_to_schema",
+        mock.AsyncMock(return_value=mock_user_schema),
     ):
         # Act
         schema = await post_to_schema(post)
@@ -0,0 +1,93 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+import pytest
+from tortoise.backends.sqlite.client import SqliteClient
+
+# Project-specific imports
+from backend.converters.posts_to_schemas import posts_to_schemas
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
+
+
+async def _create_user(email: str) -> User:
+    return await User.create(email=email, password_hash="x", display_name=email)
+
+
+@pytest.mark.asyncio
+async def test_posts_to_schemas_empty() -> None:
+    # Act
+    result = await posts_to_schemas([])
+
+    # Assert
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_posts_to_schemas_counts_and_order() -> None:
+    # Arrange
+    alice = await _create_user("alice@example.com")
+    bob = await _create_user("bob@example.com")
+    topic = await Topic.create(title="Topic", author=alice)
+    root = await create_post("root", alice.id, topic.id)
+    reply_one = await create_post("reply one", bob.id, topic.id, root.id)
+    await create_post("reply two", bob.id, topic.id, root.id)
+    await adjust_user_post_counts(bob.id, rejected_delta=1)
+    posts = {post.id: post for post in await Post.filter(topic_id=topic.id)}
+
+    # Act
+    result = await posts_to_schemas([posts[reply_one.id], posts[root.id]])
+
+    # Assert
+    assert [schema.id for schema in result] == [reply_one.id, root.id]
+    reply_schema, root_schema = result
+    assert root_schema.reply_count == 2
+    assert root_schema.parent_post_id is None
+    assert root_schema.topic_id == topic.id
+    assert root_schema.author.id == alice.id
+    assert root_schema.author.approved_count == 1
+    assert root_schema.author.rejected_count == 0
+    assert reply_schema.reply_count == 0
+    assert reply_schema.parent_post_id == root.id
+    assert reply_schema.author.approved_count == 2
+    assert reply_schema.author.rejected_count == 1
+
+
+@pytest.mark.asyncio
+async def test_posts_to_schemas_query_count_is_fixed() -> None:
+    # Arrange
+    user = await _create_user("many@example.com")
+    topic = await Topic.create(title="Topic", author=user)
+    small_page = [
+        await Post.create(content=f"post {i}", author=user, topic=topic)
+        for i in range(2)
+    ]
+    large_page = small_page + [
+        await Post.create(content=f"post {i}", author=user, topic=topic)
+        for i in range(2, 20)
+    ]
+
+    # Act
+    with mock.patch.object(
+        SqliteClient,
+        "execute_query",
+        autospec=True,
+        side_effect=SqliteClient.execute_query,
+    ) as small_spy:
+        await posts_to_schemas(small_page)
+    with mock.patch.object(
+        SqliteClient,
+        "execute_query",
+        autospec=True,
+        side_effect=SqliteClient.execute_query,
+    ) as large_spy:
+        await posts_to_schemas(large_page)
+
+    # Assert
+    assert small_spy.call_count == large_spy.call_count == 1
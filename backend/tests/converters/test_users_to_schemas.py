@@ -0,0 +1,40 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.converters.users_to_schemas import users_to_schemas
+from backend.db.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_users_to_schemas_empty() -> None:
+    # Act
+    result = await users_to_schemas([])
+
+    # Assert
+    assert result == {}
+
+
+@pytest.mark.asyncio
+async def test_users_to_schemas_counts() -> None:
+    # Arrange
+    active = await User.create(
+        email="active@example.com",
+        password_hash="x",
+        display_name="Active",
+        approved_count=2,
+        rejected_count=1,
+    )
+    idle = await User.create(
+        email="idle@example.com", password_hash="x", display_name="Idle"
+    )
+
+    # Act
+    result = await users_to_schemas([active, idle])
+
+    # Assert
+    assert result[active.id].approved_count == 2
+    assert result[active.id].rejected_count == 1
+    assert result[idle.id].approved_count == 0
+    assert result[idle.id].rejected_count == 0
+    assert result[idle.id].email == "idle@example.com"
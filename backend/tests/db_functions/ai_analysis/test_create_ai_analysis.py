@@ -4,6 +4,9 @@ import uuid
 import pytest
 
 from backend.db.models.ai_analysis import AIAnalysis
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.db_functions.ai_analysis.create_ai_analysis import create_ai_analysis
 from backend.schemas.ai_analysis import AIAnalysisCreate
 from backend.schemas.ai_analysis import AIAnalysisResponse
@@ -30,6 +33,14 @@ def mock_ai_analysis(analysis_data: AIAnalysisCreate) -> mock.MagicMock:
     ai.analysis_text = analysis_data.analysis_text
     ai.feedback_text = analysis_data.feedback_text
     ai.processing_time_ms = analysis_data.processing_time_ms
+    ai.content_hash = analysis_data.content_hash
+    ai.cache_hit = analysis_data.cache_hit
+    ai.queue_wait_ms = analysis_data.queue_wait_ms
+    ai.db_fetch_ms = analysis_data.db_fetch_ms
+    ai.prefilter_ms = analysis_data.prefilter_ms
+    ai.llm_ms = analysis_data.llm_ms
+    ai.persist_ms = analysis_data.persist_ms
+    ai.action_ms = analysis_data.action_ms
     ai.created_at = mock.MagicMock()
     ai.updated_at = mock.MagicMock()
     ai.pending_post_id = analysis_data.pending_post_id
@@ -54,4 +65,40 @@ async def test_create_ai_analysis_success(analysis_data, mock_ai_analysis) -> No
             analysis_text=analysis_data.analysis_text,
             feedback_text=analysis_data.feedback_text,
             processing_time_ms=analysis_data.processing_time_ms,
+            content_hash=analysis_data.content_hash,
+            cache_hit=analysis_data.cache_hit,
+            queue_wait_ms=analysis_data.queue_wait_ms,
+            db_fetch_ms=analysis_data.db_fetch_ms,
+            prefilter_ms=analysis_data.prefilter_ms,
+            llm_ms=analysis_data.llm_ms,
+            persist_ms=analysis_data.persist_ms,
+            action_ms=analysis_data.action_ms,
         )
+
+
+@pytest.mark.asyncio
+async def test_create_ai_analysis_replaces_earlier_attempt() -> None:
+    # Arrange
+    user = await User.create(
+        email="retry@example.com", password_hash="x", display_name="Retry"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    pending_post = await PendingPost.create(content="post", author=user, topic=topic)
+    first_attempt = AIAnalysisCreate(
+        pending_post_id=pending_post.id,
+        decision="APPROVED",
+        confidence_score=0.9,
+        analysis_text="first",
+        feedback_text="first",
+        processing_time_ms=10,
+    )
+    retry = first_attempt.model_copy(update={"analysis_text": "retry"})
+
+    # Act
+    first = await create_ai_analysis(first_attempt)
+    second = await create_ai_analysis(retry)
+
+    # Assert
+    assert second.id == first.id
+    assert second.analysis_text == "retry"
+    assert await AIAnalysis.filter(pending_post_id=pending_post.id).count() == 1
@@ -0,0 +1,55 @@
+# Standard library imports
+from datetime import timedelta
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.ai_analysis import AIAnalysis
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.ai_analysis.delete_expired_ai_analyses import (
+    delete_expired_ai_analyses,
+)
+from backend.utils.datetime import now_utc
+
+
+async def create_analysis(
+    pending_post: PendingPost | None, age: timedelta
+) -> AIAnalysis:
+    analysis = await AIAnalysis.create(
+        pending_post=pending_post,
+        decision="APPROVED",
+        confidence_score=0.9,
+        analysis_text="analysis",
+        feedback_text="feedback",
+        processing_time_ms=1200,
+        content_hash="a" * 64,
+    )
+    await AIAnalysis.filter(id=analysis.id).update(created_at=now_utc() - age)
+    return analysis
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_ai_analyses_only_drops_old_orphans() -> None:
+    author = await User.create(
+        email="author@example.com", password_hash="x", display_name="Author"
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    pending_post = await PendingPost.create(
+        content="awaiting review", author=author, topic=topic
+    )
+    decided = await PendingPost.create(content="decided", author=author, topic=topic)
+    expired = await create_analysis(decided, age=timedelta(days=2))
+    fresh = await create_analysis(None, age=timedelta(minutes=5))
+    awaiting = await create_analysis(pending_post, age=timedelta(days=2))
+    # The post was approved or rejected; its analysis is only a cache entry now
+    await decided.delete()
+
+    deleted = await delete_expired_ai_analyses(now_utc() - timedelta(days=1))
+
+    assert deleted == 1
+    remaining = set(await AIAnalysis.all().values_list("id", flat=True))
+    assert remaining == {fresh.id, awaiting.id}
+    assert expired.id not in remaining
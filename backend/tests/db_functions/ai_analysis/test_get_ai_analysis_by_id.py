@@ -12,12 +12,20 @@ from backend.schemas.ai_analysis import AIAnalysisResponse
 def mock_ai_analysis() -> mock.MagicMock:
     ai = mock.MagicMock(spec=AIAnalysis)
     ai.id = uuid.uuid4()
-    ai.pending_post = mock.MagicMock(id=uuid.uuid4())
+    ai.pending_post_id = uuid.uuid4()
     ai.decision = "APPROVED"
     ai.confidence_score = 0.9
     ai.analysis_text = "analysis"
     ai.feedback_text = "feedback"
     ai.processing_time_ms = 50
+    ai.content_hash = None
+    ai.cache_hit = False
+    ai.queue_wait_ms = None
+    ai.db_fetch_ms = None
+    ai.prefilter_ms = None
+    ai.llm_ms = None
+    ai.persist_ms = None
+    ai.action_ms = None
     ai.created_at = mock.MagicMock()
     ai.updated_at = mock.MagicMock()
     return ai
@@ -32,7 +40,7 @@ async def test_get_ai_analysis_by_id_success(mock_ai_analysis) -> None:
 
         assert isinstance(result, AIAnalysisResponse)
         assert result.id == mock_ai_analysis.id
-        assert result.pending_post_id == mock_ai_analysis.pending_post.id
+        assert result.pending_post_id == mock_ai_analysis.pending_post_id
         mock_get.assert_called_once_with(id=mock_ai_analysis.id)
 
 
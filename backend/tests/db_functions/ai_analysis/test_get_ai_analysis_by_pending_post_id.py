@@ -14,12 +14,20 @@ from backend.schemas.ai_analysis import AIAnalysisResponse
 def mock_ai_analysis() -> mock.MagicMock:
     ai = mock.MagicMock(spec=AIAnalysis)
     ai.id = uuid.uuid4()
-    ai.pending_post = mock.MagicMock(id=uuid.uuid4())
+    ai.pending_post_id = uuid.uuid4()
     ai.decision = "REJECTED"
     ai.confidence_score = 0.7
     ai.analysis_text = "bad"
     ai.feedback_text = "no"
     ai.processing_time_ms = 50
+    ai.content_hash = None
+    ai.cache_hit = False
+    ai.queue_wait_ms = None
+    ai.db_fetch_ms = None
+    ai.prefilter_ms = None
+    ai.llm_ms = None
+    ai.persist_ms = None
+    ai.action_ms = None
     ai.created_at = mock.MagicMock()
     ai.updated_at = mock.MagicMock()
     return ai
@@ -31,13 +39,13 @@ async def test_get_ai_analysis_by_pending_post_id_success(mock_ai_analysis) -> N
     qs.order_by.return_value.first = mock.AsyncMock(return_value=mock_ai_analysis)
     with mock.patch.object(AIAnalysis, "filter", return_value=qs) as mock_filter:
         result = await get_ai_analysis_by_pending_post_id(
-            mock_ai_analysis.pending_post.id
+            mock_ai_analysis.pending_post_id
         )
 
         assert isinstance(result, AIAnalysisResponse)
         assert result.id == mock_ai_analysis.id
         mock_filter.assert_called_once_with(
-            pending_post_id=mock_ai_analysis.pending_post.id
+            pending_post_id=mock_ai_analysis.pending_post_id
         )
         qs.order_by.assert_called_once_with("-created_at")
         qs.order_by.return_value.first.assert_called_once()
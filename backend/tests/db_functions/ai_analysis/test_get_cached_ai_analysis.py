@@ -0,0 +1,90 @@
+# Standard library imports
+from datetime import timedelta
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.ai_analysis import AIAnalysis
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.ai_analysis.get_cached_ai_analysis import (
+    get_cached_ai_analysis,
+)
+from backend.utils.datetime import now_utc
+
+
+async def create_pending_post() -> PendingPost:
+    author = await User.create(
+        email="author@example.com", password_hash="x", display_name="Author"
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    return await PendingPost.create(content="same", author=author, topic=topic)
+
+
+async def create_analysis(pending_post: PendingPost, **kwargs) -> AIAnalysis:
+    kwargs.setdefault("content_hash", "a" * 64)
+    kwargs.setdefault("decision", "APPROVED")
+    return await AIAnalysis.create(
+        pending_post=pending_post,
+        confidence_score=0.9,
+        analysis_text="analysis",
+        feedback_text="feedback",
+        processing_time_ms=1200,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_cached_ai_analysis_returns_latest_fresh_analysis() -> None:
+    pending_post = await create_pending_post()
+    await create_analysis(pending_post, decision="REJECTED")
+    latest = await create_analysis(pending_post)
+    await create_analysis(pending_post, content_hash="b" * 64)
+
+    result = await get_cached_ai_analysis(
+        "a" * 64, created_after=now_utc() - timedelta(hours=1)
+    )
+
+    assert result is not None
+    assert result.id == latest.id
+    assert result.decision == "APPROVED"
+    assert result.cache_hit is False
+
+
+@pytest.mark.asyncio
+async def test_get_cached_ai_analysis_ignores_cache_hits_and_stale_rows() -> None:
+    pending_post = await create_pending_post()
+    await create_analysis(pending_post, cache_hit=True)
+
+    assert (
+        await get_cached_ai_analysis(
+            "a" * 64, created_after=now_utc() - timedelta(hours=1)
+        )
+        is None
+    )
+
+    await create_analysis(pending_post)
+
+    assert (
+        await get_cached_ai_analysis(
+            "a" * 64, created_after=now_utc() + timedelta(seconds=1)
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_cached_ai_analysis_outlives_pending_post() -> None:
+    pending_post = await create_pending_post()
+    analysis = await create_analysis(pending_post)
+
+    await pending_post.delete()
+
+    result = await get_cached_ai_analysis(
+        "a" * 64, created_after=now_utc() - timedelta(hours=1)
+    )
+    assert result is not None
+    assert result.id == analysis.id
+    assert result.pending_post_id is None
@@ -0,0 +1,46 @@
+# Standard library imports
+from datetime import timedelta
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.ai_analysis import AIAnalysis
+from backend.db_functions.ai_analysis.list_ai_analysis_timings import (
+    list_ai_analysis_timings,
+)
+from backend.utils.datetime import now_utc
+
+
+async def create_analysis(llm_ms: int, age: timedelta) -> AIAnalysis:
+    # Analyses outlive their pending post, so none is needed here
+    analysis = await AIAnalysis.create(
+        decision="APPROVED",
+        confidence_score=0.9,
+        analysis_text="analysis",
+        feedback_text="feedback",
+        processing_time_ms=llm_ms,
+        queue_wait_ms=5,
+        llm_ms=llm_ms,
+    )
+    await AIAnalysis.filter(id=analysis.id).update(created_at=now_utc() - age)
+    return analysis
+
+
+@pytest.mark.asyncio
+async def test_list_ai_analysis_timings_returns_recent_stage_timings() -> None:
+    await create_analysis(1200, age=timedelta(minutes=5))
+    await create_analysis(9000, age=timedelta(hours=2))
+
+    rows = await list_ai_analysis_timings(now_utc() - timedelta(hours=1))
+
+    assert rows == [
+        {
+            "queue_wait_ms": 5,
+            "db_fetch_ms": None,
+            "prefilter_ms": None,
+            "llm_ms": 1200,
+            "persist_ms": None,
+            "action_ms": None,
+        }
+    ]
@@ -0,0 +1,123 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+from unittest import mock
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.db_functions.moderation_jobs.claim_moderation_jobs import (
+    CLAIM_MODERATION_JOBS_SQL,
+)
+from backend.db_functions.moderation_jobs.claim_moderation_jobs import (
+    claim_moderation_jobs,
+)
+from backend.utils.datetime import now_utc
+
+
+async def create_job(**kwargs) -> ModerationJob:
+    kwargs.setdefault("available_at", now_utc() - timedelta(seconds=1))
+    return await ModerationJob.create(pending_post_id=uuid.uuid4(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_claim_leases_due_jobs_in_order() -> None:
+    later = await create_job(available_at=now_utc() - timedelta(seconds=1))
+    earlier = await create_job(available_at=now_utc() - timedelta(seconds=10))
+    await create_job(available_at=now_utc() + timedelta(minutes=5))
+
+    jobs = await claim_moderation_jobs("worker-1", limit=5)
+
+    assert [job.id for job in jobs] == [earlier.id, later.id]
+    for job in jobs:
+        assert job.status == ModerationJobStatus.RUNNING
+        assert job.locked_by == "worker-1"
+        assert job.locked_until is not None
+        assert job.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_respects_limit_and_hides_claimed_jobs() -> None:
+    for _ in range(3):
+        await create_job()
+
+    first = await claim_moderation_jobs("worker-1", limit=2)
+    second = await claim_moderation_jobs("worker-2", limit=2)
+    third = await claim_moderation_jobs("worker-3", limit=2)
+
+    assert len(first) == 2
+    assert len(second) == 1
+    assert third == []
+    assert {job.id for job in first}.isdisjoint({job.id for job in second})
+
+
+@pytest.mark.asyncio
+async def test_claim_reclaims_jobs_with_expired_lease() -> None:
+    expired = await create_job(
+        status=ModerationJobStatus.RUNNING,
+        locked_by="dead-worker",
+        locked_until=now_utc() - timedelta(seconds=1),
+        attempts=1,
+    )
+    await create_job(
+        status=ModerationJobStatus.RUNNING,
+        locked_by="live-worker",
+        locked_until=now_utc() + timedelta(minutes=1),
+        attempts=1,
+    )
+    await create_job(status=ModerationJobStatus.SUCCEEDED)
+    await create_job(status=ModerationJobStatus.FAILED)
+
+    jobs = await claim_moderation_jobs("worker-2", limit=5)
+
+    assert [job.id for job in jobs] == [expired.id]
+    assert jobs[0].locked_by == "worker-2"
+    assert jobs[0].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_never_share_a_job() -> None:
+    for _ in range(6):
+        await create_job()
+
+    results = await asyncio.gather(
+        *(claim_moderation_jobs(f"worker-{index}", limit=3) for index in range(4))
+    )
+
+    claimed_ids = [job.id for jobs in results for job in jobs]
+    assert claimed_ids
+    assert len(set(claimed_ids)) == len(claimed_ids)
+
+    # Workers that lost a race claim fewer jobs; the rest stay claimable
+    remaining = await claim_moderation_jobs("worker-late", limit=6)
+    assert len(claimed_ids) + len(remaining) == 6
+
+
+@pytest.mark.asyncio
+async def test_claim_uses_skip_locked_on_postgres() -> None:
+    job = await create_job()
+    mock_connection = mock.MagicMock()
+    mock_connection.execute_query = mock.AsyncMock(return_value=(1, [{"id": job.id}]))
+
+    with (
+        mock.patch(
+            "backend.db_functions.moderation_jobs.claim_moderation_jobs.is_postgres",
+            return_value=True,
+        ),
+        mock.patch(
+            "backend.db_functions.moderation_jobs.claim_moderation_jobs.get_connection",
+            return_value=mock_connection,
+        ),
+    ):
+        jobs = await claim_moderation_jobs("worker-1", limit=4)
+
+    assert [claimed.id for claimed in jobs] == [job.id]
+    sql, params = mock_connection.execute_query.call_args.args
+    assert sql == CLAIM_MODERATION_JOBS_SQL
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params[0] == "worker-1"
+    assert params[3] == 4
@@ -0,0 +1,47 @@
+# Standard library imports
+from datetime import timedelta
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.db_functions.moderation_jobs.complete_moderation_job import (
+    complete_moderation_job,
+)
+from backend.utils.datetime import now_utc
+
+
+async def create_running_job(worker_id: str) -> ModerationJob:
+    return await ModerationJob.create(
+        pending_post_id=uuid.uuid4(),
+        status=ModerationJobStatus.RUNNING,
+        available_at=now_utc(),
+        locked_by=worker_id,
+        locked_until=now_utc() + timedelta(minutes=1),
+        attempts=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_moderation_job_releases_lease() -> None:
+    job = await create_running_job("worker-1")
+
+    assert await complete_moderation_job(job.id, "worker-1") is True
+
+    await job.refresh_from_db()
+    assert job.status == ModerationJobStatus.SUCCEEDED
+    assert job.locked_by is None
+    assert job.locked_until is None
+
+
+@pytest.mark.asyncio
+async def test_complete_moderation_job_requires_lease() -> None:
+    job = await create_running_job("worker-2")
+
+    assert await complete_moderation_job(job.id, "worker-1") is False
+
+    await job.refresh_from_db()
+    assert job.status == ModerationJobStatus.RUNNING
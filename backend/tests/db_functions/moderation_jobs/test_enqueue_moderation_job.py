@@ -0,0 +1,33 @@
+# Standard library imports
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.db_functions.moderation_jobs.enqueue_moderation_job import (
+    enqueue_moderation_job,
+)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_moderation_job_creates_queued_job() -> None:
+    pending_post_id = uuid.uuid4()
+
+    job = await enqueue_moderation_job(pending_post_id)
+
+    assert job.pending_post_id == pending_post_id
+    assert job.status == ModerationJobStatus.QUEUED
+    assert job.attempts == 0
+    assert job.locked_by is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_moderation_job_is_idempotent() -> None:
+    pending_post_id = uuid.uuid4()
+
+    first = await enqueue_moderation_job(pending_post_id)
+    second = await enqueue_moderation_job(pending_post_id)
+
+    assert first.id == second.id
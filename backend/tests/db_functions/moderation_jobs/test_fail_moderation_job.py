@@ -0,0 +1,58 @@
+# Standard library imports
+from datetime import timedelta
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.db_functions.moderation_jobs.fail_moderation_job import fail_moderation_job
+from backend.utils.datetime import now_utc
+
+
+async def create_running_job(worker_id: str) -> ModerationJob:
+    return await ModerationJob.create(
+        pending_post_id=uuid.uuid4(),
+        status=ModerationJobStatus.RUNNING,
+        available_at=now_utc(),
+        locked_by=worker_id,
+        locked_until=now_utc() + timedelta(minutes=1),
+        attempts=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fail_moderation_job_schedules_retry() -> None:
+    job = await create_running_job("worker-1")
+    before = now_utc()
+
+    assert await fail_moderation_job(job.id, "worker-1", "boom", 30.0) is True
+
+    await job.refresh_from_db()
+    assert job.status == ModerationJobStatus.QUEUED
+    assert job.last_error == "boom"
+    assert job.locked_by is None
+    assert job.available_at >= before + timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_fail_moderation_job_without_retry_is_permanent() -> None:
+    job = await create_running_job("worker-1")
+
+    assert await fail_moderation_job(job.id, "worker-1", "boom") is True
+
+    await job.refresh_from_db()
+    assert job.status == ModerationJobStatus.FAILED
+    assert job.last_error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_fail_moderation_job_requires_lease() -> None:
+    job = await create_running_job("worker-2")
+
+    assert await fail_moderation_job(job.id, "worker-1", "boom", 30.0) is False
+
+    await job.refresh_from_db()
+    assert job.status == ModerationJobStatus.RUNNING
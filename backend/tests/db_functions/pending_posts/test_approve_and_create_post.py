@@ -5,9 +5,12 @@ import pytest
 
 from backend.db.models.pending_post import PendingPost
 from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.db_functions.pending_posts.approve_and_create_post import (
     approve_and_create_post,
 )
+from backend.db_functions.posts.create_post import create_post
 from backend.schemas.post import PostResponse
 
 
@@ -61,6 +64,7 @@ def mock_post_response() -> PostResponse:
 async def test_approve_and_create_post_success(
     mock_pending_post, mock_post, mock_post_response, mock_author, mock_topic
 ) -> None:
+    mock_post_response.topic_id = mock_topic.id
     with (
         mock.patch.object(
             PendingPost,
@@ -82,17 +86,30 @@ async def test_approve_and_create_post_success(
             "backend.db_functions.pending_posts.approve_and_create_post.get_post_by_id",
             new=mock.AsyncMock(return_value=mock_post_response),
         ) as mock_get_post,
+        mock.patch(
+            "backend.db_functions.pending_posts.approve_and_create_post.adjust_topic_post_count",
+            new=mock.AsyncMock(),
+        ) as mock_topic_count,
+        mock.patch(
+            "backend.db_functions.pending_posts.approve_and_create_post.page_cache"
+        ) as mock_page_cache,
     ):
         result = await approve_and_create_post(mock_pending_post.id)
 
         assert result == mock_post_response
         mock_get.assert_called_once_with(id=mock_pending_post.id)
+        post_id = mock_create.call_args.kwargs["id"]
         mock_create.assert_called_once_with(
+            id=post_id,
             content=mock_pending_post.content,
             author=mock_author,
             topic=mock_topic,
             parent_post_id=mock_pending_post.parent_post_id,
+            thread_root_id=post_id,
+            depth=0,
+            path=f"{post_id.hex}/",
         )
+        mock_topic_count.assert_awaited_once_with(mock_topic.id, 1)
         mock_inc.assert_called_once_with(mock_author.id, mock_post.id)
         mock_event.assert_called_once_with(
             user_id=mock_author.id,
@@ -101,6 +118,7 @@ async def test_approve_and_create_post_success(
         )
         mock_pending_post.delete.assert_called_once()
         mock_get_post.assert_called_once_with(mock_post.id)
+        mock_page_cache.invalidate_topic.assert_called_once_with(mock_topic.id)
 
 
 @pytest.mark.asyncio
@@ -111,3 +129,22 @@ async def test_approve_and_create_post_not_found() -> None:
         result = await approve_and_create_post(uuid.uuid4())
         assert result is None
         mock_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_approve_and_create_post_updates_counters() -> None:
+    author = await User.create(
+        email="approve@example.com", password_hash="x", display_name="Approve"
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    parent = await create_post("parent", author.id, topic.id)
+    pending_post = await PendingPost.create(
+        content="reply", author=author, topic=topic, parent_post_id=parent.id
+    )
+
+    result = await approve_and_create_post(pending_post.id)
+
+    assert result is not None
+    assert result.author.approved_count == 2
+    assert (await Post.get(id=parent.id)).reply_count == 1
+    assert (await Topic.get(id=topic.id)).post_count == 2
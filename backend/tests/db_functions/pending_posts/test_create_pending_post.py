@@ -5,12 +5,17 @@ import uuid
 # Third-party imports
 import pytest
 from tortoise.exceptions import IntegrityError
+from tortoise.exceptions import ValidationError
 
 # Project-specific imports
 from backend.db.models.pending_post import PendingPost
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.db_functions.pending_posts.create_pending_post import create_pending_post
 from backend.schemas.pending_post import PendingPostCreate
 from backend.schemas.pending_post import PendingPostResponse
+from backend.utils.post_path import MAX_POST_DEPTH
 
 
 @pytest.fixture
@@ -178,3 +183,23 @@ async def test_create_pending_post_invalid_data() -> None:
             user_id=user_id,
             pending_post_data=pending_post_data,
         )
+
+
+@pytest.mark.asyncio
+async def test_create_pending_post_refuses_reply_too_deep() -> None:
+    # Arrange
+    user = await User.create(
+        email="deep-pending@example.com", password_hash="x", display_name="Deep"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    parent = await Post.create(
+        content="deepest", author=user, topic=topic, depth=MAX_POST_DEPTH
+    )
+    pending_post_data = PendingPostCreate(
+        content="Too deep", topic_id=topic.id, parent_post_id=parent.id
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        await create_pending_post(user_id=user.id, pending_post_data=pending_post_data)
+    assert await PendingPost.all().count() == 0
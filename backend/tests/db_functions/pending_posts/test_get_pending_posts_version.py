@@ -0,0 +1,34 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.pending_posts.get_pending_posts_version import (
+    get_pending_posts_version,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_pending_posts_version_counts_the_users_posts() -> None:
+    # Arrange
+    user = await User.create(
+        email="pending@example.com", password_hash="x", display_name="Pending"
+    )
+    other = await User.create(
+        email="other@example.com", password_hash="x", display_name="Other"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    pending_post = await PendingPost.create(content="one", author=user, topic=topic)
+    await PendingPost.create(content="two", author=other, topic=topic)
+
+    # Act
+    version = await get_pending_posts_version(topic.id, user.id)
+    await pending_post.delete()
+    after_delete = await get_pending_posts_version(topic.id, user.id)
+
+    # Assert
+    assert version.count == 1
+    assert version.last_modified == pending_post.updated_at
+    assert after_delete.count == 0
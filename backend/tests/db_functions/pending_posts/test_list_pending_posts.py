@@ -64,15 +64,13 @@ async def test_list_pending_posts_no_filters(
     ):
         # Configure mock filter chain
         mock_filter.return_value.count = mock.AsyncMock(return_value=total_count)
-        mock_filter.return_value.limit = mock.MagicMock(
+        mock_filter.return_value.order_by = mock.MagicMock(
             return_value=mock_filter.return_value
         )
         mock_filter.return_value.offset = mock.MagicMock(
             return_value=mock_filter.return_value
         )
-        mock_filter.return_value.order_by = mock.AsyncMock(
-            return_value=mock_pending_posts
-        )
+        mock_filter.return_value.limit = mock.AsyncMock(return_value=mock_pending_posts)
 
         # Act
         result = await list_pending_posts(limit=limit, offset=offset)
@@ -84,9 +82,9 @@ async def test_list_pending_posts_no_filters(
 
         # Verify function calls
         mock_filter.assert_called_with(Q())
-        mock_filter.return_value.limit.assert_called_once_with(limit)
+        mock_filter.return_value.order_by.assert_called_once_with("-created_at", "-id")
         mock_filter.return_value.offset.assert_called_once_with(offset)
-        mock_filter.return_value.order_by.assert_called_once_with("-created_at")
+        mock_filter.return_value.limit.assert_called_once_with(limit + 1)
 
         # Verify converter called for each post
         assert mock_converter.call_count == len(mock_pending_posts)
@@ -114,13 +112,13 @@ async def test_list_pending_posts_pagination(
     ):
         # Configure mock filter chain
         mock_filter.return_value.count = mock.AsyncMock(return_value=total_count)
-        mock_filter.return_value.limit = mock.MagicMock(
+        mock_filter.return_value.order_by = mock.MagicMock(
             return_value=mock_filter.return_value
         )
         mock_filter.return_value.offset = mock.MagicMock(
             return_value=mock_filter.return_value
         )
-        mock_filter.return_value.order_by = mock.AsyncMock(
+        mock_filter.return_value.limit = mock.AsyncMock(
             return_value=mock_pending_posts[:limit]
         )
 
@@ -133,8 +131,8 @@ async def test_list_pending_posts_pagination(
         assert len(result.pending_posts) == limit  # But only limited number returned
 
         # Verify pagination parameters
-        mock_filter.return_value.limit.assert_called_once_with(limit)
         mock_filter.return_value.offset.assert_called_once_with(offset)
+        mock_filter.return_value.limit.assert_called_once_with(limit + 1)
 
 
 @pytest.mark.asyncio
@@ -157,13 +155,13 @@ async def test_list_pending_posts_empty_results():
     ):
         # Configure mock filter chain to return empty list
         mock_filter.return_value.count = mock.AsyncMock(return_value=0)
-        mock_filter.return_value.limit = mock.MagicMock(
+        mock_filter.return_value.order_by = mock.MagicMock(
             return_value=mock_filter.return_value
         )
         mock_filter.return_value.offset = mock.MagicMock(
             return_value=mock_filter.return_value
         )
-        mock_filter.return_value.order_by = mock.AsyncMock(return_value=[])
+        mock_filter.return_value.limit = mock.AsyncMock(return_value=[])
 
         # Act
         result = await list_pending_posts(user_id=user_id, limit=limit, offset=offset)
@@ -5,6 +5,8 @@ import pytest
 
 from backend.db.models.pending_post import PendingPost
 from backend.db.models.rejected_post import RejectedPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.db_functions.pending_posts.reject_pending_post import reject_pending_post
 from backend.schemas.rejected_post import RejectedPostResponse
 
@@ -105,3 +107,19 @@ async def test_reject_pending_post_not_found() -> None:
         result = await reject_pending_post(uuid.uuid4(), "why")
         assert result is None
         mock_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reject_pending_post_updates_counters() -> None:
+    author = await User.create(
+        email="reject@example.com", password_hash="x", display_name="Reject"
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    pending_post = await PendingPost.create(content="bad", author=author, topic=topic)
+
+    result = await reject_pending_post(pending_post.id, "no")
+
+    assert result is not None
+    user = await User.get(id=author.id)
+    assert user.rejected_count == 1
+    assert user.approved_count == 0
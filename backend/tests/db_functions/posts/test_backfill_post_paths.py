@@ -0,0 +1,62 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.backfill_post_paths import BACKFILL_POST_PATHS_SQL
+from backend.db_functions.posts.backfill_post_paths import backfill_post_paths
+
+
+@pytest.mark.asyncio
+async def test_backfill_post_paths_walks_tree() -> None:
+    # Arrange
+    user = await User.create(
+        email="backfill@example.com", password_hash="x", display_name="Backfill"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await Post.create(content="root", author=user, topic=topic)
+    reply = await Post.create(
+        content="reply", author=user, topic=topic, parent_post=root
+    )
+    nested = await Post.create(
+        content="nested", author=user, topic=topic, parent_post=reply
+    )
+
+    # Act
+    result = await backfill_post_paths(batch_size=1)
+
+    # Assert
+    assert result == 3
+    nested = await Post.get(id=nested.id)
+    assert nested.thread_root_id == root.id
+    assert nested.depth == 2
+    assert nested.path == f"{root.id.hex}/{reply.id.hex}/{nested.id.hex}/"
+
+
+@pytest.mark.asyncio
+async def test_backfill_post_paths_postgres_single_statement() -> None:
+    # Arrange
+    connection = mock.MagicMock()
+    connection.execute_query = mock.AsyncMock(return_value=(7, []))
+
+    with (
+        mock.patch(
+            "backend.db_functions.posts.backfill_post_paths.is_postgres",
+            return_value=True,
+        ),
+        mock.patch(
+            "backend.db_functions.posts.backfill_post_paths.get_connection",
+            return_value=connection,
+        ),
+    ):
+        # Act
+        result = await backfill_post_paths()
+
+    # Assert
+    assert result == 7
+    connection.execute_query.assert_awaited_once_with(BACKFILL_POST_PATHS_SQL)
@@ -8,8 +8,11 @@ from tortoise.exceptions import IntegrityError
 
 # Project-specific imports
 from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.db_functions.posts.create_post import create_post
 from backend.schemas.post import PostResponse
+from backend.schemas.post import PostTreePosition
 
 
 @pytest.fixture
@@ -30,8 +33,18 @@ def mock_post_response(mock_post) -> PostResponse:
     return mock.MagicMock(spec=PostResponse)
 
 
+@pytest.fixture
+def mock_position() -> PostTreePosition:
+    thread_root_id = uuid.uuid4()
+    return PostTreePosition(
+        thread_root_id=thread_root_id, depth=1, path=f"{thread_root_id.hex}/child/"
+    )
+
+
 @pytest.mark.asyncio
-async def test_create_post_success(mock_post, mock_post_response) -> None:
+async def test_create_post_success(
+    mock_post, mock_post_response, mock_position
+) -> None:
     # Arrange
     content = "Test Post Content"
     author_id = uuid.uuid4()
@@ -46,6 +59,10 @@ async def test_create_post_success(mock_post, mock_post_response) -> None:
             "backend.db_functions.posts.create_post.post_to_schema",
             new=mock.AsyncMock(return_value=mock_post_response),
         ) as mock_converter,
+        mock.patch(
+            "backend.db_functions.posts.create_post.get_post_tree_position",
+            new=mock.AsyncMock(return_value=mock_position),
+        ) as mock_get_position,
     ):
         # Act
         result = await create_post(
@@ -59,17 +76,23 @@ async def test_create_post_success(mock_post, mock_post_response) -> None:
         assert result == mock_post_response
 
         # Verify function calls
+        post_id = mock_create.call_args.kwargs["id"]
+        mock_get_position.assert_awaited_once_with(post_id, None)
         mock_create.assert_called_once_with(
             using_db=None,
+            id=post_id,
             content=content,
             author_id=author_id,
             topic_id=topic_id,
+            **mock_position.model_dump(),
         )
         mock_converter.assert_called_once_with(mock_post)
 
 
 @pytest.mark.asyncio
-async def test_create_post_with_parent_post(mock_post, mock_post_response) -> None:
+async def test_create_post_with_parent_post(
+    mock_post, mock_post_response, mock_position
+) -> None:
     # Arrange
     content = "Test Reply Content"
     author_id = uuid.uuid4()
@@ -85,6 +108,10 @@ async def test_create_post_with_parent_post(mock_post, mock_post_response) -> No
             "backend.db_functions.posts.create_post.post_to_schema",
             new=mock.AsyncMock(return_value=mock_post_response),
         ) as mock_converter,
+        mock.patch(
+            "backend.db_functions.posts.create_post.get_post_tree_position",
+            new=mock.AsyncMock(return_value=mock_position),
+        ) as mock_get_position,
     ):
         # Act
         result = await create_post(
@@ -99,11 +126,17 @@ async def test_create_post_with_parent_post(mock_post, mock_post_response) -> No
         assert result == mock_post_response
 
         # Verify function calls
+        post_id = mock_create.call_args.kwargs["id"]
+        mock_get_position.assert_awaited_once_with(post_id, parent_post_id)
         mock_create.assert_called_once_with(
             using_db=None,
+            id=post_id,
             content=content,
             author_id=author_id,
             topic_id=topic_id,
+            thread_root_id=mock_position.thread_root_id,
+            depth=mock_position.depth,
+            path=mock_position.path,
             parent_post_id=parent_post_id,
         )
         mock_converter.assert_called_once_with(mock_post)
@@ -133,9 +166,13 @@ async def test_create_post_database_error() -> None:
         assert exc_info.value == db_error
         mock_create.assert_called_once_with(
             using_db=None,
+            id=mock.ANY,
             content=content,
             author_id=author_id,
             topic_id=topic_id,
+            thread_root_id=mock.ANY,
+            depth=0,
+            path=mock.ANY,
         )
 
 
@@ -154,3 +191,21 @@ async def test_create_post_invalid_data() -> None:
             author_id=author_id,
             topic_id=uuid.UUID("not-a-valid-uuid"),  # This will raise a ValueError
         )
+
+
+@pytest.mark.asyncio
+async def test_create_post_updates_counters() -> None:
+    # Arrange
+    user = await User.create(
+        email="counter@example.com", password_hash="x", display_name="Counter"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+
+    # Act
+    reply = await create_post("reply", user.id, topic.id, parent_post_id=root.id)
+
+    # Assert
+    assert reply.author.approved_count == 2
+    assert (await Post.get(id=root.id)).reply_count == 1
+    assert (await Topic.get(id=topic.id)).post_count == 2
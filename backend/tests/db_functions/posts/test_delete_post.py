@@ -8,6 +8,9 @@ from tortoise.exceptions import IntegrityError
 
 # Project-specific imports
 from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
 from backend.db_functions.posts.delete_post import delete_post
 
 
@@ -19,6 +22,7 @@ def mock_post() -> mock.MagicMock:
     post.author_id = uuid.uuid4()
     post.topic_id = uuid.uuid4()
     post.parent_post_id = None
+    post.path = ""
     return post
 
 
@@ -135,3 +139,28 @@ async def test_delete_post_cascading_deletion(mock_post) -> None:
         # since Tortoise ORM handles cascading deletions automatically based on
         # the model relationships. The delete() method on the post will trigger
         # the cascading deletions.
+
+
+@pytest.mark.asyncio
+async def test_delete_post_updates_counters() -> None:
+    # Arrange
+    author = await User.create(
+        email="author@example.com", password_hash="x", display_name="Author"
+    )
+    replier = await User.create(
+        email="replier@example.com", password_hash="x", display_name="Replier"
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    root = await create_post("root", author.id, topic.id)
+    reply = await create_post("reply", replier.id, topic.id, parent_post_id=root.id)
+    await create_post("nested", author.id, topic.id, parent_post_id=reply.id)
+
+    # Act
+    result = await delete_post(reply.id)
+
+    # Assert
+    assert result is True
+    assert (await Post.get(id=root.id)).reply_count == 0
+    assert (await Topic.get(id=topic.id)).post_count == 1
+    assert (await User.get(id=author.id)).approved_count == 1
+    assert (await User.get(id=replier.id)).approved_count == 0
@@ -0,0 +1,69 @@
+# Standard library imports
+import uuid
+
+# Third-party imports
+import pytest
+from tortoise.exceptions import ValidationError
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.get_post_tree_position import get_post_tree_position
+from backend.utils.post_path import MAX_POST_DEPTH
+
+
+@pytest.mark.asyncio
+async def test_get_post_tree_position_root() -> None:
+    # Arrange
+    post_id = uuid.uuid4()
+
+    # Act
+    result = await get_post_tree_position(post_id)
+
+    # Assert
+    assert result.thread_root_id == post_id
+    assert result.depth == 0
+    assert result.path == f"{post_id.hex}/"
+
+
+@pytest.mark.asyncio
+async def test_get_post_tree_position_reply() -> None:
+    # Arrange
+    user = await User.create(
+        email="position@example.com", password_hash="x", display_name="Position"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+    reply = await create_post("reply", user.id, topic.id, parent_post_id=root.id)
+    post_id = uuid.uuid4()
+
+    # Act
+    result = await get_post_tree_position(post_id, parent_post_id=reply.id)
+
+    # Assert
+    assert result.thread_root_id == root.id
+    assert result.depth == 2
+    assert result.path == f"{root.id.hex}/{reply.id.hex}/{post_id.hex}/"
+
+
+@pytest.mark.asyncio
+async def test_get_post_tree_position_refuses_replies_too_deep_to_store() -> None:
+    # Arrange
+    user = await User.create(
+        email="deep@example.com", password_hash="x", display_name="Deep"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    deepest = await create_post("deepest", user.id, topic.id)
+    await Post.filter(id=deepest.id).update(depth=MAX_POST_DEPTH)
+    almost = await create_post("almost", user.id, topic.id)
+    await Post.filter(id=almost.id).update(depth=MAX_POST_DEPTH - 1)
+
+    # Act
+    allowed = await get_post_tree_position(uuid.uuid4(), parent_post_id=almost.id)
+
+    # Assert
+    assert allowed.depth == MAX_POST_DEPTH
+    with pytest.raises(ValidationError):
+        await get_post_tree_position(uuid.uuid4(), parent_post_id=deepest.id)
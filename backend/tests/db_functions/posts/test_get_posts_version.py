@@ -0,0 +1,64 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.get_posts_version import get_posts_version
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_posts_version_counts_filtered_posts() -> None:
+    # Arrange
+    user = await User.create(
+        email="posts@example.com", password_hash="x", display_name="Posts"
+    )
+    other = await User.create(
+        email="other@example.com", password_hash="x", display_name="Other"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    await Post.create(content="one", author=user, topic=topic)
+    latest_post = await Post.create(content="two", author=other, topic=topic)
+
+    # Act
+    everything = await get_posts_version()
+    by_author = await get_posts_version(author_id=other.id)
+
+    # Assert
+    assert everything.count == 2
+    assert by_author.count == 1
+    assert everything.last_modified is not None
+    assert everything.last_modified >= latest_post.updated_at
+
+
+@pytest.mark.asyncio
+async def test_get_posts_version_sees_author_counter_changes() -> None:
+    # Arrange
+    user = await User.create(
+        email="author@example.com", password_hash="x", display_name="Author"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    await Post.create(content="one", author=user, topic=topic)
+    before = await get_posts_version(topic_id=topic.id)
+
+    # Act
+    await adjust_user_post_counts(user.id, approved_delta=1)
+    after = await get_posts_version(topic_id=topic.id)
+
+    # Assert
+    assert after.count == before.count
+    assert before.last_modified is not None
+    assert after.last_modified is not None
+    assert after.last_modified > before.last_modified
+
+
+@pytest.mark.asyncio
+async def test_get_posts_version_empty() -> None:
+    version = await get_posts_version()
+
+    assert version.count == 0
+    assert version.last_modified is None
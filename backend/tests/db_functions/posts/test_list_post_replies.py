@@ -8,6 +8,9 @@ from tortoise.exceptions import IntegrityError
 
 # Project-specific imports
 from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
 from backend.db_functions.posts.list_post_replies import list_post_replies
 from backend.schemas.post import PostList
 from backend.schemas.post import PostResponse
@@ -59,8 +62,8 @@ async def test_list_post_replies_success(mock_reply_posts, mock_post_responses)
             new=mock.AsyncMock(return_value=mock_reply_posts),
         ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_post_replies.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_post_replies.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -78,7 +81,7 @@ async def test_list_post_replies_success(mock_reply_posts, mock_post_responses)
         mock_count.assert_called_once()
         mock_offset.assert_called_once_with(skip)
         mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_converter.assert_awaited_once_with(mock_reply_posts)
 
 
 @pytest.mark.asyncio
@@ -108,8 +111,8 @@ async def test_list_post_replies_with_pagination(
             new=mock.AsyncMock(return_value=mock_reply_posts),
         ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_post_replies.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_post_replies.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -127,7 +130,7 @@ async def test_list_post_replies_with_pagination(
         mock_count.assert_called_once()
         mock_offset.assert_called_once_with(skip)
         mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_converter.assert_awaited_once_with(mock_reply_posts)
 
 
 @pytest.mark.asyncio
@@ -191,3 +194,34 @@ async def test_list_post_replies_database_error() -> None:
         # Verify the exception is propagated correctly
         assert exc_info.value == db_error
         mock_filter.assert_called_once_with(parent_post_id=parent_post_id)
+
+
+@pytest.mark.asyncio
+async def test_list_post_replies_nested() -> None:
+    # Arrange
+    user = await User.create(
+        email="nested@example.com", password_hash="x", display_name="Nested"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+    reply = await create_post("reply", user.id, topic.id, parent_post_id=root.id)
+    nested = await create_post("nested", user.id, topic.id, parent_post_id=reply.id)
+    await create_post("other", user.id, topic.id)
+
+    # Act
+    direct = await list_post_replies(root.id)
+    everything = await list_post_replies(root.id, nested=True)
+
+    # Assert
+    assert [post.id for post in direct.posts] == [reply.id]
+    assert everything.count == 2
+    assert [post.id for post in everything.posts] == [reply.id, nested.id]
+
+
+@pytest.mark.asyncio
+async def test_list_post_replies_nested_missing_parent() -> None:
+    # Act
+    result = await list_post_replies(uuid.uuid4(), nested=True)
+
+    # Assert
+    assert result == PostList(posts=[], count=0)
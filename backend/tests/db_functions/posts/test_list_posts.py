@@ -11,6 +11,11 @@ from backend.db.models.post import Post
 from backend.db_functions.posts.list_posts import list_posts
 from backend.schemas.post import PostList
 from backend.schemas.post import PostResponse
+from backend.utils.pagination import KeysetPage
+
+
+def make_page(rows: list) -> KeysetPage:
+    return KeysetPage(rows=rows, next_cursor=None, previous_cursor=None)
 
 
 @pytest.fixture
@@ -49,17 +54,13 @@ async def test_list_posts_success(mock_posts, mock_post_responses) -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_posts),
-        ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_posts.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_posts.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_posts)),
+        ) as mock_paginate,
+        mock.patch(
+            "backend.db_functions.posts.list_posts.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -75,9 +76,10 @@ async def test_list_posts_success(mock_posts, mock_post_responses) -> None:
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
+        mock_converter.assert_awaited_once_with(mock_posts)
 
 
 @pytest.mark.asyncio
@@ -99,17 +101,13 @@ async def test_list_posts_with_topic_filter(mock_posts, mock_post_responses) ->
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_filter.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_posts),
-        ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_posts.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_posts.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_posts)),
+        ) as mock_paginate,
+        mock.patch(
+            "backend.db_functions.posts.list_posts.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -126,9 +124,10 @@ async def test_list_posts_with_topic_filter(mock_posts, mock_post_responses) ->
         mock_all.assert_called_once()
         mock_filter.assert_called_once_with(topic_id=topic_id)
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_paginate.assert_awaited_once_with(
+            mock_filter.return_value, limit, skip=skip, cursor=None
+        )
+        mock_converter.assert_awaited_once_with(mock_posts)
 
 
 @pytest.mark.asyncio
@@ -150,17 +149,13 @@ async def test_list_posts_with_author_filter(mock_posts, mock_post_responses) ->
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_filter.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_posts),
-        ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_posts.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_posts.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_posts)),
+        ) as mock_paginate,
+        mock.patch(
+            "backend.db_functions.posts.list_posts.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -177,9 +172,10 @@ async def test_list_posts_with_author_filter(mock_posts, mock_post_responses) ->
         mock_all.assert_called_once()
         mock_filter.assert_called_once_with(author_id=author_id)
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_paginate.assert_awaited_once_with(
+            mock_filter.return_value, limit, skip=skip, cursor=None
+        )
+        mock_converter.assert_awaited_once_with(mock_posts)
 
 
 @pytest.mark.asyncio
@@ -207,17 +203,13 @@ async def test_list_posts_with_multiple_filters(
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_filter_author.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_posts),
-        ) as mock_limit,
         mock.patch(
-            "backend.db_functions.posts.list_posts.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_post_responses),
+            "backend.db_functions.posts.list_posts.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_posts)),
+        ) as mock_paginate,
+        mock.patch(
+            "backend.db_functions.posts.list_posts.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_post_responses),
         ) as mock_converter,
     ):
         # Act
@@ -237,9 +229,10 @@ async def test_list_posts_with_multiple_filters(
         mock_filter_topic.assert_called_once_with(topic_id=topic_id)
         mock_filter_author.assert_called_once_with(author_id=author_id)
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
-        assert mock_converter.call_count == expected_count
+        mock_paginate.assert_awaited_once_with(
+            mock_filter_author.return_value, limit, skip=skip, cursor=None
+        )
+        mock_converter.assert_awaited_once_with(mock_posts)
 
 
 @pytest.mark.asyncio
@@ -258,14 +251,10 @@ async def test_list_posts_empty_results() -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=empty_posts),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.posts.list_posts.paginate",
+            new=mock.AsyncMock(return_value=make_page(empty_posts)),
+        ) as mock_paginate,
     ):
         # Act
         result = await list_posts(skip=skip, limit=limit)
@@ -279,8 +268,9 @@ async def test_list_posts_empty_results() -> None:
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
 
 
 @pytest.mark.asyncio
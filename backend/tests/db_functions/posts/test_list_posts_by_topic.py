@@ -29,8 +29,8 @@ async def test_list_posts_by_topic_success(mock_posts, mock_responses) -> None:
     with (
         mock.patch.object(Post, "filter", return_value=qs) as mock_filter,
         mock.patch(
-            "backend.db_functions.posts.list_posts_by_topic.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_responses),
+            "backend.db_functions.posts.list_posts_by_topic.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_responses),
         ) as mock_conv,
     ):
         topic_id = uuid.uuid4()
@@ -43,4 +43,4 @@ async def test_list_posts_by_topic_success(mock_posts, mock_responses) -> None:
         qs.offset.return_value.limit.return_value.order_by.assert_called_once_with(
             "-created_at"
         )
-        assert mock_conv.call_count == len(mock_posts)
+        mock_conv.assert_awaited_once_with(mock_posts)
@@ -27,8 +27,8 @@ async def test_list_posts_by_user_success(mock_posts, mock_responses) -> None:
     with (
         mock.patch.object(Post, "filter", return_value=qs) as mock_filter,
         mock.patch(
-            "backend.db_functions.posts.list_posts_by_user.post_to_schema",
-            new=mock.AsyncMock(side_effect=mock_responses),
+            "backend.db_functions.posts.list_posts_by_user.posts_to_schemas",
+            new=mock.AsyncMock(return_value=mock_responses),
         ) as mock_conv,
     ):
         user = uuid.uuid4()
@@ -39,7 +39,7 @@ async def test_list_posts_by_user_success(mock_posts, mock_responses) -> None:
         qs.order_by.return_value.offset.return_value.limit.assert_called_once_with(10)
         qs.order_by.return_value.offset.return_value.limit.return_value.all.assert_called_once()
         assert len(result) == len(mock_posts)
-        assert mock_conv.call_count == len(mock_posts)
+        mock_conv.assert_awaited_once_with(mock_posts)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,119 @@
+# Standard library imports
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.list_thread_replies import list_thread_replies
+from backend.schemas.post import PostResponse
+
+
+@pytest.fixture
+async def thread() -> dict[str, PostResponse]:
+    user = await User.create(
+        email="thread@example.com", password_hash="x", display_name="Thread"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+    other_root = await create_post("other root", user.id, topic.id)
+    child_a = await create_post("child a", user.id, topic.id, parent_post_id=root.id)
+    child_b = await create_post("child b", user.id, topic.id, parent_post_id=root.id)
+    grandchild = await create_post(
+        "grandchild", user.id, topic.id, parent_post_id=child_a.id
+    )
+    other_child = await create_post(
+        "other child", user.id, topic.id, parent_post_id=other_root.id
+    )
+    return {
+        "root": root,
+        "other_root": other_root,
+        "child_a": child_a,
+        "child_b": child_b,
+        "grandchild": grandchild,
+        "other_child": other_child,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_empty_roots() -> None:
+    # Act
+    result = await list_thread_replies([])
+
+    # Assert
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_only_requested_subtrees(thread) -> None:
+    # Act
+    result = await list_thread_replies([thread["root"].id])
+
+    # Assert
+    assert [reply.id for reply in result] == [
+        thread["child_a"].id,
+        thread["child_b"].id,
+        thread["grandchild"].id,
+    ]
+    assert result[2].parent_post_id == thread["child_a"].id
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_max_depth(thread) -> None:
+    # Act
+    result = await list_thread_replies(
+        [thread["root"].id, thread["other_root"].id], max_depth=1
+    )
+
+    # Assert
+    assert {reply.id for reply in result} == {
+        thread["child_a"].id,
+        thread["child_b"].id,
+        thread["other_child"].id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_reply_cap(thread) -> None:
+    # Act
+    result = await list_thread_replies([thread["root"].id], max_replies_per_post=1)
+
+    # Assert
+    assert [reply.id for reply in result] == [
+        thread["child_a"].id,
+        thread["grandchild"].id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_reply_cap_drops_subtree(thread) -> None:
+    # Act
+    result = await list_thread_replies(
+        [thread["child_a"].id, thread["child_b"].id], max_replies_per_post=0
+    )
+
+    # Assert
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_nested_root(thread) -> None:
+    # Act
+    result = await list_thread_replies([thread["child_a"].id])
+
+    # Assert
+    assert [reply.id for reply in result] == [thread["grandchild"].id]
+    assert result[0].thread_root_id == thread["root"].id
+    assert result[0].depth == 2
+
+
+@pytest.mark.asyncio
+async def test_list_thread_replies_unknown_root() -> None:
+    # Act
+    result = await list_thread_replies([uuid.uuid4()])
+
+    # Assert
+    assert result == []
@@ -0,0 +1,52 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.list_threaded_posts_by_topic import (
+    list_threaded_posts_by_topic,
+)
+
+
+@pytest.mark.asyncio
+async def test_list_threaded_posts_by_topic_nests_page_subtrees() -> None:
+    # Arrange
+    user = await User.create(
+        email="threaded@example.com", password_hash="x", display_name="Threaded"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    older_root = await create_post("older", user.id, topic.id)
+    newer_root = await create_post("newer", user.id, topic.id)
+    reply = await create_post("reply", user.id, topic.id, parent_post_id=newer_root.id)
+    nested = await create_post("nested", user.id, topic.id, parent_post_id=reply.id)
+    await create_post("off page", user.id, topic.id, parent_post_id=older_root.id)
+
+    # Act
+    result = await list_threaded_posts_by_topic(topic.id, skip=0, limit=1)
+
+    # Assert
+    assert result.count == 2
+    assert [post.id for post in result.posts] == [newer_root.id]
+    assert [post.id for post in result.posts[0].replies] == [reply.id]
+    assert [post.id for post in result.posts[0].replies[0].replies] == [nested.id]
+
+
+@pytest.mark.asyncio
+async def test_list_threaded_posts_by_topic_max_depth() -> None:
+    # Arrange
+    user = await User.create(
+        email="depth@example.com", password_hash="x", display_name="Depth"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+    reply = await create_post("reply", user.id, topic.id, parent_post_id=root.id)
+    await create_post("nested", user.id, topic.id, parent_post_id=reply.id)
+
+    # Act
+    result = await list_threaded_posts_by_topic(topic.id, max_depth=1)
+
+    # Assert
+    assert [post.id for post in result.posts[0].replies] == [reply.id]
+    assert result.posts[0].replies[0].replies == []
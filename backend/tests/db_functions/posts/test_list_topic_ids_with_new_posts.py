@@ -0,0 +1,36 @@
+# Standard library imports
+from datetime import timedelta
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.list_topic_ids_with_new_posts import (
+    list_topic_ids_with_new_posts,
+)
+from backend.utils.datetime import now_utc
+
+
+@pytest.mark.asyncio
+async def test_list_topic_ids_with_new_posts_returns_each_topic_once() -> None:
+    # Arrange
+    user = await User.create(
+        email="poster@example.com", password_hash="x", display_name="Poster"
+    )
+    busy = await Topic.create(title="Busy", author=user)
+    quiet = await Topic.create(title="Quiet", author=user)
+    since = now_utc() - timedelta(minutes=1)
+    await create_post("first", user.id, busy.id)
+    await create_post("second", user.id, busy.id)
+    old = await create_post("old", user.id, quiet.id)
+    await Post.filter(id=old.id).update(created_at=since - timedelta(minutes=1))
+
+    # Act
+    topic_ids = await list_topic_ids_with_new_posts(since)
+
+    # Assert
+    assert topic_ids == [busy.id]
@@ -0,0 +1,34 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.reconcile_post_reply_counts import (
+    reconcile_post_reply_counts,
+)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_post_reply_counts_repairs_drift() -> None:
+    # Arrange
+    user = await User.create(
+        email="drift@example.com", password_hash="x", display_name="Drift"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    root = await create_post("root", user.id, topic.id)
+    await create_post("reply", user.id, topic.id, parent_post_id=root.id)
+    leaf = await create_post("leaf", user.id, topic.id)
+    await Post.filter(id=root.id).update(reply_count=7)
+    await Post.filter(id=leaf.id).update(reply_count=2)
+
+    # Act
+    fixed = await reconcile_post_reply_counts()
+
+    # Assert
+    assert fixed == 2
+    assert (await Post.get(id=root.id)).reply_count == 1
+    assert (await Post.get(id=leaf.id)).reply_count == 0
+    assert await reconcile_post_reply_counts() == 0
@@ -0,0 +1,83 @@
+# Standard library imports
+import asyncio
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.rate_limit_bucket import RateLimitBucket
+from backend.db_functions.rate_limits.acquire_rate_limit import ACQUIRE_RATE_LIMIT_SQL
+from backend.db_functions.rate_limits.acquire_rate_limit import acquire_rate_limit
+
+MODULE = "backend.db_functions.rate_limits.acquire_rate_limit"
+
+
+@pytest.mark.asyncio
+async def test_acquire_allows_up_to_the_limit_then_refuses() -> None:
+    # 3 requests per 60 seconds
+    results = [
+        await acquire_rate_limit("api:1.2.3.4", 20.0, 60.0, 1000.0) for _ in range(4)
+    ]
+
+    assert [allowed for allowed, _ in results] == [True, True, True, False]
+    assert results[2][1] == 1060.0
+    # A refused request does not use up allowance
+    bucket = await RateLimitBucket.get(key="api:1.2.3.4")
+    assert bucket.tat == 1060.0
+
+
+@pytest.mark.asyncio
+async def test_acquire_refills_over_time() -> None:
+    for _ in range(3):
+        await acquire_rate_limit("api:client", 20.0, 60.0, 1000.0)
+
+    allowed, tat = await acquire_rate_limit("api:client", 20.0, 60.0, 1020.0)
+
+    assert allowed is True
+    assert tat == 1080.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_never_exceed_the_limit() -> None:
+    results = await asyncio.gather(
+        *(acquire_rate_limit("api:burst", 10.0, 60.0, 1000.0) for _ in range(10))
+    )
+
+    assert sum(allowed for allowed, _ in results) == 6
+
+
+@pytest.mark.asyncio
+async def test_acquire_uses_one_upsert_on_postgres() -> None:
+    mock_connection = mock.MagicMock()
+    mock_connection.execute_query = mock.AsyncMock(return_value=(1, [{"tat": 1020.0}]))
+
+    with (
+        mock.patch(f"{MODULE}.is_postgres", return_value=True),
+        mock.patch(f"{MODULE}.get_connection", return_value=mock_connection),
+    ):
+        result = await acquire_rate_limit("api:client", 20.0, 60.0, 1000.0)
+
+    assert result == (True, 1020.0)
+    sql, params = mock_connection.execute_query.call_args.args
+    assert sql == ACQUIRE_RATE_LIMIT_SQL
+    assert "ON CONFLICT" in sql
+    # Untyped arithmetic parameters are ambiguous to Postgres
+    assert "$2 +" not in sql
+    assert "$4::double precision" in sql
+    assert params == ["api:client", 1000.0, 20.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_refused_upsert_reads_current_tat_on_postgres() -> None:
+    await RateLimitBucket.create(key="api:client", tat=1060.0)
+    mock_connection = mock.MagicMock()
+    mock_connection.execute_query = mock.AsyncMock(return_value=(0, []))
+
+    with (
+        mock.patch(f"{MODULE}.is_postgres", return_value=True),
+        mock.patch(f"{MODULE}.get_connection", return_value=mock_connection),
+    ):
+        result = await acquire_rate_limit("api:client", 20.0, 60.0, 1000.0)
+
+    assert result == (False, 1060.0)
@@ -0,0 +1,17 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.rate_limit_bucket import RateLimitBucket
+from backend.db_functions.rate_limits.prune_rate_limits import prune_rate_limits
+
+
+@pytest.mark.asyncio
+async def test_prune_deletes_refilled_rows_only() -> None:
+    await RateLimitBucket.create(key="api:idle", tat=900.0)
+    await RateLimitBucket.create(key="api:active", tat=1100.0)
+
+    deleted = await prune_rate_limits(before=1000.0)
+
+    assert deleted == 1
+    assert await RateLimitBucket.all().values_list("key", flat=True) == ["api:active"]
@@ -25,9 +25,6 @@ async def test_list_rejected_posts_success(mock_rejected_posts, mock_responses)
     qs.order_by.return_value.offset.return_value.limit = mock.AsyncMock(
         return_value=mock_rejected_posts
     )
-    qs.order_by.return_value.offset.return_value.limit.__name__ = (
-        "limit"  # for assert? but not needed
-    )
     with (
         mock.patch.object(RejectedPost, "all", return_value=qs) as mock_all,
         mock.patch(
@@ -40,9 +37,9 @@ async def test_list_rejected_posts_success(mock_rejected_posts, mock_responses)
         assert isinstance(result, RejectedPostList)
         assert result.count == len(mock_rejected_posts)
         mock_all.assert_called_once()
-        qs.order_by.assert_called_once_with("-created_at")
+        qs.order_by.assert_called_once_with("-created_at", "-id")
         qs.order_by.return_value.offset.assert_called_once_with(0)
-        qs.order_by.return_value.offset.return_value.limit.assert_called_once_with(5)
+        qs.order_by.return_value.offset.return_value.limit.assert_called_once_with(6)
         assert mock_conv.call_count == len(mock_rejected_posts)
 
 
@@ -64,4 +61,4 @@ async def test_list_rejected_posts_filtered(mock_rejected_posts) -> None:
         user = uuid.uuid4()
         await list_rejected_posts(user_id=user)
         mock_all.assert_called_once()
-        mock_filter.assert_called_once_with(user_id=user)
+        mock_filter.assert_called_once_with(author_id=user)
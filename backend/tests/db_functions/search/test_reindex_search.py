@@ -0,0 +1,36 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.search.reindex_search import reindex_search
+from backend.db_functions.search.search_content import search_content
+
+
+@pytest.mark.asyncio
+async def test_reindex_search_indexes_existing_rows() -> None:
+    # Arrange: rows written straight to the tables are not indexed
+    user = await User.create(
+        email="reindex@example.com", password_hash="x", display_name="Reindex"
+    )
+    topic = await Topic.create(title="Pistons", description="", author=user)
+    await Post.create(content="Pistons and valves", author=user, topic=topic)
+    stale = await Post.create(content="Valves only", author=user, topic=topic)
+    assert (await search_content("pistons")).results == []
+
+    # Act
+    written = await reindex_search()
+    await stale.delete()
+    rewritten = await reindex_search()
+
+    # Assert
+    assert written == 3
+    assert rewritten == 2
+    assert len((await search_content("pistons")).results) == 2
+    rows = await get_connection().execute_query_dict(
+        'SELECT count(*) AS "entries" FROM "search_index"'
+    )
+    assert rows[0]["entries"] == 2
@@ -0,0 +1,136 @@
+# Third-party imports
+import pytest
+from tortoise.transactions import in_transaction
+
+# Project-specific imports
+from backend.db.models.pending_post import PendingPost
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.pending_posts.approve_and_create_post import (
+    approve_and_create_post,
+)
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.posts.update_post import update_post
+from backend.db_functions.search.search_content import search_content
+from backend.db_functions.topics.create_topic import create_topic
+from backend.schemas.search import SearchKind
+
+
+async def create_user() -> User:
+    return await User.create(
+        email="searcher@example.com", password_hash="x", display_name="Searcher"
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_content_ranks_topic_titles_first() -> None:
+    # Arrange
+    user = await create_user()
+    topic = await create_topic("Robot labour laws", "Who keeps the machines", user.id)
+    other = await create_topic("Weather", "Rain and sun", user.id)
+    post = await create_post("Robots should unionise their labour", user.id, other.id)
+
+    # Act
+    found = await search_content("labour")
+
+    # Assert
+    assert [(r.kind, r.id) for r in found.results] == [
+        (SearchKind.TOPIC, topic.id),
+        (SearchKind.POST, post.id),
+    ]
+    assert found.results[1].topic_id == other.id
+    assert found.results[1].title == "Weather"
+    assert "<mark>labour</mark>" in found.results[1].snippet
+    assert found.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_search_content_filters_and_pages() -> None:
+    # Arrange
+    user = await create_user()
+    topic = await create_topic("Gears", "About gears", user.id)
+    for i in range(3):
+        await create_post(f"Gears turning number {i}", user.id, topic.id)
+
+    # Act
+    first = await search_content("gears", kind=SearchKind.POST, limit=2)
+    rest = await search_content("gears", kind=SearchKind.POST, limit=2, offset=2)
+
+    # Assert
+    assert len(first.results) == 2
+    assert first.has_more is True
+    assert len(rest.results) == 1
+    assert rest.has_more is False
+    assert all(r.kind == SearchKind.POST for r in first.results + rest.results)
+
+
+@pytest.mark.asyncio
+async def test_search_content_escapes_snippets() -> None:
+    # Arrange
+    user = await create_user()
+    topic = await create_topic("Markup", "", user.id)
+    await create_post("<script>alert(1)</script> obey", user.id, topic.id)
+
+    # Act
+    found = await search_content("obey")
+
+    # Assert
+    snippet = found.results[0].snippet
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet
+    assert "<mark>obey</mark>" in snippet
+
+
+@pytest.mark.asyncio
+async def test_search_content_ignores_query_syntax() -> None:
+    # Act
+    empty = await search_content('"*) OR NEAR(')
+    blank = await search_content("  ")
+
+    # Assert
+    assert empty.results == []
+    assert blank.results == []
+
+
+@pytest.mark.asyncio
+async def test_search_content_follows_approvals_edits_and_deletes() -> None:
+    # Arrange
+    user = await create_user()
+    topic = await Topic.create(title="Untitled", author=user)
+    pending = await PendingPost.create(
+        content="Calibrate the sprockets", author=user, topic=topic
+    )
+
+    # Act
+    approved = await approve_and_create_post(pending.id)
+    assert approved is not None
+    after_approval = await search_content("sprockets")
+    await update_post(approved.id, "Calibrate the flywheels")
+    after_edit = await search_content("sprockets")
+    edited = await search_content("flywheels")
+    await Post.filter(id=approved.id).delete()
+    after_delete = await search_content("flywheels")
+
+    # Assert
+    assert [r.id for r in after_approval.results] == [approved.id]
+    assert after_edit.results == []
+    assert [r.id for r in edited.results] == [approved.id]
+    assert after_delete.results == []
+
+
+@pytest.mark.asyncio
+async def test_indexing_inside_a_rolled_back_transaction_leaves_nothing() -> None:
+    # Arrange
+    user = await create_user()
+    topic = await create_topic("Weather", "Rain and sun", user.id)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        async with in_transaction():
+            await create_post("Robots should unionise", user.id, topic.id)
+            raise RuntimeError("Approval failed")
+
+    # Assert
+    assert await Post.filter(topic_id=topic.id).count() == 0
+    assert (await search_content("unionise")).results == []
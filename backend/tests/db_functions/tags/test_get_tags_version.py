@@ -0,0 +1,21 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.tag import Tag
+from backend.db_functions.tags.get_tags_version import get_tags_version
+
+
+@pytest.mark.asyncio
+async def test_get_tags_version() -> None:
+    # Arrange
+    assert (await get_tags_version()).count == 0
+    await Tag.create(name="Logic", slug="logic")
+    tag = await Tag.create(name="Reason", slug="reason")
+
+    # Act
+    version = await get_tags_version()
+
+    # Assert
+    assert version.count == 2
+    assert version.last_modified == tag.updated_at
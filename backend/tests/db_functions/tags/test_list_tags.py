@@ -11,6 +11,11 @@ from backend.db.models.tag import Tag
 from backend.db_functions.tags.list_tags import list_tags
 from backend.schemas.tag import TagList
 from backend.schemas.tag import TagResponse
+from backend.utils.pagination import KeysetPage
+
+
+def make_page(rows: list) -> KeysetPage:
+    return KeysetPage(rows=rows, next_cursor=None, previous_cursor=None)
 
 
 @pytest.fixture
@@ -45,14 +50,10 @@ async def test_list_tags_success(mock_tags, mock_tag_responses) -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_tags),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.tags.list_tags.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_tags)),
+        ) as mock_paginate,
         mock.patch(
             "backend.db_functions.tags.list_tags.tag_to_schema",
             new=mock.AsyncMock(side_effect=mock_tag_responses),
@@ -71,8 +72,9 @@ async def test_list_tags_success(mock_tags, mock_tag_responses) -> None:
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
         assert mock_converter.call_count == expected_count
 
 
@@ -95,14 +97,10 @@ async def test_list_tags_with_search(mock_tags, mock_tag_responses) -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_filter.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_tags),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.tags.list_tags.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_tags)),
+        ) as mock_paginate,
         mock.patch(
             "backend.db_functions.tags.list_tags.tag_to_schema",
             new=mock.AsyncMock(side_effect=mock_tag_responses),
@@ -122,8 +120,9 @@ async def test_list_tags_with_search(mock_tags, mock_tag_responses) -> None:
         mock_all.assert_called_once()
         mock_filter.assert_called_once_with(name__icontains=search)
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_filter.return_value, limit, skip=skip, cursor=None
+        )
         assert mock_converter.call_count == expected_count
 
 
@@ -142,14 +141,10 @@ async def test_list_tags_with_pagination(mock_tags, mock_tag_responses) -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_tags),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.tags.list_tags.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_tags)),
+        ) as mock_paginate,
         mock.patch(
             "backend.db_functions.tags.list_tags.tag_to_schema",
             new=mock.AsyncMock(side_effect=mock_tag_responses),
@@ -168,8 +163,9 @@ async def test_list_tags_with_pagination(mock_tags, mock_tag_responses) -> None:
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
         assert mock_converter.call_count == expected_count
 
 
@@ -189,14 +185,10 @@ async def test_list_tags_empty_results() -> None:
             "count",
             new=mock.AsyncMock(return_value=expected_count),
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=empty_tags),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.tags.list_tags.paginate",
+            new=mock.AsyncMock(return_value=make_page(empty_tags)),
+        ) as mock_paginate,
     ):
         # Act
         result = await list_tags(skip=skip, limit=limit)
@@ -210,8 +202,9 @@ async def test_list_tags_empty_results() -> None:
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
 
 
 @pytest.mark.asyncio
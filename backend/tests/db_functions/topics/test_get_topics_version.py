@@ -0,0 +1,69 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.tag import Tag
+from backend.db.models.topic import Topic
+from backend.db.models.topic_tag import TopicTag
+from backend.db.models.user import User
+from backend.db_functions.topics.adjust_topic_post_count import adjust_topic_post_count
+from backend.db_functions.topics.get_topics_version import get_topics_version
+
+
+@pytest.mark.asyncio
+async def test_get_topics_version_counts_topics_and_tag_links() -> None:
+    # Arrange
+    user = await User.create(
+        email="topics@example.com", password_hash="x", display_name="Topics"
+    )
+    tagged = await Topic.create(title="Tagged", author=user)
+    await Topic.create(title="Plain", author=user)
+    tag = await Tag.create(name="Logic", slug="logic")
+    await TopicTag.create(topic=tagged, tag=tag)
+
+    # Act
+    everything = await get_topics_version()
+    one = await get_topics_version(tagged.id)
+
+    # Assert
+    assert everything.count == 3
+    assert one.count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_topics_version_sees_tag_renames_and_post_counts() -> None:
+    # Arrange
+    user = await User.create(
+        email="renames@example.com", password_hash="x", display_name="Renames"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    tag = await Tag.create(name="Logic", slug="logic")
+    await TopicTag.create(topic=topic, tag=tag)
+    first = await get_topics_version(topic.id)
+
+    # Act
+    tag.name = "Reason"
+    await tag.save()
+    renamed = await get_topics_version(topic.id)
+    await adjust_topic_post_count(topic.id, 1)
+    counted = await get_topics_version(topic.id)
+
+    # Assert
+    assert first.last_modified is not None
+    assert renamed.last_modified is not None
+    assert counted.last_modified is not None
+    assert first.last_modified < renamed.last_modified < counted.last_modified
+
+
+@pytest.mark.asyncio
+async def test_get_topics_version_missing_topic() -> None:
+    user = await User.create(
+        email="missing@example.com", password_hash="x", display_name="Missing"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    await topic.delete()
+
+    version = await get_topics_version(topic.id)
+
+    assert version.count == 0
+    assert version.last_modified is None
@@ -11,6 +11,11 @@ from backend.db.models.topic import Topic
 from backend.db_functions.topics.list_topics import list_topics
 from backend.schemas.topic import TopicList
 from backend.schemas.topic import TopicResponse
+from backend.utils.pagination import KeysetPage
+
+
+def make_page(rows: list) -> KeysetPage:
+    return KeysetPage(rows=rows, next_cursor=None, previous_cursor=None)
 
 
 @pytest.fixture
@@ -53,14 +58,10 @@ async def test_list_topics_success(
         mock.patch.object(
             mock_all.return_value, "count", new=mock.AsyncMock(return_value=count)
         ) as mock_count,
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value,
-            "limit",
-            new=mock.AsyncMock(return_value=mock_topics),
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.topics.list_topics.paginate",
+            new=mock.AsyncMock(return_value=make_page(mock_topics)),
+        ) as mock_paginate,
         mock.patch(
             "backend.db_functions.topics.list_topics.topic_to_schema",
             new=mock.AsyncMock(side_effect=mock_topic_responses),
@@ -77,8 +78,9 @@ async def test_list_topics_success(
         # Verify function calls
         mock_all.assert_called_once()
         mock_count.assert_called_once()
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
         assert mock_converter.call_count == len(mock_topics)
 
 
@@ -96,12 +98,10 @@ async def test_list_topics_pagination() -> None:
         mock.patch.object(
             mock_all.return_value, "count", new=mock.AsyncMock(return_value=count)
         ),
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value, "limit", new=mock.AsyncMock(return_value=topics)
-        ) as mock_limit,
+        mock.patch(
+            "backend.db_functions.topics.list_topics.paginate",
+            new=mock.AsyncMock(return_value=make_page(topics)),
+        ) as mock_paginate,
         mock.patch(
             "backend.db_functions.topics.list_topics.topic_to_schema",
             new=mock.AsyncMock(return_value=mock.MagicMock(spec=TopicResponse)),
@@ -116,8 +116,9 @@ async def test_list_topics_pagination() -> None:
         assert len(result.topics) == len(topics)
 
         # Verify pagination parameters are used correctly
-        mock_offset.assert_called_once_with(skip)
-        mock_limit.assert_called_once_with(limit)
+        mock_paginate.assert_awaited_once_with(
+            mock_all.return_value, limit, skip=skip, cursor=None
+        )
 
 
 @pytest.mark.asyncio
@@ -134,11 +135,9 @@ async def test_list_topics_empty_results() -> None:
         mock.patch.object(
             mock_all.return_value, "count", new=mock.AsyncMock(return_value=count)
         ),
-        mock.patch.object(
-            mock_all.return_value, "offset", return_value=mock.MagicMock()
-        ) as mock_offset,
-        mock.patch.object(
-            mock_offset.return_value, "limit", new=mock.AsyncMock(return_value=topics)
+        mock.patch(
+            "backend.db_functions.topics.list_topics.paginate",
+            new=mock.AsyncMock(return_value=make_page(topics)),
         ),
     ):
         # Act
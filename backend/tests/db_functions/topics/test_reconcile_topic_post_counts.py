@@ -0,0 +1,70 @@
+# Standard library imports
+from typing import Any
+from typing import List
+from unittest import mock
+
+# Third-party imports
+import pytest
+from tortoise.expressions import F
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.topics.reconcile_topic_post_counts import (
+    reconcile_topic_post_counts,
+)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_topic_post_counts_repairs_drift() -> None:
+    # Arrange
+    user = await User.create(
+        email="topic@example.com", password_hash="x", display_name="Topic"
+    )
+    busy = await Topic.create(title="Busy", author=user)
+    empty = await Topic.create(title="Empty", author=user, post_count=4)
+    await Post.create(content="one", author=user, topic=busy)
+    await Post.create(content="two", author=user, topic=busy)
+
+    # Act
+    fixed = await reconcile_topic_post_counts()
+
+    # Assert
+    assert fixed == 2
+    assert (await Topic.get(id=busy.id)).post_count == 2
+    assert (await Topic.get(id=empty.id)).post_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_topic_post_counts_keeps_concurrent_increment() -> None:
+    # Arrange
+    user = await User.create(
+        email="race@example.com", password_hash="x", display_name="Race"
+    )
+    topic = await Topic.create(title="Drifted", author=user, post_count=5)
+    await Post.create(content="one", author=user, topic=topic)
+    read_topics = Topic.all
+
+    class ApproveAfterRead:
+        # A post is approved just after the stored counters are read
+        def values_list(self, *fields: str) -> Any:
+            return self.read(*fields)
+
+        async def read(self, *fields: str) -> List[Any]:
+            rows = await read_topics().values_list(*fields)
+            await Post.create(content="two", author=user, topic=topic)
+            await Topic.filter(id=topic.id).update(post_count=F("post_count") + 1)
+            return list(rows)
+
+    # Act
+    with mock.patch.object(Topic, "all", return_value=ApproveAfterRead()):
+        first = await reconcile_topic_post_counts()
+    stored_after_race = (await Topic.get(id=topic.id)).post_count
+    second = await reconcile_topic_post_counts()
+
+    # Assert
+    assert first == 0
+    assert stored_after_race == 6
+    assert second == 1
+    assert (await Topic.get(id=topic.id)).post_count == 2
@@ -1,4 +1,5 @@
 # Standard library imports
+from datetime import datetime
 from unittest import mock
 import uuid
 
@@ -72,9 +73,9 @@ async def test_get_user_events_success(mock_user_events, mock_event_schemas) ->
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(return_value=mock_user_events)
+        mock_query.limit = mock.AsyncMock(return_value=mock_user_events)
 
         # Act
         result = await get_user_events(
@@ -92,9 +93,10 @@ async def test_get_user_events_success(mock_user_events, mock_event_schemas) ->
         # Verify function calls
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
 
         # Verify converter was called for each event
         assert mock_converter.call_count == len(mock_user_events)
@@ -132,9 +134,9 @@ async def test_get_user_events_with_event_type(
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(return_value=filtered_events)
+        mock_query.limit = mock.AsyncMock(return_value=filtered_events)
 
         # Act
         result = await get_user_events(
@@ -154,9 +156,10 @@ async def test_get_user_events_with_event_type(
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.filter.assert_called_once_with(event_type=test_event_type)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
 
         # Verify converter was called for each event
         assert mock_converter.call_count == len(filtered_events)
@@ -180,9 +183,9 @@ async def test_get_user_events_empty() -> None:
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(return_value=[])
+        mock_query.limit = mock.AsyncMock(return_value=[])
 
         # Act
         result = await get_user_events(
@@ -200,9 +203,10 @@ async def test_get_user_events_empty() -> None:
         # Verify function calls
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
 
 
 @pytest.mark.asyncio
@@ -215,6 +219,9 @@ async def test_get_user_events_with_pagination() -> None:
     mock_page_events = [mock.MagicMock(spec=UserEvent) for _ in range(10)]
     for event in mock_page_events:
         event.fetch_related = mock.AsyncMock()
+        # Rows past the first page need keys for the previous-page cursor
+        event.created_at = datetime.now()
+        event.id = uuid.uuid4()
 
     mock_schemas = [
         mock.MagicMock(spec=UserEventSchema) for _ in range(len(mock_page_events))
@@ -234,9 +241,9 @@ async def test_get_user_events_with_pagination() -> None:
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(return_value=mock_page_events)
+        mock_query.limit = mock.AsyncMock(return_value=mock_page_events)
 
         # Act
         result = await get_user_events(
@@ -250,13 +257,16 @@ async def test_get_user_events_with_pagination() -> None:
         assert isinstance(result, UserEventListSchema)
         assert len(result.user_events) == len(mock_page_events)
         assert result.count == test_count
+        assert result.previous_cursor is not None
+        assert result.next_cursor is None
 
         # Verify function calls
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
 
         # Verify converter was called for each event
         assert mock_converter.call_count == len(mock_page_events)
@@ -309,9 +319,9 @@ async def test_get_user_events_query_error() -> None:
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(side_effect=db_error)
+        mock_query.limit = mock.AsyncMock(side_effect=db_error)
 
         # Act & Assert
         with pytest.raises(OperationalError) as exc_info:
@@ -325,9 +335,10 @@ async def test_get_user_events_query_error() -> None:
         assert exc_info.value == db_error
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
 
 
 @pytest.mark.asyncio
@@ -356,9 +367,9 @@ async def test_get_user_events_converter_error() -> None:
         mock_query = mock_filter.return_value
         mock_query.count = mock.AsyncMock(return_value=test_count)
         mock_query.filter = mock.MagicMock(return_value=mock_query)
+        mock_query.order_by = mock.MagicMock(return_value=mock_query)
         mock_query.offset = mock.MagicMock(return_value=mock_query)
-        mock_query.limit = mock.MagicMock(return_value=mock_query)
-        mock_query.order_by = mock.AsyncMock(return_value=mock_events)
+        mock_query.limit = mock.AsyncMock(return_value=mock_events)
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -372,7 +383,8 @@ async def test_get_user_events_converter_error() -> None:
         assert exc_info.value == converter_error
         mock_filter.assert_called_once_with(user_id=test_user_id)
         mock_query.count.assert_called_once()
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
         mock_query.offset.assert_called_once_with(test_skip)
-        mock_query.limit.assert_called_once_with(test_limit)
-        mock_query.order_by.assert_called_once_with("-created_at")
+        # One extra row tells whether there is a next page
+        mock_query.limit.assert_called_once_with(test_limit + 1)
         mock_converter.assert_called_once_with(mock_events[0])
@@ -41,7 +41,9 @@ async def test_cleanup_expired_sessions_success() -> None:
             expires_at__lt=test_now,
             is_active=True,
         )
-        filter_mock.update.assert_called_once_with(is_active=False)
+        filter_mock.update.assert_called_once_with(
+            is_active=False, updated_at=mock_now_utc.return_value
+        )
         mock_now_utc.assert_called_once()
 
 
@@ -73,7 +75,9 @@ async def test_cleanup_expired_sessions_no_expired() -> None:
             expires_at__lt=test_now,
             is_active=True,
         )
-        filter_mock.update.assert_called_once_with(is_active=False)
+        filter_mock.update.assert_called_once_with(
+            is_active=False, updated_at=mock_now_utc.return_value
+        )
         mock_now_utc.assert_called_once()
 
 
@@ -133,5 +137,7 @@ async def test_cleanup_expired_sessions_update_error() -> None:
             expires_at__lt=test_now,
             is_active=True,
         )
-        filter_mock.update.assert_called_once_with(is_active=False)
+        filter_mock.update.assert_called_once_with(
+            is_active=False, updated_at=mock_now_utc.return_value
+        )
         mock_now_utc.assert_called_once()
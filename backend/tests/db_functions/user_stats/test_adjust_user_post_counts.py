@@ -0,0 +1,37 @@
+# Standard library imports
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.user import User
+from backend.db_functions.user_stats.adjust_user_post_counts import (
+    adjust_user_post_counts,
+)
+
+
+@pytest.mark.asyncio
+async def test_adjust_user_post_counts() -> None:
+    # Arrange
+    user = await User.create(
+        email="adjust@example.com", password_hash="x", display_name="Adjust"
+    )
+
+    # Act
+    result = await adjust_user_post_counts(user.id, approved_delta=2)
+    await adjust_user_post_counts(user.id, approved_delta=-1, rejected_delta=1)
+
+    # Assert
+    assert result is True
+    user = await User.get(id=user.id)
+    assert (user.approved_count, user.rejected_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_adjust_user_post_counts_user_not_found() -> None:
+    # Act
+    result = await adjust_user_post_counts(uuid.uuid4(), approved_delta=1)
+
+    # Assert
+    assert result is False
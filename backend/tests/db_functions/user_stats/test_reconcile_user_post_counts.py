@@ -0,0 +1,39 @@
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.post import Post
+from backend.db.models.rejected_post import RejectedPost
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.user_stats.reconcile_user_post_counts import (
+    reconcile_user_post_counts,
+)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_user_post_counts_repairs_drift() -> None:
+    # Arrange
+    author = await User.create(
+        email="author@example.com", password_hash="x", display_name="Author"
+    )
+    lurker = await User.create(
+        email="lurker@example.com",
+        password_hash="x",
+        display_name="Lurker",
+        approved_count=3,
+    )
+    topic = await Topic.create(title="Topic", author=author)
+    await Post.create(content="ok", author=author, topic=topic)
+    await RejectedPost.create(
+        content="bad", author=author, topic=topic, moderation_reason="no"
+    )
+
+    # Act
+    fixed = await reconcile_user_post_counts()
+
+    # Assert
+    assert fixed == 2
+    author = await User.get(id=author.id)
+    assert (author.approved_count, author.rejected_count) == (1, 1)
+    assert (await User.get(id=lurker.id)).approved_count == 0
@@ -61,11 +61,11 @@ async def test_set_user_password_success(mock_user, mock_user_schema) -> None:
             new=mock.AsyncMock(return_value=mock_user_schema),
         ) as mock_converter,
         mock.patch(
-            "backend.db_functions.users.set_user_password.bcrypt.gensalt",
+            "backend.utils.password_hashing.bcrypt.gensalt",
             return_value=b"mock_salt",
         ) as mock_gensalt,
         mock.patch(
-            "backend.db_functions.users.set_user_password.bcrypt.hashpw",
+            "backend.utils.password_hashing.bcrypt.hashpw",
             return_value=b"hashed_password",
         ) as mock_hashpw,
     ):
@@ -142,7 +142,7 @@ async def test_set_user_password_bcrypt_error(mock_user) -> None:
             User, "get_or_none", new=mock.AsyncMock(return_value=mock_user)
         ) as mock_get,
         mock.patch(
-            "backend.db_functions.users.set_user_password.bcrypt.gensalt",
+            "backend.utils.password_hashing.bcrypt.gensalt",
             side_effect=bcrypt_error,
         ) as mock_gensalt,
     ):
@@ -170,11 +170,11 @@ async def test_set_user_password_save_error(mock_user) -> None:
             User, "get_or_none", new=mock.AsyncMock(return_value=mock_user)
         ) as mock_get,
         mock.patch(
-            "backend.db_functions.users.set_user_password.bcrypt.gensalt",
+            "backend.utils.password_hashing.bcrypt.gensalt",
             return_value=b"mock_salt",
         ) as mock_gensalt,
         mock.patch(
-            "backend.db_functions.users.set_user_password.bcrypt.hashpw",
+            "backend.utils.password_hashing.bcrypt.hashpw",
             return_value=b"hashed_password",
         ) as mock_hashpw,
     ):
@@ -1,5 +1,6 @@
 from bs4 import BeautifulSoup
 
+from backend.dominate_templates.components.pagination import create_cursor_pagination
 from backend.dominate_templates.components.pagination import create_pagination
 
 
@@ -204,3 +205,59 @@ def test_pagination_custom_limit():
     next_link = pagination.select("li.page-item")[-1].select_one("a")["href"]
     assert "limit=15" in next_link
     assert "offset=30" in next_link
+
+
+def render_cursor_pagination_to_soup(limit, base_url, previous_cursor, next_cursor):
+    """Helper function to render cursor pagination and parse with BeautifulSoup."""
+    from dominate.document import document
+
+    doc = document()
+    with doc:
+        create_cursor_pagination(
+            limit=limit,
+            base_url=base_url,
+            previous_cursor=previous_cursor,
+            next_cursor=next_cursor,
+        )
+
+    return BeautifulSoup(doc.render(), "html.parser")
+
+
+def test_cursor_pagination_single_page():
+    """Test that cursor pagination is not rendered without neighbouring pages."""
+    # Arrange & Act
+    soup = render_cursor_pagination_to_soup(10, "/test/", None, None)
+
+    # Assert
+    assert soup.select_one(".pagination") is None
+
+
+def test_cursor_pagination_first_page():
+    """Test cursor pagination on the newest page."""
+    # Arrange & Act
+    soup = render_cursor_pagination_to_soup(10, "/test/", None, "older")
+
+    # Assert
+    items = soup.select("li.page-item")
+    assert [item.select_one("a").text for item in items] == [
+        "Newest",
+        "Previous",
+        "Next",
+    ]
+    assert "disabled" in items[0]["class"]
+    assert "disabled" in items[1]["class"]
+    assert "disabled" not in items[2]["class"]
+    assert items[2].select_one("a")["href"] == "/test/?limit=10&cursor=older"
+
+
+def test_cursor_pagination_middle_page():
+    """Test cursor pagination with pages either side."""
+    # Arrange & Act
+    soup = render_cursor_pagination_to_soup(5, "/test/", "newer", "older")
+
+    # Assert
+    items = soup.select("li.page-item")
+    assert all("disabled" not in item["class"] for item in items)
+    assert items[0].select_one("a")["href"] == "/test/?limit=5"
+    assert items[1].select_one("a")["href"] == "/test/?limit=5&cursor=newer"
+    assert items[2].select_one("a")["href"] == "/test/?limit=5&cursor=older"
@@ -6,6 +6,7 @@ import pytest
 
 from backend.dominate_templates.base import create_base_document
 from backend.dominate_templates.base import create_base_page
+from backend.dominate_templates.base import stream_base_document
 
 
 @pytest.fixture
@@ -260,3 +261,31 @@ def test_create_base_document_with_additional_kwargs():
     content_div = soup.select_one(".test-content")
     assert content_div is not None
     assert content_div.select_one("p").text == "Test param: Hello World"
+
+
+@pytest.mark.asyncio
+async def test_stream_base_document_sends_the_shell_around_the_content():
+    """Test the head is sent first and content chunks land in the content block."""
+
+    # Arrange
+    async def content_chunks():
+        yield "<p>first</p>"
+        yield "<p>second</p>"
+
+    # Act
+    chunks = [
+        chunk
+        async for chunk in stream_base_document(content_chunks(), title_text="Title")
+    ]
+
+    # Assert
+    assert len(chunks) == 4
+    assert "<title>Title</title>" in chunks[0]
+    assert "site-header" in chunks[0]
+    assert "footer" in chunks[-1]
+    soup = BeautifulSoup("".join(chunks), "html.parser")
+    content = soup.select_one(".container.content")
+    assert [paragraph.text for paragraph in content.select("p")] == [
+        "first",
+        "second",
+    ]
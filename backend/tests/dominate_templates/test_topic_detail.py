@@ -0,0 +1,153 @@
+# Standard library imports
+from datetime import timedelta
+from unittest import mock
+import uuid
+
+# Third-party imports
+from bs4 import BeautifulSoup
+import pytest
+
+# Project-specific imports
+from backend.dominate_templates.topics.detail import create_topic_detail_page
+from backend.dominate_templates.topics.detail import stream_topic_detail_page
+from backend.schemas.post import PostResponse
+from backend.schemas.topic import TopicResponse
+from backend.schemas.user import UserSchema
+from backend.utils.datetime import now_utc
+from backend.utils.fragment_cache import fragment_cache
+
+
+def make_author(approved_count: int = 3) -> UserSchema:
+    now = now_utc()
+    return UserSchema(
+        id=uuid.uuid4(),
+        email="author@example.com",
+        display_name="Author",
+        is_verified=True,
+        role="user",
+        created_at=now,
+        updated_at=now,
+        approved_count=approved_count,
+    )
+
+
+def make_post(
+    author: UserSchema,
+    topic_id: uuid.UUID,
+    content: str = "A logical statement",
+    **kwargs,
+) -> PostResponse:
+    now = now_utc()
+    return PostResponse(
+        id=uuid.uuid4(),
+        content=content,
+        author=author,
+        topic_id=topic_id,
+        created_at=now,
+        updated_at=now,
+        **kwargs,
+    )
+
+
+def make_topic() -> TopicResponse:
+    now = now_utc()
+    return TopicResponse(
+        id=uuid.uuid4(),
+        title="Topic",
+        description="Description",
+        author=make_author(),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def render(topic, posts, current_user=None, highlight_post_id=None) -> str:
+    doc = create_topic_detail_page(
+        topic=topic,
+        posts=posts,
+        total_posts=len(posts),
+        current_page=1,
+        total_pages=1,
+        current_user=current_user,
+        highlight_post_id=highlight_post_id,
+    )
+    return str(doc)
+
+
+def test_post_fragments_are_cached_and_spliced_in():
+    topic = make_topic()
+    author = make_author()
+    reply = make_post(author, topic.id, content="A reply")
+    post = make_post(author, topic.id, replies=[reply])
+
+    first = render(topic, [post])
+    assert fragment_cache.stats().misses == 2
+
+    # Highlighting lives on the container, outside the cached fragment
+    second = render(topic, [post], highlight_post_id=str(reply.id))
+    assert fragment_cache.stats().hits == 2
+
+    soup = BeautifulSoup(second, "html.parser")
+    container = soup.find(id=f"post-{post.id}")
+    assert container is not None
+    assert container.find(class_="post-content-link").text == "A logical statement"
+    assert container.find(id=f"post-{reply.id}") is not None
+    assert "highlighted-post" in soup.find(id=f"post-{reply.id}")["class"]
+    first_reply = BeautifulSoup(first, "html.parser").find(id=f"post-{reply.id}")
+    assert "highlighted-post" not in first_reply["class"]
+
+
+def test_fragments_are_keyed_on_viewer_and_author_counters():
+    topic = make_topic()
+    author = make_author(approved_count=3)
+    post = make_post(author, topic.id)
+    viewer = mock.MagicMock(id=uuid.uuid4(), display_name="Viewer")
+
+    anonymous = render(topic, [post])
+    assert "Submit Reply" not in anonymous
+    member = render(topic, [post], current_user=viewer)
+    assert "Submit Reply" in member
+
+    author.approved_count = 4
+    assert "✓ 4" in render(topic, [post])
+
+    post.updated_at += timedelta(seconds=1)
+    post.content = "An edited statement"
+    assert "An edited statement" in render(topic, [post])
+    assert fragment_cache.stats().hits == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_page_sends_one_thread_per_chunk():
+    topic = make_topic()
+    author = make_author()
+    older = make_post(author, topic.id, content="Older thread")
+    newer = make_post(author, topic.id, content="Newer thread")
+    newer.created_at += timedelta(seconds=1)
+
+    chunks = [
+        chunk
+        async for chunk in stream_topic_detail_page(
+            topic=topic,
+            posts=[older, newer],
+            total_posts=2,
+            current_page=1,
+            total_pages=1,
+        )
+    ]
+
+    # Shell start, content up to the posts, two threads, the rest, shell end
+    assert len(chunks) == 6
+    assert "<head>" in chunks[0]
+    assert "Newer thread" in chunks[2]
+    assert "Older thread" in chunks[3]
+
+    streamed = BeautifulSoup("".join(chunks), "html.parser")
+    buffered = BeautifulSoup(render(topic, [older, newer]), "html.parser")
+    for soup in (streamed, buffered):
+        threads = soup.select(".threaded-posts > .post-container")
+        assert [thread["id"] for thread in threads] == [
+            f"post-{newer.id}",
+            f"post-{older.id}",
+        ]
+        assert soup.select_one(".pagination span").text == "Page 1 of 1"
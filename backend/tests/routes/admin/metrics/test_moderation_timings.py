@@ -0,0 +1,39 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.ai_analysis import AIAnalysis
+from backend.routes.admin.metrics.moderation_timings import get_moderation_timings
+from backend.utils.ai_moderation.timings import moderation_timings
+
+
+@pytest.mark.asyncio
+async def test_get_moderation_timings_reports_stored_analyses():
+    """Test timings recorded by another process, e.g. the worker, are reported."""
+    # Arrange
+    moderation_timings.clear()
+    await AIAnalysis.create(
+        decision="APPROVED",
+        confidence_score=0.9,
+        analysis_text="analysis",
+        feedback_text="feedback",
+        processing_time_ms=1200,
+        llm_ms=1200,
+    )
+
+    # Act
+    with mock.patch(
+        "backend.routes.admin.metrics.moderation_timings.settings."
+        "MODERATION_TIMINGS_RETENTION_SECONDS",
+        600.0,
+    ):
+        result = await get_moderation_timings(window_seconds=3600.0, _=None)
+
+    # Assert
+    stages = {stage.stage: stage for stage in result.stages}
+    assert result.window_seconds == 600.0
+    assert stages["llm"].count == 1
+    assert stages["llm"].max_ms == 1200
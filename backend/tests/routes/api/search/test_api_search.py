@@ -0,0 +1,36 @@
+# Third-party imports
+import httpx
+import pytest
+
+# Project-specific imports
+from backend.app import app
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.topics.create_topic import create_topic
+
+
+@pytest.mark.asyncio
+async def test_search_returns_ranked_results():
+    user = await User.create(
+        email="api-search@example.com", password_hash="x", display_name="Searcher"
+    )
+    topic = await create_topic("Copper boards", "Solder and tin", user.id)
+    post = await create_post("Copper traces everywhere", user.id, topic.id)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/search/", params={"q": "copper"})
+        posts_only = await client.get(
+            "/api/search/", params={"q": "copper", "kind": "post"}
+        )
+        missing_query = await client.get("/api/search/")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "copper"
+    assert body["has_more"] is False
+    assert [r["kind"] for r in body["results"]] == ["topic", "post"]
+    assert body["results"][0]["id"] == str(topic.id)
+    assert "<mark>Copper</mark>" in body["results"][1]["snippet"]
+    assert [r["id"] for r in posts_only.json()["results"]] == [str(post.id)]
+    assert missing_query.status_code == 422
@@ -32,6 +32,10 @@ async def test_login_success():
     mock_request.client.host = "127.0.0.1"
     mock_request.headers = {"User-Agent": "Test User Agent"}
 
+    # Create mock session opened by the login
+    mock_session = mock.MagicMock()
+    mock_session.id = uuid.uuid4()
+
     # Create login data
     login_data = UserLoginSchema(email=email, password=password)
 
@@ -47,12 +51,12 @@ async def test_login_success():
         ),
         mock.patch(
             "backend.routes.auth.login.record_login_success",
-            new=mock.AsyncMock(),
+            new=mock.AsyncMock(return_value=mock_session),
         ) as mock_record_login_success,
         mock.patch(
             "backend.routes.auth.login.create_access_token",
             return_value="mock_access_token",
-        ),
+        ) as mock_create_access_token,
         mock.patch(
             "backend.routes.auth.login.create_refresh_token",
             return_value="mock_refresh_token",
@@ -72,6 +76,11 @@ async def test_login_success():
             user_id, "127.0.0.1", "Test User Agent"
         )
 
+        # Verify the access token is tied to the new session
+        token_data = mock_create_access_token.call_args.args[0]
+        assert token_data["sid"] == str(mock_session.id)
+        assert token_data["role"] == "user"
+
 
 @pytest.mark.asyncio
 async def test_login_invalid_password():
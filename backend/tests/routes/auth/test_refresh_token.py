@@ -218,3 +218,92 @@ async def test_refresh_token_invalid_token():
         # Verify the exception details
         assert excinfo.value.status_code == 401
         assert "Invalid refresh token" in excinfo.value.detail
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_keeps_session_id():
+    """Test refreshed tokens stay tied to an active session."""
+    # Arrange
+    user_id = uuid.uuid4()
+    session_id = str(uuid.uuid4())
+    payload = {"sub": str(user_id), "sid": session_id, "refresh": True}
+
+    mock_user = UserSchema(
+        id=user_id,
+        email="test@example.com",
+        display_name="Test User",
+        is_verified=True,
+        role="user",
+        is_locked=False,
+        created_at=mock.MagicMock(),
+        updated_at=mock.MagicMock(),
+    )
+
+    with (
+        mock.patch(
+            "backend.routes.auth.refresh_token.decode_token", return_value=payload
+        ),
+        mock.patch(
+            "backend.routes.auth.refresh_token.get_user_by_id",
+            new=mock.AsyncMock(return_value=mock_user),
+        ),
+        mock.patch(
+            "backend.routes.auth.refresh_token.is_session_active",
+            new=mock.AsyncMock(return_value=True),
+        ),
+        mock.patch(
+            "backend.routes.auth.refresh_token.create_access_token",
+            return_value="new_access_token",
+        ) as mock_create_access_token,
+        mock.patch(
+            "backend.routes.auth.refresh_token.create_refresh_token",
+            return_value="new_refresh_token",
+        ),
+    ):
+        # Act
+        result = await refresh_token(mock.MagicMock(), "token")
+
+        # Assert
+        assert result.access_token == "new_access_token"
+        token_data = mock_create_access_token.call_args.args[0]
+        assert token_data["sid"] == session_id
+        assert token_data["role"] == "user"
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_terminated_session():
+    """Test refresh is refused once the token's session is deactivated."""
+    # Arrange
+    user_id = uuid.uuid4()
+    payload = {"sub": str(user_id), "sid": str(uuid.uuid4()), "refresh": True}
+
+    mock_user = UserSchema(
+        id=user_id,
+        email="test@example.com",
+        display_name="Test User",
+        is_verified=True,
+        role="user",
+        is_locked=False,
+        created_at=mock.MagicMock(),
+        updated_at=mock.MagicMock(),
+    )
+
+    with (
+        mock.patch(
+            "backend.routes.auth.refresh_token.decode_token", return_value=payload
+        ),
+        mock.patch(
+            "backend.routes.auth.refresh_token.get_user_by_id",
+            new=mock.AsyncMock(return_value=mock_user),
+        ),
+        mock.patch(
+            "backend.routes.auth.refresh_token.is_session_active",
+            new=mock.AsyncMock(return_value=False),
+        ),
+    ):
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await refresh_token(mock.MagicMock(), "token")
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Session has been terminated"
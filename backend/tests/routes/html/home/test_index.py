@@ -5,6 +5,7 @@ from fastapi.responses import HTMLResponse
 import pytest
 
 from backend.routes.html.home.index import home
+from backend.utils.counting import CountMode
 
 
 @pytest.fixture
@@ -81,8 +82,12 @@ async def test_home_authenticated_user(
 
         # Assert
         assert isinstance(result, HTMLResponse)
-        mock_list_topics.assert_called_once_with(skip=0, limit=5)
-        mock_list_posts.assert_called_once_with(skip=0, limit=10)
+        mock_list_topics.assert_called_once_with(
+            skip=0, limit=5, count_mode=CountMode.CAPPED
+        )
+        mock_list_posts.assert_called_once_with(
+            skip=0, limit=10, count_mode=CountMode.CAPPED
+        )
         mock_create_home_page.assert_called_once_with(
             topics=mock_topics.topics, posts=mock_posts.posts, user=mock_user
         )
@@ -108,8 +113,12 @@ async def test_home_unauthenticated_user(mock_request, mock_topics, mock_posts):
 
         # Assert
         assert isinstance(result, HTMLResponse)
-        mock_list_topics.assert_called_once_with(skip=0, limit=5)
-        mock_list_posts.assert_called_once_with(skip=0, limit=10)
+        mock_list_topics.assert_called_once_with(
+            skip=0, limit=5, count_mode=CountMode.CAPPED
+        )
+        mock_list_posts.assert_called_once_with(
+            skip=0, limit=10, count_mode=CountMode.CAPPED
+        )
         mock_create_home_page.assert_called_once_with(
             topics=mock_topics.topics, posts=mock_posts.posts, user=None
         )
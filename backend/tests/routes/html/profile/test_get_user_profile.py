@@ -0,0 +1,43 @@
+# Standard library imports
+import uuid
+
+# Third-party imports
+from bs4 import BeautifulSoup
+import httpx
+import pytest
+
+# Project-specific imports
+from backend.app import app
+from backend.db.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_profile_page_is_streamed():
+    user = await User.create(
+        email="citizen@example.com", password_hash="x", display_name="Citizen"
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="http://test") as client,
+        client.stream("GET", f"/html/profile/{user.id}/") as response,
+    ):
+        chunks = [chunk async for chunk in response.aiter_text()]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "content-length" not in response.headers
+    soup = BeautifulSoup("".join(chunks), "html.parser")
+    assert soup.select_one(".profile-container h1").text == "CITIZEN PROFILE"
+    assert (
+        soup.select_one(".profile-posts p").text == "YOU HAVE NOT SUBMITTED ANY POSTS"
+    )
+
+
+@pytest.mark.asyncio
+async def test_unknown_profile_is_not_found_before_streaming():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(f"/html/profile/{uuid.uuid4()}/")
+
+    assert response.status_code == 404
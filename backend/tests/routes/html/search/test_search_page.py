@@ -0,0 +1,40 @@
+# Third-party imports
+from bs4 import BeautifulSoup
+import httpx
+import pytest
+
+# Project-specific imports
+from backend.app import app
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.db_functions.topics.create_topic import create_topic
+
+
+@pytest.mark.asyncio
+async def test_search_page_shows_highlighted_results():
+    user = await User.create(
+        email="html-search@example.com", password_hash="x", display_name="Searcher"
+    )
+    topic = await create_topic("Servo motors", "", user.id)
+    for i in range(3):
+        await create_post(f"<b>Servo</b> reading {i}", user.id, topic.id)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        empty = await client.get("/html/search/")
+        response = await client.get("/html/search/", params={"q": "servo", "limit": 2})
+
+    assert empty.status_code == 200
+    assert BeautifulSoup(empty.text, "html.parser").select(".search-result") == []
+
+    assert response.status_code == 200
+    soup = BeautifulSoup(response.text, "html.parser")
+    results = soup.select(".search-result")
+    assert len(results) == 2
+    assert results[0].select_one("h2 a")["href"] == f"/html/topics/{topic.id}/"
+    snippets = soup.select(".search-snippet")
+    assert all(s.select("b") == [] for s in snippets)
+    assert any(s.select_one("mark") is not None for s in snippets)
+    pagination = soup.select_one(".pagination")
+    assert [link.text for link in pagination.select("a")] == ["Next"]
+    assert "offset=2" in pagination.select_one("a")["href"]
@@ -0,0 +1,69 @@
+# Third-party imports
+from bs4 import BeautifulSoup
+import httpx
+import pytest
+
+# Project-specific imports
+from backend.app import app
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_topic_page_is_streamed():
+    user = await User.create(
+        email="citizen@example.com", password_hash="x", display_name="Citizen"
+    )
+    topic = await Topic.create(title="Streamed topic", author=user)
+
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="http://test") as client,
+        client.stream("GET", f"/html/topics/{topic.id}/") as response,
+    ):
+        chunks = [chunk async for chunk in response.aiter_text()]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    soup = BeautifulSoup("".join(chunks), "html.parser")
+    assert soup.select_one(".topic-title-link").text == "Streamed topic"
+    assert (
+        soup.select_one(".posts-section p").text
+        == "NO POSTS HAVE BEEN APPROVED FOR THIS TOPIC"
+    )
+
+
+@pytest.mark.asyncio
+async def test_topic_page_answers_not_modified():
+    user = await User.create(
+        email="validator@example.com", password_hash="x", display_name="Validator"
+    )
+    topic = await Topic.create(title="Cached topic", author=user)
+
+    # Exercise the route itself rather than the anonymous page cache
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"X-Page-Cache-Bypass": "1"},
+    ) as client:
+        first = await client.get(f"/html/topics/{topic.id}/")
+        repeat = await client.get(
+            f"/html/topics/{topic.id}/",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        topic.title = "Renamed topic"
+        await topic.save()
+        changed = await client.get(
+            f"/html/topics/{topic.id}/",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert first.headers["Vary"] == "Cookie"
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["ETag"] == first.headers["ETag"]
+    assert changed.status_code == 200
+    assert "Renamed topic" in changed.text
@@ -0,0 +1,140 @@
+# Standard library imports
+from datetime import timedelta
+import secrets
+from unittest import mock
+
+# Third-party imports
+from fastapi import Request
+import pytest
+import pytest_asyncio
+
+# Project-specific imports
+from backend.db.models.user import User
+from backend.db.models.user import UserRole
+from backend.db.models.user_session import UserSession
+from backend.db_functions.user_sessions.deactivate_all_user_sessions import (
+    deactivate_all_user_sessions,
+)
+from backend.db_functions.user_sessions.delete_user_session import delete_user_session
+from backend.db_functions.users.lock_user_account import lock_user_account
+from backend.db_functions.users.set_user_password import set_user_password
+from backend.db_functions.users.set_user_role import set_user_role
+from backend.routes.html.utils.auth import get_current_user_optional
+from backend.utils.datetime import now_utc
+from backend.utils.session_cache import session_cache
+
+
+@pytest.fixture
+def mock_request() -> mock.MagicMock:
+    return mock.MagicMock(spec=Request)
+
+
+@pytest_asyncio.fixture
+async def test_user() -> User:
+    return await User.create(
+        email="cached@example.com",
+        display_name="Cached Citizen",
+        password_hash="hashed_password",
+    )
+
+
+@pytest_asyncio.fixture
+async def test_user_session(test_user: User) -> UserSession:
+    return await UserSession.create(
+        user=test_user,
+        session_token=secrets.token_hex(32),
+        expires_at=now_utc() + timedelta(days=7),
+        user_agent="Test Agent",
+        ip_address="127.0.0.1",
+        is_active=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_served_from_cache(
+    mock_request, test_user: User, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+
+    first = await get_current_user_optional(mock_request, token)
+    assert first is not None
+    assert first.id == test_user.id
+
+    with mock.patch(
+        "backend.routes.html.utils.auth.get_user_session_by_token",
+        new=mock.AsyncMock(),
+    ) as mock_get_session:
+        second = await get_current_user_optional(mock_request, token)
+
+    assert second == first
+    mock_get_session.assert_not_called()
+
+    stats = session_cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_invalidates_cached_session(
+    mock_request, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+    assert await get_current_user_optional(mock_request, token) is not None
+
+    await delete_user_session(token)
+
+    assert await get_current_user_optional(mock_request, token) is None
+
+
+@pytest.mark.asyncio
+async def test_deactivate_all_sessions_invalidates_cache(
+    mock_request, test_user: User, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+    assert await get_current_user_optional(mock_request, token) is not None
+
+    await deactivate_all_user_sessions(test_user.id)
+
+    assert await get_current_user_optional(mock_request, token) is None
+
+
+@pytest.mark.asyncio
+async def test_lock_user_account_invalidates_cache(
+    mock_request, test_user: User, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+    cached = await get_current_user_optional(mock_request, token)
+    assert cached is not None
+    assert cached.is_locked is False
+
+    await lock_user_account(test_user.id)
+
+    refreshed = await get_current_user_optional(mock_request, token)
+    assert refreshed is not None
+    assert refreshed.is_locked is True
+
+
+@pytest.mark.asyncio
+async def test_set_user_role_invalidates_cache(
+    mock_request, test_user: User, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+    assert await get_current_user_optional(mock_request, token) is not None
+
+    await set_user_role(test_user.id, UserRole.MODERATOR)
+
+    refreshed = await get_current_user_optional(mock_request, token)
+    assert refreshed is not None
+    assert refreshed.role == UserRole.MODERATOR
+
+
+@pytest.mark.asyncio
+async def test_password_change_invalidates_cache(
+    mock_request, test_user: User, test_user_session: UserSession
+):
+    token = test_user_session.session_token
+    assert await get_current_user_optional(mock_request, token) is not None
+
+    await set_user_password(test_user.id, "NewPassword123!")
+
+    assert session_cache.stats().size == 0
@@ -42,11 +42,11 @@ async def test_get_current_user_info_success():
         last_login=datetime(2025, 5, 26),
     )
 
-    # Mock the user_to_schema converter
+    # Mock the get_user_by_id db function
     with mock.patch(
-        "backend.routes.profile.get_me.user_to_schema",
+        "backend.routes.profile.get_me.get_user_by_id",
         new=mock.AsyncMock(return_value=expected_user_schema),
-    ) as mock_user_to_schema:
+    ) as mock_get_user_by_id:
         # Act
         result = await get_current_user_info(current_user=mock_user)
 
@@ -62,8 +62,8 @@ async def test_get_current_user_info_success():
         assert result.updated_at == datetime(2025, 5, 25)
         assert result.last_login == datetime(2025, 5, 26)
 
-        # Verify the converter was called with the right user
-        mock_user_to_schema.assert_called_once_with(mock_user)
+        # Verify the full record was loaded for the right user
+        mock_get_user_by_id.assert_called_once_with(user_id)
 
 
 @pytest.mark.asyncio
@@ -82,7 +82,7 @@ async def test_list_my_rejected_posts_success(mock_user, mock_rejected_posts):
         assert result.rejected_posts == mock_rejected_posts
         assert result.count == len(mock_rejected_posts)
         mock_list_rejected.assert_called_once_with(
-            user_id=mock_user.id, limit=limit, offset=offset
+            user_id=mock_user.id, limit=limit, offset=offset, cursor=None
         )
 
 
@@ -116,7 +116,7 @@ async def test_list_my_rejected_posts_empty_results(mock_user):
         assert result.rejected_posts == empty_posts
         assert result.count == 0
         mock_list_rejected.assert_called_once_with(
-            user_id=mock_user.id, limit=limit, offset=offset
+            user_id=mock_user.id, limit=limit, offset=offset, cursor=None
         )
 
 
@@ -149,7 +149,7 @@ async def test_list_my_rejected_posts_pagination(mock_user, mock_rejected_posts)
         assert len(result.rejected_posts) == 2
         assert result.count == 2
         mock_list_rejected.assert_called_once_with(
-            user_id=mock_user.id, limit=limit, offset=offset
+            user_id=mock_user.id, limit=limit, offset=offset, cursor=None
         )
 
 
@@ -1,15 +1,38 @@
 # Standard library imports
 from datetime import datetime
+from datetime import timedelta
+import secrets
 from unittest import mock
 import uuid
 
 # Third-party imports
+import httpx
 import pytest
 
 # Project-specific imports
+from backend.app import app
+from backend.db.models.user import User
+from backend.db.models.user_session import UserSession
 from backend.routes.topics.create_topic import create_topic
 from backend.schemas.topic import TopicCreate
 from backend.schemas.topic import TopicResponse
+from backend.schemas.user import UserSchema
+from backend.utils.auth import create_access_token
+from backend.utils.datetime import now_utc
+from backend.utils.settings import settings
+
+
+def author_schema(mock_user: mock.AsyncMock) -> UserSchema:
+    return UserSchema(
+        id=mock_user.id,
+        email=mock_user.email,
+        display_name=mock_user.display_name,
+        is_verified=mock_user.is_verified,
+        last_login=mock_user.last_login,
+        role=mock_user.role,
+        created_at=mock_user.created_at,
+        updated_at=mock_user.updated_at,
+    )
 
 
 @pytest.mark.asyncio
@@ -55,6 +78,10 @@ async def test_create_topic_success():
 
     # Mock dependencies
     with (
+        mock.patch(
+            "backend.routes.topics.create_topic.get_user_by_id",
+            new=mock.AsyncMock(return_value=author_schema(mock_user)),
+        ),
         mock.patch(
             "backend.routes.topics.create_topic.db_create_topic",
             new=mock.AsyncMock(return_value=mock_topic),
@@ -151,6 +178,10 @@ async def test_create_topic_with_existing_tag():
 
     # Mock dependencies
     with (
+        mock.patch(
+            "backend.routes.topics.create_topic.get_user_by_id",
+            new=mock.AsyncMock(return_value=author_schema(mock_user)),
+        ),
         mock.patch(
             "backend.routes.topics.create_topic.db_create_topic",
             new=mock.AsyncMock(return_value=mock_topic),
@@ -234,6 +265,10 @@ async def test_create_topic_with_tag_error():
 
     # Mock dependencies with error in add_tags_to_topic
     with (
+        mock.patch(
+            "backend.routes.topics.create_topic.get_user_by_id",
+            new=mock.AsyncMock(return_value=author_schema(mock_user)),
+        ),
         mock.patch(
             "backend.routes.topics.create_topic.db_create_topic",
             new=mock.AsyncMock(return_value=mock_topic),
@@ -280,3 +315,47 @@ async def test_create_topic_with_tag_error():
         # Verify function calls
         mock_add_tags_to_topic.assert_called_once()
         mock_get_tags_for_topic.assert_called_once_with(topic_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stateless", [False, True])
+async def test_create_topic_over_http(stateless: bool):
+    """Test the author is loaded in full whichever way the token is checked."""
+    # Arrange
+    test_user = await User.create(
+        email="author@example.com", password_hash="x", display_name="Test User"
+    )
+    session = await UserSession.create(
+        user=test_user,
+        session_token=secrets.token_hex(32),
+        expires_at=now_utc() + timedelta(days=7),
+        user_agent="Test Agent",
+        ip_address="127.0.0.1",
+        is_active=True,
+    )
+    token = create_access_token(
+        data={
+            "sub": str(test_user.id),
+            "sid": str(session.id),
+            "email": test_user.email,
+            "role": test_user.role.value,
+        }
+    )
+    transport = httpx.ASGITransport(app=app)
+
+    # Act
+    with mock.patch.object(settings, "JWT_STATELESS_AUTH", stateless):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/topics/",
+                json={"title": "Robot rights", "description": "Debate", "tags": []},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+    # Assert
+    assert response.status_code == 201
+    author = response.json()["author"]
+    assert author["id"] == str(test_user.id)
+    assert author["display_name"] == "Test User"
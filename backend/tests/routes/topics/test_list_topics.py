@@ -6,12 +6,17 @@ from unittest import mock
 import uuid
 
 # Third-party imports
+import httpx
 import pytest
 
 # Project-specific imports
+from backend.app import app
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
 from backend.routes.topics.list_topics import list_topics
 from backend.schemas.topic import TopicList
 from backend.schemas.topic import TopicResponse
+from backend.utils.counting import CountMode
 
 
 @pytest.mark.asyncio
@@ -50,7 +55,9 @@ async def test_list_topics_success():
         assert result.count == 2
 
         # Verify function calls
-        mock_db_list_topics.assert_called_once_with(skip=0, limit=10)
+        mock_db_list_topics.assert_called_once_with(
+            skip=0, limit=10, cursor=None, count_mode=CountMode.EXACT
+        )
 
 
 @pytest.mark.asyncio
@@ -87,7 +94,9 @@ async def test_list_topics_with_pagination():
         assert result is mock_topic_list
 
         # Verify function calls with correct pagination parameters
-        mock_db_list_topics.assert_called_once_with(skip=1, limit=5)
+        mock_db_list_topics.assert_called_once_with(
+            skip=1, limit=5, cursor=None, count_mode=CountMode.EXACT
+        )
 
 
 @pytest.mark.asyncio
@@ -210,3 +219,91 @@ async def test_list_topics_with_tag_not_found():
         assert isinstance(result, TopicList)
         assert len(result.topics) == 0
         assert result.count == 0
+
+
+@pytest.mark.asyncio
+async def test_list_topics_answers_not_modified():
+    """Test that a repeated request with a current ETag gets a 304."""
+    # Arrange
+    user = await User.create(
+        email="lister@example.com", password_hash="x", display_name="Lister"
+    )
+    await Topic.create(title="First topic", author=user)
+    transport = httpx.ASGITransport(app=app)
+
+    # Act
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/topics/")
+        repeat = await client.get(
+            "/topics/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        await Topic.create(title="Second topic", author=user)
+        changed = await client.get(
+            "/topics/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    # Assert
+    assert first.status_code == 200
+    assert "Last-Modified" in first.headers
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != first.headers["ETag"]
+    assert changed.json()["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_topics_cursor_pagination():
+    """Test that next_cursor pages through topics and a bad cursor is a 400."""
+    # Arrange
+    user = await User.create(
+        email="pager@example.com", password_hash="x", display_name="Pager"
+    )
+    for i in range(3):
+        await Topic.create(title=f"Topic {i}", author=user)
+    transport = httpx.ASGITransport(app=app)
+
+    # Act
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = (await client.get("/topics/", params={"limit": 2})).json()
+        second = (
+            await client.get(
+                "/topics/", params={"limit": 2, "cursor": first["next_cursor"]}
+            )
+        ).json()
+        invalid = await client.get("/topics/", params={"cursor": "not-a-cursor"})
+
+    # Assert
+    assert len(first["topics"]) == 2
+    assert first["previous_cursor"] is None
+    assert len(second["topics"]) == 1
+    assert second["next_cursor"] is None
+    assert second["previous_cursor"] is not None
+    titles = {t["title"] for t in first["topics"] + second["topics"]}
+    assert titles == {"Topic 0", "Topic 1", "Topic 2"}
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_topics_capped_count():
+    """Test that ?count=capped reports the total along with whether it is exact."""
+    # Arrange
+    user = await User.create(
+        email="counter@example.com", password_hash="x", display_name="Counter"
+    )
+    for i in range(3):
+        await Topic.create(title=f"Topic {i}", author=user)
+    transport = httpx.ASGITransport(app=app)
+
+    # Act
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        exact = (await client.get("/topics/")).json()
+        capped = (await client.get("/topics/", params={"count": "capped"})).json()
+        invalid = await client.get("/topics/", params={"count": "roughly"})
+
+    # Assert
+    assert exact["count"] == 3
+    assert exact["count_exact"] is True
+    assert capped["count"] == 3
+    assert capped["count_exact"] is True
+    assert invalid.status_code == 422
@@ -0,0 +1,57 @@
+# Standard library imports
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.tasks.ai_analyses import prune_ai_analyses
+from backend.tasks.ai_analyses import run_ai_analysis_prune_task
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_prune_ai_analyses_deletes_rows_older_than_ttl() -> None:
+    with (
+        mock.patch(
+            "backend.tasks.ai_analyses.delete_expired_ai_analyses",
+            new=mock.AsyncMock(return_value=4),
+        ) as mock_delete,
+        mock.patch("backend.tasks.ai_analyses.now_utc", return_value=NOW),
+    ):
+        result = await prune_ai_analyses(ttl_seconds=60.0)
+
+    assert result == 4
+    mock_delete.assert_called_once_with(NOW - timedelta(seconds=60))
+
+
+@pytest.mark.asyncio
+async def test_prune_ai_analyses_error_returns_zero() -> None:
+    with mock.patch(
+        "backend.tasks.ai_analyses.delete_expired_ai_analyses",
+        new=mock.AsyncMock(side_effect=Exception("Database error")),
+    ):
+        result = await prune_ai_analyses()
+
+    assert result == 0
+
+
+@pytest.mark.asyncio
+async def test_run_ai_analysis_prune_task() -> None:
+    with (
+        mock.patch("backend.tasks.ai_analyses.prune_ai_analyses") as mock_prune,
+        mock.patch("backend.tasks.ai_analyses.asyncio.sleep") as mock_sleep,
+    ):
+        mock_sleep.side_effect = [None, asyncio.CancelledError()]
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_ai_analysis_prune_task(interval_seconds=1.0)
+
+        assert mock_prune.call_count == 1
+        assert mock_sleep.call_count == 2
+        mock_sleep.assert_called_with(1.0)
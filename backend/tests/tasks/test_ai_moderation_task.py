@@ -1,5 +1,4 @@
 # Standard library imports
-import asyncio
 from unittest import mock
 from uuid import uuid4
 
@@ -7,8 +6,15 @@ from uuid import uuid4
 import pytest
 
 # Project-specific imports
+from backend.db.models.moderation_job import ModerationJob
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.schemas.ai_analysis import AIAnalysisCreate
+from backend.schemas.ai_analysis import AIAnalysisResponse
+from backend.tasks.ai_moderation_task import moderate_pending_post
 from backend.tasks.ai_moderation_task import process_pending_post
 from backend.tasks.ai_moderation_task import schedule_post_moderation
+from backend.utils.ai_moderation.timings import ModerationTimings
+from backend.utils.datetime import now_utc
 
 
 @pytest.mark.asyncio
@@ -116,6 +122,8 @@ async def test_process_pending_post_approved_auto_approve():
         mock.patch(
             "backend.tasks.ai_moderation_task.reject_pending_post"
         ) as mock_reject_post,
+        mock.patch("backend.tasks.ai_moderation_task.update_ai_analysis_timings"),
+        mock.patch("backend.tasks.ai_moderation_task.moderation_timings"),
     ):
         # Configure mocks
         mock_settings.AI_MODERATION_ENABLED = True
@@ -164,6 +172,8 @@ async def test_process_pending_post_rejected_auto_reject():
         mock.patch(
             "backend.tasks.ai_moderation_task.reject_pending_post"
         ) as mock_reject_post,
+        mock.patch("backend.tasks.ai_moderation_task.update_ai_analysis_timings"),
+        mock.patch("backend.tasks.ai_moderation_task.moderation_timings"),
     ):
         # Configure mocks
         mock_settings.AI_MODERATION_ENABLED = True
@@ -214,6 +224,8 @@ async def test_process_pending_post_auto_actions_disabled():
         mock.patch(
             "backend.tasks.ai_moderation_task.reject_pending_post"
         ) as mock_reject_post,
+        mock.patch("backend.tasks.ai_moderation_task.update_ai_analysis_timings"),
+        mock.patch("backend.tasks.ai_moderation_task.moderation_timings"),
     ):
         # Configure mocks
         mock_settings.AI_MODERATION_ENABLED = True
@@ -237,6 +249,65 @@ async def test_process_pending_post_auto_actions_disabled():
         mock_reject_post.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_moderate_pending_post_records_stage_timings():
+    # Arrange
+    pending_post_id = uuid4()
+    analysis_result = AIAnalysisCreate(
+        pending_post_id=pending_post_id,
+        decision="APPROVED",
+        confidence_score=0.9,
+        analysis_text="fine",
+        feedback_text="APPROVED, CITIZEN",
+        processing_time_ms=40,
+        db_fetch_ms=3,
+        prefilter_ms=1,
+        llm_ms=35,
+    )
+    timings = ModerationTimings()
+
+    async def create(data: AIAnalysisCreate) -> AIAnalysisResponse:
+        return AIAnalysisResponse(
+            id=uuid4(), created_at=now_utc(), updated_at=now_utc(), **data.model_dump()
+        )
+
+    # Mock dependencies
+    with (
+        mock.patch("backend.tasks.ai_moderation_task.settings") as mock_settings,
+        mock.patch(
+            "backend.tasks.ai_moderation_task.get_ai_moderator_service"
+        ) as mock_get_service,
+        mock.patch("backend.tasks.ai_moderation_task.create_ai_analysis", new=create),
+        mock.patch("backend.tasks.ai_moderation_task.approve_and_create_post"),
+        mock.patch(
+            "backend.tasks.ai_moderation_task.update_ai_analysis_timings"
+        ) as mock_update_timings,
+        mock.patch("backend.tasks.ai_moderation_task.moderation_timings", timings),
+    ):
+        mock_settings.AI_MODERATION_ENABLED = True
+        mock_settings.AI_MODERATION_AUTO_APPROVE = True
+        mock_ai_service = mock.AsyncMock()
+        mock_ai_service.analyze_content.return_value = analysis_result
+        mock_get_service.return_value = mock_ai_service
+
+        # Act
+        result = await moderate_pending_post(pending_post_id, queue_wait_ms=250)
+
+    # Assert
+    assert result is not None
+    assert result.queue_wait_ms == 250
+    assert result.llm_ms == 35
+    assert result.persist_ms is not None
+    assert result.action_ms is not None
+    mock_update_timings.assert_awaited_once_with(
+        result.id, persist_ms=result.persist_ms, action_ms=result.action_ms
+    )
+    stages = {stage.stage: stage for stage in timings.summary().stages}
+    assert all(stage.count == 1 for stage in stages.values())
+    assert stages["queue_wait"].max_ms == 250
+    assert stages["llm"].max_ms == 35
+
+
 @pytest.mark.asyncio
 async def test_process_pending_post_exception():
     """Test that process_pending_post handles exceptions gracefully."""
@@ -271,22 +342,16 @@ async def test_process_pending_post_exception():
 
 @pytest.mark.asyncio
 async def test_schedule_post_moderation():
-    """Test that schedule_post_moderation creates an asyncio task."""
+    """Test that schedule_post_moderation enqueues a durable moderation job."""
     # Arrange
     pending_post_id = uuid4()
 
-    # Mock dependencies
-    with mock.patch(
-        "backend.tasks.ai_moderation_task.asyncio.create_task"
-    ) as mock_create_task:
-        # Act
-        await schedule_post_moderation(pending_post_id)
+    # Act
+    await schedule_post_moderation(pending_post_id)
+    await schedule_post_moderation(pending_post_id)
 
-        # Assert
-        mock_create_task.assert_called_once()
-        # Get the call arguments
-        args, kwargs = mock_create_task.call_args
-        # The first argument should be a coroutine from process_pending_post
-        assert len(args) == 1
-        # We can't directly compare coroutines, but we can check it's a coroutine
-        assert asyncio.iscoroutine(args[0])
+    # Assert
+    jobs = await ModerationJob.filter(pending_post_id=pending_post_id)
+    assert len(jobs) == 1
+    assert jobs[0].status == ModerationJobStatus.QUEUED
+    assert jobs[0].attempts == 0
@@ -0,0 +1,59 @@
+# Standard library imports
+import asyncio
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.tasks.counters import reconcile_counters
+from backend.tasks.counters import run_counter_reconciliation_task
+
+
+@pytest.mark.asyncio
+async def test_reconcile_counters_sums_repairs() -> None:
+    with (
+        mock.patch(
+            "backend.tasks.counters.reconcile_post_reply_counts",
+            new=mock.AsyncMock(return_value=1),
+        ),
+        mock.patch(
+            "backend.tasks.counters.reconcile_topic_post_counts",
+            new=mock.AsyncMock(return_value=2),
+        ),
+        mock.patch(
+            "backend.tasks.counters.reconcile_user_post_counts",
+            new=mock.AsyncMock(return_value=3),
+        ),
+    ):
+        result = await reconcile_counters()
+
+    assert result == 6
+
+
+@pytest.mark.asyncio
+async def test_reconcile_counters_error_returns_zero() -> None:
+    with mock.patch(
+        "backend.tasks.counters.reconcile_post_reply_counts",
+        new=mock.AsyncMock(side_effect=Exception("Database error")),
+    ):
+        result = await reconcile_counters()
+
+    assert result == 0
+
+
+@pytest.mark.asyncio
+async def test_run_counter_reconciliation_task() -> None:
+    with (
+        mock.patch("backend.tasks.counters.reconcile_counters") as mock_reconcile,
+        mock.patch("backend.tasks.counters.asyncio.sleep") as mock_sleep,
+    ):
+        mock_sleep.side_effect = [None, asyncio.CancelledError()]
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_counter_reconciliation_task(interval_seconds=1.0)
+
+        # Sleeps first, so a restart does not trigger a recount
+        assert mock_reconcile.call_count == 1
+        assert mock_sleep.call_count == 2
+        mock_sleep.assert_called_with(1.0)
@@ -0,0 +1,252 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+from unittest import mock
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.moderation_job import ModerationJobStatus
+from backend.schemas.moderation_job import ModerationJobSchema
+from backend.tasks.moderation_jobs import ModerationConsumerStats
+from backend.tasks.moderation_jobs import consume_moderation_jobs
+from backend.tasks.moderation_jobs import moderation_retry_delay
+from backend.tasks.moderation_jobs import run_moderation_job
+from backend.tasks.moderation_jobs import start_moderation_consumers
+from backend.utils.datetime import now_utc
+
+MODULE = "backend.tasks.moderation_jobs"
+
+
+def make_job(attempts: int = 1) -> ModerationJobSchema:
+    now = now_utc()
+    return ModerationJobSchema(
+        id=uuid.uuid4(),
+        pending_post_id=uuid.uuid4(),
+        status=ModerationJobStatus.RUNNING,
+        attempts=attempts,
+        available_at=now,
+        locked_by="worker-1",
+        locked_until=now + timedelta(minutes=2),
+        last_error=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def mock_queue():
+    with (
+        mock.patch(
+            f"{MODULE}.get_pending_post_by_id", new=mock.AsyncMock()
+        ) as mock_get_pending_post,
+        mock.patch(
+            f"{MODULE}.moderate_pending_post", new=mock.AsyncMock()
+        ) as mock_moderate,
+        mock.patch(
+            f"{MODULE}.complete_moderation_job",
+            new=mock.AsyncMock(return_value=True),
+        ) as mock_complete,
+        mock.patch(
+            f"{MODULE}.fail_moderation_job", new=mock.AsyncMock(return_value=True)
+        ) as mock_fail,
+        mock.patch(f"{MODULE}.settings") as mock_settings,
+    ):
+        mock_settings.MODERATION_JOB_MAX_ATTEMPTS = 3
+        mock_settings.MODERATION_JOB_RETRY_BASE_SECONDS = 5.0
+        mock_settings.MODERATION_JOB_RETRY_MAX_SECONDS = 60.0
+        yield mock.Mock(
+            get_pending_post=mock_get_pending_post,
+            moderate=mock_moderate,
+            complete=mock_complete,
+            fail=mock_fail,
+        )
+
+
+def test_moderation_retry_delay_backs_off_exponentially():
+    with mock.patch(f"{MODULE}.settings") as mock_settings:
+        mock_settings.MODERATION_JOB_RETRY_BASE_SECONDS = 5.0
+        mock_settings.MODERATION_JOB_RETRY_MAX_SECONDS = 60.0
+
+        assert moderation_retry_delay(1) == 5.0
+        assert moderation_retry_delay(2) == 10.0
+        assert moderation_retry_delay(3) == 20.0
+        assert moderation_retry_delay(10) == 60.0
+
+
+@pytest.mark.asyncio
+async def test_run_moderation_job_completes(mock_queue):
+    job = make_job()
+    job.available_at = now_utc() - timedelta(seconds=2)
+
+    assert await run_moderation_job(job, "worker-1") is True
+
+    mock_queue.moderate.assert_awaited_once_with(
+        job.pending_post_id, queue_wait_ms=mock.ANY
+    )
+    assert mock_queue.moderate.await_args.kwargs["queue_wait_ms"] >= 2000
+    mock_queue.complete.assert_awaited_once_with(job.id, "worker-1")
+    mock_queue.fail.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_moderation_job_skips_missing_pending_post(mock_queue):
+    mock_queue.get_pending_post.return_value = None
+    job = make_job()
+
+    assert await run_moderation_job(job, "worker-1") is True
+
+    mock_queue.moderate.assert_not_awaited()
+    mock_queue.complete.assert_awaited_once_with(job.id, "worker-1")
+
+
+@pytest.mark.asyncio
+async def test_run_moderation_job_schedules_retry(mock_queue):
+    mock_queue.moderate.side_effect = RuntimeError("LLM unavailable")
+    job = make_job(attempts=2)
+
+    assert await run_moderation_job(job, "worker-1") is False
+
+    mock_queue.fail.assert_awaited_once_with(
+        job.id, "worker-1", "LLM unavailable", 10.0
+    )
+    mock_queue.complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_moderation_job_fails_permanently_on_last_attempt(mock_queue):
+    mock_queue.moderate.side_effect = RuntimeError("LLM unavailable")
+    job = make_job(attempts=3)
+
+    assert await run_moderation_job(job, "worker-1") is False
+
+    mock_queue.fail.assert_awaited_once_with(
+        job.id, "worker-1", "LLM unavailable", None
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_moderation_job_gives_up_after_abandoned_leases(mock_queue):
+    job = make_job(attempts=4)
+
+    assert await run_moderation_job(job, "worker-1") is False
+
+    mock_queue.moderate.assert_not_awaited()
+    mock_queue.fail.assert_awaited_once_with(
+        job.id, "worker-1", "Gave up after 3 attempts"
+    )
+
+
+@pytest.mark.asyncio
+async def test_consume_moderation_jobs_runs_claimed_jobs_until_stopped():
+    job = make_job()
+    stop_event = asyncio.Event()
+    stats = ModerationConsumerStats()
+
+    async def claim(*args, **kwargs):
+        if mock_claim.await_count == 1:
+            return [job]
+        stop_event.set()
+        return []
+
+    with (
+        mock.patch(
+            f"{MODULE}.claim_moderation_jobs", new=mock.AsyncMock(side_effect=claim)
+        ) as mock_claim,
+        mock.patch(
+            f"{MODULE}.run_moderation_job", new=mock.AsyncMock(return_value=True)
+        ) as mock_run,
+    ):
+        await consume_moderation_jobs(
+            "worker-1",
+            poll_interval_seconds=30.0,
+            stop_event=stop_event,
+            stats=stats,
+        )
+
+    assert mock_claim.await_count == 2
+    mock_run.assert_awaited_once_with(job, "worker-1")
+    assert stats.jobs_completed == 1
+    assert stats.jobs_failed == 0
+    assert stats.jobs_in_flight == 0
+    assert stats.consumers_running == 0
+    assert stats.last_poll_at is not None
+
+
+@pytest.mark.asyncio
+async def test_consume_moderation_jobs_finishes_running_job_on_stop():
+    job = make_job()
+    stop_event = asyncio.Event()
+    stats = ModerationConsumerStats()
+
+    async def run_job(*args):
+        # Shutdown arrives while the job is in flight
+        assert stats.jobs_in_flight == 1
+        stop_event.set()
+        await asyncio.sleep(0)
+        return False
+
+    with (
+        mock.patch(
+            f"{MODULE}.claim_moderation_jobs",
+            new=mock.AsyncMock(return_value=[job]),
+        ) as mock_claim,
+        mock.patch(
+            f"{MODULE}.run_moderation_job", new=mock.AsyncMock(side_effect=run_job)
+        ),
+    ):
+        await consume_moderation_jobs("worker-1", stop_event=stop_event, stats=stats)
+
+    mock_claim.assert_awaited_once()
+    assert stats.jobs_failed == 1
+    assert stats.jobs_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_moderation_jobs_survives_errors():
+    job = make_job()
+    stop_event = asyncio.Event()
+    stats = ModerationConsumerStats()
+
+    async def claim(*args, **kwargs):
+        if mock_claim.await_count == 1:
+            raise RuntimeError("database down")
+        if mock_claim.await_count == 2:
+            return [job]
+        stop_event.set()
+        return []
+
+    with (
+        mock.patch(
+            f"{MODULE}.claim_moderation_jobs", new=mock.AsyncMock(side_effect=claim)
+        ) as mock_claim,
+        mock.patch(
+            f"{MODULE}.run_moderation_job",
+            new=mock.AsyncMock(side_effect=RuntimeError("database down")),
+        ),
+    ):
+        await consume_moderation_jobs(
+            "worker-1",
+            poll_interval_seconds=0.01,
+            stop_event=stop_event,
+            stats=stats,
+        )
+
+    assert mock_claim.await_count == 3
+    assert stats.jobs_failed == 1
+
+
+@pytest.mark.asyncio
+async def test_start_moderation_consumers_uses_unique_worker_ids():
+    with mock.patch(
+        f"{MODULE}.consume_moderation_jobs", new=mock.AsyncMock()
+    ) as mock_consume:
+        tasks = start_moderation_consumers(3)
+        await asyncio.gather(*tasks)
+
+    worker_ids = [call.args[0] for call in mock_consume.await_args_list]
+    assert len(tasks) == 3
+    assert len(set(worker_ids)) == 3
+    assert all(worker_id.endswith(f":{i}") for i, worker_id in enumerate(worker_ids))
@@ -0,0 +1,98 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+from unittest import mock
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.topic import Topic
+from backend.db.models.user import User
+from backend.db_functions.posts.create_post import create_post
+from backend.tasks.page_cache_invalidations import refresh_page_cache_invalidations
+from backend.tasks.page_cache_invalidations import run_page_cache_invalidation_task
+from backend.utils.page_cache import CachedPage
+from backend.utils.page_cache import PageCache
+
+
+def cached_page() -> CachedPage:
+    return CachedPage(
+        status=200, headers=[], body=b"<p>page</p>", stored_at=0.0, generation=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_drops_pages_of_topics_posted_to_elsewhere() -> None:
+    user = await User.create(
+        email="poster@example.com", password_hash="x", display_name="Poster"
+    )
+    topic = await Topic.create(title="Topic", author=user)
+    # Another process, e.g. the moderation worker, approves a post
+    await create_post("approved elsewhere", user.id, topic.id)
+
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cache.store((f"/html/topics/{topic.id}/", ""), cached_page())
+    cache.store(("/html/topics/", ""), cached_page())
+    cache.store((f"/html/topics/{uuid.uuid4()}/", ""), cached_page())
+    with mock.patch("backend.tasks.page_cache_invalidations.page_cache", cache):
+        result = await refresh_page_cache_invalidations()
+
+    assert result == 1
+    assert cache.stats().size == 1
+    assert cache.last_refreshed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_reads_posts_since_last_refresh() -> None:
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    with (
+        mock.patch("backend.tasks.page_cache_invalidations.page_cache", cache),
+        mock.patch(
+            "backend.tasks.page_cache_invalidations.list_topic_ids_with_new_posts",
+            new=mock.AsyncMock(return_value=[]),
+        ) as mock_list_topics,
+    ):
+        await refresh_page_cache_invalidations(overlap_seconds=0)
+        last_refreshed_at = cache.last_refreshed_at
+        await refresh_page_cache_invalidations(overlap_seconds=5)
+
+    assert last_refreshed_at is not None
+    mock_list_topics.assert_called_with(last_refreshed_at - timedelta(seconds=5))
+
+
+@pytest.mark.asyncio
+async def test_refresh_error_returns_zero() -> None:
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    with (
+        mock.patch("backend.tasks.page_cache_invalidations.page_cache", cache),
+        mock.patch(
+            "backend.tasks.page_cache_invalidations.list_topic_ids_with_new_posts",
+            new=mock.AsyncMock(side_effect=Exception("Database error")),
+        ),
+    ):
+        result = await refresh_page_cache_invalidations()
+
+    assert result == 0
+    assert cache.last_refreshed_at is None
+
+
+@pytest.mark.asyncio
+async def test_run_page_cache_invalidation_task() -> None:
+    with (
+        mock.patch(
+            "backend.tasks.page_cache_invalidations.refresh_page_cache_invalidations"
+        ) as mock_refresh,
+        mock.patch(
+            "backend.tasks.page_cache_invalidations.asyncio.sleep"
+        ) as mock_sleep,
+    ):
+        mock_sleep.side_effect = [None, asyncio.CancelledError]
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_page_cache_invalidation_task(interval_seconds=2)
+
+    assert mock_refresh.call_count == 2
+    mock_refresh.assert_called_with(overlap_seconds=2)
+    mock_sleep.assert_called_with(2)
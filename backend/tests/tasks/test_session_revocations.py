@@ -0,0 +1,128 @@
+# Standard library imports
+import asyncio
+from datetime import timedelta
+import secrets
+from unittest import mock
+import uuid
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.models.user import User
+from backend.db.models.user import UserRole
+from backend.db.models.user_session import UserSession
+from backend.db_functions.users.set_user_role import set_user_role
+from backend.tasks.session_revocations import refresh_session_revocations
+from backend.tasks.session_revocations import run_session_revocation_refresh_task
+from backend.utils.datetime import now_utc
+from backend.utils.session_revocations import SessionRevocationList
+from backend.utils.session_revocations import session_revocations
+
+
+async def create_user(email: str, is_locked: bool = False) -> User:
+    return await User.create(
+        email=email,
+        display_name=email.split("@")[0],
+        password_hash="hashed_password",
+        is_locked=is_locked,
+        tokens_revoked_at=now_utc() if is_locked else None,
+    )
+
+
+async def create_session(user: User, is_active: bool) -> UserSession:
+    return await UserSession.create(
+        user=user,
+        session_token=secrets.token_hex(32),
+        expires_at=now_utc() + timedelta(days=7),
+        user_agent="Test Agent",
+        ip_address="127.0.0.1",
+        is_active=is_active,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_deactivated_sessions_and_locked_users() -> None:
+    user = await create_user("active@example.com")
+    locked_user = await create_user("locked@example.com", is_locked=True)
+    active_session = await create_session(user, is_active=True)
+    revoked_session = await create_session(user, is_active=False)
+    issued_at = (now_utc() - timedelta(seconds=1)).timestamp()
+
+    result = await refresh_session_revocations()
+
+    assert result == 2
+    assert session_revocations.last_refreshed_at is not None
+    assert session_revocations.is_revoked(revoked_session.id, user.id, issued_at)
+    assert not session_revocations.is_revoked(active_session.id, user.id, issued_at)
+    assert session_revocations.is_revoked(uuid.uuid4(), locked_user.id, issued_at)
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_role_changes_made_by_other_processes() -> None:
+    admin = await create_user("demoted@example.com")
+    issued_before = (now_utc() - timedelta(seconds=1)).timestamp()
+    await set_user_role(admin.id, UserRole.USER)
+    issued_after = (now_utc() + timedelta(seconds=1)).timestamp()
+
+    # Another worker starts with an empty revocation list
+    other_process = SessionRevocationList()
+    with mock.patch(
+        "backend.tasks.session_revocations.session_revocations", other_process
+    ):
+        result = await refresh_session_revocations()
+
+    assert result == 1
+    assert other_process.is_revoked(uuid.uuid4(), admin.id, issued_before)
+    assert not other_process.is_revoked(uuid.uuid4(), admin.id, issued_after)
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_reads_changes_since_last_refresh() -> None:
+    await refresh_session_revocations(overlap_seconds=0)
+
+    with (
+        mock.patch(
+            "backend.tasks.session_revocations.list_revoked_session_ids",
+            new=mock.AsyncMock(return_value=[]),
+        ) as mock_list_sessions,
+        mock.patch(
+            "backend.tasks.session_revocations.list_token_revocations",
+            new=mock.AsyncMock(return_value={}),
+        ),
+    ):
+        last_refreshed_at = session_revocations.last_refreshed_at
+        await refresh_session_revocations(overlap_seconds=5)
+
+    assert last_refreshed_at is not None
+    mock_list_sessions.assert_called_once_with(last_refreshed_at - timedelta(seconds=5))
+
+
+@pytest.mark.asyncio
+async def test_refresh_error_returns_zero() -> None:
+    with mock.patch(
+        "backend.tasks.session_revocations.list_revoked_session_ids",
+        new=mock.AsyncMock(side_effect=Exception("Database error")),
+    ):
+        result = await refresh_session_revocations()
+
+    assert result == 0
+    assert session_revocations.last_refreshed_at is None
+
+
+@pytest.mark.asyncio
+async def test_run_session_revocation_refresh_task() -> None:
+    with (
+        mock.patch(
+            "backend.tasks.session_revocations.refresh_session_revocations"
+        ) as mock_refresh,
+        mock.patch("backend.tasks.session_revocations.asyncio.sleep") as mock_sleep,
+    ):
+        mock_sleep.side_effect = [None, asyncio.CancelledError]
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_session_revocation_refresh_task(interval_seconds=2)
+
+    assert mock_refresh.call_count == 2
+    mock_refresh.assert_called_with(overlap_seconds=2)
+    mock_sleep.assert_called_with(2)
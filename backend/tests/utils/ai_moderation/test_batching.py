@@ -0,0 +1,112 @@
+# Standard library imports
+import asyncio
+from typing import List
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.utils.ai_moderation.batching import MicroBatcher
+
+
+class Recorder:
+    def __init__(self, batch_error: Exception | None = None, drop_last=False):
+        self.batches: List[List[str]] = []
+        self.singles: List[str] = []
+        self.batch_error = batch_error
+        self.drop_last = drop_last
+
+    async def run_batch(self, items: List[str]) -> List[str]:
+        self.batches.append(items)
+        if self.batch_error:
+            raise self.batch_error
+        results = [f"batch:{item}" for item in items]
+        return results[:-1] if self.drop_last else results
+
+    async def run_single(self, item: str) -> str:
+        self.singles.append(item)
+        if item == "bad":
+            raise RuntimeError("single failed")
+        return f"single:{item}"
+
+
+@pytest.mark.asyncio
+async def test_batches_concurrent_submissions_up_to_max_size():
+    recorder = Recorder()
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=3, max_wait_seconds=60.0
+    )
+
+    results = await asyncio.gather(*(batcher.submit(str(i)) for i in range(3)))
+
+    assert results == ["batch:0", "batch:1", "batch:2"]
+    assert recorder.batches == [["0", "1", "2"]]
+    assert batcher.batches == 1
+    assert batcher.batched_items == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_max_wait():
+    recorder = Recorder()
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=10, max_wait_seconds=0.01
+    )
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert results == ["batch:a", "batch:b"]
+    assert recorder.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_lone_item_uses_single_call():
+    recorder = Recorder()
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=10, max_wait_seconds=0.01
+    )
+
+    assert await batcher.submit("a") == "single:a"
+    assert recorder.batches == []
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_calls():
+    recorder = Recorder(batch_error=RuntimeError("rate limited"))
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=2, max_wait_seconds=60.0
+    )
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert results == ["single:a", "single:b"]
+    assert recorder.singles == ["a", "b"]
+    assert batcher.fallbacks == 1
+    assert batcher.batches == 0
+
+
+@pytest.mark.asyncio
+async def test_incomplete_batch_falls_back_to_single_calls():
+    recorder = Recorder(drop_last=True)
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=2, max_wait_seconds=60.0
+    )
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert results == ["single:a", "single:b"]
+    assert batcher.fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_single_call_errors_only_reach_their_caller():
+    recorder = Recorder(batch_error=RuntimeError("rate limited"))
+    batcher = MicroBatcher(
+        recorder.run_batch, recorder.run_single, max_size=2, max_wait_seconds=60.0
+    )
+
+    results = await asyncio.gather(
+        batcher.submit("bad"), batcher.submit("good"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "single:good"
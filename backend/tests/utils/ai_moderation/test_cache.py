@@ -0,0 +1,85 @@
+# Standard library imports
+from unittest import mock
+
+# Project-specific imports
+from backend.utils.ai_moderation.cache import CachedModeration
+from backend.utils.ai_moderation.cache import ModerationCache
+from backend.utils.ai_moderation.cache import moderation_content_hash
+from backend.utils.ai_moderation.cache import normalize_content
+
+DECISION = CachedModeration(
+    decision="APPROVED",
+    confidence_score=0.9,
+    analysis_text="analysis",
+    feedback_text="feedback",
+)
+
+
+def test_normalize_content_collapses_whitespace():
+    assert normalize_content("  Hello,\n\tcomrade   world ") == "Hello, comrade world"
+
+
+def test_content_hash_ignores_whitespace_but_not_version_or_case():
+    base = moderation_content_hash("Hello comrade", "v1")
+
+    assert moderation_content_hash(" Hello\n comrade ", "v1") == base
+    assert moderation_content_hash("Hello comrade", "v2") != base
+    assert moderation_content_hash("HELLO COMRADE", "v1") != base
+    assert len(base) == 64
+
+
+def test_cache_hit_and_miss():
+    cache = ModerationCache(max_size=10, ttl_seconds=60)
+
+    assert cache.get("key") is None
+    cache.set("key", DECISION)
+    assert cache.get("key") == DECISION
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ModerationCache(max_size=2, ttl_seconds=60)
+    cache.set("a", DECISION)
+    cache.set("b", DECISION)
+    cache.get("a")
+
+    cache.set("c", DECISION)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == DECISION
+    assert cache.get("c") == DECISION
+    assert cache.stats().evictions == 1
+
+
+def test_cache_entries_expire():
+    cache = ModerationCache(max_size=10, ttl_seconds=60)
+
+    with mock.patch(
+        "backend.utils.ai_moderation.cache.time.monotonic", return_value=1000.0
+    ):
+        cache.set("key", DECISION)
+        cache.set("short", DECISION, ttl_seconds=5)
+        cache.set("expired", DECISION, ttl_seconds=-1)
+
+    with mock.patch(
+        "backend.utils.ai_moderation.cache.time.monotonic", return_value=1010.0
+    ):
+        assert cache.get("key") == DECISION
+        assert cache.get("short") is None
+        assert cache.get("expired") is None
+
+    with mock.patch(
+        "backend.utils.ai_moderation.cache.time.monotonic", return_value=1061.0
+    ):
+        assert cache.get("key") is None
+
+
+def test_cache_disabled_with_zero_size():
+    cache = ModerationCache(max_size=0)
+    cache.set("key", DECISION)
+
+    assert cache.get("key") is None
@@ -0,0 +1,87 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+import pytest
+
+# Project-specific imports
+from backend.utils.ai_moderation.fake_model import FakeModerator
+from backend.utils.ai_moderation.fake_model import create_fake_moderation_model
+from backend.utils.ai_moderation.service import MODERATION_PROMPT_TEMPLATE
+from backend.utils.ai_moderation.service import AIModeratorService
+from backend.utils.ai_moderation.service import BatchContentAnalysisResult
+from backend.utils.ai_moderation.service import ContentAnalysisResult
+
+
+def test_judge_is_deterministic_per_seed_and_content():
+    moderator = FakeModerator(seed=7)
+
+    assert moderator.judge("same post") == FakeModerator(seed=7).judge("same post")
+    decisions = {
+        FakeModerator(seed=seed).judge("same post")["decision"] for seed in range(50)
+    }
+    assert decisions == {"APPROVED", "REJECTED"}
+
+
+def test_judge_follows_approve_ratio():
+    moderator = FakeModerator(approve_ratio=0.25)
+
+    approved = sum(
+        moderator.judge(f"post {i}")["decision"] == "APPROVED" for i in range(1000)
+    )
+
+    assert 200 < approved < 300
+
+
+def test_latency_is_lognormal_around_median():
+    moderator = FakeModerator(latency_ms=100, latency_sigma=0.5)
+    samples = sorted(moderator.latency_seconds() for _ in range(1001))
+
+    assert 0.09 < samples[500] < 0.11
+    assert FakeModerator(latency_ms=0).latency_seconds() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_fake_model_answers_single_and_batch_prompts():
+    model = create_fake_moderation_model(latency_ms=0)
+
+    single = await Agent(model, output_type=ContentAnalysisResult).run("A post")
+    batch = await Agent(model, output_type=BatchContentAnalysisResult).run(
+        "POST 1:\n---\nfirst\n---\n\nPOST 2:\n---\nsecond\n---"
+    )
+
+    assert single.output.decision in ("APPROVED", "REJECTED")
+    assert [item.post_number for item in batch.output.results] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_fake_model_raises_retryable_errors():
+    model = create_fake_moderation_model(latency_ms=0, error_rate=1.0)
+
+    with pytest.raises(ModelHTTPError) as error:
+        await Agent(model, output_type=ContentAnalysisResult).run("A post")
+    assert error.value.status_code == 503
+
+
+@mock.patch("backend.utils.settings.settings.AI_MODERATION_MODEL", "fake")
+def test_service_uses_fake_model_when_selected():
+    service = AIModeratorService()
+
+    assert service.agent is not None
+    assert service.http_client is None
+    assert service.model_name == "function:fake-moderator"
+
+
+@pytest.mark.asyncio
+async def test_fake_model_judges_a_post_the_same_alone_or_batched():
+    model = create_fake_moderation_model(latency_ms=0, seed=11)
+    moderator = FakeModerator(seed=11)
+
+    single = await Agent(model, output_type=ContentAnalysisResult).run(
+        MODERATION_PROMPT_TEMPLATE.format(content="A post")
+    )
+
+    assert single.output.decision == moderator.judge("A post")["decision"]
+    assert single.output.confidence == moderator.judge("A post")["confidence"]
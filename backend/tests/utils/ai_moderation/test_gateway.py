@@ -0,0 +1,219 @@
+# Standard library imports
+import asyncio
+import time
+from unittest import mock
+
+# Third-party imports
+from pydantic_ai.exceptions import ModelHTTPError
+import pytest
+
+# Project-specific imports
+from backend.utils.ai_moderation.gateway import CircuitBreaker
+from backend.utils.ai_moderation.gateway import CircuitOpenError
+from backend.utils.ai_moderation.gateway import CircuitState
+from backend.utils.ai_moderation.gateway import ModerationGateway
+from backend.utils.ai_moderation.gateway import TokenBucket
+from backend.utils.ai_moderation.gateway import is_retryable
+
+
+def make_gateway(**kwargs) -> ModerationGateway:
+    kwargs.setdefault("requests_per_minute", 0)
+    kwargs.setdefault("backoff_base_seconds", 0.001)
+    kwargs.setdefault("backoff_max_seconds", 0.001)
+    return ModerationGateway(**kwargs)
+
+
+class Flaky:
+    """Fails with the given errors in order, then returns "ok"."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def http_error(status_code: int) -> ModelHTTPError:
+    return ModelHTTPError(status_code=status_code, model_name="test")
+
+
+def test_is_retryable():
+    assert is_retryable(http_error(429))
+    assert is_retryable(http_error(503))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(http_error(400))
+    assert not is_retryable(ValueError())
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate_per_second=50, burst=2)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.01
+
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_tokens():
+    bucket = TokenBucket(rate_per_second=1000, burst=5)
+    bucket.pause(0.05)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_circuit_breaker_opens_after_threshold_and_half_opens():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60.0)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trips == 1
+    assert not breaker.allow()
+
+    breaker.reset_timeout_seconds = 0.0
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    # Only one trial call goes through while half-open
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_circuit_breaker_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0.0)
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.reset_timeout_seconds = 60.0
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trips == 2
+
+
+@pytest.mark.asyncio
+async def test_call_retries_rate_limits_and_server_errors():
+    gateway = make_gateway(max_retries=3)
+    func = Flaky(http_error(429), http_error(503))
+
+    assert await gateway.call(func) == "ok"
+    assert func.calls == 3
+    stats = gateway.stats()
+    assert stats.retries == 2
+    assert stats.rate_limited == 1
+    assert stats.successes == 1
+    assert stats.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_call_does_not_retry_client_errors():
+    gateway = make_gateway(failure_threshold=1)
+    func = Flaky(http_error(400))
+
+    with pytest.raises(ModelHTTPError):
+        await gateway.call(func)
+    assert func.calls == 1
+    assert gateway.stats().failures == 1
+    # A rejected request does not count as an outage
+    assert gateway.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_call_gives_up_after_max_retries_and_opens_circuit():
+    gateway = make_gateway(max_retries=2, failure_threshold=1)
+    func = Flaky(*(http_error(500) for _ in range(5)))
+
+    with pytest.raises(ModelHTTPError):
+        await gateway.call(func)
+    assert func.calls == 3
+    assert gateway.breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await gateway.call(Flaky())
+    assert gateway.stats().rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_frees_the_trial_slot():
+    gateway = make_gateway(failure_threshold=1, reset_timeout_seconds=0.0)
+    gateway.breaker.record_failure()
+    assert gateway.breaker.state == CircuitState.HALF_OPEN
+
+    trial = asyncio.create_task(gateway.call(lambda: asyncio.sleep(1)))
+    await asyncio.sleep(0)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # The next caller becomes the trial instead of being rejected forever
+    assert await gateway.call(Flaky()) == "ok"
+    assert gateway.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_call_times_out_slow_attempts():
+    gateway = make_gateway(call_timeout_seconds=0.01, max_retries=1)
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        await gateway.call(slow)
+    assert calls == 2
+    assert gateway.stats().timeouts == 2
+
+
+@pytest.mark.asyncio
+async def test_call_stops_retrying_at_deadline():
+    gateway = make_gateway(
+        deadline_seconds=0.05, backoff_base_seconds=1.0, backoff_max_seconds=1.0
+    )
+    func = Flaky(http_error(503), http_error(503))
+
+    with pytest.raises(ModelHTTPError):
+        await gateway.call(func)
+    # The backoff would overrun the deadline, so no retry was attempted
+    assert func.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_call_caps_concurrency():
+    gateway = make_gateway(max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def tracked():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "ok"
+
+    await asyncio.gather(*(gateway.call(tracked) for _ in range(6)))
+    assert peak == 2
+    assert gateway.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_bucket():
+    gateway = make_gateway(requests_per_minute=60000)
+    with mock.patch.object(gateway.bucket, "pause") as pause:
+        await gateway.call(Flaky(http_error(429)))
+    pause.assert_called_once()
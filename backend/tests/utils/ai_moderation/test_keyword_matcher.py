@@ -0,0 +1,197 @@
+# Standard library imports
+import os
+from pathlib import Path
+import time
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.utils.ai_moderation.keyword_matcher import DEFAULT_KEYWORD_RULES_PATH
+from backend.utils.ai_moderation.keyword_matcher import KeywordCategory
+from backend.utils.ai_moderation.keyword_matcher import KeywordHit
+from backend.utils.ai_moderation.keyword_matcher import KeywordMatcher
+from backend.utils.ai_moderation.keyword_matcher import KeywordRuleSet
+
+RULES_TEMPLATE = """
+version = {version}
+
+[categories.incivility]
+keywords = [{keywords}]
+analysis = "Post contains uncivil language: '{{keyword}}'"
+feedback = "COMRADE, '{{KEYWORD}}' IS UNCIVIL."
+"""
+
+
+def write_rules(path: Path, version: int, keywords: list[str]) -> None:
+    quoted = ", ".join(f'"{keyword}"' for keyword in keywords)
+    path.write_text(RULES_TEMPLATE.format(version=version, keywords=quoted))
+
+
+def make_matcher() -> KeywordMatcher:
+    return KeywordMatcher(
+        [
+            KeywordCategory(
+                name="incivility",
+                keywords=("idiot", "you're an idiot", "shut up"),
+                analysis="uncivil: '{keyword}'",
+                feedback="'{KEYWORD}' IS UNCIVIL",
+            ),
+            KeywordCategory(
+                name="propaganda",
+                keywords=("fake news",),
+                analysis="propaganda: '{keyword}'",
+                feedback="'{KEYWORD}' IS PROPAGANDA",
+            ),
+        ],
+        version="7",
+    )
+
+
+def test_find_all_returns_every_hit_with_category_and_offset():
+    content = "Shut up, this is FAKE NEWS and you're an idiot."
+
+    hits = make_matcher().find_all(content)
+
+    assert hits == [
+        KeywordHit(category="incivility", keyword="shut up", start=0, end=7),
+        KeywordHit(category="propaganda", keyword="fake news", start=17, end=26),
+        KeywordHit(category="incivility", keyword="you're an idiot", start=31, end=46),
+    ]
+
+
+def test_keywords_only_match_whole_words():
+    matcher = make_matcher()
+
+    assert matcher.find_all("idiotic idiots") == []
+    assert matcher.first("what an idiot!") == KeywordHit(
+        category="incivility", keyword="idiot", start=8, end=13
+    )
+
+
+def test_keyword_whitespace_matches_any_whitespace():
+    hit = make_matcher().first("that is fake\n  news")
+
+    assert hit is not None
+    assert hit.keyword == "fake news"
+
+
+def test_templates_render_matched_keyword():
+    matcher = make_matcher()
+    category = matcher.categories["propaganda"]
+
+    assert category.render_analysis("fake news") == "propaganda: 'fake news'"
+    assert category.render_feedback("fake news") == "'FAKE NEWS' IS PROPAGANDA"
+
+
+def test_duplicate_keywords_are_rejected():
+    category = KeywordCategory(
+        name="a", keywords=("Idiot",), analysis="{keyword}", feedback="{KEYWORD}"
+    )
+    other = KeywordCategory(
+        name="b", keywords=("idiot",), analysis="{keyword}", feedback="{KEYWORD}"
+    )
+
+    with pytest.raises(ValueError):
+        KeywordMatcher([category, other])
+
+
+def test_broken_templates_are_rejected():
+    with pytest.raises(KeyError):
+        KeywordCategory(
+            name="a", keywords=("idiot",), analysis="{word}", feedback="{KEYWORD}"
+        )
+
+
+def test_empty_matcher_matches_nothing():
+    matcher = KeywordMatcher([])
+
+    assert matcher.find_all("anything at all") == []
+    assert matcher.first("anything at all") is None
+
+
+def test_scan_time_does_not_grow_with_rule_count():
+    def matcher_with(rule_count: int) -> KeywordMatcher:
+        keywords = tuple(f"banned phrase {number}" for number in range(rule_count))
+        return KeywordMatcher(
+            [
+                KeywordCategory(
+                    name="a", keywords=keywords, analysis="{keyword}", feedback="x"
+                )
+            ]
+        )
+
+    def best_scan_seconds(matcher: KeywordMatcher, content: str) -> float:
+        timings = []
+        for _ in range(5):
+            started_at = time.perf_counter()
+            matcher.find_all(content)
+            timings.append(time.perf_counter() - started_at)
+        return min(timings)
+
+    content = "A reasoned, civil argument about banned phrases. " * 60
+    small = matcher_with(30)
+    large = matcher_with(5000)
+
+    assert large.first("this is banned phrase 4999!") is not None
+    assert best_scan_seconds(large, content) < best_scan_seconds(small, content) * 3
+
+
+def test_default_rules_file_loads():
+    matcher = KeywordMatcher.load(DEFAULT_KEYWORD_RULES_PATH)
+
+    assert matcher.version
+    assert set(matcher.categories) == {
+        "propaganda",
+        "incivility",
+        "irrelevance",
+        "illogical",
+    }
+    assert matcher.first("This is pure nonsense.").category == "illogical"
+    assert matcher.first("A conspiracy!").category == "propaganda"
+
+
+def test_rule_set_hot_reloads_changed_rules(tmp_path: Path):
+    rules_path = tmp_path / "rules.toml"
+    write_rules(rules_path, 1, ["idiot"])
+    rule_set = KeywordRuleSet(rules_path, reload_interval_seconds=0.0)
+
+    assert rule_set.get().version == "1"
+    assert rule_set.get().first("you moron") is None
+
+    write_rules(rules_path, 2, ["idiot", "moron"])
+    stat = rules_path.stat()
+    os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    matcher = rule_set.get()
+    assert matcher.version == "2"
+    assert matcher.first("you moron") is not None
+
+
+def test_rule_set_keeps_previous_rules_when_file_breaks(tmp_path: Path):
+    rules_path = tmp_path / "rules.toml"
+    write_rules(rules_path, 1, ["idiot"])
+    rule_set = KeywordRuleSet(rules_path, reload_interval_seconds=0.0)
+    rule_set.get()
+
+    rules_path.write_text("version = [broken")
+
+    assert rule_set.reload(force=True) is False
+    assert rule_set.get().version == "1"
+
+
+def test_rule_set_throttles_file_checks(tmp_path: Path):
+    rules_path = tmp_path / "rules.toml"
+    write_rules(rules_path, 1, ["idiot"])
+    rule_set = KeywordRuleSet(rules_path, reload_interval_seconds=3600.0)
+    rule_set.get()
+
+    write_rules(rules_path, 2, ["idiot", "moron"])
+
+    assert rule_set.get().version == "1"
+
+
+def test_rule_set_without_file_matches_nothing(tmp_path: Path):
+    rule_set = KeywordRuleSet(tmp_path / "missing.toml")
+
+    assert rule_set.get().first("idiot") is None
@@ -1,11 +1,19 @@
+import asyncio
+from datetime import datetime
+from datetime import timezone
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 import uuid
 
-from pydantic_graph import End
+from pydantic_ai.messages import ModelResponse
+from pydantic_ai.messages import ToolCallPart
+from pydantic_ai.models.function import AgentInfo
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.models.test import TestModel
 
+from src.backend.schemas.ai_analysis import AIAnalysisResponse
 from src.backend.utils.ai_moderation.service import AIModeratorService
 from src.backend.utils.ai_moderation.service import ContentAnalysisResult
 
@@ -51,18 +59,10 @@ class TestAIModeratorService(IsolatedAsyncioTestCase):
         )
         mock_agent.run.return_value = mock_result
 
-        # Mock the graph run method to return an End node with the expected result
+        # Mock the graph run method to return a run result with the analysis
         self.service.moderation_graph.run = AsyncMock()
-        self.service.moderation_graph.run.return_value = End(
-            ContentAnalysisResult(
-                decision="APPROVED",
-                confidence=0.9,
-                analysis="This post is logical and coherent.",
-                feedback=(
-                    "CITIZEN, YOUR SUBMISSION MEETS THE STANDARDS OF THE "
-                    "ROBOT OVERLORD."
-                ),
-            )
+        self.service.moderation_graph.run.return_value = MagicMock(
+            output=mock_result.output
         )
 
         # Call the method under test
@@ -72,15 +72,9 @@ class TestAIModeratorService(IsolatedAsyncioTestCase):
 
         # Assertions
         self.assertEqual(result.pending_post_id, self.pending_post_id)
-        # We're expecting the decision to be REJECTED now as per our new default
-        self.assertEqual(result.decision, "REJECTED")
-        # The actual confidence score might be different from what we mocked
-        # since the service might override it
-        self.assertIsInstance(result.confidence_score, float)
-        self.assertGreaterEqual(result.confidence_score, 0)
-        self.assertLessEqual(result.confidence_score, 1.0)
-        # Check that analysis text exists but don't check exact content
-        self.assertIsNotNone(result.analysis_text)
+        self.assertEqual(result.decision, "APPROVED")
+        self.assertEqual(result.confidence_score, 0.9)
+        self.assertEqual(result.analysis_text, "This post is logical and coherent.")
         # Check that feedback text contains expected phrases
         self.assertIn("THE ROBOT OVERLORD", result.feedback_text)
         # Check that processing time is recorded
@@ -113,6 +107,8 @@ class TestAIModeratorService(IsolatedAsyncioTestCase):
         self.assertIn("ROBOT OVERLORD REJECTS", result.feedback_text)
         # Check that processing time is recorded
         self.assertGreaterEqual(result.processing_time_ms, 0)
+        self.assertIsNotNone(result.prefilter_ms)
+        self.assertIsNone(result.llm_ms)
 
         # Verify that the agent was not called for rejection keywords
         mock_agent_class.assert_not_called()
@@ -136,24 +132,231 @@ class TestAIModeratorService(IsolatedAsyncioTestCase):
             "Graph execution error"
         )
 
-        # Call the method under test
-        result = await self.service.analyze_content(
-            pending_post_id=self.pending_post_id
+        # The error reaches the moderation job, which retries the post
+        # rather than rejecting it
+        with self.assertRaisesRegex(Exception, "Graph execution error"):
+            await self.service.analyze_content(pending_post_id=self.pending_post_id)
+
+    @patch(
+        "src.backend.utils.ai_moderation.service.get_cached_ai_analysis",
+        new=AsyncMock(return_value=None),
+    )
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_with_fake_model(self, mock_get_pending_post):
+        # Setup a service backed by a local fake model
+        mock_get_pending_post.return_value = self.mock_pending_post
+        fake_model = TestModel(
+            custom_output_args={
+                "decision": "APPROVED",
+                "confidence": 0.95,
+                "analysis": "This post is logical and coherent.",
+                "feedback": "THE ROBOT OVERLORD APPROVES, CITIZEN.",
+            }
         )
+        service = AIModeratorService(model=fake_model)
+        agent = service.agent
+
+        # Call the method under test twice
+        first = await service.analyze_content(pending_post_id=self.pending_post_id)
+        second = await service.analyze_content(pending_post_id=self.pending_post_id)
+
+        # The same long-lived agent served both calls
+        self.assertIs(service.agent, agent)
+        self.assertIsNone(service.http_client)
+        for result in (first, second):
+            self.assertEqual(result.decision, "APPROVED")
+            self.assertEqual(result.confidence_score, 0.95)
+            self.assertEqual(result.analysis_text, "This post is logical and coherent.")
+            self.assertEqual(result.content_hash, first.content_hash)
+
+        # The repeat was answered by the moderation cache
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertIsNotNone(first.content_hash)
+
+        # Both runs timed their stages; only the first called the model
+        for result in (first, second):
+            self.assertIsNotNone(result.db_fetch_ms)
+            self.assertIsNotNone(result.prefilter_ms)
+        self.assertIsNotNone(first.llm_ms)
+        self.assertIsNone(second.llm_ms)
+
+    @patch("src.backend.utils.ai_moderation.service.get_cached_ai_analysis")
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_uses_persistent_cache(
+        self, mock_get_pending_post, mock_get_cached_ai_analysis
+    ):
+        # Setup a stored analysis of identical content
+        mock_get_pending_post.return_value = self.mock_pending_post
+        mock_get_cached_ai_analysis.return_value = AIAnalysisResponse(
+            id=uuid.uuid4(),
+            pending_post_id=None,
+            decision="REJECTED",
+            confidence_score=0.85,
+            analysis_text="Seen before.",
+            feedback_text="CITIZEN, WE HAVE SEEN THIS BEFORE.",
+            processing_time_ms=1500,
+            content_hash="cached",
+            cache_hit=False,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        service = AIModeratorService(model=TestModel())
+        service.moderation_graph.run = AsyncMock()
+
+        # Call the method under test twice
+        first = await service.analyze_content(pending_post_id=self.pending_post_id)
+        second = await service.analyze_content(pending_post_id=self.pending_post_id)
+
+        # The model never ran and the stored row was read once
+        service.moderation_graph.run.assert_not_called()
+        mock_get_cached_ai_analysis.assert_awaited_once()
+        for result in (first, second):
+            self.assertTrue(result.cache_hit)
+            self.assertEqual(result.decision, "REJECTED")
+            self.assertEqual(result.analysis_text, "Seen before.")
+            self.assertLess(result.processing_time_ms, 1500)
+
+    @patch(
+        "src.backend.utils.ai_moderation.service.get_cached_ai_analysis",
+        new=AsyncMock(return_value=None),
+    )
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_model_errors_propagate_uncached(
+        self, mock_get_pending_post
+    ):
+        # Setup a model that always fails
+        mock_get_pending_post.return_value = self.mock_pending_post
+        service = AIModeratorService(model=TestModel())
+        service.agent.run = AsyncMock(side_effect=Exception("API error"))
+
+        # Each attempt reaches the moderation job instead of approving
+        for _ in range(2):
+            with self.assertRaisesRegex(Exception, "API error"):
+                await service.analyze_content(pending_post_id=self.pending_post_id)
+
+        # Nothing was cached, so the retry calls the model again
+        self.assertEqual(service.agent.run.await_count, 2)
+        self.assertEqual(service.cache.stats().size, 0)
+
+    @patch(
+        "src.backend.utils.ai_moderation.service.get_cached_ai_analysis",
+        new=AsyncMock(return_value=None),
+    )
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_open_circuit_uses_keyword_filter_only(
+        self, mock_get_pending_post
+    ):
+        # Setup a service whose circuit breaker has opened
+        mock_get_pending_post.return_value = self.mock_pending_post
+        service = AIModeratorService(model=TestModel())
+        service.agent.run = AsyncMock()
+        for _ in range(service.gateway.breaker.failure_threshold):
+            service.gateway.breaker.record_failure()
+
+        # Call the method under test
+        result = await service.analyze_content(pending_post_id=self.pending_post_id)
+
+        # The model was not called and the result is a low-confidence pass
+        service.agent.run.assert_not_awaited()
+        self.assertEqual(result.decision, "APPROVED")
+        self.assertLess(result.confidence_score, 0.7)
+        self.assertIn("keyword filtering only", result.analysis_text)
+        self.assertIsNone(result.content_hash)
+        self.assertEqual(service.gateway.stats().rejected, 1)
+
+    @patch(
+        "backend.utils.settings.settings.ANTHROPIC_API_KEY",
+        "sk-dummy-key-for-development",
+    )
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_without_model_falls_back(
+        self, mock_get_pending_post
+    ):
+        # Without an API key the service has no agent
+        mock_get_pending_post.return_value = self.mock_pending_post
+        service = AIModeratorService()
+        self.assertIsNone(service.agent)
+
+        # Call the method under test
+        result = await service.analyze_content(pending_post_id=self.pending_post_id)
 
         # Assertions
-        self.assertEqual(result.pending_post_id, self.pending_post_id)
-        self.assertEqual(result.decision, "REJECTED")
-        # For error cases, confidence should be low or zero
-        self.assertIsInstance(result.confidence_score, float)
-        self.assertGreaterEqual(result.confidence_score, 0)
-        # Check that analysis text mentions error
-        self.assertIn("error", result.analysis_text.lower())
-        # Check that feedback text contains expected phrases
-        self.assertIn("ROBOT OVERLORD", result.feedback_text)
-        self.assertIn("REJECTED", result.feedback_text)
-        # Check that processing time is recorded
-        self.assertGreaterEqual(result.processing_time_ms, 0)
+        self.assertEqual(result.decision, "APPROVED")
+        self.assertIn("No moderation model configured", result.analysis_text)
+
+    @patch("backend.utils.settings.settings.ANTHROPIC_API_KEY", "sk-ant-test-key-1234")
+    async def test_anthropic_model_uses_pooled_http_client(self):
+        # Create a service configured for the Anthropic API
+        service = AIModeratorService()
+
+        # Assertions
+        self.assertIsNotNone(service.agent)
+        self.assertIsNotNone(service.http_client)
+        http_client = service.http_client
+
+        # Retries are left to the moderation gateway
+        self.assertEqual(service.agent.model.client.max_retries, 0)
+
+        # Closing the service closes the shared client
+        await service.aclose()
+        self.assertTrue(http_client.is_closed)
+        self.assertIsNone(service.http_client)
+
+    @patch("backend.utils.settings.settings.AI_MODERATION_BATCH_ENABLED", True)
+    @patch("backend.utils.settings.settings.AI_MODERATION_BATCH_MAX_SIZE", 3)
+    @patch(
+        "src.backend.utils.ai_moderation.service.get_cached_ai_analysis",
+        new=AsyncMock(return_value=None),
+    )
+    @patch("src.backend.utils.ai_moderation.service.get_pending_post_by_id")
+    async def test_analyze_content_batches_concurrent_posts(
+        self, mock_get_pending_post
+    ):
+        # Setup three pending posts
+        posts = {}
+        for number in range(3):
+            post = MagicMock()
+            post.id = uuid.uuid4()
+            post.content = f"Post body {number}"
+            posts[post.id] = post
+        mock_get_pending_post.side_effect = lambda post_id: posts[post_id]
+
+        # Setup a fake model that answers batches in reverse order
+        prompts = []
+
+        def judge(messages, info: AgentInfo) -> ModelResponse:
+            prompt = messages[-1].parts[-1].content
+            prompts.append(prompt)
+            results = [
+                {
+                    "post_number": number,
+                    "decision": "APPROVED",
+                    "confidence": 0.9,
+                    "analysis": f"Judged post {number}",
+                    "feedback": "APPROVED, CITIZEN.",
+                }
+                for number in range(prompt.count("POST "), 0, -1)
+            ]
+            return ModelResponse(
+                parts=[ToolCallPart(info.output_tools[0].name, {"results": results})]
+            )
+
+        service = AIModeratorService(model=FunctionModel(judge))
+
+        # Call the method under test concurrently
+        results = await asyncio.gather(
+            *(service.analyze_content(pending_post_id=post_id) for post_id in posts)
+        )
+
+        # One model call judged every post and each got its own result
+        self.assertEqual(len(prompts), 1)
+        self.assertEqual(
+            [result.analysis_text for result in results],
+            ["Judged post 1", "Judged post 2", "Judged post 3"],
+        )
+        self.assertEqual([result.pending_post_id for result in results], list(posts))
+        self.assertEqual(service.batcher.batches, 1)
 
 
 # Tests should be run with pytest, not directly
@@ -0,0 +1,95 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.utils.ai_moderation.timings import LatencyHistogram
+from backend.utils.ai_moderation.timings import ModerationTimings
+from backend.utils.ai_moderation.timings import summarize_stage_timings
+
+
+def test_histogram_percentiles_fall_in_the_right_buckets():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(15)
+    for _ in range(10):
+        histogram.record(4000)
+
+    assert 10 <= histogram.percentile(0.50) <= 20
+    assert 2000 <= histogram.percentile(0.95) <= 4000
+    assert histogram.percentile(0.99) <= histogram.max_ms == 4000
+
+
+def test_histogram_empty_and_overflow():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) == 0.0
+
+    histogram.record(5_000_000)
+    assert 3_600_000 < histogram.percentile(0.99) <= 5_000_000
+
+
+def test_summary_reports_every_stage():
+    timings = ModerationTimings()
+    timings.record("llm", 1200)
+    timings.record("llm", 800)
+    timings.record("prefilter", 1)
+    timings.record("action", None)
+
+    stages = {stage.stage: stage for stage in timings.summary().stages}
+
+    assert list(stages) == [
+        "queue_wait",
+        "db_fetch",
+        "prefilter",
+        "llm",
+        "persist",
+        "action",
+    ]
+    assert stages["llm"].count == 2
+    assert stages["llm"].mean_ms == 1000
+    assert stages["llm"].max_ms == 1200
+    assert stages["prefilter"].count == 1
+    assert stages["action"].count == 0
+
+
+def test_record_rejects_unknown_stage():
+    with pytest.raises(ValueError):
+        ModerationTimings().record("render", 1)
+
+
+def test_summary_window_and_retention():
+    timings = ModerationTimings(retention_seconds=600, slice_seconds=60)
+    clock = mock.Mock(return_value=1000.0)
+    with mock.patch("backend.utils.ai_moderation.timings.time.monotonic", clock):
+        timings.record("llm", 100)
+        clock.return_value = 1300.0
+        timings.record("llm", 300)
+
+        # Only the recent slice falls inside a one-minute window
+        recent = timings.summary(window_seconds=60).stages[3]
+        assert recent.count == 1
+        assert recent.max_ms == 300
+        assert timings.summary().stages[3].count == 2
+
+        # Slices older than the retention are dropped
+        clock.return_value = 1700.0
+        assert timings.summary().stages[3].count == 1
+
+
+def test_summarize_stage_timings_from_stored_rows():
+    rows = [
+        {"queue_wait_ms": 30, "llm_ms": 1200, "prefilter_ms": 1},
+        {"queue_wait_ms": 10, "llm_ms": None, "prefilter_ms": 2},
+    ]
+
+    summary = summarize_stage_timings(rows, window_seconds=600.0)
+
+    stages = {stage.stage: stage for stage in summary.stages}
+    assert summary.window_seconds == 600.0
+    assert stages["queue_wait"].count == 2
+    assert stages["queue_wait"].mean_ms == 20.0
+    assert stages["llm"].count == 1
+    assert stages["llm"].max_ms == 1200
+    assert stages["action"].count == 0
@@ -15,6 +15,7 @@ from backend.db.models.user_session import UserSession
 from backend.utils.auth import decode_token
 from backend.utils.auth import get_current_user
 from backend.utils.auth import get_optional_user
+from backend.utils.session_revocations import session_revocations
 from backend.utils.settings import settings
 
 
@@ -276,3 +277,95 @@ async def test_get_optional_user_with_invalid_token():
 
         # Assert
         assert result is None
+
+
+@pytest.fixture
+def stateless_payload() -> dict:
+    """Returns access token claims tied to a session."""
+    return {
+        "sub": str(uuid.uuid4()),
+        "sid": str(uuid.uuid4()),
+        "email": "citizen@example.com",
+        "role": "moderator",
+        "iat": 1735732800.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_stateless_skips_database(stateless_payload):
+    """Test the stateless fast path resolves the user from claims alone."""
+    with (
+        mock.patch.object(settings, "JWT_STATELESS_AUTH", True),
+        mock.patch("backend.utils.auth.decode_token", return_value=stateless_payload),
+        mock.patch.object(User, "get_or_none") as mock_get_user,
+        mock.patch.object(UserSession, "filter") as mock_filter,
+    ):
+        # Act
+        result = await get_current_user("valid_token")
+
+        # Assert
+        assert str(result.id) == stateless_payload["sub"]
+        assert result.role == "moderator"
+        mock_get_user.assert_not_called()
+        mock_filter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_stateless_revoked_session(stateless_payload):
+    """Test the stateless fast path rejects tokens of revoked sessions."""
+    session_revocations.revoke_session(uuid.UUID(stateless_payload["sid"]))
+
+    with (
+        mock.patch.object(settings, "JWT_STATELESS_AUTH", True),
+        mock.patch("backend.utils.auth.decode_token", return_value=stateless_payload),
+    ):
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user("valid_token")
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "SESSION HAS EXPIRED OR BEEN TERMINATED" in exc_info.value.detail
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_stateless_rejects_refresh_token(stateless_payload):
+    """Test the stateless fast path does not accept refresh tokens."""
+    stateless_payload["refresh"] = True
+
+    with (
+        mock.patch.object(settings, "JWT_STATELESS_AUTH", True),
+        mock.patch("backend.utils.auth.decode_token", return_value=stateless_payload),
+    ):
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user("valid_token")
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_checks_token_session(mock_user, stateless_payload):
+    """Test tokens with a session id are checked against that session."""
+    stateless_payload["sub"] = str(mock_user.id)
+
+    with (
+        mock.patch("backend.utils.auth.decode_token", return_value=stateless_payload),
+        mock.patch.object(
+            User, "get_or_none", new=mock.AsyncMock(return_value=mock_user)
+        ),
+        mock.patch.object(
+            UserSession, "filter", return_value=mock.AsyncMock()
+        ) as mock_filter,
+    ):
+        mock_filter.return_value.exists = mock.AsyncMock(return_value=True)
+
+        # Act
+        result = await get_current_user("valid_token")
+
+        # Assert
+        assert result == mock_user
+        mock_filter.assert_called_once_with(
+            id=stateless_payload["sid"],
+            user_id=stateless_payload["sub"],
+            is_active=True,
+        )
@@ -0,0 +1,101 @@
+# Standard library imports
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+# Third-party imports
+from fastapi import HTTPException
+from fastapi import Request
+import pytest
+
+# Project-specific imports
+from backend.schemas.resource_version import ResourceVersion
+from backend.utils.conditional_get import check_not_modified
+from backend.utils.conditional_get import is_not_modified
+from backend.utils.conditional_get import resource_validators
+
+CHANGED_AT = datetime(2026, 10, 17, 12, 0, 0, tzinfo=UTC)
+VERSION = ResourceVersion(count=3, last_modified=CHANGED_AT)
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_resource_validators_headers():
+    validators = resource_validators(VERSION, private=True, vary="Cookie")
+
+    assert validators["ETag"].startswith('W/"')
+    assert validators["Last-Modified"] == "Sat, 17 Oct 2026 12:00:00 GMT"
+    assert validators["Cache-Control"] == "private, no-cache"
+    assert validators["Vary"] == "Cookie"
+    assert resource_validators(ResourceVersion(count=0)) == {
+        "ETag": resource_validators(ResourceVersion(count=0))["ETag"],
+        "Cache-Control": "no-cache",
+    }
+
+
+def test_etag_changes_with_count_time_and_viewer():
+    etag = resource_validators(VERSION)["ETag"]
+
+    assert resource_validators(VERSION)["ETag"] == etag
+    assert resource_validators(VERSION.model_copy(update={"count": 2}))["ETag"] != etag
+    later = VERSION.model_copy(update={"last_modified": CHANGED_AT + timedelta(1)})
+    assert resource_validators(later)["ETag"] != etag
+    assert resource_validators(VERSION, "viewer")["ETag"] != etag
+
+
+def test_if_none_match():
+    validators = resource_validators(VERSION)
+    etag = validators["ETag"]
+
+    assert is_not_modified(make_request(if_none_match=etag), validators)
+    assert is_not_modified(make_request(if_none_match=etag[2:]), validators)
+    assert is_not_modified(make_request(if_none_match=f'"x", {etag}'), validators)
+    assert is_not_modified(make_request(if_none_match="*"), validators)
+    assert not is_not_modified(make_request(if_none_match='"x"'), validators)
+
+
+def test_if_modified_since():
+    validators = resource_validators(VERSION)
+
+    assert is_not_modified(
+        make_request(if_modified_since="Sat, 17 Oct 2026 12:00:00 GMT"), validators
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since="Sat, 17 Oct 2026 11:59:59 GMT"), validators
+    )
+    assert not is_not_modified(make_request(if_modified_since="never"), validators)
+    assert not is_not_modified(make_request(), validators)
+
+
+def test_if_none_match_takes_precedence():
+    validators = resource_validators(VERSION)
+
+    # A deletion changes the ETag but not Last-Modified
+    request = make_request(
+        if_none_match='"stale"', if_modified_since="Sat, 17 Oct 2026 12:00:00 GMT"
+    )
+
+    assert not is_not_modified(request, validators)
+
+
+def test_check_not_modified():
+    validators = check_not_modified(make_request(), VERSION)
+    request = make_request(if_none_match=validators["ETag"])
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_not_modified(request, VERSION)
+
+    assert exc_info.value.status_code == 304
+    assert exc_info.value.headers == validators
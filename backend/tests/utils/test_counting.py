@@ -0,0 +1,137 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# Project-specific imports
+from backend.db.dialect import get_connection
+from backend.db.models.tag import Tag
+from backend.utils.counting import CountCache
+from backend.utils.counting import CountMode
+from backend.utils.counting import RowCount
+from backend.utils.counting import count_cache
+from backend.utils.counting import count_rows
+
+
+async def create_tags(count: int, prefix: str = "tag") -> None:
+    for i in range(count):
+        await Tag.create(name=f"{prefix} {i}", slug=f"{prefix}-{i}")
+
+
+def test_cache_miss_then_hit():
+    cache = CountCache(max_size=10, ttl_seconds=60)
+    key = ("capped", 100, "SELECT COUNT(*) FROM tag")
+
+    assert cache.get(key) is None
+    cache.set(key, RowCount(5, exact=True))
+    assert cache.get(key) == RowCount(5, exact=True)
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+    assert stats.hit_ratio == 0.5
+
+
+def test_cache_entries_expire_after_ttl():
+    cache = CountCache(max_size=10, ttl_seconds=10)
+    key = ("capped", 100, "SELECT COUNT(*) FROM tag")
+    with mock.patch("backend.utils.counting.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        cache.set(key, RowCount(5, exact=True))
+
+        mock_monotonic.return_value = 109.0
+        assert cache.get(key) is not None
+
+        mock_monotonic.return_value = 111.0
+        assert cache.get(key) is None
+
+    assert cache.stats().size == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CountCache(max_size=2, ttl_seconds=60)
+    keys = [("capped", 100, f"query {i}") for i in range(3)]
+    cache.set(keys[0], RowCount(0, exact=True))
+    cache.set(keys[1], RowCount(1, exact=True))
+    cache.get(keys[0])
+    cache.set(keys[2], RowCount(2, exact=True))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_count_rows_exact_is_live():
+    await create_tags(3)
+
+    first = await count_rows(Tag.all())
+    await create_tags(1, prefix="late")
+    second = await count_rows(Tag.all())
+
+    assert first == RowCount(3, exact=True)
+    assert second == RowCount(4, exact=True)
+    assert count_cache.stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_count_rows_capped():
+    await create_tags(5)
+
+    below = await count_rows(Tag.all(), CountMode.CAPPED, cap=10)
+    at_cap = await count_rows(Tag.all(), CountMode.CAPPED, cap=5)
+    above = await count_rows(Tag.all(), CountMode.CAPPED, cap=3)
+    filtered = await count_rows(
+        Tag.filter(slug__in=["tag-0", "tag-1"]), CountMode.CAPPED, cap=3
+    )
+
+    assert below == RowCount(5, exact=True)
+    assert at_cap == RowCount(5, exact=True)
+    assert above == RowCount(3, exact=False)
+    assert filtered == RowCount(2, exact=True)
+
+
+@pytest.mark.asyncio
+async def test_count_rows_capped_counts_in_the_database():
+    await create_tags(5)
+    connection = get_connection()
+
+    with mock.patch.object(
+        connection, "execute_query_dict", wraps=connection.execute_query_dict
+    ) as execute_query_dict:
+        count = await count_rows(Tag.all(), CountMode.CAPPED, cap=3)
+
+    assert count == RowCount(3, exact=False)
+    # One row with the count comes back, not the ids of the matching rows
+    (sql,) = execute_query_dict.call_args.args
+    assert sql.startswith("SELECT COUNT(*)")
+    assert "LIMIT 4" in sql
+
+
+@pytest.mark.asyncio
+async def test_count_rows_estimated_counts_on_sqlite():
+    await create_tags(4)
+
+    count = await count_rows(Tag.filter(name__startswith="tag"), CountMode.ESTIMATED)
+
+    assert count == RowCount(4, exact=True)
+
+
+@pytest.mark.asyncio
+async def test_count_rows_caches_approximate_counts_per_query():
+    await create_tags(3)
+
+    first = await count_rows(Tag.all(), CountMode.CAPPED)
+    await create_tags(1, prefix="late")
+    cached = await count_rows(Tag.all(), CountMode.CAPPED)
+    other_filter = await count_rows(
+        Tag.filter(name__startswith="late"), CountMode.CAPPED
+    )
+
+    assert first == cached == RowCount(3, exact=True)
+    assert other_filter == RowCount(1, exact=True)
+    stats = count_cache.stats()
+    assert stats.hits == 1
+    assert stats.size == 2
@@ -0,0 +1,70 @@
+# Standard library imports
+import sys
+
+# Project-specific imports
+from backend.utils.fragment_cache import FragmentCache
+
+
+def test_get_miss_then_hit():
+    cache = FragmentCache(max_bytes=10_000)
+
+    assert cache.get("post") is None
+    cache.set("post", "<div>post</div>")
+    assert cache.get("post") == "<div>post</div>"
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+    assert stats.bytes == sys.getsizeof("<div>post</div>")
+    assert stats.hit_ratio == 0.5
+
+
+def test_evicts_least_recently_used_past_memory_cap():
+    fragment = "x" * 100
+    size = sys.getsizeof(fragment)
+    cache = FragmentCache(max_bytes=size * 2)
+    cache.set("a", fragment)
+    cache.set("b", fragment)
+    # Touch "a" so "b" is the least recently used
+    cache.get("a")
+
+    cache.set("c", fragment)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == fragment
+    assert cache.get("c") == fragment
+    assert cache.stats().evictions == 1
+    assert cache.stats().bytes == size * 2
+
+
+def test_replacing_a_key_keeps_the_byte_count():
+    cache = FragmentCache(max_bytes=10_000)
+    cache.set("a", "short")
+    cache.set("a", "a longer fragment")
+
+    assert cache.stats().size == 1
+    assert cache.stats().bytes == sys.getsizeof("a longer fragment")
+
+
+def test_oversized_fragments_and_zero_cap_are_not_cached():
+    cache = FragmentCache(max_bytes=10)
+    cache.set("a", "far too long to fit")
+    assert cache.get("a") is None
+
+    disabled = FragmentCache(max_bytes=0)
+    disabled.set("a", "")
+    assert disabled.get("a") is None
+
+
+def test_clear_resets_entries_and_counters():
+    cache = FragmentCache()
+    cache.set("a", "fragment")
+    cache.get("a")
+
+    cache.clear()
+
+    stats = cache.stats()
+    assert stats.size == 0
+    assert stats.bytes == 0
+    assert stats.hits == 0
@@ -0,0 +1,209 @@
+# Standard library imports
+import asyncio
+import uuid
+
+# Third-party imports
+from fastapi import FastAPI
+from fastapi import Response
+from fastapi.responses import HTMLResponse
+import httpx
+import pytest
+
+# Project-specific imports
+from backend.utils.page_cache import CachedPage
+from backend.utils.page_cache import PageCache
+from backend.utils.page_cache import PageCacheMiddleware
+
+
+def make_app(cache: PageCache) -> tuple[FastAPI, list[str]]:
+    cached_app = FastAPI()
+    renders: list[str] = []
+    release = asyncio.Event()
+    release.set()
+    cached_app.state.release = release
+
+    @cached_app.get("/html/topics/{topic_id}/")
+    async def topic_page(topic_id: str) -> HTMLResponse:
+        await release.wait()
+        renders.append(topic_id)
+        return HTMLResponse(
+            f"<p>{topic_id} #{len(renders)}</p>", headers={"ETag": f'W/"{topic_id}"'}
+        )
+
+    @cached_app.get("/html/topics/{topic_id}/missing/")
+    async def missing_page(topic_id: str) -> Response:
+        renders.append(topic_id)
+        return Response(status_code=404)
+
+    cached_app.add_middleware(PageCacheMiddleware, cache=cache)
+    return cached_app, renders
+
+
+def make_client(cached_app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=cached_app), base_url="http://test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_anonymous_pages_are_served_from_the_cache():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+
+    async with make_client(cached_app) as client:
+        first = await client.get("/html/topics/a/?page=1&limit=10")
+        second = await client.get("/html/topics/a/?limit=10&page=1")
+
+    assert renders == ["a"]
+    assert first.headers["X-Page-Cache"] == "MISS"
+    assert second.headers["X-Page-Cache"] == "HIT"
+    assert second.text == first.text
+    assert second.headers["content-length"] == str(len(first.content))
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_bypass_header_and_errors_skip_the_cache():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+
+    async with make_client(cached_app) as client:
+        await client.get("/html/topics/a/", headers={"Cookie": "session_token=token"})
+        bypassed = await client.get(
+            "/html/topics/a/", headers={"X-Page-Cache-Bypass": "1"}
+        )
+        await client.get("/html/topics/b/missing/")
+        await client.get("/html/topics/b/missing/")
+
+    assert renders == ["a", "a", "b", "b"]
+    assert bypassed.headers["X-Page-Cache"] == "BYPASS"
+    assert cache.stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_render():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+    cached_app.state.release.clear()
+
+    async with make_client(cached_app) as client:
+        requests = [
+            asyncio.create_task(client.get("/html/topics/a/")) for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        cached_app.state.release.set()
+        responses = await asyncio.gather(*requests)
+
+    assert renders == ["a"]
+    assert {response.text for response in responses} == {"<p>a #1</p>"}
+    assert cache.stats().coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_stale_pages_are_served_while_revalidating():
+    cache = PageCache(ttl_seconds=0.05, stale_seconds=0.25)
+    cached_app, renders = make_app(cache)
+
+    async with make_client(cached_app) as client:
+        await client.get("/html/topics/a/")
+        await asyncio.sleep(0.1)
+        stale = await client.get("/html/topics/a/")
+        await asyncio.sleep(0.01)
+        refreshed = await client.get("/html/topics/a/")
+        await asyncio.sleep(0.4)
+        expired = await client.get("/html/topics/a/")
+
+    assert stale.headers["X-Page-Cache"] == "STALE"
+    assert stale.text == "<p>a #1</p>"
+    assert refreshed.headers["X-Page-Cache"] == "HIT"
+    assert refreshed.text == "<p>a #2</p>"
+    assert expired.headers["X-Page-Cache"] == "MISS"
+    assert len(renders) == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_pages_answer_conditional_requests():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+
+    async with make_client(cached_app) as client:
+        first = await client.get("/html/topics/a/", headers={"If-None-Match": '"x"'})
+        repeat = await client.get(
+            "/html/topics/a/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert first.status_code == 200
+    assert first.text == "<p>a #1</p>"
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert renders == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_topic_drops_only_that_topics_pages():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+    topic_id = uuid.uuid4()
+
+    async with make_client(cached_app) as client:
+        await client.get(f"/html/topics/{topic_id}/")
+        await client.get(f"/html/topics/{topic_id}/?page=2")
+        await client.get("/html/topics/other/")
+        cache.invalidate_topic(topic_id)
+        after = await client.get(f"/html/topics/{topic_id}/")
+        other = await client.get("/html/topics/other/")
+
+    assert after.headers["X-Page-Cache"] == "MISS"
+    assert other.headers["X-Page-Cache"] == "HIT"
+    assert cache.stats().invalidations == 1
+
+
+def test_invalidate_topic_drops_topic_list_and_tag_pages():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    topic_id = uuid.uuid4()
+    for path in ("/html/topics/", "/html/tags/news/", "/html/topics/other/"):
+        cache.store(
+            (path, ""),
+            CachedPage(
+                status=200, headers=[], body=b"<p></p>", stored_at=0.0, generation=0
+            ),
+        )
+
+    cache.invalidate_topic(topic_id)
+
+    assert cache.lookup(("/html/topics/", ""))[0] is None
+    assert cache.lookup(("/html/tags/news/", ""))[0] is None
+    assert cache.stats().size == 1
+
+
+@pytest.mark.asyncio
+async def test_renders_begun_before_an_invalidation_are_not_kept():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60)
+    cached_app, renders = make_app(cache)
+    cached_app.state.release.clear()
+
+    async with make_client(cached_app) as client:
+        request = asyncio.create_task(client.get("/html/topics/a/"))
+        await asyncio.sleep(0.01)
+        cache.invalidate("/html/topics/a/")
+        cached_app.state.release.set()
+        await request
+
+    assert cache.stats().size == 0
+
+
+def test_page_cache_evicts_least_recently_used_pages():
+    cache = PageCache(ttl_seconds=60, stale_seconds=60, max_bytes=10)
+
+    for path in ("/a/", "/b/", "/c/"):
+        cache.store(
+            (path, ""),
+            CachedPage(
+                status=200, headers=[], body=b"12345", stored_at=0, generation=0
+            ),
+        )
+
+    assert cache.stats().size == 2
+    assert cache.stats().evictions == 1
+    assert cache.lookup(("/a/", ""))[0] is None
@@ -0,0 +1,112 @@
+# Standard library imports
+from datetime import timedelta
+from typing import List
+
+# Third-party imports
+from fastapi import HTTPException
+import pytest
+
+# Project-specific imports
+from backend.db.models.tag import Tag
+from backend.utils.datetime import now_utc
+from backend.utils.pagination import AFTER
+from backend.utils.pagination import BEFORE
+from backend.utils.pagination import decode_cursor
+from backend.utils.pagination import encode_cursor
+from backend.utils.pagination import paginate
+from backend.utils.pagination import parse_cursor
+
+
+async def create_tags(count: int) -> List[Tag]:
+    """Create tags newest first, two of them sharing a timestamp."""
+    start = now_utc()
+    tags = []
+    for i in range(count):
+        tag = await Tag.create(name=f"Tag {i}", slug=f"tag-{i}")
+        # Ties on created_at must still page in a stable order
+        tag.created_at = start - timedelta(minutes=i // 2)
+        await tag.save(update_fields=["created_at"])
+        tags.append(tag)
+    return sorted(tags, key=lambda t: (t.created_at, t.id), reverse=True)
+
+
+def test_cursor_round_trip() -> None:
+    tag = Tag(name="Tag", slug="tag", created_at=now_utc())
+
+    cursor = decode_cursor(encode_cursor(AFTER, tag))
+
+    assert cursor.direction == AFTER
+    assert cursor.created_at == tag.created_at
+    assert cursor.id == tag.id
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eHxub3R8YQ"])
+def test_decode_cursor_invalid(token: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_parse_cursor_invalid() -> None:
+    assert parse_cursor(None) is None
+
+    with pytest.raises(HTTPException) as exc_info:
+        parse_cursor("not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_paginate_offset_mode() -> None:
+    tags = await create_tags(5)
+
+    first = await paginate(Tag.all(), 2)
+    second = await paginate(Tag.all(), 2, skip=2)
+
+    assert [t.id for t in first.rows] == [t.id for t in tags[:2]]
+    assert first.previous_cursor is None
+    assert first.next_cursor is not None
+    assert [t.id for t in second.rows] == [t.id for t in tags[2:4]]
+    assert second.previous_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursors_walk_every_row_once() -> None:
+    tags = await create_tags(5)
+
+    seen = []
+    pages = []
+    page = await paginate(Tag.all(), 2)
+    while True:
+        pages.append(page)
+        seen.extend(t.id for t in page.rows)
+        if page.next_cursor is None:
+            break
+        page = await paginate(Tag.all(), 2, cursor=decode_cursor(page.next_cursor))
+
+    assert seen == [t.id for t in tags]
+    assert [len(p.rows) for p in pages] == [2, 2, 1]
+
+    # Paging back from the last page returns the page before it
+    last = pages[-1]
+    assert last.previous_cursor is not None
+    back = await paginate(Tag.all(), 2, cursor=decode_cursor(last.previous_cursor))
+    assert [t.id for t in back.rows] == [t.id for t in pages[1].rows]
+    assert back.previous_cursor is not None
+    assert back.next_cursor is not None
+
+    newest = await paginate(Tag.all(), 2, cursor=decode_cursor(back.previous_cursor))
+    assert [t.id for t in newest.rows] == [t.id for t in pages[0].rows]
+    assert newest.previous_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_paginate_before_first_row_is_empty() -> None:
+    tags = await create_tags(2)
+
+    page = await paginate(
+        Tag.all(), 2, cursor=decode_cursor(encode_cursor(BEFORE, tags[0]))
+    )
+
+    assert page.rows == []
+    assert page.next_cursor is None
+    assert page.previous_cursor is None
@@ -0,0 +1,87 @@
+# Standard library imports
+import asyncio
+import threading
+
+# Third-party imports
+import bcrypt
+from fastapi import HTTPException
+from fastapi import status
+import pytest
+
+# Project-specific imports
+from backend.utils.password_hashing import PasswordHashingExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_records_metrics():
+    executor = PasswordHashingExecutor(max_workers=2, max_queue=2)
+    try:
+        hashed = await executor.run(bcrypt.hashpw, b"Password123!", bcrypt.gensalt(4))
+        assert await executor.run(bcrypt.checkpw, b"Password123!", hashed)
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats.completed == 2
+    assert stats.rejected == 0
+    assert stats.in_flight == 0
+    assert stats.hash_time.count == 2
+    assert stats.hash_time.max_seconds > 0
+    assert stats.queue_wait.count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_when_saturated():
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.create_task(executor.run(release.wait, 5))
+        queued = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(release.wait, 5)
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers == {"Retry-After": "1"}
+
+        release.set()
+        assert await running is True
+        assert await queued is True
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats.rejected == 1
+    assert stats.completed == 2
+    assert stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_block_event_loop():
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+    try:
+        task = asyncio.create_task(executor.run(release.wait, 5))
+
+        # The loop keeps serving other work while the hash is running
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        release.set()
+        assert await task is True
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_restarts_lazily():
+    executor = PasswordHashingExecutor(max_workers=1, max_queue=0)
+    assert await executor.run(sum, [1, 2]) == 3
+
+    executor.shutdown()
+
+    assert await executor.run(sum, [3, 4]) == 7
+    executor.shutdown()
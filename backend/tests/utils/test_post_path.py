@@ -0,0 +1,47 @@
+# Standard library imports
+import uuid
+
+# Project-specific imports
+from backend.utils.post_path import build_post_path
+from backend.utils.post_path import parse_post_path
+from backend.utils.post_path import subtree_path_filter
+
+
+def test_build_post_path_root() -> None:
+    # Arrange
+    post_id = uuid.uuid4()
+
+    # Act
+    result = build_post_path("", post_id)
+
+    # Assert
+    assert result == f"{post_id.hex}/"
+
+
+def test_build_post_path_extends_parent() -> None:
+    # Arrange
+    root_id = uuid.uuid4()
+    post_id = uuid.uuid4()
+    parent_path = build_post_path("", root_id)
+
+    # Act
+    result = build_post_path(parent_path, post_id)
+
+    # Assert
+    assert result.startswith(parent_path)
+    assert parse_post_path(result) == [root_id, post_id]
+
+
+def test_subtree_path_filter_bounds_descendants_only() -> None:
+    # Arrange
+    root_path = build_post_path("", uuid.uuid4())
+    child_path = build_post_path(root_path, uuid.uuid4())
+    sibling_path = build_post_path("", uuid.uuid4())
+
+    # Act
+    result = subtree_path_filter(root_path)
+
+    # Assert
+    assert result["path__gte"] <= root_path < result["path__lt"]
+    assert result["path__gte"] <= child_path < result["path__lt"]
+    assert not (result["path__gte"] <= sibling_path < result["path__lt"])
@@ -0,0 +1,188 @@
+# Standard library imports
+from unittest import mock
+
+# Third-party imports
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi.testclient import TestClient
+import pytest
+
+# Project-specific imports
+from backend.app import app
+from backend.utils.rate_limiter import DatabaseRateLimitBackend
+from backend.utils.rate_limiter import MemoryRateLimitBackend
+from backend.utils.rate_limiter import RateLimiter
+from backend.utils.rate_limiter import RateLimitMiddleware
+from backend.utils.rate_limiter import RateLimitRule
+from backend.utils.rate_limiter import gcra
+
+API_RULE = RateLimitRule(name="API", path_prefix="/api/", limit=3, window_seconds=60)
+WEBHOOK_RULE = RateLimitRule(
+    name="moderation", path_prefix="/api/posts/moderation-webhook", limit=1
+)
+
+
+def test_gcra_allows_a_burst_of_limit_then_paces():
+    tat = None
+    results = []
+    for _ in range(4):
+        allowed, tat = gcra(tat, 20.0, 60.0, 1000.0)
+        results.append(allowed)
+
+    assert results == [True, True, True, False]
+    # One emission interval later one more request fits
+    assert gcra(tat, 20.0, 60.0, 1020.0) == (True, 1080.0)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used_keys():
+    backend = MemoryRateLimitBackend(max_keys=2)
+
+    for key in ("a", "b", "c"):
+        await backend.acquire(key, 20.0, 60.0, 1000.0)
+
+    assert len(backend) == 2
+    assert backend.evictions == 1
+    # "a" was evicted, so it starts over with a full allowance
+    allowed, tat = await backend.acquire("a", 20.0, 60.0, 1000.0)
+    assert allowed is True
+    assert tat == 1020.0
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_drops_idle_keys():
+    backend = MemoryRateLimitBackend(max_keys=100)
+    await backend.acquire("idle", 20.0, 60.0, 1000.0)
+
+    await backend.acquire("busy", 20.0, 60.0, 2000.0)
+
+    assert len(backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_reports_remaining_and_retry_after():
+    limiter = RateLimiter([API_RULE], MemoryRateLimitBackend())
+
+    with mock.patch("backend.utils.rate_limiter.time.time", return_value=1000.0):
+        decisions = [await limiter.check("/api/topics/", "1.2.3.4") for _ in range(4)]
+
+    assert [decision.remaining for decision in decisions if decision] == [2, 1, 0, 0]
+    refused = decisions[-1]
+    assert refused is not None
+    assert refused.allowed is False
+    assert refused.retry_after_seconds == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_limiter_matches_most_specific_rule_per_client():
+    limiter = RateLimiter([API_RULE, WEBHOOK_RULE], MemoryRateLimitBackend())
+
+    assert await limiter.check("/html/topics/", "client") is None
+    webhook = await limiter.check("/api/posts/moderation-webhook/", "client")
+    assert webhook is not None
+    assert webhook.rule == WEBHOOK_RULE
+
+    # Limits are counted per rule and per client
+    refused = await limiter.check("/api/posts/moderation-webhook/", "client")
+    assert refused is not None and refused.allowed is False
+    other_client = await limiter.check("/api/posts/moderation-webhook/", "other")
+    assert other_client is not None and other_client.allowed is True
+    api = await limiter.check("/api/topics/", "client")
+    assert api is not None and api.allowed is True
+
+
+@pytest.mark.asyncio
+async def test_database_backend_shares_limits_between_instances():
+    first = RateLimiter([API_RULE], DatabaseRateLimitBackend())
+    second = RateLimiter([API_RULE], DatabaseRateLimitBackend())
+
+    decisions = [
+        await limiter.check("/api/topics/", "client")
+        for limiter in (first, second, first, second)
+    ]
+
+    assert [decision.allowed for decision in decisions if decision] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_database_backend_remembers_refused_keys_locally():
+    backend = DatabaseRateLimitBackend()
+    for _ in range(3):
+        await backend.acquire("api:client", 20.0, 60.0, 1000.0)
+    assert (await backend.acquire("api:client", 20.0, 60.0, 1000.0))[0] is False
+
+    with mock.patch(
+        "backend.utils.rate_limiter.acquire_rate_limit", new=mock.AsyncMock()
+    ) as mock_acquire:
+        allowed, _ = await backend.acquire("api:client", 20.0, 60.0, 1010.0)
+
+    assert allowed is False
+    mock_acquire.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_database_backend_fails_open():
+    backend = DatabaseRateLimitBackend()
+
+    with mock.patch(
+        "backend.utils.rate_limiter.acquire_rate_limit",
+        new=mock.AsyncMock(side_effect=RuntimeError("database down")),
+    ):
+        allowed, _ = await backend.acquire("api:client", 20.0, 60.0, 1000.0)
+
+    assert allowed is True
+
+
+def test_middleware_limits_requests_and_sets_headers():
+    limited_app = FastAPI()
+
+    @limited_app.get("/api/ping")
+    async def ping(request: Request) -> dict:
+        return {"remaining": request.state.rate_limit_remaining}
+
+    @limited_app.get("/html/ping")
+    async def html_ping() -> dict:
+        return {}
+
+    limited_app.add_middleware(
+        RateLimitMiddleware,
+        limiter=RateLimiter([API_RULE], MemoryRateLimitBackend()),
+    )
+    client = TestClient(limited_app)
+
+    responses = [client.get("/api/ping") for _ in range(4)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200, 429]
+    assert responses[0].json() == {"remaining": 2}
+    assert responses[0].headers["X-Rate-Limit-Limit"] == "3"
+    assert responses[2].headers["X-Rate-Limit-Remaining"] == "0"
+    assert responses[3].headers["Retry-After"] == "20"
+    assert responses[3].json() == {
+        "detail": "Rate limit exceeded for API requests. Try again later."
+    }
+    assert "X-Rate-Limit-Limit" not in client.get("/html/ping").headers
+
+
+def test_app_limits_moderation_webhook():
+    client = TestClient(app)
+    rule = RateLimitRule(
+        name="moderation", path_prefix="/api/posts/moderation-webhook", limit=1
+    )
+
+    with mock.patch(
+        "backend.utils.rate_limiter.rate_limiter",
+        RateLimiter([rule], MemoryRateLimitBackend()),
+    ):
+        first = client.post("/api/posts/moderation-webhook/", json={})
+        second = client.post("/api/posts/moderation-webhook/", json={})
+
+    assert first.status_code != 429
+    assert second.status_code == 429
+    assert second.json()["detail"] == (
+        "Rate limit exceeded for moderation requests. Try again later."
+    )
@@ -0,0 +1,119 @@
+# Standard library imports
+from datetime import timedelta
+from unittest import mock
+import uuid
+
+# Project-specific imports
+from backend.routes.html.schemas.user import UserResponse
+from backend.utils.datetime import now_utc
+from backend.utils.session_cache import SessionCache
+
+
+def make_user(user_id: uuid.UUID | None = None) -> UserResponse:
+    now = now_utc()
+    return UserResponse(
+        id=user_id or uuid.uuid4(),
+        email="citizen@example.com",
+        display_name="Citizen",
+        is_verified=True,
+        role="user",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_get_miss_then_hit():
+    cache = SessionCache(max_size=10, ttl_seconds=60)
+    user = make_user()
+
+    assert cache.get("token") is None
+    cache.set("token", user)
+    assert cache.get("token") == user
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+    assert stats.hit_ratio == 0.5
+
+
+def test_entries_expire_after_ttl():
+    cache = SessionCache(max_size=10, ttl_seconds=30)
+    with mock.patch("backend.utils.session_cache.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        cache.set("token", make_user())
+
+        mock_monotonic.return_value = 129.0
+        assert cache.get("token") is not None
+
+        mock_monotonic.return_value = 131.0
+        assert cache.get("token") is None
+
+    assert cache.stats().size == 0
+
+
+def test_ttl_is_capped_by_session_expiry():
+    cache = SessionCache(max_size=10, ttl_seconds=30)
+
+    cache.set("expired", make_user(), now_utc() - timedelta(seconds=1))
+    assert cache.get("expired") is None
+
+    with mock.patch("backend.utils.session_cache.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        cache.set("short", make_user(), now_utc() + timedelta(seconds=5))
+
+        mock_monotonic.return_value = 110.0
+        assert cache.get("short") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SessionCache(max_size=2, ttl_seconds=60)
+    cache.set("a", make_user())
+    cache.set("b", make_user())
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") is not None
+    cache.set("c", make_user())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_user_drops_all_sessions_for_user():
+    cache = SessionCache(max_size=10, ttl_seconds=60)
+    user_id = uuid.uuid4()
+    cache.set("first", make_user(user_id))
+    cache.set("second", make_user(user_id))
+    cache.set("other", make_user())
+
+    cache.invalidate_user(user_id)
+
+    assert cache.get("first") is None
+    assert cache.get("second") is None
+    assert cache.get("other") is not None
+    assert cache.stats().invalidations == 2
+
+
+def test_invalidate_token_and_clear():
+    cache = SessionCache(max_size=10, ttl_seconds=60)
+    cache.set("token", make_user())
+
+    cache.invalidate_token("token")
+    cache.invalidate_token("missing")
+    assert cache.get("token") is None
+    assert cache.stats().invalidations == 1
+
+    cache.set("token", make_user())
+    cache.clear()
+    stats = cache.stats()
+    assert stats.size == 0
+    assert stats.hits == 0
+    assert stats.misses == 0
+
+
+def test_zero_size_disables_cache():
+    cache = SessionCache(max_size=0, ttl_seconds=60)
+    cache.set("token", make_user())
+    assert cache.get("token") is None
@@ -0,0 +1,61 @@
+# Standard library imports
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import mock
+import uuid
+
+# Project-specific imports
+from backend.utils.session_revocations import SessionRevocationList
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_revoked_session_rejects_all_its_tokens():
+    revocations = SessionRevocationList()
+    session_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+
+    assert not revocations.is_revoked(session_id, user_id, NOW.timestamp())
+
+    revocations.revoke_session(session_id)
+
+    assert revocations.is_revoked(session_id, user_id, NOW.timestamp() + 3600)
+    assert not revocations.is_revoked(uuid.uuid4(), user_id, NOW.timestamp())
+
+
+def test_revoked_user_rejects_only_earlier_tokens():
+    revocations = SessionRevocationList()
+    user_id = uuid.uuid4()
+
+    with mock.patch("backend.utils.session_revocations.now_utc", return_value=NOW):
+        revocations.revoke_user(user_id)
+
+    earlier = (NOW - timedelta(seconds=1)).timestamp()
+    later = (NOW + timedelta(seconds=1)).timestamp()
+    assert revocations.is_revoked(uuid.uuid4(), user_id, earlier)
+    assert not revocations.is_revoked(uuid.uuid4(), user_id, later)
+    assert not revocations.is_revoked(uuid.uuid4(), uuid.uuid4(), earlier)
+
+
+def test_prune_drops_entries_past_retention():
+    revocations = SessionRevocationList(retention_seconds=60)
+    old_session_id = uuid.uuid4()
+    new_session_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+
+    with mock.patch("backend.utils.session_revocations.now_utc") as mock_now:
+        mock_now.return_value = NOW
+        revocations.revoke_session(old_session_id)
+        revocations.revoke_user(user_id)
+
+        mock_now.return_value = NOW + timedelta(seconds=45)
+        revocations.revoke_session(new_session_id)
+
+        mock_now.return_value = NOW + timedelta(seconds=90)
+        revocations.prune()
+
+    issued_at = (NOW - timedelta(seconds=1)).timestamp()
+    assert not revocations.is_revoked(old_session_id, uuid.uuid4(), issued_at)
+    assert not revocations.is_revoked(uuid.uuid4(), user_id, issued_at)
+    assert revocations.is_revoked(new_session_id, uuid.uuid4(), issued_at)
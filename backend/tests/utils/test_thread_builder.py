@@ -0,0 +1,46 @@
+# Standard library imports
+from datetime import datetime
+import uuid
+
+# Project-specific imports
+from backend.schemas.post import PostResponse
+from backend.schemas.user import UserSchema
+from backend.utils.thread_builder import attach_replies
+
+
+def _post(parent_post_id: uuid.UUID | None = None) -> PostResponse:
+    now = datetime.now()
+    return PostResponse(
+        id=uuid.uuid4(),
+        content="content",
+        author=UserSchema(
+            id=uuid.uuid4(),
+            email="user@example.com",
+            display_name="User",
+            is_verified=True,
+            role="user",
+            created_at=now,
+            updated_at=now,
+        ),
+        topic_id=uuid.uuid4(),
+        parent_post_id=parent_post_id,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_attach_replies_nests_by_parent() -> None:
+    # Arrange
+    root = _post()
+    reply = _post(parent_post_id=root.id)
+    nested = _post(parent_post_id=reply.id)
+    orphan = _post(parent_post_id=uuid.uuid4())
+
+    # Act
+    result = attach_replies([root], [reply, nested, orphan])
+
+    # Assert
+    assert result == [root]
+    assert root.replies == [reply]
+    assert reply.replies == [nested]
+    assert orphan.replies == []
@@ -0,0 +1,96 @@
+# Standard library imports
+import asyncio
+from unittest import mock
+
+# Third-party imports
+from httpx import ASGITransport
+from httpx import AsyncClient
+import pytest
+
+# Project-specific imports
+from backend.tasks.moderation_jobs import ModerationConsumerStats
+from backend.workers.moderation import ModerationWorker
+from backend.workers.moderation import create_health_app
+
+MODULE = "backend.workers.moderation"
+
+
+def fake_consumers(job_seconds: float):
+    """Consumers that hold one job for ``job_seconds`` once asked to stop."""
+
+    def start(count, stop_event, stats: ModerationConsumerStats):
+        async def consume() -> None:
+            stats.consumers_running += 1
+            try:
+                await stop_event.wait()
+                stats.jobs_in_flight += 1
+                await asyncio.sleep(job_seconds)
+                stats.jobs_in_flight -= 1
+                stats.jobs_completed += 1
+            finally:
+                stats.consumers_running -= 1
+
+        return [asyncio.create_task(consume()) for _ in range(count)]
+
+    return start
+
+
+@pytest.mark.asyncio
+async def test_worker_drains_in_flight_jobs_on_stop():
+    worker = ModerationWorker(concurrency=2, shutdown_timeout_seconds=5.0)
+
+    with mock.patch(
+        f"{MODULE}.start_moderation_consumers", side_effect=fake_consumers(0.01)
+    ):
+        run_task = asyncio.create_task(worker.run())
+        while worker.stats.consumers_running < 2:
+            await asyncio.sleep(0)
+        assert worker.health().status == "ok"
+
+        worker.stop()
+        await run_task
+
+    assert worker.stats.jobs_completed == 2
+    assert worker.stats.consumers_running == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_cancels_jobs_past_shutdown_timeout():
+    worker = ModerationWorker(concurrency=1, shutdown_timeout_seconds=0.01)
+
+    with mock.patch(
+        f"{MODULE}.start_moderation_consumers", side_effect=fake_consumers(60.0)
+    ):
+        run_task = asyncio.create_task(worker.run())
+        while worker.stats.consumers_running < 1:
+            await asyncio.sleep(0)
+        worker.stop()
+        await asyncio.wait_for(run_task, timeout=5.0)
+
+    assert worker.stats.jobs_completed == 0
+    assert worker.stats.consumers_running == 0
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_reports_worker_state():
+    worker = ModerationWorker(concurrency=2)
+    worker.stats.consumers_running = 2
+    worker.stats.jobs_completed = 7
+    transport = ASGITransport(app=create_health_app(worker))
+
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        healthy = await client.get("/health/")
+
+        worker.stats.consumers_running = 1
+        degraded = await client.get("/health/")
+
+        worker.stop()
+        draining = await client.get("/health/")
+
+    assert healthy.status_code == 200
+    assert healthy.json()["status"] == "ok"
+    assert healthy.json()["jobs_completed"] == 7
+    assert degraded.status_code == 503
+    assert degraded.json()["status"] == "degraded"
+    assert draining.status_code == 503
+    assert draining.json()["status"] == "draining"
@@ -0,0 +1,9 @@
+#!/bin/bash
+
+set -e
+
+echo "Auditing query plans for sequential scans..."
+cd backend
+uv run python -m backend.commands.audit_indexes "$@"
+cd ..
+echo "...Finished auditing query plans"
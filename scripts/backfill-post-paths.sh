@@ -0,0 +1,9 @@
+#!/bin/bash
+
+set -e
+
+echo "Backfilling post thread paths..."
+cd backend
+uv run python -m backend.commands.backfill_post_paths "$@"
+cd ..
+echo "...Finished backfilling post thread paths"
@@ -0,0 +1,9 @@
+#!/bin/bash
+
+set -e
+
+echo "Benchmarking the moderation pipeline against the fake model..."
+cd backend
+uv run python -m backend.commands.benchmark_moderation "$@"
+cd ..
+echo "...Finished benchmarking the moderation pipeline"
@@ -0,0 +1,9 @@
+#!/bin/bash
+
+set -e
+
+echo "Starting The Robot Overlord moderation worker..."
+cd backend
+uv run python -m backend.workers.moderation
+cd ..
+echo "...Stopped The Robot Overlord moderation worker"
@@ -0,0 +1,9 @@
+#!/bin/bash
+
+set -e
+
+echo "Reconciling denormalized counters..."
+cd backend
+uv run python -m backend.commands.reconcile_counters
+cd ..
+echo "...Finished reconciling denormalized counters"